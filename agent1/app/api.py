@@ -3,11 +3,17 @@
 
 구구단 문제를 생성하고 답변기 에이전트와 통신하는 API를 정의합니다.
 """
-import httpx
-from fastapi import FastAPI, HTTPException
-from typing import Dict, Optional
+from fastapi import FastAPI, Response
+from typing import Dict, Optional, Union
 from fastapi.middleware.cors import CORSMiddleware
 
+from shared import __version__
+from shared.http_metrics import instrument_app
+from shared.loop_monitor import instrument_loop_monitor
+from shared.memory import instrument_memory
+from shared.priority import instrument_priority
+from shared.profiling import instrument_profiling
+from shared.tracing import instrument_tracing
 from shared.schemas import (
     ProblemRequest,
     ProblemGenerated,
@@ -15,6 +21,9 @@ from shared.schemas import (
     AnswerResponse,
 )
 
+from .relay import close_client, relay_answer
+from .stream import router as stream_router
+
 app = FastAPI(title="구구단 문제 생성기 에이전트")
 
 # CORS 설정 추가
@@ -26,6 +35,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 지연 시간 메트릭과 /metrics 엔드포인트
+instrument_app(app)
+# 요청별 추적 구간과 /traces 엔드포인트
+instrument_tracing(app, "agent1")
+# 요청의 우선순위 클래스(x-priority-class 헤더) 적용
+instrument_priority(app)
+# 관리자용 프로파일링 엔드포인트 (/admin/profile)
+instrument_profiling(app, "agent1")
+# 이벤트 루프 지연 감시 (/admin/loop/stalls)
+instrument_loop_monitor(app, "agent1")
+# 관리자용 메모리 스냅샷 엔드포인트 (/admin/memory)
+instrument_memory(app)
+# 문제 스트리밍 엔드포인트 (/problem/stream)
+app.include_router(stream_router)
+# 답변기 호출용 공유 HTTP 클라이언트 정리
+app.add_event_handler("shutdown", close_client)
+
 # 에이전트 상태 저장
 state: Dict[str, any] = {
     "current_table": None,
@@ -43,7 +69,7 @@ async def health_check() -> Dict[str, str]:
     Returns:
         Dict[str, str]: 에이전트 상태 정보
     """
-    return {"status": "ok", "agent": "problem_generator"}
+    return {"status": "ok", "agent": "problem_generator", "version": __version__}
 
 
 @app.post("/problem/initialize", response_model=ProblemGenerated)
@@ -110,35 +136,22 @@ async def next_problem() -> Optional[ProblemGenerated]:
 
 
 @app.post("/problem/solve", response_model=AnswerResponse)
-async def solve_problem(problem: AnswerRequest) -> AnswerResponse:
+async def solve_problem(problem: AnswerRequest) -> Union[Response, AnswerResponse]:
     """
     생성된 문제를 답변기 에이전트에 전송하여 해결 요청
 
+    기본(passthrough) 모드에서는 답변기의 응답 본문과 상태 코드를 그대로 전달합니다.
+
     Args:
         problem (AnswerRequest): 해결할 구구단 문제
 
     Returns:
-        AnswerResponse: 답변기로부터 받은 답변
+        Union[Response, AnswerResponse]: 답변기로부터 받은 답변
 
     Raises:
         HTTPException: 답변기 에이전트 통신 오류 시
     """
-    agent2_url = "http://localhost:6001/answer"
-    
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(agent2_url, json=problem.dict())
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"답변기 에이전트 응답 오류: {response.text}"
-                )
-            return AnswerResponse.parse_obj(response.json())
-    except httpx.RequestError as e:
-        raise HTTPException(
-            status_code=503,
-            detail=f"답변기 에이전트 연결 실패: {str(e)}"
-        )
+    return await relay_answer(problem)
 
 
 @app.post("/problem/end")
@@ -0,0 +1,106 @@
+"""
+에이전트1(문제 생성기) 답변기 중계 모듈
+
+문제를 답변기 에이전트에 전달하고 그 응답을 호출자에게 돌려줍니다.
+기본 'passthrough' 모드는 답변기의 응답 본문과 상태 코드를 다시 파싱·검증하지 않고 그대로 스트리밍하고,
+'validate' 모드는 응답을 AnswerResponse로 검증한 뒤 반환합니다.
+"""
+from typing import Optional, Union
+
+import httpx
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from shared.config import agent_request_timeout, get_settings
+from shared.priority import PriorityScheduler, inject_priority
+from shared.schemas import AnswerRequest, AnswerResponse
+from shared.tracing import inject, start_span
+
+# 중계 모드 ('passthrough' 또는 'validate')
+RELAY_MODE = get_settings().agent1_relay_mode
+# 응답에 그대로 전달하는 답변기 응답 헤더
+FORWARDED_HEADERS = ("content-type", "content-encoding")
+
+# 답변기 호출 스케줄러 (요청의 우선순위 클래스 순으로 슬롯 배정)
+relay_scheduler = PriorityScheduler("agent1", get_settings().agent1_relay_concurrency)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    답변기 호출에 재사용하는 HTTP 클라이언트를 반환합니다 (처음 호출할 때 생성).
+
+    Returns:
+        httpx.AsyncClient: 공유 HTTP 클라이언트
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        # Reason: 답변기의 묶음 대기와 LLM 호출 시간(최대 30초)을 모두 기다리도록 제한 시간을 그보다 길게 둡니다.
+        _client = httpx.AsyncClient(timeout=agent_request_timeout())
+    return _client
+
+
+async def close_client():
+    """
+    공유 HTTP 클라이언트를 닫습니다 (앱 종료 시 호출).
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def relay_answer(problem: AnswerRequest, mode: Optional[str] = None) -> Union[StreamingResponse, AnswerResponse]:
+    """
+    문제를 답변기에 전달하고 응답을 반환합니다.
+
+    Args:
+        problem (AnswerRequest): 해결할 구구단 문제
+        mode (Optional[str]): 중계 모드 (기본값: RELAY_MODE)
+
+    Returns:
+        Union[StreamingResponse, AnswerResponse]: 'passthrough'이면 답변기 응답 그대로, 'validate'이면 검증된 답변
+
+    Raises:
+        HTTPException: 답변기 연결 실패 시, 또는 'validate' 모드에서 답변기가 오류를 응답한 경우
+    """
+    mode = mode or RELAY_MODE
+    agent2_url = f"{get_settings().agent2_url}/answer"
+    client = get_client()
+
+    try:
+        # 답변기 호출 구간 (추적 컨텍스트와 우선순위 클래스를 헤더로 전달, 응답 헤더를 받을 때까지)
+        with start_span("relay.agent2", problem=problem.problem, mode=mode):
+            request = client.build_request(
+                "POST",
+                agent2_url,
+                content=problem.model_dump_json(exclude_none=True),
+                headers=inject_priority(inject({"content-type": "application/json"})),
+            )
+            # Reason: 답변기는 설명을 모두 만든 뒤 응답 헤더를 보내므로 헤더를 받을 때까지만 슬롯을 씁니다.
+            async with relay_scheduler.slot():
+                response = await client.send(request, stream=(mode == "passthrough"))
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"답변기 에이전트 연결 실패: {str(e)}"
+        )
+
+    if mode == "passthrough":
+        # Reason: 설명 마크다운이 커서 파싱·검증·재직렬화 비용이 크므로 바이트를 그대로 흘려보냅니다.
+        headers = {name: response.headers[name] for name in FORWARDED_HEADERS if name in response.headers}
+        return StreamingResponse(
+            response.aiter_raw(),
+            status_code=response.status_code,
+            headers=headers,
+            background=BackgroundTask(response.aclose),
+        )
+
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"답변기 에이전트 응답 오류: {response.text}"
+        )
+    return AnswerResponse.model_validate_json(response.content)
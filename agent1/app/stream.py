@@ -0,0 +1,111 @@
+"""
+에이전트1(문제 생성기) 문제 스트리밍 모듈
+
+`/problem/next`처럼 전역 상태를 바꾸며 한 문제씩 가져오는 대신, 연결 하나로 구구단 문제를
+NDJSON 또는 SSE로 계속 받습니다. 문제는 생성기로 필요한 만큼만 만들고 여러 줄씩 묶어 전송합니다.
+"""
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from shared.gugudan import PlannedStep, iter_steps
+
+router = APIRouter()
+
+# 한 번에 묶어 전송하는 문제 수
+STREAM_CHUNK_SIZE = 256
+# 한 스트림에서 허용하는 최대 곱하는 수
+MAX_STREAM_MULTIPLICAND = 1_000_000
+
+# 형식별 응답 콘텐츠 타입
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "compact": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+def format_step(step: PlannedStep, fmt: str) -> str:
+    """
+    한 단계를 스트림의 한 항목으로 변환합니다.
+
+    Args:
+        step (PlannedStep): 구구단 단계
+        fmt (str): 'ndjson', 'sse' 또는 'compact'
+
+    Returns:
+        str: 줄바꿈을 포함한 항목 텍스트
+    """
+    if fmt == "compact":
+        # [곱해지는 수, 곱하는 수] 배열 (문제 문자열은 받는 쪽에서 만들 수 있음)
+        return f"[{step.multiplier},{step.multiplicand}]\n"
+    status = "completed" if step.final else "continue"
+    # Reason: 필드가 정수와 고정 형식 문자열뿐이므로 모델 직렬화 없이 ProblemGenerated와 같은 JSON을 만듭니다.
+    item = (
+        f'{{"problem":"{step.problem}","multiplier":{step.multiplier},'
+        f'"multiplicand":{step.multiplicand},"status":"{status}"}}'
+    )
+    if fmt == "sse":
+        return f"data: {item}\n\n"
+    return f"{item}\n"
+
+
+async def stream_steps(
+    table: int,
+    stop_value: Optional[int],
+    first: int,
+    last: int,
+    fmt: str,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    """
+    구구단 문제를 묶음 단위로 생성합니다.
+
+    Args:
+        table (int): 구구단 단수
+        stop_value (Optional[int]): 종료 조건 값
+        first (int): 시작 곱하는 수
+        last (int): 마지막 곱하는 수
+        fmt (str): 'ndjson', 'sse' 또는 'compact'
+        chunk_size (int): 한 번에 묶는 문제 수
+
+    Yields:
+        str: 여러 항목을 이어 붙인 텍스트
+    """
+    chunk = []
+    for step in iter_steps(table, stop_value, first, last):
+        chunk.append(format_step(step, fmt))
+        if len(chunk) >= chunk_size:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+@router.get("/problem/stream")
+async def stream_problems(
+    table: int = Query(..., ge=1, le=100, description="구구단 단수 (N)"),
+    stop_value: Optional[int] = Query(None, description="종료할 결과값 (M)"),
+    first: int = Query(1, ge=0, description="시작 곱하는 수"),
+    last: int = Query(9, ge=0, le=MAX_STREAM_MULTIPLICAND, description="마지막 곱하는 수"),
+    format: str = Query("ndjson", pattern="^(ndjson|sse|compact)$", description="ndjson, sse 또는 compact"),
+) -> StreamingResponse:
+    """
+    구구단 문제를 연결 하나로 스트리밍합니다.
+
+    전역 문제 상태(`/problem/next`)는 바꾸지 않습니다. 종료 조건에 도달하거나 마지막 곱하는 수에서 끝나며,
+    마지막 문제의 status는 'completed'입니다.
+
+    Returns:
+        StreamingResponse: ProblemGenerated 형식의 NDJSON/SSE 또는 `[N, X]` 배열 NDJSON
+
+    Raises:
+        HTTPException: 시작 곱하는 수가 마지막 곱하는 수보다 큰 경우
+    """
+    if first > last:
+        raise HTTPException(status_code=400, detail="first는 last보다 클 수 없습니다.")
+    return StreamingResponse(
+        stream_steps(table, stop_value, first, last, format),
+        media_type=MEDIA_TYPES[format],
+    )
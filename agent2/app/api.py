@@ -3,18 +3,25 @@
 
 구구단 문제를 받아 계산하고 답변을 제공하는 API를 정의합니다.
 """
-import re
-import os
-import httpx
+import time
 from fastapi import FastAPI, HTTPException
 from typing import Dict, List
-from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
 
+from shared import __version__
+from shared.config import EXPLANATION_LLM_TIMEOUT, get_settings
+from shared.gugudan import parse_problem
+from shared.http_metrics import instrument_app
+from shared.loop_monitor import instrument_loop_monitor
+from shared.memory import instrument_memory
+from shared.metrics import REGISTRY
+from shared.priority import PriorityScheduler, instrument_priority
+from shared.profiling import instrument_profiling
+from shared.tracing import inject, instrument_tracing, start_span
 from shared.schemas import AnswerRequest, AnswerResponse
 
-# 환경 변수 로드
-load_dotenv()
+from .batching import EXPLANATION_MODE, ExplanationBatcher, ExplanationError
+from .matrix import router as matrix_router
 
 app = FastAPI(title="구구단 답변기 에이전트")
 
@@ -27,6 +34,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 지연 시간 메트릭과 /metrics 엔드포인트
+instrument_app(app)
+# 요청별 추적 구간과 /traces 엔드포인트
+instrument_tracing(app, "agent2")
+# 요청의 우선순위 클래스(x-priority-class 헤더) 적용
+instrument_priority(app)
+# 관리자용 프로파일링 엔드포인트 (/admin/profile)
+instrument_profiling(app, "agent2")
+# 이벤트 루프 지연 감시 (/admin/loop/stalls)
+instrument_loop_monitor(app, "agent2")
+# 관리자용 메모리 스냅샷 엔드포인트 (/admin/memory)
+instrument_memory(app)
+# 곱셈표 행렬 엔드포인트 (/matrix)
+app.include_router(matrix_router)
+
+# LLM 동시 호출 제한 (요청의 우선순위 클래스 순으로 슬롯 배정)
+llm_scheduler = PriorityScheduler("agent2.llm", get_settings().llm_concurrency)
+
+# LLM 호출 지연 시간 (status: HTTP 상태 코드 또는 'error')
+llm_request_duration = REGISTRY.histogram(
+    "llm_request_duration_seconds",
+    "LLM API 호출 시간 (초)",
+    ("status",),
+)
+
 
 @app.get("/health")
 async def health_check() -> Dict[str, str]:
@@ -36,12 +68,15 @@ async def health_check() -> Dict[str, str]:
     Returns:
         Dict[str, str]: 에이전트 상태 정보
     """
-    return {"status": "ok", "agent": "answer_provider"}
+    return {"status": "ok", "agent": "answer_provider", "version": __version__}
 
 
 async def get_explanation(calculation: str, answer: int) -> str:
     """
     Claude API를 호출하여 구구단 계산에 대한 설명을 생성합니다.
+
+    동시 호출 수는 llm_scheduler가 제한하며, 기다리는 호출은 우선순위 클래스 순으로 보냅니다.
+    EXPLANATION_MODE가 'batch'이면 짧은 시간 안에 들어온 요청을 모아 한 번에 요청합니다.
     
     Args:
         calculation (str): 전체 계산식 (예: "4×5=20")
@@ -49,44 +84,119 @@ async def get_explanation(calculation: str, answer: int) -> str:
         
     Returns:
         str: 생성된 설명
+
+    Raises:
+        ExplanationError: API 키가 없거나 설명 생성에 실패한 경우
     """
-    prompt = f"다음 구구단 계산 결과를 초등학생이 이해할 수 있도록 간단하게 설명해주세요:\n\n계산: {calculation}\n결과: {answer}\n\n설명은 간결하고 완전한 문장으로 100단어 이내로 작성해주세요. 마크다운 형식으로 작성해 주세요."
-    
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    
     # API 키 확인
-    if not api_key:
-        return "API 키가 설정되지 않아 설명을 생성할 수 없습니다."
-    
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": api_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json"
-                },
-                json={
-                    "model": "claude-3-haiku-20240307",
-                    "max_tokens": 300,  # 토큰 제한 늘림
-                    "temperature": 0.5,
-                    "system": "당신은 초등학생에게 구구단을 가르치는 친절한 선생님입니다. 설명은 마크다운 형식으로 작성하고, 완전한 문장으로 끝내세요.",
-                    "messages": [
-                        {"role": "user", "content": prompt}
-                    ]
-                },
-                timeout=10.0
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return data["content"][0]["text"]
-            else:
-                return f"설명 생성 중 오류 발생: {response.status_code}"
-    
-    except Exception as e:
-        return f"API 호출 중 오류 발생: {str(e)}"
+    if not get_settings().anthropic_api_key:
+        raise ExplanationError("API 키가 설정되지 않아 설명을 생성할 수 없습니다.")
+
+    if EXPLANATION_MODE == "batch":
+        return await explanation_batcher.explain(calculation, answer)
+    return await explain_single(calculation, answer)
+
+
+async def explain_single(calculation: str, answer: int) -> str:
+    """
+    계산 하나의 설명을 Claude API에 요청합니다.
+
+    Args:
+        calculation (str): 전체 계산식 (예: "4×5=20")
+        answer (int): 계산 결과
+
+    Returns:
+        str: 생성된 설명
+    """
+    prompt = f"다음 구구단 계산 결과를 초등학생이 이해할 수 있도록 간단하게 설명해주세요:\n\n계산: {calculation}\n결과: {answer}\n\n설명은 간결하고 완전한 문장으로 100단어 이내로 작성해주세요. 마크다운 형식으로 작성해 주세요."
+
+    # 실시간 요청이 일괄 작업 뒤에서 기다리지 않도록 우선순위 순으로 LLM 호출 슬롯을 얻음
+    async with llm_scheduler.slot():
+        return await request_explanation(get_settings().anthropic_api_key, prompt)
+
+
+async def explain_batch(prompt: str, max_tokens: int) -> str:
+    """
+    여러 계산을 묶은 프롬프트로 Claude API를 호출합니다 (ExplanationBatcher에서 사용).
+
+    Args:
+        prompt (str): 묶음 프롬프트
+        max_tokens (int): 최대 응답 토큰 수
+
+    Returns:
+        str: LLM 응답 텍스트
+
+    Raises:
+        ExplanationError: API 호출에 실패한 경우
+    """
+    async with llm_scheduler.slot():
+        return await request_explanation(get_settings().anthropic_api_key, prompt, max_tokens, timeout=EXPLANATION_LLM_TIMEOUT)
+
+
+async def request_explanation(api_key: str, prompt: str, max_tokens: int = 300, timeout: float = 10.0) -> str:
+    """
+    Claude API에 설명 생성을 요청합니다.
+
+    Args:
+        api_key (str): Anthropic API 키
+        prompt (str): 사용자 프롬프트
+        max_tokens (int): 최대 응답 토큰 수
+        timeout (float): 요청 제한 시간 (초)
+
+    Returns:
+        str: 생성된 설명
+
+    Raises:
+        ExplanationError: 응답 상태 코드가 200이 아니거나 호출 중 오류가 발생한 경우
+    """
+    # Reason: httpx는 LLM 설명을 만들 때만 필요하므로 첫 호출 시 가져와 에이전트 시작 시간을 줄입니다.
+    import httpx
+
+    started = time.perf_counter()
+    status = "error"
+    # LLM 호출 구간 (상태 코드를 속성으로 기록)
+    with start_span("llm.explanation", model="claude-3-haiku-20240307") as span:
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(
+                    "https://api.anthropic.com/v1/messages",
+                    headers=inject({
+                        "x-api-key": api_key,
+                        "anthropic-version": "2023-06-01",
+                        "content-type": "application/json"
+                    }),
+                    json={
+                        "model": "claude-3-haiku-20240307",
+                        "max_tokens": max_tokens,
+                        "temperature": 0.5,
+                        "system": "당신은 초등학생에게 구구단을 가르치는 친절한 선생님입니다. 설명은 마크다운 형식으로 작성하고, 완전한 문장으로 끝내세요.",
+                        "messages": [
+                            {"role": "user", "content": prompt}
+                        ]
+                    },
+                    timeout=timeout
+                )
+                status = str(response.status_code)
+                
+                if response.status_code == 200:
+                    data = response.json()
+                    return data["content"][0]["text"]
+                else:
+                    raise ExplanationError(f"설명 생성 중 오류 발생: {response.status_code}")
+
+        except ExplanationError:
+            raise
+        except Exception as e:
+            raise ExplanationError(f"API 호출 중 오류 발생: {str(e)}") from e
+        finally:
+            span.set_attribute("status", status)
+            if status != "200":
+                span.status = "error"
+            llm_request_duration.labels(status).observe(time.perf_counter() - started)
+
+
+# 설명 묶음 요청기 (EXPLANATION_MODE=batch일 때 사용)
+explanation_batcher = ExplanationBatcher(explain_batch, explain_single)
 
 
 def generate_visual_explanation(n: int, x: int, result: int) -> str:
@@ -124,22 +234,21 @@ async def calculate_answer(request: AnswerRequest) -> AnswerResponse:
     Raises:
         HTTPException: 올바르지 않은 형식의 문제가 입력된 경우
     """
-    problem = request.problem
-    
-    # 문제 형식 검증 및 숫자 추출
-    pattern = r"(\d+)×(\d+)="
-    match = re.match(pattern, problem)
-    
-    if not match:
-        raise HTTPException(
-            status_code=400,
-            detail=f"올바르지 않은 문제 형식입니다: {problem}"
-        )
+    if request.structured:
+        # 숫자가 함께 오면 문제 문자열을 파싱하지 않음
+        n, x = request.multiplier, request.multiplicand
+    else:
+        # 문제 형식 검증 및 숫자 추출
+        numbers = parse_problem(request.problem)
+        if numbers is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"올바르지 않은 문제 형식입니다: {request.problem}"
+            )
+        n, x = numbers
     
     try:
-        # 두 숫자 추출 및 계산
-        n = int(match.group(1))
-        x = int(match.group(2))
+        # 계산
         result = n * x
         
         # 전체 계산식 생성
@@ -148,8 +257,13 @@ async def calculate_answer(request: AnswerRequest) -> AnswerResponse:
         # 시각적 표현 생성
         visual = generate_visual_explanation(n, x, result)
         
-        # Claude API를 통한 설명 생성
-        explanation = await get_explanation(calculation, result)
+        # Claude API를 통한 설명 생성 (실패하면 오류 안내 문구를 설명 대신 전달)
+        explanation_error = False
+        try:
+            explanation = await get_explanation(calculation, result)
+        except ExplanationError as e:
+            explanation = str(e)
+            explanation_error = True
         
         # 최종 설명에 시각적 표현 추가
         full_explanation = f"{explanation}\n\n시각적 표현:\n{visual}"
@@ -157,7 +271,9 @@ async def calculate_answer(request: AnswerRequest) -> AnswerResponse:
         return AnswerResponse(
             answer=result, 
             calculation=calculation,
-            explanation=full_explanation
+            explanation=full_explanation,
+            id=request.id,
+            explanation_error=explanation_error,
         )
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,219 @@
+"""
+에이전트2(답변기) 설명 묶음 생성 모듈
+
+계산마다 LLM을 따로 호출하면 요청마다 시스템 프롬프트와 호출 비용이 반복됩니다.
+짧은 시간(window) 안에 들어온 설명 요청을 우선순위 클래스별로 모아 하나의 구조화된 프롬프트로 요청하고,
+JSON 응답을 계산별 설명으로 나눕니다. 응답을 해석하지 못한 계산은 한 건씩 다시 요청하고,
+묶음 호출 자체가 실패하면(시간 초과, 오류 응답, API 키 없음) 모든 요청에 그 오류를 돌려줍니다.
+"""
+import asyncio
+import json
+import re
+from typing import Awaitable, Callable, Dict, List, Sequence, Tuple, Union
+
+from shared.config import get_settings
+from shared.metrics import REGISTRY
+from shared.priority import current_priority, priority_context
+
+# 설명 생성 방식 ('single': 계산마다 호출, 'batch': 묶어서 호출)
+EXPLANATION_MODE = get_settings().explanation_mode
+# 설명 요청을 모으는 시간 (초)
+BATCH_WINDOW = get_settings().explanation_batch_window
+# 한 번에 묶는 최대 계산 수 (구구단 한 단 = 9)
+BATCH_MAX_SIZE = get_settings().explanation_batch_max
+# 계산 하나당 응답 토큰 수 (묶음 요청의 max_tokens 계산에 사용)
+TOKENS_PER_ITEM = 300
+# 묶음 요청의 최대 max_tokens (모델의 최대 출력 토큰 수)
+MAX_BATCH_TOKENS = 4096
+
+# (계산식, 결과) 설명 요청 항목
+Item = Tuple[str, int]
+# 프롬프트와 max_tokens로 LLM 응답 텍스트를 받는 함수
+RequestFn = Callable[[str, int], Awaitable[str]]
+# 계산 하나의 설명을 받는 함수
+SingleFn = Callable[[str, int], Awaitable[str]]
+
+
+class ExplanationError(Exception):
+    """
+    LLM 설명 생성 실패 (메시지는 사용자에게 보여줄 오류 안내 문구)
+    """
+
+
+# 묶음 요청 크기
+llm_batch_size = REGISTRY.histogram(
+    "llm_batch_size",
+    "LLM 설명 묶음 요청에 포함된 계산 수",
+    (),
+    buckets=(1, 2, 3, 5, 9, 16, 32),
+)
+# 묶음 응답을 해석하지 못해 한 건씩 다시 요청한 계산 수
+llm_batch_fallbacks = REGISTRY.counter(
+    "llm_batch_fallbacks_total",
+    "묶음 응답을 해석하지 못해 한 건씩 다시 요청한 계산 수",
+)
+
+
+def build_batch_prompt(items: Sequence[Item]) -> str:
+    """
+    여러 계산의 설명을 한 번에 요청하는 프롬프트를 만듭니다.
+
+    Args:
+        items (Sequence[Item]): (계산식, 결과) 목록
+
+    Returns:
+        str: 구조화된 사용자 프롬프트
+    """
+    lines = "\n".join(f"{index}. 계산: {calculation} (결과: {answer})" for index, (calculation, answer) in enumerate(items, 1))
+    return (
+        "다음 구구단 계산 결과들을 초등학생이 이해할 수 있도록 각각 간단하게 설명해주세요:\n\n"
+        f"{lines}\n\n"
+        "각 설명은 간결하고 완전한 문장으로 100단어 이내로, 마크다운 형식으로 작성해 주세요.\n"
+        "다른 말 없이 아래 형식의 JSON으로만 답해주세요. calculation은 위의 계산식을 그대로 적어주세요.\n"
+        '{"explanations": [{"calculation": "계산식", "explanation": "설명"}]}'
+    )
+
+
+def parse_batch_response(text: str, calculations: Sequence[str]) -> Dict[str, str]:
+    """
+    묶음 응답에서 계산별 설명을 꺼냅니다.
+
+    응답 앞뒤의 코드 블록이나 문장은 무시하고 첫 번째 JSON 객체를 해석합니다.
+
+    Args:
+        text (str): LLM 응답 텍스트
+        calculations (Sequence[str]): 요청한 계산식 목록
+
+    Returns:
+        Dict[str, str]: 계산식별 설명 (해석하지 못한 계산은 빠짐)
+    """
+    match = re.search(r"\{.*\}", text, re.DOTALL)
+    if match is None:
+        return {}
+    try:
+        entries = json.loads(match.group(0)).get("explanations")
+    except (ValueError, AttributeError):
+        return {}
+    if not isinstance(entries, list):
+        return {}
+
+    wanted = set(calculations)
+    explanations: Dict[str, str] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        calculation, explanation = entry.get("calculation"), entry.get("explanation")
+        if calculation in wanted and isinstance(explanation, str) and explanation.strip():
+            explanations[calculation] = explanation.strip()
+    return explanations
+
+
+class ExplanationBatcher:
+    """
+    설명 요청을 모아 묶음으로 LLM에 보내는 객체
+
+    첫 요청이 들어오면 window초 동안(또는 max_size개가 찰 때까지) 같은 우선순위 클래스의 요청을 모읍니다.
+    """
+
+    def __init__(
+        self,
+        request: RequestFn,
+        single: SingleFn,
+        window: float = BATCH_WINDOW,
+        max_size: int = BATCH_MAX_SIZE,
+    ):
+        """
+        ExplanationBatcher 초기화
+
+        Args:
+            request (RequestFn): 묶음 프롬프트로 LLM을 호출하는 함수
+            single (SingleFn): 계산 하나의 설명을 요청하는 함수 (한 건 요청과 해석 실패 시 사용)
+            window (float): 요청을 모으는 시간 (초)
+            max_size (int): 한 번에 묶는 최대 계산 수
+        """
+        self.request = request
+        self.single = single
+        self.window = window
+        self.max_size = max(1, max_size)
+        self._pending: Dict[str, List[Tuple[Item, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+
+    async def explain(self, calculation: str, answer: int) -> str:
+        """
+        계산의 설명을 묶음 요청에 추가하고 결과를 기다립니다.
+
+        Args:
+            calculation (str): 전체 계산식 (예: "4×5=20")
+            answer (int): 계산 결과
+
+        Returns:
+            str: 생성된 설명
+        """
+        loop = asyncio.get_running_loop()
+        cls = current_priority()
+        future = loop.create_future()
+        pending = self._pending.setdefault(cls, [])
+        pending.append(((calculation, answer), future))
+        if len(pending) >= self.max_size:
+            self._start_flush(cls)
+        elif cls not in self._timers:
+            self._timers[cls] = loop.call_later(self.window, self._start_flush, cls)
+        return await future
+
+    def _start_flush(self, cls: str) -> None:
+        timer = self._timers.pop(cls, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(cls, [])
+        if batch:
+            with priority_context(cls):
+                asyncio.get_running_loop().create_task(self._flush(batch))
+
+    async def _flush(self, batch: List[Tuple[Item, asyncio.Future]]) -> None:
+        items = [item for item, _ in batch]
+        try:
+            results = await self.explain_many(items)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (item, future), explanation in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(explanation, BaseException):
+                future.set_exception(explanation)
+            else:
+                future.set_result(explanation)
+
+    async def explain_many(self, items: Sequence[Item]) -> List[Union[str, BaseException]]:
+        """
+        여러 계산의 설명을 한 번의 LLM 호출로 생성합니다.
+
+        정상 응답에서 설명을 찾지 못한 계산만 한 건씩 다시 요청합니다.
+
+        Args:
+            items (Sequence[Item]): (계산식, 결과) 목록
+
+        Returns:
+            List[Union[str, BaseException]]: items 순서의 설명 목록 (한 건 요청에 실패한 계산은 그 예외)
+
+        Raises:
+            ExplanationError: 묶음 호출에 실패한 경우 (모든 계산에 같은 오류를 돌려줌)
+        """
+        if len(items) == 1:
+            return await asyncio.gather(self.single(*items[0]), return_exceptions=True)
+
+        llm_batch_size.observe(len(items))
+        calculations = [calculation for calculation, _ in items]
+        # Reason: 호출 실패를 한 건씩 다시 보내면 장애 중인 API에 요청이 묶음 크기만큼 늘어나므로 그대로 올려 보냅니다.
+        text = await self.request(build_batch_prompt(items), min(TOKENS_PER_ITEM * len(items), MAX_BATCH_TOKENS))
+        explanations: Dict[str, Union[str, BaseException]] = dict(parse_batch_response(text, calculations))
+
+        missing = [item for item in items if item[0] not in explanations]
+        if missing:
+            # Reason: 형식이 어긋난 응답 때문에 설명이 빠지지 않도록 빠진 계산만 한 건씩 요청합니다.
+            llm_batch_fallbacks.inc(len(missing))
+            singles = await asyncio.gather(*(self.single(*item) for item in missing), return_exceptions=True)
+            explanations.update(zip((calculation for calculation, _ in missing), singles))
+        return [explanations[calculation] for calculation in calculations]
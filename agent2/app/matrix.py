@@ -0,0 +1,288 @@
+"""
+에이전트2(답변기) 구구단 행렬 모듈
+
+여러 단수 × 곱하는 수 범위의 곱셈표 전체를 한 번에 계산해 스트리밍합니다.
+NumPy가 있으면 외적(outer product)으로 묶음 단위 계산을 하고 텍스트 형식도 `np.savetxt`로 묶음 단위로 변환하며,
+없으면 `array('q')` 기반으로 계산합니다 (셀마다 문자열을 만드는 텍스트 형식은 셀 수를 더 작게 제한).
+설명(LLM)은 만들지 않으므로 학습지 생성이나 분석처럼 표 전체가 필요할 때 `/answer`를 반복 호출하지 않아도 됩니다.
+"""
+import io
+import sys
+from array import array
+from typing import Iterator, List, Optional, Sequence
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 array 모듈로 계산
+    np = None
+
+router = APIRouter()
+
+# 한 번에 계산해 전송하는 최대 셀 수
+MATRIX_CHUNK_CELLS = 65536
+# 요청 하나에서 허용하는 최대 셀 수
+MAX_MATRIX_CELLS = 10_000_000
+# NumPy 없이 텍스트 형식(ndjson, csv)으로 보낼 때의 최대 셀 수
+MAX_PYTHON_TEXT_CELLS = 1_000_000
+# 단수와 곱하는 수의 최대값 (곱이 int64 범위를 넘지 않도록)
+MAX_MATRIX_VALUE = 1_000_000_000
+
+# 형식별 응답 콘텐츠 타입
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "binary": "application/octet-stream",
+}
+
+
+def numpy_blocks(tables: range, multiplicands: range, rows_per_chunk: int) -> Iterator["np.ndarray"]:
+    """
+    NumPy 외적으로 행렬을 여러 행씩 계산합니다.
+
+    Args:
+        tables (range): 단수 범위 (행)
+        multiplicands (range): 곱하는 수 범위 (열)
+        rows_per_chunk (int): 한 번에 계산할 행 수
+
+    Yields:
+        np.ndarray: (행 수, 열 수) 크기의 int64 행렬
+    """
+    columns = np.arange(multiplicands.start, multiplicands.stop, dtype=np.int64)
+    for start in range(0, len(tables), rows_per_chunk):
+        stop = min(start + rows_per_chunk, len(tables))
+        rows = np.arange(tables.start + start, tables.start + stop, dtype=np.int64)
+        yield np.multiply.outer(rows, columns)
+
+
+def python_rows(tables: range, multiplicands: range) -> Iterator[array]:
+    """
+    NumPy 없이 행렬을 한 행씩 계산합니다.
+
+    Args:
+        tables (range): 단수 범위 (행)
+        multiplicands (range): 곱하는 수 범위 (열)
+
+    Yields:
+        array: 한 단수의 곱 목록 (int64)
+    """
+    first, last = multiplicands.start, multiplicands.stop - 1
+    for table in tables:
+        if table == 0:
+            yield array("q", bytes(8 * len(multiplicands)))
+        else:
+            # 등차수열이므로 곱셈 없이 range에서 바로 배열을 만듦
+            yield array("q", range(table * first, table * last + 1, table))
+
+
+def format_rows(tables: Sequence[int], rows: Sequence[Sequence[int]], fmt: str) -> str:
+    """
+    여러 행을 NDJSON 또는 CSV 텍스트로 변환합니다.
+
+    Args:
+        tables (Sequence[int]): 각 행의 단수
+        rows (Sequence[Sequence[int]]): 각 행의 곱 목록
+        fmt (str): 'ndjson' 또는 'csv'
+
+    Returns:
+        str: 줄바꿈을 포함한 텍스트
+    """
+    if fmt == "csv":
+        return "".join(f"{table},{','.join(map(str, row))}\n" for table, row in zip(tables, rows))
+    return "".join(
+        f'{{"table":{table},"products":[{",".join(map(str, row))}]}}\n' for table, row in zip(tables, rows)
+    )
+
+
+def format_block(tables: range, block: "np.ndarray", fmt: str) -> bytes:
+    """
+    NumPy 행렬 묶음을 np.savetxt로 NDJSON 또는 CSV 텍스트로 변환합니다 (format_rows와 같은 출력).
+
+    Args:
+        tables (range): 묶음의 각 행 단수
+        block (np.ndarray): (행 수, 열 수) 크기의 곱 행렬
+        fmt (str): 'ndjson' 또는 'csv'
+
+    Returns:
+        bytes: 줄바꿈을 포함한 텍스트
+    """
+    # 단수를 첫 열로 붙여 행마다 한 번의 서식 적용으로 한 줄을 만듦
+    rows = np.hstack((np.arange(tables.start, tables.stop, dtype=np.int64)[:, None], block))
+    if fmt == "csv":
+        row_format = "%d"
+    else:
+        row_format = '{"table":%d,"products":[' + ",".join(["%d"] * block.shape[1]) + "]}"
+    buffer = io.StringIO()
+    np.savetxt(buffer, rows, fmt=row_format, delimiter=",")
+    return buffer.getvalue().encode()
+
+
+def _encode_python_chunk(tables: List[int], rows: List[array], fmt: str) -> bytes:
+    if fmt != "binary":
+        return format_rows(tables, rows, fmt).encode()
+    if sys.byteorder == "big":
+        for row in rows:
+            row.byteswap()
+    return b"".join(row.tobytes() for row in rows)
+
+
+def _encode_segment(table: int, columns: range, fmt: str, backend: str) -> bytes:
+    """
+    한 행의 일부 열 구간을 구분자 없이 바이트로 변환합니다.
+
+    Args:
+        table (int): 행의 단수
+        columns (range): 이번 구간의 곱하는 수 범위
+        fmt (str): 'ndjson', 'csv' 또는 'binary'
+        backend (str): 'numpy' 또는 'python'
+
+    Returns:
+        bytes: 쉼표로 이어진 곱 텍스트 또는 little-endian int64 바이트
+    """
+    if backend == "numpy":
+        segment = np.arange(columns.start, columns.stop, dtype=np.int64) * table
+        if fmt == "binary":
+            return segment.astype("<i8", copy=False).tobytes()
+        buffer = io.StringIO()
+        np.savetxt(buffer, segment[None, :], fmt="%d", delimiter=",")
+        return buffer.getvalue().rstrip("\n").encode()
+
+    segment = next(python_rows(range(table, table + 1), columns))
+    if fmt != "binary":
+        return ",".join(map(str, segment)).encode()
+    if sys.byteorder == "big":
+        segment.byteswap()
+    return segment.tobytes()
+
+
+def _iter_wide_rows(tables: range, multiplicands: range, fmt: str, backend: str) -> Iterator[bytes]:
+    """
+    열이 MATRIX_CHUNK_CELLS보다 많은 행렬을 행마다 열 구간으로 나눠 생성합니다 (iter_matrix와 같은 출력).
+
+    Args:
+        tables (range): 단수 범위 (행)
+        multiplicands (range): 곱하는 수 범위 (열)
+        fmt (str): 'ndjson', 'csv' 또는 'binary'
+        backend (str): 'numpy' 또는 'python'
+
+    Yields:
+        bytes: 응답 본문 조각 (각 조각은 최대 MATRIX_CHUNK_CELLS 셀)
+    """
+    for table in tables:
+        if fmt == "csv":
+            yield f"{table},".encode()
+        elif fmt == "ndjson":
+            yield f'{{"table":{table},"products":['.encode()
+        for start in range(0, len(multiplicands), MATRIX_CHUNK_CELLS):
+            if start and fmt != "binary":
+                yield b","
+            columns = multiplicands[start:start + MATRIX_CHUNK_CELLS]
+            yield _encode_segment(table, columns, fmt, backend)
+        if fmt == "csv":
+            yield b"\n"
+        elif fmt == "ndjson":
+            yield b"]}\n"
+
+
+def iter_matrix(tables: range, multiplicands: range, fmt: str, backend: str) -> Iterator[bytes]:
+    """
+    행렬을 묶음 단위로 계산해 지정한 형식의 바이트로 생성합니다.
+
+    Args:
+        tables (range): 단수 범위 (행)
+        multiplicands (range): 곱하는 수 범위 (열)
+        fmt (str): 'ndjson', 'csv' 또는 'binary' (행 우선 little-endian int64)
+        backend (str): 'numpy' 또는 'python'
+
+    Yields:
+        bytes: 응답 본문 조각
+    """
+    if fmt == "csv":
+        # Reason: 열이 아주 많아도 머리글 문자열 하나가 커지지 않도록 열 묶음 단위로 나눠 보냅니다.
+        yield b"table"
+        for start in range(0, len(multiplicands), MATRIX_CHUNK_CELLS):
+            columns = multiplicands[start:start + MATRIX_CHUNK_CELLS]
+            yield ("," + ",".join(map(str, columns))).encode()
+        yield b"\n"
+
+    if len(multiplicands) > MATRIX_CHUNK_CELLS:
+        # Reason: 한 행만으로 묶음 크기를 넘으면 행 묶음 대신 열 묶음으로 나눠 메모리와 서식 문자열 크기를 제한합니다.
+        yield from _iter_wide_rows(tables, multiplicands, fmt, backend)
+        return
+
+    rows_per_chunk = max(1, MATRIX_CHUNK_CELLS // len(multiplicands))
+    if backend == "numpy":
+        offset = 0
+        for block in numpy_blocks(tables, multiplicands, rows_per_chunk):
+            if fmt == "binary":
+                # Reason: 셀마다 파이썬 객체를 만들지 않도록 행렬 메모리를 그대로 바이트로 내보냅니다.
+                yield block.astype("<i8", copy=False).tobytes()
+            else:
+                # Reason: 셀마다 파이썬 정수와 문자열을 만들지 않도록 묶음 전체를 savetxt로 서식화합니다.
+                yield format_block(tables[offset:offset + len(block)], block, fmt)
+            offset += len(block)
+        return
+
+    chunk_tables: List[int] = []
+    chunk_rows: List[array] = []
+    for table, row in zip(tables, python_rows(tables, multiplicands)):
+        chunk_tables.append(table)
+        chunk_rows.append(row)
+        if len(chunk_rows) < rows_per_chunk:
+            continue
+        yield _encode_python_chunk(chunk_tables, chunk_rows, fmt)
+        chunk_tables, chunk_rows = [], []
+    if chunk_rows:
+        yield _encode_python_chunk(chunk_tables, chunk_rows, fmt)
+
+
+@router.get("/matrix")
+async def multiplication_matrix(
+    table_start: int = Query(1, ge=0, le=MAX_MATRIX_VALUE, description="시작 단수"),
+    table_end: int = Query(9, ge=0, le=MAX_MATRIX_VALUE, description="마지막 단수"),
+    multiplicand_start: int = Query(1, ge=0, le=MAX_MATRIX_VALUE, description="시작 곱하는 수"),
+    multiplicand_end: int = Query(9, ge=0, le=MAX_MATRIX_VALUE, description="마지막 곱하는 수"),
+    format: str = Query("ndjson", pattern="^(ndjson|csv|binary)$", description="ndjson, csv 또는 binary"),
+    backend: Optional[str] = Query(None, pattern="^(numpy|python)$", description="계산 방식 (기본값: NumPy가 있으면 numpy)"),
+) -> StreamingResponse:
+    """
+    단수 × 곱하는 수 범위의 곱셈표를 스트리밍합니다.
+
+    - ndjson: 한 줄에 `{"table": N, "products": [...]}`
+    - csv: 머리글(`table,곱하는 수...`) 다음 한 줄에 한 단수
+    - binary: 행 우선(row-major) little-endian int64 (모양은 X-Matrix-Shape 헤더)
+
+    Returns:
+        StreamingResponse: 곱셈표 스트림
+
+    Raises:
+        HTTPException: 범위가 올바르지 않거나 너무 크거나(python 계산의 텍스트 형식은 MAX_PYTHON_TEXT_CELLS),
+            NumPy가 없는데 numpy 계산을 요청한 경우
+    """
+    if table_start > table_end or multiplicand_start > multiplicand_end:
+        raise HTTPException(status_code=400, detail="시작 값은 마지막 값보다 클 수 없습니다.")
+    tables = range(table_start, table_end + 1)
+    multiplicands = range(multiplicand_start, multiplicand_end + 1)
+    cells = len(tables) * len(multiplicands)
+    if cells > MAX_MATRIX_CELLS:
+        raise HTTPException(status_code=413, detail=f"셀 수({cells})가 최대 {MAX_MATRIX_CELLS}개를 넘습니다.")
+    if backend == "numpy" and np is None:
+        raise HTTPException(status_code=400, detail="NumPy가 설치되어 있지 않습니다.")
+    backend = backend or ("numpy" if np is not None else "python")
+    if backend == "python" and format != "binary" and cells > MAX_PYTHON_TEXT_CELLS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"NumPy 없이 텍스트 형식으로 보낼 수 있는 셀 수는 최대 {MAX_PYTHON_TEXT_CELLS}개입니다 (binary 형식 사용).",
+        )
+
+    # 동기 생성기는 스레드 풀에서 실행되므로 큰 행렬을 계산해도 이벤트 루프를 막지 않음
+    return StreamingResponse(
+        iter_matrix(tables, multiplicands, format, backend),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "X-Matrix-Shape": f"{len(tables)},{len(multiplicands)}",
+            "X-Matrix-Backend": backend,
+        },
+    )
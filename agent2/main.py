@@ -3,28 +3,25 @@
 
 구구단 문제의 답변을 제공하는 에이전트 서버를 실행합니다.
 """
+import argparse
 import uvicorn
-import os
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
 # 현재 파일 위치를 기준으로 프로젝트 루트 경로를 추가
 sys.path.append(str(Path(__file__).parent.parent))
 
-# 공통 로깅 모듈 임포트
+# 공통 설정/로깅 모듈 임포트 (shared를 가져올 때 .env가 한 번 적용됨)
+from shared.config import get_settings
 from shared.logger import get_agent_logger
 
 # 로깅 설정
 logger = get_agent_logger("agent2")
 
-# .env 파일 로드 (있는 경우)
-load_dotenv()
-
-# 기본 포트 설정
-DEFAULT_PORT = 6001  # 6000에서 6001로 변경 (6001은 브라우저에서 안전하지 않은 포트로 간주됨)
-PORT = int(os.getenv("AGENT2_PORT", DEFAULT_PORT))
-HOST = os.getenv("AGENT2_HOST", "0.0.0.0")
+# 포트 설정 (환경 변수 AGENT2_HOST, AGENT2_PORT)
+settings = get_settings()
+PORT = settings.agent2_port
+HOST = settings.agent2_host
 
 
 def main():
@@ -42,4 +39,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="답변기 에이전트 서버 실행")
+    parser.add_argument("--startup-report", action="store_true", help="모듈별 가져오기/초기화 시간을 출력하고 종료")
+    args = parser.parse_args()
+
+    if args.startup_report:
+        from shared.startup import startup_report
+        print(startup_report("app.api", str(Path(__file__).parent)))
+    else:
+        main()
@@ -7,63 +7,39 @@ export const useAgentStore = defineStore('agents', () => {
   const agent1 = ref(false);
   const agent2 = ref(false);
   const isChecking = ref(false);
+  // 에이전트별 상세 상태 (응답 시간, 버전, 확인 시각)
+  const details = ref({});
+
+  // 슈퍼바이저가 캐시한 에이전트 상태 반영 (조회 응답과 웹소켓 agent_status 메시지에서 사용)
+  function applyStatus(agents) {
+    for (const [name, entry] of Object.entries(agents || {})) {
+      details.value = { ...details.value, [name]: entry };
+      if (name === 'agent1') {
+        agent1.value = entry.status === 'ok';
+      } else if (name === 'agent2') {
+        agent2.value = entry.status === 'ok';
+      }
+    }
+  }
 
   // 에이전트 상태 확인
+  // 각 에이전트를 직접 호출하지 않고 슈퍼바이저의 캐시된 상태를 한 번만 조회
   async function checkAgentsStatus() {
     isChecking.value = true;
-    
+
     try {
-      // 슈퍼바이저 상태 확인
-      await checkAgent('supervisor', 'http://localhost:8000/health');
+      const response = await axios.get('http://localhost:8000/health/agents', { timeout: 3000 });
+      supervisor.value = response.status === 200;
+      applyStatus(response.data.agents);
     } catch (error) {
+      // 슈퍼바이저가 응답하지 않으면 에이전트 상태도 알 수 없음
       supervisor.value = false;
-      console.error('슈퍼바이저 상태 확인 실패:', error);
-    }
-    
-    try {
-      // 에이전트1(문제 생성기) 상태 확인
-      await checkAgent('agent1', 'http://localhost:5000/health');
-    } catch (error) {
       agent1.value = false;
-      console.error('문제 생성기 상태 확인 실패:', error);
-    }
-    
-    try {
-      // 에이전트2(답변기) 상태 확인
-      await checkAgent('agent2', 'http://localhost:6001/health');
-    } catch (error) {
       agent2.value = false;
-      console.error('답변기 상태 확인 실패:', error);
+      console.error('에이전트 상태 확인 실패:', error);
     }
-    
-    isChecking.value = false;
-  }
 
-  // 개별 에이전트 상태 확인
-  async function checkAgent(agentName, url) {
-    try {
-      const response = await axios.get(url, { timeout: 10000 });
-      if (response.status === 200) {
-        if (agentName === 'supervisor') {
-          supervisor.value = true;
-        } else if (agentName === 'agent1') {
-          agent1.value = true;
-        } else if (agentName === 'agent2') {
-          agent2.value = true;
-        }
-        return true;
-      }
-    } catch (error) {
-      if (agentName === 'supervisor') {
-        supervisor.value = false;
-      } else if (agentName === 'agent1') {
-        agent1.value = false;
-      } else if (agentName === 'agent2') {
-        agent2.value = false;
-      }
-      throw error;
-    }
-    return false;
+    isChecking.value = false;
   }
 
   return {
@@ -71,6 +47,8 @@ export const useAgentStore = defineStore('agents', () => {
     agent1,
     agent2,
     isChecking,
+    details,
+    applyStatus,
     checkAgentsStatus
   };
-}); 
\ No newline at end of file
+});
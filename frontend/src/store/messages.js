@@ -1,11 +1,15 @@
 import { defineStore } from 'pinia';
 import { ref } from 'vue';
+import { useAgentStore } from './agents';
 
 export const useMessageStore = defineStore('messages', () => {
   const messages = ref([]);
   const isConnected = ref(false);
   const showExplanations = ref(true);
   let socket = null;
+  // 재연결 시 놓친 이벤트를 받기 위한 세션 정보
+  let sessionId = null;
+  let lastSeq = 0;
 
   // 초기화 시 로컬 스토리지에서 설명 표시 설정 로드
   try {
@@ -29,7 +33,11 @@ export const useMessageStore = defineStore('messages', () => {
     const wsProtocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
     const wsHost = 'localhost'; // 명시적으로 localhost 지정
     const wsPort = '8000';
-    const wsUrl = `${wsProtocol}//${wsHost}:${wsPort}/ws`;
+    let wsUrl = `${wsProtocol}//${wsHost}:${wsPort}/ws`;
+    if (sessionId) {
+      // 재연결: 마지막으로 받은 시퀀스 이후의 이벤트만 다시 받음
+      wsUrl += `?session_id=${encodeURIComponent(sessionId)}&last_seq=${lastSeq}`;
+    }
     
     socket = new WebSocket(wsUrl);
     console.log(`웹소켓 연결 URL: ${wsUrl}`);
@@ -50,6 +58,35 @@ export const useMessageStore = defineStore('messages', () => {
       console.log("메시지 수신:", event.data);
       try {
         const data = JSON.parse(event.data);
+
+        // 세션 핸드셰이크 메시지
+        if (data.type === 'session') {
+          if (!data.resumed) {
+            lastSeq = 0;
+          } else if (data.gap) {
+            addMessage({
+              type: 'system_message',
+              content: '연결이 끊긴 동안의 메시지 일부를 복구하지 못했습니다.',
+              sender: 'system',
+              timestamp: new Date().toISOString()
+            });
+          }
+          sessionId = data.session_id;
+          return;
+        }
+
+        // 이미 받은 이벤트는 무시
+        if (data.seq) {
+          if (data.seq <= lastSeq) return;
+          lastSeq = data.seq;
+        }
+
+        // 에이전트 상태 변경 알림은 채팅 메시지가 아니라 상태 표시에 반영
+        if (data.type === 'agent_status') {
+          useAgentStore().applyStatus(data.agents);
+          return;
+        }
+
         addMessage(data);
       } catch (e) {
         console.error('메시지 파싱 오류:', e);
@@ -5,65 +5,65 @@
 """
 import subprocess
 import sys
-import os
 import time
 import signal
-from dotenv import load_dotenv
 import argparse
 from pathlib import Path
 import platform
 import socket
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 # 현재 파일 위치를 기준으로 프로젝트 루트 경로를 추가
 sys.path.append(str(Path(__file__).parent))
 
-# 공통 로깅 모듈 임포트
+# 공통 설정/로깅 모듈 임포트 (shared를 가져올 때 .env가 한 번 적용됨)
+from shared.config import get_settings
 from shared.logger import get_agent_logger
+from shared.process_manager import ManagedProcess, ProcessSupervisor
 
 # 로깅 설정
 logger = get_agent_logger("main")
 
-# .env 파일 로드 (있는 경우)
-load_dotenv()
+# 공통 설정 (포트, 에이전트 URL)
+settings = get_settings()
 
-# 실행 프로세스 관리
-processes = []
+# 실행 프로세스 관리 (출력 수집, 비정상 종료 시 재시작)
+supervisor = ProcessSupervisor()
+
+# 준비 완료를 기다리는 전체 제한 시간 (초)
+STARTUP_TIMEOUT = settings.startup_timeout
+# /health 확인 간격 (초)
+HEALTH_POLL_INTERVAL = 0.1
+
+# 백엔드 컴포넌트 (이름, 실행 명령, 헬스 체크 URL)
+BACKEND_COMPONENTS = [
+    ("슈퍼바이저", ["python", "supervisor/main.py"],
+     f"http://localhost:{settings.supervisor_port}/health"),
+    ("문제 생성기", ["python", "agent1/main.py"],
+     f"{settings.agent1_url}/health"),
+    ("답변기", ["python", "agent2/main.py"],
+     f"{settings.agent2_url}/health"),
+]
 
 def run_command(command, name):
     """
-    명령어를 서브프로세스로 실행하고 프로세스 객체를 반환합니다.
+    명령어를 관리 대상 서브프로세스로 실행합니다.
+
+    출력은 백그라운드 스레드가 계속 읽어 `[이름]` 접두어를 붙인 로그로 전달하고,
+    프로세스가 비정상 종료하면 슈퍼바이저가 지수 백오프로 다시 실행합니다.
     
     Args:
         command (list): 실행할 명령어와 인자들
         name (str): 프로세스 이름
         
     Returns:
-        subprocess.Popen: 실행된 프로세스 객체
+        ManagedProcess: 실행된 프로세스 객체 (실패하면 None)
     """
-    system = platform.system()
-    
     try:
-        if system == "Windows":
-            # Windows에서는 새 콘솔 창에서 실행 (프로세스 분리)
-            process = subprocess.Popen(
-                command,
-                creationflags=subprocess.CREATE_NEW_CONSOLE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                universal_newlines=True,
-            )
-        else:
-            # Linux, MacOS에서는 같은 터미널에서 실행하되 출력 파이프
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                universal_newlines=True,
-            )
-        
-        logger.info(f"{name} 프로세스 시작 (PID: {process.pid})")
+        process = ManagedProcess(name, command)
+        process.start()
+        supervisor.add(process)
         return process
     
     except Exception as e:
@@ -71,6 +71,83 @@ def run_command(command, name):
         return None
 
 
+def probe_health(url, timeout=1.0):
+    """
+    헬스 체크 URL이 200으로 응답하는지 확인합니다.
+
+    Args:
+        url (str): 헬스 체크 URL
+        timeout (float): 요청 제한 시간 (초)
+
+    Returns:
+        bool: 200으로 응답하면 True
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+def wait_until_ready(name, url, process, started, deadline, probe=probe_health):
+    """
+    컴포넌트의 /health가 응답할 때까지 기다립니다.
+
+    Args:
+        name (str): 컴포넌트 이름
+        url (str): 헬스 체크 URL
+        process (ManagedProcess): 컴포넌트 프로세스
+        started (float): 프로세스 시작 시각 (time.monotonic 기준)
+        deadline (float): 대기 마감 시각 (time.monotonic 기준)
+        probe (Callable[[str], bool]): 헬스 체크 함수
+
+    Returns:
+        Optional[float]: 시작부터 준비 완료까지 걸린 시간 (초), 실패하면 None
+    """
+    while time.monotonic() < deadline:
+        if probe(url):
+            return time.monotonic() - started
+        if process.poll() is not None:
+            logger.error(f"{name} 프로세스가 준비 전에 종료되었습니다. (종료 코드: {process.returncode})")
+            return None
+        time.sleep(HEALTH_POLL_INTERVAL)
+    logger.error(f"{name}이(가) 제한 시간 안에 준비되지 않았습니다. ({url})")
+    return None
+
+
+def start_backends(timeout=STARTUP_TIMEOUT):
+    """
+    백엔드 컴포넌트를 동시에 실행하고 모두 준비될 때까지 기다립니다.
+
+    Args:
+        timeout (float): 전체 대기 제한 시간 (초)
+
+    Returns:
+        bool: 모든 컴포넌트가 준비되었으면 True
+    """
+    launched = []
+    for name, command, url in BACKEND_COMPONENTS:
+        started = time.monotonic()
+        process = run_command(command, name)
+        if process is None:
+            return False
+        launched.append((name, url, process, started))
+
+    # Reason: 고정 대기 대신 각 컴포넌트의 /health를 동시에 확인하므로 실제 부팅 시간만큼만 기다립니다.
+    deadline = time.monotonic() + timeout
+    with ThreadPoolExecutor(max_workers=len(launched)) as executor:
+        futures = [
+            (name, executor.submit(wait_until_ready, name, url, process, started, deadline))
+            for name, url, process, started in launched
+        ]
+        elapsed = [(name, future.result()) for name, future in futures]
+
+    for name, seconds in elapsed:
+        if seconds is not None:
+            logger.info(f"⏱️  {name} 준비 완료 ({seconds:.2f}초)")
+    return all(seconds is not None for _, seconds in elapsed)
+
+
 def check_port_in_use(port):
     """
     지정된 포트가 이미 사용 중인지 확인합니다.
@@ -112,7 +189,7 @@ def start_all():
     logger.info("🚀 구구단 시스템 전체 실행을 시작합니다...")
     
     # 포트 사용 중인지 확인 및 프로세스 종료
-    ports = [8000, 5000, 6001]
+    ports = [settings.supervisor_port, settings.agent1_port, settings.agent2_port]
     for port in ports:
         if check_port_in_use(port):
             logger.warning(f"포트 {port}가 이미 사용 중입니다. 해당 프로세스를 종료합니다.")
@@ -120,34 +197,23 @@ def start_all():
             time.sleep(1)  # 프로세스가 완전히 종료되도록 대기
     
     try:
-        # 슈퍼바이저 서버 실행
-        supervisor = run_command(["python", "supervisor/main.py"], "슈퍼바이저")
-        if supervisor:
-            processes.append(supervisor)
-            time.sleep(2)  # 슈퍼바이저가 먼저 시작되도록 대기 시간 증가
+        startup_started = time.monotonic()
         
-        # 에이전트1 (문제 생성기) 실행
-        agent1 = run_command(["python", "agent1/main.py"], "문제 생성기")
-        if agent1:
-            processes.append(agent1)
-            time.sleep(2)
-        
-        # 에이전트2 (답변기) 실행
-        agent2 = run_command(["python", "agent2/main.py"], "답변기")
-        if agent2:
-            processes.append(agent2)
-            time.sleep(2)
-        
-        # 프론트엔드 실행 (개발 서버)
+        # 프론트엔드 실행 (개발 서버, 백엔드와 동시에 시작)
         system = platform.system()
         if system == "Windows":
             frontend_cmd = ["cmd", "/c", "cd", "frontend", "&&", "npm", "run", "dev"]
         else:
             frontend_cmd = ["sh", "-c", "cd frontend && npm run dev"]
             
-        frontend = run_command(frontend_cmd, "프론트엔드")
-        if frontend:
-            processes.append(frontend)
+        run_command(frontend_cmd, "프론트엔드")
+        
+        # 슈퍼바이저, 문제 생성기, 답변기를 동시에 실행하고 준비될 때까지 대기
+        if not start_backends():
+            logger.error("❌ 일부 컴포넌트가 준비되지 않아 시스템을 종료합니다.")
+            cleanup()
+            sys.exit(1)
+        logger.info(f"백엔드 준비 완료: 총 {time.monotonic() - startup_started:.2f}초")
         
         logger.info("✅ 모든 컴포넌트가 실행되었습니다!")
         logger.info("📊 슈퍼바이저: http://localhost:8000")
@@ -156,9 +222,8 @@ def start_all():
         logger.info("🖥️  프론트엔드: http://localhost:3000 또는 http://localhost:5173")
         logger.info("종료하려면 Ctrl+C를 누르세요...")
         
-        # 메인 프로세스가 종료되지 않도록 대기
-        for process in processes:
-            process.wait()
+        # 종료 요청이 올 때까지 프로세스를 감시하며 비정상 종료한 프로세스를 다시 실행
+        supervisor.run_forever()
             
     except KeyboardInterrupt:
         logger.info("👋 사용자에 의해 프로그램이 종료됩니다...")
@@ -170,18 +235,8 @@ def cleanup():
     모든 서브프로세스 종료 처리
     """
     logger.info("🧹 실행 중인 모든 프로세스를 종료합니다...")
-    
-    for process in processes:
-        if process and process.poll() is None:  # 프로세스가 여전히 실행 중인지 확인
-            try:
-                # Unix/Windows 호환 종료 처리
-                if platform.system() == "Windows":
-                    process.terminate()
-                else:
-                    os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                logger.info(f"PID {process.pid} 종료 요청 전송")
-            except Exception as e:
-                logger.error(f"프로세스 종료 오류: {e}")
+    supervisor.stop_all()
+    supervisor.report()
 
 
 if __name__ == "__main__":
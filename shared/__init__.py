@@ -1,3 +1,10 @@
 """
 구구단 프로젝트 공유 모듈 패키지
-""" 
\ No newline at end of file
+"""
+from shared.config import load_env
+
+# 에이전트 버전 (/health 응답에 포함)
+__version__ = "0.1.0"
+
+# Reason: 공유 모듈은 가져올 때 환경 변수 상수를 읽으므로 그보다 먼저 .env를 한 번 적용합니다.
+load_env()
@@ -0,0 +1,29 @@
+"""
+관리자 엔드포인트 인증 모듈
+
+프로파일링, 메모리 스냅샷 등 운영용 엔드포인트는 `X-Admin-Token` 헤더가
+ADMIN_TOKEN 환경 변수와 일치할 때만 허용합니다. ADMIN_TOKEN이 없으면 비활성화됩니다.
+"""
+import hmac
+import os
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """
+    관리자 토큰을 검증하는 FastAPI 의존성
+
+    Args:
+        x_admin_token (Optional[str]): `X-Admin-Token` 헤더 값
+
+    Raises:
+        HTTPException: 관리자 엔드포인트가 비활성화되었거나 토큰이 일치하지 않는 경우
+    """
+    # Reason: 테스트나 실행 중에 토큰을 바꿀 수 있도록 요청마다 환경 변수를 읽습니다.
+    admin_token = os.getenv("ADMIN_TOKEN")
+    if not admin_token:
+        raise HTTPException(status_code=403, detail="관리자 엔드포인트가 비활성화되어 있습니다. (ADMIN_TOKEN 미설정)")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(status_code=401, detail="관리자 토큰이 올바르지 않습니다.")
@@ -0,0 +1,241 @@
+"""
+공통 설정 모듈
+
+.env 파일은 프로세스당 한 번만 읽고, 에이전트 주소와 포트부터 로그·추적·작업 조정값까지 모든 환경 변수 설정을
+하나의 설정 객체로 제공합니다. 각 모듈의 설정 상수는 이 객체에서 값을 가져오며, 시작 시간 보고서(`--startup-report`)에도 표시됩니다.
+"""
+import os
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+
+# 프로젝트 루트 디렉토리
+ROOT_DIR = Path(__file__).parent.parent
+
+# 답변기의 묶음 설명 LLM 호출 제한 시간 (초)
+EXPLANATION_LLM_TIMEOUT = 30.0
+# 설명 생성을 기다리는 에이전트 호출에 LLM 제한 시간 외에 더하는 여유 시간 (초)
+AGENT_REQUEST_MARGIN = 10.0
+
+_env_loaded = False
+
+
+def load_env():
+    """
+    프로젝트 루트의 .env 파일을 환경 변수로 적용합니다 (이미 설정된 값은 유지).
+
+    여러 번 호출해도 파일은 한 번만 읽습니다.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    # Reason: dotenv는 설정을 읽을 때만 필요하므로 함수 안에서 가져옵니다.
+    from dotenv import load_dotenv
+
+    load_dotenv(ROOT_DIR / ".env")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    에이전트 공통 설정
+
+    모든 환경 변수 설정을 한 곳에서 읽습니다. 각 모듈의 설정 상수(예: `tracing.TRACE_SAMPLE_RATE`)는
+    이 객체의 값을 가져온 것입니다.
+
+    Attributes:
+        supervisor_host (str): 슈퍼바이저 바인드 주소
+        supervisor_port (int): 슈퍼바이저 포트
+        agent1_host (str): 문제 생성기 바인드 주소
+        agent1_port (int): 문제 생성기 포트
+        agent2_host (str): 답변기 바인드 주소
+        agent2_port (int): 답변기 포트
+        agent1_url (str): 다른 에이전트가 문제 생성기를 호출하는 기본 URL
+        agent2_url (str): 다른 에이전트가 답변기를 호출하는 기본 URL
+        anthropic_api_key (Optional[str]): Claude API 키
+        topology (str): 슈퍼바이저의 기본 답변 요청 경로 ('relay' 또는 'direct')
+        startup_timeout (float): run.py가 백엔드 준비를 기다리는 전체 제한 시간 (초)
+        child_output_rate (float): 자식 프로세스 출력을 로그로 전달하는 초당 줄 수
+        child_output_burst (int): 자식 프로세스 출력의 순간 최대 줄 수
+        log_dir (str): 에이전트 로그 디렉토리
+        log_batch_size (int): 로그 파일에 한 번에 쓰는 최대 레코드 수
+        log_flush_interval (float): 로그 파일 flush 간격 (초)
+        log_file_format (str): 로그 파일 형식 ('text' 또는 'json')
+        log_index_enabled (bool): 로그 인덱스(SQLite) 사용 여부
+        log_index_retention_hours (float): 로그 인덱스 보관 시간 (시간)
+        trace_sample_rate (float): 추적 샘플링 비율 (0~1)
+        trace_buffer_size (int): 메모리에 보관하는 최대 추적 구간 수
+        trace_export (str): 추적 구간 내보내기 방식 ('memory' 또는 'jsonl')
+        profile_sample_interval (float): 샘플링 프로파일러 간격 (초)
+        profile_p99_threshold (float): 자동 프로파일링을 시작하는 p99 지연 시간 (초, 0이면 끔)
+        profile_check_interval (float): p99 확인 간격 (초)
+        profile_auto_seconds (float): 자동 프로파일링 시간 (초)
+        profile_cooldown (float): 자동 프로파일링 사이 최소 간격 (초)
+        loop_monitor_enabled (bool): 이벤트 루프 감시 사용 여부
+        loop_monitor_interval (float): 이벤트 루프 지연 측정 간격 (초)
+        loop_slow_threshold (float): 느린 콜백으로 기록하는 루프 지연 (초)
+        tracemalloc_frames (int): 메모리 할당 추적 스택 깊이
+        session_buffer_size (int): 웹소켓 세션마다 보관하는 재전송 메시지 수
+        session_ttl (float): 끊긴 웹소켓 세션을 보관하는 시간 (초)
+        result_cache_max_bytes (int): 결과 캐시 최대 크기 (바이트)
+        agent_health_interval (float): 에이전트 상태 확인 간격 (초)
+        agent_health_timeout (float): 에이전트 상태 확인 제한 시간 (초)
+        supervisor_outbound_concurrency (int): 슈퍼바이저의 에이전트 동시 호출 수
+        agent1_relay_concurrency (int): 문제 생성기의 답변기 동시 호출 수
+        agent1_relay_mode (str): 문제 생성기 중계 모드 ('passthrough' 또는 'validate')
+        llm_concurrency (int): 답변기의 LLM 동시 호출 수
+        explanation_mode (str): 설명 생성 방식 ('single' 또는 'batch')
+        explanation_batch_window (float): 설명 요청을 모으는 시간 (초)
+        explanation_batch_max (int): 한 번에 묶는 최대 계산 수
+        job_dir (Path): 일괄 작업 결과 디렉토리
+        job_max_active (int): 동시에 실행하는 최대 일괄 작업 수
+        job_max_items (int): 작업 하나에서 허용하는 최대 답변 요청 수
+        job_flush_rows (int): 결과 파일에 한 번에 기록하는 최대 행 수
+        job_flush_interval (float): 결과 파일 기록 간격 (초)
+    """
+    supervisor_host: str = "0.0.0.0"
+    supervisor_port: int = 8000
+    agent1_host: str = "0.0.0.0"
+    agent1_port: int = 5000
+    agent2_host: str = "0.0.0.0"
+    agent2_port: int = 6001
+    agent1_url: str = "http://localhost:5000"
+    agent2_url: str = "http://localhost:6001"
+    anthropic_api_key: Optional[str] = None
+    topology: str = "relay"
+    startup_timeout: float = 30.0
+    child_output_rate: float = 200.0
+    child_output_burst: int = 500
+    log_dir: str = "logs"
+    log_batch_size: int = 256
+    log_flush_interval: float = 0.5
+    log_file_format: str = "text"
+    log_index_enabled: bool = False
+    log_index_retention_hours: float = 72.0
+    trace_sample_rate: float = 0.1
+    trace_buffer_size: int = 2000
+    trace_export: str = "memory"
+    profile_sample_interval: float = 0.005
+    profile_p99_threshold: float = 0.0
+    profile_check_interval: float = 10.0
+    profile_auto_seconds: float = 5.0
+    profile_cooldown: float = 300.0
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval: float = 0.1
+    loop_slow_threshold: float = 0.1
+    tracemalloc_frames: int = 25
+    session_buffer_size: int = 500
+    session_ttl: float = 300.0
+    result_cache_max_bytes: int = 16 * 1024 * 1024
+    agent_health_interval: float = 5.0
+    agent_health_timeout: float = 2.0
+    supervisor_outbound_concurrency: int = 64
+    agent1_relay_concurrency: int = 32
+    agent1_relay_mode: str = "passthrough"
+    llm_concurrency: int = 8
+    explanation_mode: str = "single"
+    explanation_batch_window: float = 0.05
+    explanation_batch_max: int = 9
+    job_dir: Path = ROOT_DIR / "jobs"
+    job_max_active: int = 2
+    job_max_items: int = 100_000
+    job_flush_rows: int = 256
+    job_flush_interval: float = 1.0
+
+
+# 설정 보고서에서 값을 가리는 항목
+SECRET_FIELDS = ("anthropic_api_key",)
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    환경 변수(.env 포함)에서 설정을 읽어 반환합니다.
+
+    Returns:
+        Settings: 프로세스 전역 설정 객체 (처음 호출할 때 한 번 생성)
+    """
+    load_env()
+    agent1_port = int(os.getenv("AGENT1_PORT", 5000))
+    agent2_port = int(os.getenv("AGENT2_PORT", 6001))
+    return Settings(
+        supervisor_host=os.getenv("SUPERVISOR_HOST", "0.0.0.0"),
+        supervisor_port=int(os.getenv("SUPERVISOR_PORT", 8000)),
+        agent1_host=os.getenv("AGENT1_HOST", "0.0.0.0"),
+        agent1_port=agent1_port,
+        agent2_host=os.getenv("AGENT2_HOST", "0.0.0.0"),
+        agent2_port=agent2_port,
+        agent1_url=os.getenv("AGENT1_URL", f"http://localhost:{agent1_port}"),
+        agent2_url=os.getenv("AGENT2_URL", f"http://localhost:{agent2_port}"),
+        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY") or None,
+        topology=os.getenv("GUGUDAN_TOPOLOGY", "relay"),
+        startup_timeout=float(os.getenv("STARTUP_TIMEOUT", 30)),
+        child_output_rate=float(os.getenv("CHILD_OUTPUT_RATE", 200)),
+        child_output_burst=int(os.getenv("CHILD_OUTPUT_BURST", 500)),
+        log_dir=os.getenv("LOG_DIR", "logs"),
+        log_batch_size=int(os.getenv("LOG_BATCH_SIZE", 256)),
+        log_flush_interval=float(os.getenv("LOG_FLUSH_INTERVAL", 0.5)),
+        log_file_format=os.getenv("LOG_FILE_FORMAT", "text"),
+        log_index_enabled=os.getenv("LOG_INDEX", "0") == "1",
+        log_index_retention_hours=float(os.getenv("LOG_INDEX_RETENTION_HOURS", 72)),
+        trace_sample_rate=float(os.getenv("TRACE_SAMPLE_RATE", 0.1)),
+        trace_buffer_size=int(os.getenv("TRACE_BUFFER_SIZE", 2000)),
+        trace_export=os.getenv("TRACE_EXPORT", "memory"),
+        profile_sample_interval=float(os.getenv("PROFILE_SAMPLE_INTERVAL", 0.005)),
+        profile_p99_threshold=float(os.getenv("PROFILE_P99_THRESHOLD", 0)),
+        profile_check_interval=float(os.getenv("PROFILE_CHECK_INTERVAL", 10)),
+        profile_auto_seconds=float(os.getenv("PROFILE_AUTO_SECONDS", 5)),
+        profile_cooldown=float(os.getenv("PROFILE_COOLDOWN", 300)),
+        loop_monitor_enabled=os.getenv("LOOP_MONITOR", "1") != "0",
+        loop_monitor_interval=float(os.getenv("LOOP_MONITOR_INTERVAL", 0.1)),
+        loop_slow_threshold=float(os.getenv("LOOP_SLOW_THRESHOLD", 0.1)),
+        tracemalloc_frames=int(os.getenv("TRACEMALLOC_FRAMES", 25)),
+        session_buffer_size=int(os.getenv("SESSION_BUFFER_SIZE", 500)),
+        session_ttl=float(os.getenv("SESSION_TTL", 300)),
+        result_cache_max_bytes=int(os.getenv("RESULT_CACHE_MAX_BYTES", 16 * 1024 * 1024)),
+        agent_health_interval=float(os.getenv("AGENT_HEALTH_INTERVAL", 5)),
+        agent_health_timeout=float(os.getenv("AGENT_HEALTH_TIMEOUT", 2)),
+        supervisor_outbound_concurrency=int(os.getenv("SUPERVISOR_OUTBOUND_CONCURRENCY", 64)),
+        agent1_relay_concurrency=int(os.getenv("AGENT1_RELAY_CONCURRENCY", 32)),
+        agent1_relay_mode=os.getenv("AGENT1_RELAY_MODE", "passthrough"),
+        llm_concurrency=int(os.getenv("LLM_CONCURRENCY", 8)),
+        explanation_mode=os.getenv("EXPLANATION_MODE", "single"),
+        explanation_batch_window=float(os.getenv("EXPLANATION_BATCH_WINDOW", 0.05)),
+        explanation_batch_max=int(os.getenv("EXPLANATION_BATCH_MAX", 9)),
+        job_dir=Path(os.getenv("GUGUDAN_JOB_DIR", ROOT_DIR / "jobs")),
+        job_max_active=int(os.getenv("JOB_MAX_ACTIVE", 2)),
+        job_max_items=int(os.getenv("JOB_MAX_ITEMS", 100_000)),
+        job_flush_rows=int(os.getenv("JOB_FLUSH_ROWS", 256)),
+        job_flush_interval=float(os.getenv("JOB_FLUSH_INTERVAL", 1.0)),
+    )
+
+
+def format_settings(settings: Settings) -> List[str]:
+    """
+    설정 값을 보고서용 줄 목록으로 만듭니다 (API 키 같은 비밀 값은 가림).
+
+    Args:
+        settings (Settings): 표시할 설정
+
+    Returns:
+        List[str]: '이름 = 값' 형식의 줄 목록 (필드 선언 순서)
+    """
+    lines = []
+    for field in fields(settings):
+        value = getattr(settings, field.name)
+        if field.name in SECRET_FIELDS and value:
+            value = "***"
+        lines.append(f"  {field.name:<34} = {value}")
+    return lines
+
+
+def agent_request_timeout() -> float:
+    """
+    설명 생성을 기다리는 에이전트 호출(슈퍼바이저 → 에이전트, 문제 생성기 → 답변기)의 제한 시간을 계산합니다.
+
+    Returns:
+        float: 묶음 대기 시간(EXPLANATION_BATCH_WINDOW)과 LLM 호출 제한 시간에 여유를 더한 값 (초)
+    """
+    return get_settings().explanation_batch_window + EXPLANATION_LLM_TIMEOUT + AGENT_REQUEST_MARGIN
@@ -0,0 +1,104 @@
+"""
+구구단 진행 규칙 모듈
+
+구구단 단수, 종료 조건, ×9 제한으로 결정되는 문제 순서를 정의합니다.
+문제 생성기와 슈퍼바이저가 같은 규칙을 공유하기 위해 사용합니다.
+"""
+import re
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+# 기본 종료 조건 (N×9까지 진행)
+MAX_MULTIPLICAND = 9
+# 문자열 문제 형식 (예: '3×4=')
+PROBLEM_PATTERN = re.compile(r"(\d+)×(\d+)=")
+
+
+class PlannedStep(NamedTuple):
+    """구구단 실행 계획의 한 단계"""
+    multiplier: int
+    multiplicand: int
+    answer: int
+    final: bool
+
+    @property
+    def problem(self) -> str:
+        """
+        단계의 문제 문자열
+
+        Returns:
+            str: 구구단 문제 (예: '3×4=')
+        """
+        return format_problem(self.multiplier, self.multiplicand)
+
+
+def format_problem(multiplier: int, multiplicand: int) -> str:
+    """
+    구구단 문제 문자열을 생성합니다.
+
+    Args:
+        multiplier (int): 첫 번째 숫자 (N)
+        multiplicand (int): 두 번째 숫자 (X)
+
+    Returns:
+        str: 구구단 문제 (예: '3×4=')
+    """
+    return f"{multiplier}×{multiplicand}="
+
+
+def parse_problem(problem: str) -> Optional[Tuple[int, int]]:
+    """
+    구구단 문제 문자열에서 두 숫자를 꺼냅니다.
+
+    Args:
+        problem (str): 구구단 문제 (예: '3×4=')
+
+    Returns:
+        Optional[Tuple[int, int]]: (첫 번째 숫자, 두 번째 숫자) (형식이 맞지 않으면 None)
+    """
+    match = PROBLEM_PATTERN.match(problem)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def reaches_stop_value(answer: int, stop_value: Optional[int]) -> bool:
+    """
+    정답이 종료 조건 값에 도달했는지 확인합니다.
+
+    Args:
+        answer (int): 단계의 정답
+        stop_value (Optional[int]): 종료 조건 값
+
+    Returns:
+        bool: 종료 조건에 도달했으면 True
+    """
+    return bool(stop_value) and answer >= stop_value
+
+
+def iter_steps(
+    table: int,
+    stop_value: Optional[int] = None,
+    first: int = 1,
+    last: int = MAX_MULTIPLICAND,
+) -> Iterator[PlannedStep]:
+    """
+    구구단 실행 계획을 단계별로 생성합니다.
+
+    정답이 종료 조건 값에 도달하는 단계 또는 마지막 곱하는 수에서 멈추므로
+    실행하지 않을 단계는 만들지 않습니다.
+
+    Args:
+        table (int): 구구단 단수
+        stop_value (Optional[int]): 종료 조건 값
+        first (int): 시작 곱하는 수
+        last (int): 마지막 곱하는 수
+
+    Yields:
+        PlannedStep: 실행할 단계
+    """
+    for multiplicand in range(first, last + 1):
+        answer = table * multiplicand
+        final = multiplicand == last or reaches_stop_value(answer, stop_value)
+        yield PlannedStep(table, multiplicand, answer, final)
+        if final:
+            return
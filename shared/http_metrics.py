@@ -0,0 +1,83 @@
+"""
+HTTP 요청 메트릭 모듈
+
+엔드포인트별 요청 지연 시간을 기록하는 ASGI 미들웨어와,
+프로세스 메트릭 레지스트리를 Prometheus 텍스트 형식으로 제공하는 `/metrics` 엔드포인트를 앱에 추가합니다.
+"""
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+
+from shared.metrics import CONTENT_TYPE, REGISTRY, MetricsRegistry
+
+# 엔드포인트별 HTTP 요청 지연 시간 (응답 헤더 전송 시점까지)
+http_request_duration = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (초)",
+    ("method", "route", "status"),
+)
+
+
+class MetricsMiddleware:
+    """
+    엔드포인트별 요청 수, 상태 코드, 지연 시간을 기록하는 ASGI 미들웨어
+
+    경로 파라미터로 레이블 수가 늘어나지 않도록 실제 경로 대신 라우트 템플릿을 사용합니다.
+    """
+
+    def __init__(self, app):
+        """
+        MetricsMiddleware 초기화
+
+        Args:
+            app: 감쌀 ASGI 애플리케이션
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = "500"
+
+        async def send_wrapper(message):
+            nonlocal status, started
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+                # Reason: SSE 같은 스트리밍 응답은 본문이 끝나지 않으므로 헤더 전송 시점까지만 측정합니다.
+                record(time.perf_counter() - started)
+                started = None
+            await send(message)
+
+        def record(elapsed: float):
+            route = scope.get("route")
+            template = getattr(route, "path", "unmatched")
+            http_request_duration.labels(scope["method"], template, status).observe(elapsed)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if started is not None:
+                # 응답을 시작하기 전에 예외가 발생한 경우
+                record(time.perf_counter() - started)
+
+
+def instrument_app(app: FastAPI, registry: MetricsRegistry = REGISTRY):
+    """
+    앱에 요청 지연 시간 미들웨어와 `/metrics` 엔드포인트를 추가합니다.
+
+    Args:
+        app (FastAPI): 대상 FastAPI 앱
+        registry (MetricsRegistry): 출력할 메트릭 레지스트리
+    """
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        """
+        Prometheus 텍스트 형식의 메트릭 엔드포인트
+        """
+        return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,219 @@
+"""
+로그 인덱스 모듈
+
+구조화된 로그 레코드를 SQLite 사이드카 파일에 저장하여,
+로그 파일 전체를 훑지 않고 에이전트, 세션, 실행, 레벨, 시간 범위로 조회할 수 있게 합니다.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from shared.config import get_settings
+
+# 구조화 로그에 포함하는 추가 필드 (logger.info(..., extra={...})로 전달)
+STRUCTURED_FIELDS = ("session_id", "run_id", "hop", "latency_ms")
+# 인덱스에 보관하는 기간 (시간)
+RETENTION_HOURS = get_settings().log_index_retention_hours
+# 오래된 레코드를 정리하는 주기 (삽입 레코드 수)
+PRUNE_EVERY = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS log_records (
+    ts REAL NOT NULL,
+    agent TEXT NOT NULL,
+    level TEXT NOT NULL,
+    levelno INTEGER NOT NULL,
+    session_id TEXT,
+    run_id TEXT,
+    hop TEXT,
+    latency_ms REAL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_log_agent_ts ON log_records (agent, ts);
+CREATE INDEX IF NOT EXISTS idx_log_session_ts ON log_records (session_id, ts);
+CREATE INDEX IF NOT EXISTS idx_log_run_ts ON log_records (run_id, ts);
+CREATE INDEX IF NOT EXISTS idx_log_ts ON log_records (ts);
+"""
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """
+    로그 인덱스 데이터베이스에 연결하고 스키마를 준비합니다.
+
+    Args:
+        db_path (str): SQLite 파일 경로
+
+    Returns:
+        sqlite3.Connection: 데이터베이스 연결
+    """
+    conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
+    # Reason: 여러 에이전트 프로세스가 같은 파일에 쓰고 슈퍼바이저가 동시에 읽으므로 WAL 모드를 사용합니다.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    로그 레코드를 한 줄의 JSON으로 변환하는 포매터
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "agent": record.name,
+            "message": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class LogIndexHandler(logging.Handler):
+    """
+    로그 레코드를 모아 두었다가 flush할 때 SQLite 인덱스에 한 번에 저장하는 핸들러
+
+    BatchingQueueListener의 백그라운드 스레드에서 사용되므로 로그 호출 경로를 막지 않습니다.
+    """
+
+    def __init__(self, db_path: str, retention_hours: float = RETENTION_HOURS):
+        """
+        LogIndexHandler 초기화
+
+        Args:
+            db_path (str): SQLite 파일 경로
+            retention_hours (float): 레코드 보관 기간 (시간)
+        """
+        super().__init__()
+        self.db_path = db_path
+        self.retention_hours = retention_hours
+        self._rows: List[tuple] = []
+        self._conn: Optional[sqlite3.Connection] = None
+        self._inserted = 0
+        self._rows_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            row = (
+                record.created,
+                record.name,
+                record.levelname,
+                record.levelno,
+                getattr(record, "session_id", None),
+                getattr(record, "run_id", None),
+                getattr(record, "hop", None),
+                getattr(record, "latency_ms", None),
+                record.getMessage(),
+            )
+            with self._rows_lock:
+                self._rows.append(row)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self._rows_lock:
+            rows, self._rows = self._rows, []
+        if not rows:
+            return
+        try:
+            if self._conn is None:
+                self._conn = connect(self.db_path)
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO log_records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+            self._inserted += len(rows)
+            if self._inserted >= PRUNE_EVERY:
+                self._inserted = 0
+                with self._conn:
+                    self._conn.execute(
+                        "DELETE FROM log_records WHERE ts < ?",
+                        (time.time() - self.retention_hours * 3600,),
+                    )
+        except sqlite3.Error:
+            # 인덱스 저장 실패는 로그 파일 기록에 영향을 주지 않음
+            pass
+
+    def close(self):
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        super().close()
+
+
+def query_logs(
+    db_path: str,
+    agent: Optional[str] = None,
+    session_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    level: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    limit: int = 200,
+) -> List[Dict[str, Any]]:
+    """
+    로그 인덱스에서 조건에 맞는 레코드를 최신순으로 조회합니다.
+
+    Args:
+        db_path (str): SQLite 파일 경로
+        agent (Optional[str]): 에이전트(로거) 이름
+        session_id (Optional[str]): 세션 ID
+        run_id (Optional[str]): 실행 ID
+        level (Optional[str]): 최소 로그 레벨 (예: 'WARNING')
+        since (Optional[float]): 시작 시각 (유닉스 타임스탬프)
+        until (Optional[float]): 종료 시각 (유닉스 타임스탬프)
+        limit (int): 최대 레코드 수
+
+    Returns:
+        List[Dict[str, Any]]: 조회된 로그 레코드 목록
+    """
+    if not os.path.exists(db_path):
+        return []
+
+    conditions, params = [], []
+    for column, value in (("agent", agent), ("session_id", session_id), ("run_id", run_id)):
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+    if level is not None:
+        levelno = logging.getLevelName(level.upper())
+        conditions.append("levelno >= ?")
+        params.append(levelno if isinstance(levelno, int) else 0)
+    if since is not None:
+        conditions.append("ts >= ?")
+        params.append(since)
+    if until is not None:
+        conditions.append("ts <= ?")
+        params.append(until)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    conn = sqlite3.connect(db_path, timeout=5.0)
+    try:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            f"SELECT ts, agent, level, session_id, run_id, hop, latency_ms, message "
+            f"FROM log_records {where} ORDER BY ts DESC LIMIT ?",
+            (*params, limit),
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {
+            **{key: row[key] for key in row.keys() if row[key] is not None},
+            "ts": datetime.fromtimestamp(row["ts"]).isoformat(timespec="milliseconds"),
+        }
+        for row in rows
+    ]
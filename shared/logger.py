@@ -1,59 +1,235 @@
+"""
+공통 로깅 모듈
+
+로그 호출 시점에는 레코드를 큐에 넣기만 하고, 실제 파일/콘솔 기록은 백그라운드
+스레드(QueueListener)가 모아서 처리합니다. 이벤트 루프에서 로그를 남겨도
+파일 I/O로 블로킹되지 않습니다.
+"""
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Tuple
+
+from shared.config import get_settings
+from shared.log_index import JsonFormatter, LogIndexHandler
+
+# 에이전트 로그 디렉토리 (테스트에서는 임시 디렉토리로 바꿈)
+LOG_DIR = get_settings().log_dir
+# 로그 형식
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+# 한 번에 모아서 기록할 최대 레코드 수
+BATCH_SIZE = get_settings().log_batch_size
+# 새 레코드가 없을 때 버퍼를 비우는 간격 (초)
+FLUSH_INTERVAL = get_settings().log_flush_interval
+# 로그 파일 형식 ('text' 또는 'json')
+LOG_FILE_FORMAT = get_settings().log_file_format
+# SQLite 로그 인덱스 사용 여부 (LOG_INDEX=1일 때만 사용)
+LOG_INDEX_ENABLED = get_settings().log_index_enabled
+# SQLite 로그 인덱스 파일 이름 (로그 디렉토리 기준)
+LOG_INDEX_FILE = "index.sqlite3"
+
+# 로거 이름 -> (큐 핸들러, 리스너)
+_listeners: Dict[str, Tuple[QueueHandler, QueueListener]] = {}
+_lock = threading.Lock()
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    레코드마다 flush하지 않는 스트림 핸들러
+
+    flush는 BatchingQueueListener가 배치 단위로 호출합니다.
+    """
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    레코드마다 flush하지 않는 로테이팅 파일 핸들러
+
+    flush는 BatchingQueueListener가 배치 단위로 호출합니다.
+    """
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    큐에 쌓인 레코드를 배치로 처리하고 배치마다 한 번만 flush하는 리스너
+    """
+
+    def __init__(self, log_queue, *handlers, batch_size: int = BATCH_SIZE, flush_interval: float = FLUSH_INTERVAL):
+        """
+        BatchingQueueListener 초기화
 
-def setup_logger(name, log_file, level=logging.INFO):
+        Args:
+            log_queue (queue.Queue): 로그 레코드 큐
+            *handlers (logging.Handler): 레코드를 기록할 핸들러
+            batch_size (int): 한 번에 처리할 최대 레코드 수
+            flush_interval (float): 큐가 비어 있을 때 대기하는 최대 시간 (초)
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+    def flush(self):
+        """
+        모든 핸들러의 버퍼를 비웁니다.
+        """
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except Exception:
+                # 닫힌 스트림 등으로 flush에 실패해도 리스너 스레드는 계속 동작
+                pass
+
+    def _monitor(self):
+        # Reason: 기본 QueueListener는 레코드마다 핸들러가 flush하므로, 배치 단위로 모아서 한 번만 flush합니다.
+        q = self.queue
+        while True:
+            try:
+                record = q.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = [record]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                    continue
+                self.handle(record)
+            self.flush()
+            if stop:
+                break
+
+
+def setup_logger(name, log_file, level=logging.INFO, file_format=None, index=None):
     """
     로깅 설정을 구성하는 함수
-    
+
+    같은 이름으로 여러 번 호출해도 핸들러는 한 번만 추가됩니다.
+
     Args:
         name (str): 로거 이름
         log_file (str): 로그 파일 경로
         level (int): 로깅 레벨
-        
+        file_format (str, optional): 로그 파일 형식 ('text' 또는 'json', 기본값은 LOG_FILE_FORMAT)
+        index (bool, optional): SQLite 로그 인덱스 사용 여부 (기본값은 LOG_INDEX_ENABLED)
+
     Returns:
         logging.Logger: 설정된 로거 객체
     """
-    # 로그 디렉토리 생성
-    log_dir = os.path.dirname(log_file)
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-    # 로거 설정
     logger = logging.getLogger(name)
-    logger.setLevel(level)
-    
-    # 파일 핸들러 (로그 파일로 출력)
-    file_handler = RotatingFileHandler(
-        log_file, 
-        maxBytes=10*1024*1024,  # 10MB
-        backupCount=5
-    )
-    file_formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
-    file_handler.setFormatter(file_formatter)
-    
-    # 콘솔 핸들러 (터미널에도 출력)
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
-    console_handler.setFormatter(console_formatter)
-    
-    # 핸들러 추가
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+
+    with _lock:
+        if name in _listeners:
+            return logger
+
+        # 로그 디렉토리 생성
+        log_dir = os.path.dirname(log_file)
+        if log_dir and not os.path.exists(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
+
+        logger.setLevel(level)
+        formatter = logging.Formatter(LOG_FORMAT)
+
+        # 파일 핸들러 (로그 파일로 출력)
+        file_handler = BufferedRotatingFileHandler(
+            log_file,
+            maxBytes=10*1024*1024,  # 10MB
+            backupCount=5,
+            encoding="utf-8",
+        )
+        file_format = file_format or LOG_FILE_FORMAT
+        file_handler.setFormatter(JsonFormatter() if file_format == "json" else formatter)
+
+        # 콘솔 핸들러 (터미널에도 출력)
+        console_handler = BufferedStreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+
+        # 로그 호출 시에는 큐에 넣기만 하고 기록은 백그라운드 리스너가 처리
+        log_queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        handlers = [file_handler, console_handler]
+        if LOG_INDEX_ENABLED if index is None else index:
+            # 조회용 인덱스 (배치 flush마다 SQLite에 한 번에 저장)
+            handlers.append(LogIndexHandler(os.path.join(log_dir or ".", LOG_INDEX_FILE)))
+        listener = BatchingQueueListener(log_queue, *handlers)
+        listener.start()
+
+        logger.addHandler(queue_handler)
+        _listeners[name] = (queue_handler, listener)
+
     return logger
 
+
+def shutdown_logger(name):
+    """
+    로거의 백그라운드 리스너를 멈추고 남은 로그를 모두 기록합니다.
+
+    Args:
+        name (str): 로거 이름
+    """
+    with _lock:
+        entry = _listeners.pop(name, None)
+    if entry is None:
+        return
+
+    queue_handler, listener = entry
+    logging.getLogger(name).removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def shutdown_logging():
+    """
+    모든 로거의 백그라운드 리스너를 멈추고 남은 로그를 기록합니다.
+    """
+    for name in list(_listeners):
+        shutdown_logger(name)
+
+
+atexit.register(shutdown_logging)
+
+
 def get_agent_logger(agent_name):
     """
     에이전트용 로거를 반환하는 함수
-    
+
     Args:
         agent_name (str): 에이전트 이름 ('supervisor', 'agent1', 'agent2')
-        
+
     Returns:
         logging.Logger: 설정된 로거 객체
     """
-    # 실행 폴더 기준으로 로그 파일 경로 설정
-    log_file = os.path.join('logs', f'{agent_name}.log')
-    return setup_logger(agent_name, log_file) 
\ No newline at end of file
+    # LOG_DIR(기본값: 실행 폴더의 logs) 기준으로 로그 파일 경로 설정
+    log_file = os.path.join(LOG_DIR, f'{agent_name}.log')
+    return setup_logger(agent_name, log_file)
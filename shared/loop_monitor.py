@@ -0,0 +1,181 @@
+"""
+이벤트 루프 지연 감시 모듈
+
+이벤트 루프의 스케줄링 지연(lag)을 계속 측정해 메트릭으로 내보내고,
+루프가 임계값보다 오래 멈추면 감시 스레드가 그 순간의 루프 스레드 스택을 기록합니다.
+한 세션의 느린 콜백이 모든 세션의 지연으로 나타나는 문제를 찾는 데 사용합니다.
+"""
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional
+
+from fastapi import APIRouter, Depends, FastAPI
+
+from shared.admin import require_admin
+from shared.config import get_settings
+from shared.logger import get_agent_logger
+from shared.metrics import REGISTRY
+
+# 감시 사용 여부
+LOOP_MONITOR_ENABLED = get_settings().loop_monitor_enabled
+# 지연 측정 간격 (초)
+LOOP_MONITOR_INTERVAL = get_settings().loop_monitor_interval
+# 느린 콜백으로 판단하는 루프 정지 시간 (초)
+LOOP_SLOW_THRESHOLD = get_settings().loop_slow_threshold
+# 보관하는 최근 정지 기록 수
+LOOP_STALL_HISTORY = 50
+# 감시 스레드 종료를 기다리는 최대 시간 (초)
+WATCHDOG_JOIN_TIMEOUT = 1.0
+
+loop_lag = REGISTRY.histogram(
+    "event_loop_lag_seconds",
+    "이벤트 루프 스케줄링 지연 (초)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+slow_callbacks = REGISTRY.counter(
+    "event_loop_slow_callbacks_total",
+    "임계값보다 오래 이벤트 루프를 막은 콜백 수",
+)
+
+
+class LoopMonitor:
+    """
+    이벤트 루프 지연 측정 작업과 정지 감시 스레드
+
+    측정 작업은 일정 간격으로 잠들었다 깨어나며 예정보다 늦은 만큼을 지연으로 기록하고,
+    감시 스레드는 측정 작업의 마지막 실행 시각이 임계값보다 오래되면 루프 스레드의 스택을 수집합니다.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        interval: float = LOOP_MONITOR_INTERVAL,
+        slow_threshold: float = LOOP_SLOW_THRESHOLD,
+    ):
+        """
+        LoopMonitor 초기화
+
+        Args:
+            service (str): 에이전트 이름 (로그에 사용)
+            interval (float): 지연 측정 간격 (초)
+            slow_threshold (float): 느린 콜백으로 판단하는 정지 시간 (초)
+        """
+        self.service = service
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=LOOP_STALL_HISTORY)
+        self._beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self):
+        """
+        지연 측정 작업과 감시 스레드를 시작합니다 (이벤트 루프 안에서 호출).
+        """
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._loop = asyncio.get_running_loop()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._measure())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def stop(self):
+        """
+        지연 측정 작업과 감시 스레드를 멈춥니다.
+
+        감시 스레드는 정지 신호를 받으면 바로 끝나므로 WATCHDOG_JOIN_TIMEOUT초까지만 기다립니다.
+        """
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=WATCHDOG_JOIN_TIMEOUT)
+            self._watchdog = None
+
+    async def _measure(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            loop_lag.observe(max(0.0, loop.time() - expected))
+            self._beat = time.monotonic()
+
+    def _watch(self):
+        stalled_since: Optional[float] = None
+        # Reason: 정지를 놓치지 않으면서 감시 비용을 줄이기 위해 임계값의 절반 간격으로 확인합니다.
+        check_interval = max(0.005, self.slow_threshold / 2)
+        while not self._stop.wait(check_interval):
+            beat = self._beat
+            blocked = time.monotonic() - beat - self.interval
+            if blocked < self.slow_threshold:
+                stalled_since = None
+                continue
+            if stalled_since == beat:
+                # 같은 정지는 한 번만 기록
+                continue
+            stalled_since = beat
+            self._record_stall(blocked)
+
+    def _record_stall(self, blocked: float):
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        # Reason: 메트릭은 이벤트 루프 스레드에서만 갱신하므로 감시 스레드는 증가를 루프에 넘깁니다 (루프가 풀리면 반영).
+        try:
+            self._loop.call_soon_threadsafe(slow_callbacks.inc)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘
+            pass
+        self.stalls.append({
+            "detected_at": datetime.now().isoformat(),
+            "blocked_seconds": round(blocked, 4),
+            "stack": stack,
+        })
+        get_agent_logger(self.service).warning(
+            f"이벤트 루프가 {blocked:.3f}초 이상 멈췄습니다. 실행 중인 스택:\n{stack}"
+        )
+
+
+def instrument_loop_monitor(app: FastAPI, service: str) -> LoopMonitor:
+    """
+    앱 시작 시 이벤트 루프 감시를 시작하고 정지 기록 조회 엔드포인트를 추가합니다.
+
+    Args:
+        app (FastAPI): 대상 FastAPI 앱
+        service (str): 에이전트 이름
+
+    Returns:
+        LoopMonitor: 앱에 연결된 감시기
+    """
+    monitor = LoopMonitor(service)
+    if LOOP_MONITOR_ENABLED:
+        app.add_event_handler("startup", monitor.start)
+        app.add_event_handler("shutdown", monitor.stop)
+
+    # 앱마다 자신의 감시기를 조회하도록 라우터를 따로 만듦
+    router = APIRouter(prefix="/admin/loop", dependencies=[Depends(require_admin)])
+
+    @router.get("/stalls")
+    async def get_stalls() -> Dict[str, Any]:
+        """
+        최근 이벤트 루프 정지 기록과 당시의 스택을 최신순으로 조회합니다.
+        """
+        return {
+            "service": service,
+            "slow_threshold": monitor.slow_threshold,
+            "stalls": list(reversed(monitor.stalls)),
+        }
+
+    app.include_router(router)
+    return monitor
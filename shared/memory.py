@@ -0,0 +1,278 @@
+"""
+메모리 스냅샷 모듈
+
+실행 중인 에이전트에서 tracemalloc을 켜고 스냅샷을 찍어, 메모리를 가장 많이 할당한 위치와
+두 스냅샷 사이의 증가분을 관리자 엔드포인트로 제공합니다. 누수나 과도한 메모리 사용을
+프로세스를 재시작하지 않고 진단하는 데 사용합니다.
+"""
+import tracemalloc
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
+
+from shared.admin import require_admin
+from shared.config import get_settings
+
+# 스냅샷에 기록하는 기본 호출 스택 깊이
+TRACEMALLOC_FRAMES = get_settings().tracemalloc_frames
+# 보관하는 최대 스냅샷 수
+MAX_SNAPSHOTS = 5
+# 통계에서 제외하는 내부 할당 위치
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+# 통계 묶음 기준
+GROUP_BY_PATTERN = "^(lineno|filename|traceback)$"
+
+
+def format_stat(stat: Any, group_by: str) -> Dict[str, Any]:
+    """
+    tracemalloc 통계 항목을 응답용 딕셔너리로 변환합니다.
+
+    Args:
+        stat: tracemalloc.Statistic 또는 tracemalloc.StatisticDiff
+        group_by (str): 묶음 기준 ('lineno', 'filename', 'traceback')
+
+    Returns:
+        Dict[str, Any]: 할당 위치, 크기(KiB), 블록 수 (diff이면 증가분 포함)
+    """
+    frame = stat.traceback[0]
+    entry: Dict[str, Any] = {
+        "location": f"{frame.filename}:{frame.lineno}" if group_by != "filename" else frame.filename,
+        "size_kb": round(stat.size / 1024, 1),
+        "count": stat.count,
+    }
+    if isinstance(stat, tracemalloc.StatisticDiff):
+        entry["size_diff_kb"] = round(stat.size_diff / 1024, 1)
+        entry["count_diff"] = stat.count_diff
+    if group_by == "traceback":
+        entry["traceback"] = stat.traceback.format()
+    return entry
+
+
+class MemoryTracker:
+    """
+    tracemalloc 스냅샷을 번호로 보관하고 통계와 차이를 계산합니다.
+    """
+
+    def __init__(self, max_snapshots: int = MAX_SNAPSHOTS):
+        """
+        MemoryTracker 초기화
+
+        Args:
+            max_snapshots (int): 보관할 최대 스냅샷 수 (넘으면 오래된 것부터 삭제)
+        """
+        self.max_snapshots = max_snapshots
+        self.snapshots: "OrderedDict[int, Tuple[str, tracemalloc.Snapshot]]" = OrderedDict()
+        self._next_id = 1
+
+    def status(self) -> Dict[str, Any]:
+        """
+        tracemalloc 상태와 보관 중인 스냅샷 목록을 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 추적 여부, 현재/최대 추적 메모리(KiB), 스냅샷 목록
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracing": tracemalloc.is_tracing(),
+            "frames": tracemalloc.get_traceback_limit(),
+            "traced_kb": round(current / 1024, 1),
+            "peak_kb": round(peak / 1024, 1),
+            "snapshots": [
+                {"id": snapshot_id, "taken_at": taken_at}
+                for snapshot_id, (taken_at, _) in self.snapshots.items()
+            ],
+        }
+
+    def start(self, frames: int = TRACEMALLOC_FRAMES):
+        """
+        tracemalloc 추적을 시작합니다 (이미 추적 중이면 그대로 둠).
+
+        Args:
+            frames (int): 할당마다 기록할 호출 스택 깊이
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def stop(self):
+        """
+        tracemalloc 추적을 멈추고 스냅샷을 모두 버립니다.
+        """
+        tracemalloc.stop()
+        self.snapshots.clear()
+
+    def take(self) -> int:
+        """
+        현재 메모리 할당 스냅샷을 찍어 보관합니다.
+
+        Returns:
+            int: 스냅샷 번호
+
+        Raises:
+            RuntimeError: tracemalloc이 추적 중이 아닌 경우
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc이 시작되지 않았습니다.")
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        snapshot_id = self._next_id
+        self._next_id += 1
+        self.snapshots[snapshot_id] = (datetime.now().isoformat(), snapshot)
+        while len(self.snapshots) > self.max_snapshots:
+            self.snapshots.popitem(last=False)
+        return snapshot_id
+
+    def get(self, snapshot_id: int) -> tracemalloc.Snapshot:
+        """
+        번호로 스냅샷을 조회합니다.
+
+        Args:
+            snapshot_id (int): 스냅샷 번호
+
+        Returns:
+            tracemalloc.Snapshot: 스냅샷
+
+        Raises:
+            KeyError: 해당 번호의 스냅샷이 없는 경우
+        """
+        return self.snapshots[snapshot_id][1]
+
+    def top(self, snapshot_id: int, limit: int = 20, group_by: str = "lineno") -> List[Dict[str, Any]]:
+        """
+        스냅샷에서 메모리를 가장 많이 할당한 위치를 반환합니다.
+
+        Args:
+            snapshot_id (int): 스냅샷 번호
+            limit (int): 최대 항목 수
+            group_by (str): 묶음 기준 ('lineno', 'filename', 'traceback')
+
+        Returns:
+            List[Dict[str, Any]]: 크기순 할당 위치 목록
+        """
+        stats = self.get(snapshot_id).statistics(group_by)
+        return [format_stat(stat, group_by) for stat in stats[:limit]]
+
+    def diff(self, base_id: int, target_id: int, limit: int = 20, group_by: str = "lineno") -> List[Dict[str, Any]]:
+        """
+        두 스냅샷 사이에 메모리가 가장 많이 늘어난 위치를 반환합니다.
+
+        Args:
+            base_id (int): 기준 스냅샷 번호
+            target_id (int): 비교 스냅샷 번호
+            limit (int): 최대 항목 수
+            group_by (str): 묶음 기준 ('lineno', 'filename', 'traceback')
+
+        Returns:
+            List[Dict[str, Any]]: 증가량순 할당 위치 목록
+        """
+        stats = self.get(target_id).compare_to(self.get(base_id), group_by)
+        return [format_stat(stat, group_by) for stat in stats[:limit]]
+
+
+# 프로세스 전역 메모리 추적기 (tracemalloc은 프로세스 단위)
+tracker = MemoryTracker()
+
+router = APIRouter(prefix="/admin/memory", dependencies=[Depends(require_admin)])
+
+
+@router.get("")
+async def memory_status() -> Dict[str, Any]:
+    """
+    tracemalloc 상태와 보관 중인 스냅샷 목록을 조회합니다.
+    """
+    return tracker.status()
+
+
+@router.post("/start")
+async def start_tracing(
+    frames: int = Query(TRACEMALLOC_FRAMES, ge=1, le=100, description="할당마다 기록할 호출 스택 깊이"),
+) -> Dict[str, Any]:
+    """
+    tracemalloc 추적을 시작합니다.
+    """
+    tracker.start(frames)
+    return tracker.status()
+
+
+@router.post("/stop")
+async def stop_tracing() -> Dict[str, Any]:
+    """
+    tracemalloc 추적을 멈추고 스냅샷을 모두 버립니다.
+    """
+    tracker.stop()
+    return tracker.status()
+
+
+@router.post("/snapshots")
+async def take_snapshot(
+    limit: int = Query(20, ge=1, le=500, description="반환할 상위 할당 위치 수"),
+    group_by: str = Query("lineno", pattern=GROUP_BY_PATTERN, description="묶음 기준"),
+) -> Dict[str, Any]:
+    """
+    스냅샷을 찍고 메모리를 가장 많이 할당한 위치를 반환합니다.
+
+    Raises:
+        HTTPException: tracemalloc이 시작되지 않은 경우
+    """
+    try:
+        snapshot_id = await run_in_threadpool(tracker.take)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    top = await run_in_threadpool(tracker.top, snapshot_id, limit, group_by)
+    return {"id": snapshot_id, "top": top}
+
+
+@router.get("/snapshots/{snapshot_id}")
+async def snapshot_top(
+    snapshot_id: int,
+    limit: int = Query(20, ge=1, le=500, description="반환할 상위 할당 위치 수"),
+    group_by: str = Query("lineno", pattern=GROUP_BY_PATTERN, description="묶음 기준"),
+) -> Dict[str, Any]:
+    """
+    보관 중인 스냅샷의 상위 할당 위치를 조회합니다.
+
+    Raises:
+        HTTPException: 스냅샷이 없는 경우
+    """
+    if snapshot_id not in tracker.snapshots:
+        raise HTTPException(status_code=404, detail=f"스냅샷 {snapshot_id}이(가) 없습니다.")
+    top = await run_in_threadpool(tracker.top, snapshot_id, limit, group_by)
+    return {"id": snapshot_id, "top": top}
+
+
+@router.get("/diff")
+async def snapshot_diff(
+    base: int = Query(..., description="기준 스냅샷 번호"),
+    target: Optional[int] = Query(None, description="비교 스냅샷 번호 (기본값: 가장 최근 스냅샷)"),
+    limit: int = Query(20, ge=1, le=500, description="반환할 할당 위치 수"),
+    group_by: str = Query("lineno", pattern=GROUP_BY_PATTERN, description="묶음 기준"),
+) -> Dict[str, Any]:
+    """
+    두 스냅샷 사이에 메모리가 가장 많이 늘어난 위치를 조회합니다.
+
+    Raises:
+        HTTPException: 스냅샷이 없는 경우
+    """
+    if target is None and tracker.snapshots:
+        target = next(reversed(tracker.snapshots))
+    for snapshot_id in (base, target):
+        if snapshot_id not in tracker.snapshots:
+            raise HTTPException(status_code=404, detail=f"스냅샷 {snapshot_id}이(가) 없습니다.")
+    diff = await run_in_threadpool(tracker.diff, base, target, limit, group_by)
+    return {"base": base, "target": target, "diff": diff}
+
+
+def instrument_memory(app: FastAPI):
+    """
+    앱에 메모리 스냅샷 관리자 엔드포인트(/admin/memory)를 추가합니다.
+
+    Args:
+        app (FastAPI): 대상 FastAPI 앱
+    """
+    app.include_router(router)
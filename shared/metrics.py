@@ -0,0 +1,477 @@
+"""
+공통 메트릭 모듈
+
+카운터, 게이지, 히스토그램을 프로세스 메모리에 집계하고 Prometheus 텍스트 형식으로 변환합니다.
+요청 지연 시간 미들웨어와 `/metrics` 엔드포인트는 `shared.http_metrics`에 있습니다.
+외부 의존성 없이 값 갱신은 딕셔너리 조회와 덧셈 정도로만 끝나도록 구성합니다.
+"""
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Prometheus 텍스트 형식의 Content-Type (charset은 응답 객체가 덧붙임)
+CONTENT_TYPE = "text/plain; version=0.0.4"
+# 기본 지연 시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def escape_label(value: str) -> str:
+    """
+    레이블 값을 Prometheus 텍스트 형식에 맞게 이스케이프합니다.
+
+    Args:
+        value (str): 레이블 값
+
+    Returns:
+        str: 이스케이프된 레이블 값
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """
+    레이블 이름과 값을 `{name="value",...}` 형식으로 변환합니다.
+
+    Args:
+        names (Sequence[str]): 레이블 이름 목록
+        values (Sequence[str]): 레이블 값 목록
+        extra (str): 뒤에 덧붙일 레이블 (예: 히스토그램의 le)
+
+    Returns:
+        str: 레이블 문자열 (레이블이 없으면 빈 문자열)
+    """
+    parts = [f'{name}="{escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def format_value(value: float) -> str:
+    """
+    메트릭 값을 문자열로 변환합니다.
+
+    Args:
+        value (float): 메트릭 값
+
+    Returns:
+        str: 정수 값은 소수점 없이, 그 외에는 repr 형식
+    """
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric(ABC):
+    """
+    레이블 조합별 값을 관리하는 메트릭 기본 클래스
+
+    하위 클래스는 레이블 조합마다 값을 담을 객체를 만드는 `_new_child`를 구현합니다.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Metric 초기화
+
+        Args:
+            name (str): 메트릭 이름
+            documentation (str): 메트릭 설명 (HELP)
+            labelnames (Sequence[str]): 레이블 이름 목록
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # Reason: 값 갱신은 이벤트 루프 스레드에서만 일어나므로 잠금 없이 딕셔너리만 사용합니다.
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values) -> object:
+        """
+        레이블 값 조합에 해당하는 하위 메트릭을 반환합니다.
+
+        Args:
+            *values: 레이블 값 (labelnames 순서)
+
+        Returns:
+            object: 하위 메트릭
+
+        Raises:
+            ValueError: 레이블 값 개수가 맞지 않는 경우
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 레이블 {self.labelnames}의 값이 필요합니다.")
+            child = self._children[key] = self._new_child()
+        return child
+
+    @abstractmethod
+    def _new_child(self) -> object:
+        """
+        새 레이블 조합의 값을 담을 하위 메트릭을 만듭니다.
+
+        Returns:
+            object: 하위 메트릭 (samples가 읽는 value 속성을 가짐)
+        """
+
+    def samples(self) -> List[str]:
+        """
+        Prometheus 텍스트 형식의 샘플 줄 목록을 반환합니다.
+
+        Returns:
+            List[str]: 샘플 줄 목록
+        """
+        return [
+            f"{self.name}{format_labels(self.labelnames, key)} {format_value(child.value)}"
+            for key, child in list(self._children.items())
+        ]
+
+    def render(self) -> str:
+        """
+        HELP, TYPE 줄을 포함한 메트릭 전체를 텍스트로 변환합니다.
+
+        Returns:
+            str: Prometheus 텍스트 형식 문자열
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class _Value:
+    """
+    카운터와 게이지의 단일 값
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Counter(Metric):
+    """
+    증가만 하는 카운터
+    """
+
+    kind = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        """
+        레이블이 없는 카운터를 증가시킵니다.
+
+        Args:
+            amount (float): 증가량
+        """
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """
+    올라가고 내려가는 현재 값
+
+    set_function으로 수집 시점에 값을 계산하는 함수를 지정할 수 있습니다.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._function: Optional[Callable[[], float]] = None
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def set(self, value: float):
+        """
+        레이블이 없는 게이지의 값을 설정합니다.
+
+        Args:
+            value (float): 현재 값
+        """
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0):
+        """
+        레이블이 없는 게이지의 값을 늘립니다.
+
+        Args:
+            amount (float): 증가량
+        """
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        """
+        레이블이 없는 게이지의 값을 줄입니다.
+
+        Args:
+            amount (float): 감소량
+        """
+        self.labels().dec(amount)
+
+    def set_function(self, function: Callable[[], float]):
+        """
+        수집 시점에 값을 계산할 함수를 지정합니다 (레이블이 없는 게이지 전용).
+
+        Args:
+            function (Callable[[], float]): 현재 값을 반환하는 함수
+        """
+        self._function = function
+
+    def samples(self) -> List[str]:
+        if self._function is not None:
+            return [f"{self.name} {format_value(self._function())}"]
+        return super().samples()
+
+
+class _HistogramValue:
+    """
+    히스토그램의 레이블 조합별 버킷 카운트
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # 마지막 칸은 +Inf 버킷
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self) -> "_Timer":
+        return _Timer(self)
+
+
+class _Timer:
+    """
+    with 블록의 실행 시간을 히스토그램에 기록하는 컨텍스트 관리자
+    """
+
+    __slots__ = ("target", "started")
+
+    def __init__(self, target: _HistogramValue):
+        self.target = target
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.target.observe(time.perf_counter() - self.started)
+        return False
+
+
+class Histogram(Metric):
+    """
+    값의 분포를 누적 버킷으로 집계하는 히스토그램
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Histogram 초기화
+
+        Args:
+            name (str): 메트릭 이름
+            documentation (str): 메트릭 설명 (HELP)
+            labelnames (Sequence[str]): 레이블 이름 목록
+            buckets (Sequence[float]): 버킷 상한 목록 (+Inf는 자동 추가)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        """
+        레이블이 없는 히스토그램에 값을 기록합니다.
+
+        Args:
+            value (float): 관측 값
+        """
+        self.labels().observe(value)
+
+    def time(self) -> _Timer:
+        """
+        레이블이 없는 히스토그램에 with 블록의 실행 시간을 기록합니다.
+
+        Returns:
+            _Timer: 컨텍스트 관리자
+        """
+        return self.labels().time()
+
+    def totals(self, where: Optional[Callable[[Dict[str, str]], bool]] = None) -> List[int]:
+        """
+        레이블 조합을 합친 버킷별 관측 수를 반환합니다 (누적 아님, 마지막 칸은 +Inf).
+
+        Args:
+            where (Optional[Callable[[Dict[str, str]], bool]]): 합칠 레이블 조합을 고르는 함수 (None이면 전체)
+
+        Returns:
+            List[int]: 버킷별 관측 수
+        """
+        totals = [0] * (len(self.buckets) + 1)
+        for key, child in list(self._children.items()):
+            if where is not None and not where(dict(zip(self.labelnames, key))):
+                continue
+            for index, count in enumerate(child.counts):
+                totals[index] += count
+        return totals
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), child.counts):
+                cumulative += count
+                le = f'le="{format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+def bucket_quantile(buckets: Sequence[float], counts: Sequence[int], q: float) -> Optional[float]:
+    """
+    버킷별 관측 수로 분위수의 상한을 추정합니다.
+
+    Args:
+        buckets (Sequence[float]): 버킷 상한 목록 (+Inf 제외)
+        counts (Sequence[int]): 버킷별 관측 수 (누적 아님, 마지막 칸은 +Inf)
+        q (float): 분위수 (0~1)
+
+    Returns:
+        Optional[float]: 분위수가 속한 버킷의 상한 (+Inf 버킷이면 inf, 관측이 없으면 None)
+    """
+    total = sum(counts)
+    if total == 0:
+        return None
+    target = q * total
+    cumulative = 0
+    for bound, count in zip(tuple(buckets) + (float("inf"),), counts):
+        cumulative += count
+        if cumulative >= target:
+            return bound
+    return float("inf")
+
+
+class MetricsRegistry:
+    """
+    프로세스의 메트릭을 모아 텍스트로 출력하는 레지스트리
+
+    같은 이름으로 다시 요청하면 기존 메트릭을 반환합니다.
+    """
+
+    def __init__(self):
+        """
+        MetricsRegistry 초기화
+        """
+        self._metrics: Dict[str, Metric] = {}
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs) -> Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, *args, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"{name}은(는) 이미 {metric.kind} 메트릭으로 등록되어 있습니다.")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """
+        카운터를 등록하거나 이미 등록된 카운터를 반환합니다.
+
+        Args:
+            name (str): 메트릭 이름
+            documentation (str): 메트릭 설명 (HELP)
+            labelnames (Sequence[str]): 레이블 이름 목록
+
+        Returns:
+            Counter: 카운터
+
+        Raises:
+            ValueError: 같은 이름이 다른 종류의 메트릭으로 등록되어 있는 경우
+        """
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """
+        게이지를 등록하거나 이미 등록된 게이지를 반환합니다.
+
+        Args:
+            name (str): 메트릭 이름
+            documentation (str): 메트릭 설명 (HELP)
+            labelnames (Sequence[str]): 레이블 이름 목록
+
+        Returns:
+            Gauge: 게이지
+
+        Raises:
+            ValueError: 같은 이름이 다른 종류의 메트릭으로 등록되어 있는 경우
+        """
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        히스토그램을 등록하거나 이미 등록된 히스토그램을 반환합니다.
+
+        Args:
+            name (str): 메트릭 이름
+            documentation (str): 메트릭 설명 (HELP)
+            labelnames (Sequence[str]): 레이블 이름 목록
+            buckets (Sequence[float]): 버킷 상한 목록 (+Inf는 자동 추가, 이미 등록된 경우 무시)
+
+        Returns:
+            Histogram: 히스토그램
+
+        Raises:
+            ValueError: 같은 이름이 다른 종류의 메트릭으로 등록되어 있는 경우
+        """
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def render(self) -> str:
+        """
+        등록된 모든 메트릭을 Prometheus 텍스트 형식으로 변환합니다.
+
+        Returns:
+            str: Prometheus 텍스트 형식 문자열
+        """
+        return "\n".join(metric.render() for metric in list(self._metrics.values())) + "\n"
+
+
+# 프로세스 전역 레지스트리
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,220 @@
+"""
+우선순위 스케줄링 모듈
+
+실시간 수업(웹소켓) 실행, API 실행, 일괄 작업이 같은 에이전트를 함께 쓸 때 실시간 사용자의 지연이
+늘지 않도록 외부 호출을 우선순위 클래스별로 스케줄링합니다.
+
+- 우선순위 클래스는 컨텍스트 변수로 전달되며, 에이전트 사이에서는 `x-priority-class` 헤더로 이어집니다.
+- `PriorityScheduler`는 동시 호출 수를 제한하면서, 기다리는 호출 중 interactive를 항상 먼저 보내고
+  나머지 클래스(api, batch)는 가중치에 따른 가중 공정 큐잉(WFQ)으로 순서를 정합니다.
+- 슬롯 일부(reserved)는 interactive만 쓸 수 있어 일괄 작업이 모든 슬롯을 차지해도 실시간 호출이 바로 나갑니다.
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import FastAPI
+
+from shared.metrics import REGISTRY
+
+# 우선순위 클래스 (interactive: 웹소켓 실행, api: HTTP API 실행, batch: 일괄 작업)
+PRIORITY_CLASSES = ("interactive", "api", "batch")
+# 클래스를 알 수 없을 때의 기본 클래스
+DEFAULT_CLASS = "api"
+# WFQ 가중치 (클수록 더 자주 순서가 돌아옴)
+DEFAULT_WEIGHTS = {"interactive": 8, "api": 4, "batch": 1}
+# 우선순위 클래스를 전달하는 HTTP 헤더
+PRIORITY_HEADER = "x-priority-class"
+
+# 현재 실행의 우선순위 클래스
+priority_class: ContextVar[str] = ContextVar("priority_class", default=DEFAULT_CLASS)
+
+# 스케줄러 슬롯을 기다린 시간
+priority_wait = REGISTRY.histogram(
+    "priority_wait_seconds",
+    "우선순위 스케줄러 슬롯 대기 시간 (초)",
+    ("scheduler", "class"),
+)
+
+
+def current_priority() -> str:
+    """
+    현재 컨텍스트의 우선순위 클래스를 반환합니다.
+
+    Returns:
+        str: 우선순위 클래스
+    """
+    return priority_class.get()
+
+
+@contextmanager
+def priority_context(cls: str) -> Iterator[None]:
+    """
+    블록 안(그리고 블록 안에서 만든 태스크)의 우선순위 클래스를 지정합니다.
+
+    Args:
+        cls (str): 우선순위 클래스
+    """
+    token = priority_class.set(cls if cls in PRIORITY_CLASSES else DEFAULT_CLASS)
+    try:
+        yield
+    finally:
+        priority_class.reset(token)
+
+
+def inject_priority(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    현재 우선순위 클래스를 요청 헤더에 추가합니다.
+
+    Args:
+        headers (Optional[Dict[str, str]]): 기존 헤더
+
+    Returns:
+        Dict[str, str]: `x-priority-class`가 추가된 헤더
+    """
+    headers = dict(headers or {})
+    headers[PRIORITY_HEADER] = current_priority()
+    return headers
+
+
+class PriorityScheduler:
+    """
+    우선순위 클래스별 동시 호출 제한기
+
+    슬롯이 모두 쓰이면 호출은 대기열에서 기다리며, 슬롯이 반환될 때 다음 순서로 깨웁니다.
+    순서는 (interactive 여부, WFQ 종료 태그, 도착 순서)로 정합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        capacity: int,
+        weights: Optional[Dict[str, float]] = None,
+        reserved: int = 1,
+    ):
+        """
+        PriorityScheduler 초기화
+
+        Args:
+            name (str): 스케줄러 이름 (메트릭 레이블)
+            capacity (int): 최대 동시 호출 수
+            weights (Optional[Dict[str, float]]): 클래스별 WFQ 가중치 (기본값: DEFAULT_WEIGHTS)
+            reserved (int): interactive만 쓸 수 있는 슬롯 수
+        """
+        self.name = name
+        self.capacity = max(1, capacity)
+        self.weights = weights or DEFAULT_WEIGHTS
+        self.reserved = min(max(0, reserved), self.capacity - 1)
+        self.in_use = 0
+        self._waiters: List[Tuple[int, float, int, float, str, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._last_finish: Dict[str, float] = {}
+
+    @property
+    def waiting(self) -> int:
+        """대기열에서 기다리는 호출 수 (취소된 호출 제외)"""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def _limit(self, cls: str) -> int:
+        return self.capacity if cls == "interactive" else self.capacity - self.reserved
+
+    def _dispatch(self) -> None:
+        while self._waiters:
+            rank, finish, seq, start, cls, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            # Reason: 맨 앞 호출이 interactive가 아니면 대기열에 interactive가 없으므로 더 볼 필요가 없습니다.
+            if self.in_use >= self._limit(cls):
+                return
+            heapq.heappop(self._waiters)
+            self.in_use += 1
+            self._virtual_time = max(self._virtual_time, start)
+            future.set_result(None)
+
+    async def acquire(self, cls: Optional[str] = None) -> None:
+        """
+        슬롯을 얻을 때까지 기다립니다.
+
+        Args:
+            cls (Optional[str]): 우선순위 클래스 (기본값: 현재 컨텍스트의 클래스)
+        """
+        cls = cls or current_priority()
+        start = max(self._virtual_time, self._last_finish.get(cls, 0.0))
+        finish = start + 1.0 / self.weights.get(cls, 1.0)
+        self._last_finish[cls] = finish
+        future = asyncio.get_running_loop().create_future()
+        rank = 0 if cls == "interactive" else 1
+        heapq.heappush(self._waiters, (rank, finish, next(self._sequence), start, cls, future))
+        self._dispatch()
+        if future.done():
+            return
+
+        started = time.perf_counter()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 받은 직후 취소되었으면 반환
+                self.release()
+            raise
+        finally:
+            priority_wait.labels(self.name, cls).observe(time.perf_counter() - started)
+
+    def release(self) -> None:
+        """
+        슬롯을 반환하고 다음 호출을 깨웁니다.
+        """
+        self.in_use -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, cls: Optional[str] = None) -> AsyncIterator[None]:
+        """
+        블록 동안 슬롯 하나를 사용합니다.
+
+        Args:
+            cls (Optional[str]): 우선순위 클래스 (기본값: 현재 컨텍스트의 클래스)
+        """
+        await self.acquire(cls)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+class PriorityMiddleware:
+    """
+    요청의 `x-priority-class` 헤더를 현재 우선순위 클래스로 적용하는 ASGI 미들웨어
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        cls = DEFAULT_CLASS
+        for key, value in scope.get("headers", ()):
+            if key == PRIORITY_HEADER.encode():
+                cls = value.decode("latin-1")
+                break
+        with priority_context(cls):
+            await self.app(scope, receive, send)
+
+
+def instrument_priority(app: FastAPI):
+    """
+    앱에 우선순위 헤더 미들웨어를 추가합니다.
+
+    Args:
+        app (FastAPI): 대상 FastAPI 앱
+    """
+    app.add_middleware(PriorityMiddleware)
@@ -0,0 +1,315 @@
+"""
+자식 프로세스 관리 모듈
+
+run.py가 실행하는 컴포넌트의 출력을 백그라운드 스레드에서 계속 읽어
+`[이름]` 접두어를 붙인 로그로 전달합니다(초당 줄 수 제한). 파이프가 가득 차서
+자식 프로세스가 멈추는 일이 없도록 하고, 비정상 종료한 프로세스는 지수 백오프로 다시 실행합니다.
+"""
+import os
+import platform
+import signal
+import subprocess
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from shared.config import get_settings
+from shared.logger import get_agent_logger
+
+logger = get_agent_logger("main")
+
+# 프로세스별 초당 출력 줄 수 제한과 순간 허용량
+OUTPUT_LINES_PER_SECOND = get_settings().child_output_rate
+OUTPUT_BURST = get_settings().child_output_burst
+# 재시작 백오프 (초)
+RESTART_BACKOFF_BASE = 1.0
+RESTART_BACKOFF_MAX = 30.0
+# 이 시간 이상 실행되면 안정된 것으로 보고 백오프를 초기화 (초)
+STABLE_AFTER = 30.0
+# 종료 요청 후 강제 종료까지 기다리는 시간 (초)
+STOP_TIMEOUT = 5.0
+
+
+class LineRateLimiter:
+    """
+    초당 출력 줄 수를 제한하는 토큰 버킷
+
+    제한을 넘은 줄은 버리고 개수만 세어 두었다가 다음에 출력할 수 있을 때 알립니다.
+    """
+
+    def __init__(self, rate: float = OUTPUT_LINES_PER_SECOND, burst: int = OUTPUT_BURST):
+        """
+        LineRateLimiter 초기화
+
+        Args:
+            rate (float): 초당 허용 줄 수
+            burst (int): 순간 최대 허용 줄 수
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.dropped = 0
+        self._updated = time.monotonic()
+
+    def allow(self) -> bool:
+        """
+        한 줄을 출력해도 되는지 확인합니다.
+
+        Returns:
+            bool: 출력 가능하면 True (아니면 버린 줄 수를 늘림)
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        self.dropped += 1
+        return False
+
+    def take_dropped(self) -> int:
+        """
+        지금까지 버린 줄 수를 반환하고 초기화합니다.
+
+        Returns:
+            int: 버린 줄 수
+        """
+        dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+class ManagedProcess:
+    """
+    출력을 계속 읽어 주고 비정상 종료 시 다시 실행하는 자식 프로세스
+    """
+
+    def __init__(self, name: str, command: List[str], restart: bool = True, restart_on_success: bool = False):
+        """
+        ManagedProcess 초기화
+
+        Args:
+            name (str): 프로세스 이름 (출력 접두어)
+            command (List[str]): 실행할 명령어와 인자
+            restart (bool): 비정상 종료(종료 코드가 0이 아님) 시 다시 실행할지 여부
+            restart_on_success (bool): 정상 종료(종료 코드 0)한 경우에도 다시 실행할지 여부
+        """
+        self.name = name
+        self.command = command
+        self.restart = restart
+        self.restart_on_success = restart_on_success
+        self.process: Optional[subprocess.Popen] = None
+        self.restarts = 0
+        self.failures = 0
+        self.started_at: Optional[float] = None
+        self.next_restart_at: Optional[float] = None
+        self.limiter = LineRateLimiter()
+        self._reader: Optional[threading.Thread] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process else None
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self.process.returncode if self.process else None
+
+    def poll(self) -> Optional[int]:
+        """
+        프로세스 종료 여부를 확인합니다.
+
+        Returns:
+            Optional[int]: 종료 코드 (실행 중이면 None)
+        """
+        return self.process.poll() if self.process else None
+
+    def start(self):
+        """
+        프로세스를 실행하고 출력 읽기 스레드를 시작합니다.
+        """
+        kwargs: Dict[str, Any] = {}
+        if platform.system() == "Windows":
+            kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            # Reason: 자식마다 새 세션을 만들어야 종료 시 run.py 자신이 아닌 자식 프로세스 그룹만 종료됩니다.
+            kwargs["start_new_session"] = True
+
+        self.process = subprocess.Popen(
+            self.command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            **kwargs,
+        )
+        self.started_at = time.monotonic()
+        self.next_restart_at = None
+        self._reader = threading.Thread(
+            target=self._drain, args=(self.process,), name=f"output-{self.name}", daemon=True
+        )
+        self._reader.start()
+        logger.info(f"{self.name} 프로세스 시작 (PID: {self.process.pid})")
+
+    def _drain(self, process: subprocess.Popen):
+        # 출력이 끝날 때(프로세스 종료)까지 계속 읽어 파이프가 가득 차지 않게 함
+        for line in process.stdout:
+            if self.limiter.allow():
+                dropped = self.limiter.take_dropped()
+                if dropped:
+                    logger.warning(f"[{self.name}] 출력 제한으로 {dropped}줄 생략")
+                logger.info(f"[{self.name}] {line.rstrip()}")
+        process.stdout.close()
+
+    def uptime(self) -> float:
+        """
+        현재 실행이 시작된 뒤 지난 시간을 반환합니다.
+
+        Returns:
+            float: 실행 시간 (초, 실행 중이 아니면 0)
+        """
+        if self.started_at is None or self.poll() is not None:
+            return 0.0
+        return time.monotonic() - self.started_at
+
+    def schedule_restart(self):
+        """
+        종료된 프로세스의 재시작 시각을 지수 백오프로 정합니다.
+        """
+        ran_for = time.monotonic() - (self.started_at or time.monotonic())
+        if ran_for >= STABLE_AFTER:
+            self.failures = 0
+        delay = min(RESTART_BACKOFF_MAX, RESTART_BACKOFF_BASE * (2 ** self.failures))
+        self.failures += 1
+        self.next_restart_at = time.monotonic() + delay
+        logger.warning(
+            f"{self.name} 프로세스가 종료되었습니다. (종료 코드: {self.returncode}, "
+            f"실행 시간: {ran_for:.1f}초) {delay:.1f}초 뒤 다시 실행합니다."
+        )
+
+    def stop(self, timeout: float = STOP_TIMEOUT):
+        """
+        프로세스 그룹에 종료를 요청하고, 제한 시간 안에 끝나지 않으면 강제 종료합니다.
+
+        Args:
+            timeout (float): 강제 종료 전 대기 시간 (초)
+        """
+        self.restart = False
+        process = self.process
+        if process is None or process.poll() is not None:
+            return
+        try:
+            if platform.system() == "Windows":
+                process.terminate()
+            else:
+                os.killpg(process.pid, signal.SIGTERM)
+            logger.info(f"PID {process.pid} 종료 요청 전송")
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"{self.name} 프로세스가 응답하지 않아 강제 종료합니다.")
+            if platform.system() == "Windows":
+                process.kill()
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        except Exception as e:
+            logger.error(f"프로세스 종료 오류: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        """
+        프로세스 상태를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 이름, PID, 실행 여부, 재시작 횟수, 실행 시간
+        """
+        return {
+            "name": self.name,
+            "pid": self.pid,
+            "running": self.process is not None and self.poll() is None,
+            "restarts": self.restarts,
+            "uptime": round(self.uptime(), 1),
+        }
+
+
+class ProcessSupervisor:
+    """
+    관리 대상 프로세스를 감시하여 종료된 프로세스를 다시 실행하고 상태를 보고합니다.
+    """
+
+    def __init__(self, report_interval: float = 60.0):
+        """
+        ProcessSupervisor 초기화
+
+        Args:
+            report_interval (float): 상태 보고 간격 (초)
+        """
+        self.processes: List[ManagedProcess] = []
+        self.report_interval = report_interval
+        self._stopping = threading.Event()
+
+    def add(self, process: ManagedProcess):
+        """
+        관리 대상 프로세스를 추가합니다.
+
+        Args:
+            process (ManagedProcess): 관리할 프로세스
+        """
+        self.processes.append(process)
+
+    def check(self):
+        """
+        비정상 종료한 프로세스의 재시작을 예약하거나, 예약 시각이 지난 프로세스를 다시 실행합니다.
+
+        정상 종료(종료 코드 0)한 프로세스는 restart_on_success일 때만 다시 실행합니다.
+        """
+        now = time.monotonic()
+        for managed in self.processes:
+            if self._stopping.is_set() or not managed.restart or managed.process is None:
+                continue
+            returncode = managed.poll()
+            if returncode is None:
+                continue
+            if returncode == 0 and not managed.restart_on_success:
+                # Reason: 종료 코드 0은 스스로 끝낸 정상 종료이므로 재시작 정책이 허용할 때만 다시 실행합니다.
+                logger.info(f"{managed.name} 프로세스가 정상 종료되어 다시 실행하지 않습니다.")
+                managed.restart = False
+                continue
+            if managed.next_restart_at is None:
+                managed.schedule_restart()
+            elif now >= managed.next_restart_at:
+                managed.restarts += 1
+                managed.start()
+
+    def report(self):
+        """
+        프로세스별 재시작 횟수와 실행 시간을 로그로 남깁니다.
+        """
+        for status in (managed.status() for managed in self.processes):
+            state = "실행 중" if status["running"] else "중지됨"
+            logger.info(
+                f"📈 {status['name']}: {state}, 재시작 {status['restarts']}회, 실행 시간 {status['uptime']}초"
+            )
+
+    def run_forever(self, poll_interval: float = 0.5):
+        """
+        stop_all이 호출될 때까지 프로세스를 감시합니다.
+
+        Args:
+            poll_interval (float): 감시 간격 (초)
+        """
+        next_report = time.monotonic() + self.report_interval
+        while not self._stopping.wait(poll_interval):
+            self.check()
+            if time.monotonic() >= next_report:
+                self.report()
+                next_report = time.monotonic() + self.report_interval
+
+    def stop_all(self):
+        """
+        감시를 멈추고 모든 프로세스를 종료합니다.
+        """
+        self._stopping.set()
+        for managed in self.processes:
+            managed.stop()
@@ -0,0 +1,350 @@
+"""
+온디맨드 프로파일링 모듈
+
+실행 중인 에이전트의 이벤트 루프를 N초 동안 cProfile 또는 통계적 샘플링으로 측정하고,
+결과를 pstats 텍스트나 collapsed-stack(플레임 그래프 입력) 텍스트로 반환합니다.
+요청 p99 지연 시간이 임계값을 넘으면 샘플링 프로파일을 자동으로 수집할 수도 있습니다.
+"""
+import asyncio
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter as CounterDict, deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from shared.admin import require_admin
+from shared.config import get_settings
+from shared.logger import get_agent_logger
+from shared.http_metrics import http_request_duration
+from shared.metrics import Histogram, bucket_quantile
+
+# 샘플링 간격 (초)
+SAMPLE_INTERVAL = get_settings().profile_sample_interval
+# 자동 수집을 시작하는 p99 지연 시간 (초, 0이면 비활성화)
+PROFILE_P99_THRESHOLD = get_settings().profile_p99_threshold
+# p99를 계산하는 주기 (초)
+PROFILE_CHECK_INTERVAL = get_settings().profile_check_interval
+# 자동 수집 시 프로파일링 시간 (초)
+PROFILE_AUTO_SECONDS = get_settings().profile_auto_seconds
+# 자동 수집 후 다시 수집하지 않는 시간 (초)
+PROFILE_COOLDOWN = get_settings().profile_cooldown
+# 보관하는 최근 프로파일 결과 수
+PROFILE_HISTORY = 5
+# 최소 관측 수 (요청이 적을 때의 p99는 의미가 없음)
+PROFILE_MIN_SAMPLES = 20
+# p99 계산에서 빼는 경로 접두사 (관리자 엔드포인트, 프로파일링 요청 자체가 수 초 걸림)
+PROFILE_EXCLUDED_PREFIXES = ("/admin/",)
+# p99 계산에서 빼는 스트리밍 경로 (연결이 오래 열려 있어 지연 시간이 처리 시간을 뜻하지 않음)
+PROFILE_EXCLUDED_ROUTES = frozenset({
+    "/problem/stream",
+    "/logs/{agent_name}/follow",
+    "/matrix",
+    "/jobs/{job_id}/result",
+})
+
+
+def counts_toward_p99(labels: Dict[str, str]) -> bool:
+    """
+    요청 지연 시간 레이블 조합이 자동 수집의 p99 계산에 포함되는지 판단합니다.
+
+    Args:
+        labels (Dict[str, str]): 히스토그램 레이블 (route 레이블이 없으면 포함)
+
+    Returns:
+        bool: 관리자 엔드포인트나 스트리밍 경로가 아니면 True
+    """
+    route = labels.get("route", "")
+    return route not in PROFILE_EXCLUDED_ROUTES and not route.startswith(PROFILE_EXCLUDED_PREFIXES)
+
+
+def frame_label(frame) -> str:
+    """
+    스택 프레임을 `파일:함수` 형식으로 변환합니다.
+
+    Args:
+        frame: 파이썬 프레임 객체
+
+    Returns:
+        str: 프레임 이름
+    """
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class StackSampler:
+    """
+    다른 스레드에서 대상 스레드의 스택을 주기적으로 수집하는 통계적 프로파일러
+
+    대상 스레드(이벤트 루프)에는 계측 코드를 넣지 않으므로 오버헤드가 작습니다.
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        """
+        StackSampler 초기화
+
+        Args:
+            thread_id (int): 샘플링할 스레드 ID
+            interval (float): 샘플링 간격 (초)
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: CounterDict = CounterDict()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """
+        샘플링 스레드를 시작합니다.
+        """
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        샘플링 스레드를 멈춥니다.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(frame_label(frame))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(labels))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """
+        수집한 스택을 collapsed-stack 형식으로 반환합니다.
+
+        Returns:
+            str: `프레임;프레임;... 횟수` 줄 목록 (많이 관측된 순)
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class Profiler:
+    """
+    이벤트 루프 프로파일링을 한 번에 하나씩 실행하고 최근 결과를 보관합니다.
+    """
+
+    def __init__(self, history: int = PROFILE_HISTORY):
+        """
+        Profiler 초기화
+
+        Args:
+            history (int): 보관할 최근 결과 수
+        """
+        self.results: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._lock = asyncio.Lock()
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    async def run(self, seconds: float, mode: str = "sample", reason: str = "manual") -> Dict[str, Any]:
+        """
+        이벤트 루프를 지정한 시간 동안 프로파일링합니다.
+
+        이벤트 루프 스레드에서 호출해야 합니다.
+
+        Args:
+            seconds (float): 프로파일링 시간 (초)
+            mode (str): 'cprofile' (pstats 텍스트) 또는 'sample' (collapsed-stack 텍스트)
+            reason (str): 수집 이유 ('manual' 또는 'auto')
+
+        Returns:
+            Dict[str, Any]: 수집 시각, 방식, 이유, 결과 텍스트
+        """
+        async with self._lock:
+            started = datetime.now().isoformat()
+            if mode == "cprofile":
+                profile = cProfile.Profile()
+                profile.enable()
+                try:
+                    await asyncio.sleep(seconds)
+                finally:
+                    profile.disable()
+                output = io.StringIO()
+                pstats.Stats(profile, stream=output).sort_stats("cumulative").print_stats(50)
+                text = output.getvalue()
+            else:
+                sampler = StackSampler(threading.get_ident())
+                sampler.start()
+                try:
+                    await asyncio.sleep(seconds)
+                finally:
+                    # Reason: join이 이벤트 루프를 막지 않도록 스레드 풀에서 멈춥니다.
+                    await asyncio.get_running_loop().run_in_executor(None, sampler.stop)
+                text = sampler.collapsed()
+
+            result = {
+                "started_at": started,
+                "seconds": seconds,
+                "mode": mode,
+                "reason": reason,
+                "text": text,
+            }
+            self.results.append(result)
+            return result
+
+
+class AutoProfiler:
+    """
+    요청 p99 지연 시간이 임계값을 넘으면 샘플링 프로파일을 자동으로 수집합니다.
+
+    p99는 직전 확인 이후 늘어난 히스토그램 버킷 수로 추정하며, 관리자 엔드포인트와 스트리밍 경로는 제외합니다.
+    """
+
+    def __init__(
+        self,
+        profiler: Profiler,
+        threshold: float = PROFILE_P99_THRESHOLD,
+        histogram: Histogram = http_request_duration,
+        cooldown: float = PROFILE_COOLDOWN,
+        route_filter: Callable[[Dict[str, str]], bool] = counts_toward_p99,
+    ):
+        """
+        AutoProfiler 초기화
+
+        Args:
+            profiler (Profiler): 프로파일 실행기
+            threshold (float): p99 임계값 (초)
+            histogram (Histogram): 요청 지연 시간 히스토그램
+            cooldown (float): 수집 후 다시 수집하지 않는 시간 (초)
+            route_filter (Callable[[Dict[str, str]], bool]): p99 계산에 포함할 레이블 조합을 고르는 함수
+        """
+        self.profiler = profiler
+        self.threshold = threshold
+        self.histogram = histogram
+        self.cooldown = cooldown
+        self.route_filter = route_filter
+        self._previous: List[int] = histogram.totals(route_filter)
+        self._last_capture: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def window_p99(self) -> Optional[float]:
+        """
+        직전 호출 이후 관측된 요청의 p99 상한을 계산합니다.
+
+        Returns:
+            Optional[float]: p99 상한 (관측이 부족하면 None)
+        """
+        current = self.histogram.totals(self.route_filter)
+        window = [now - before for now, before in zip(current, self._previous)]
+        self._previous = current
+        if sum(window) < PROFILE_MIN_SAMPLES:
+            return None
+        return bucket_quantile(self.histogram.buckets, window, 0.99)
+
+    def should_capture(self) -> bool:
+        """
+        지금 자동 수집을 시작해야 하는지 판단합니다.
+
+        Returns:
+            bool: p99가 임계값을 넘었고 대기 시간이 지났으면 True
+        """
+        p99 = self.window_p99()
+        if p99 is None or p99 <= self.threshold or self.profiler.busy:
+            return False
+        now = time.monotonic()
+        if self._last_capture is not None and now - self._last_capture < self.cooldown:
+            return False
+        self._last_capture = now
+        return True
+
+    async def _watch(self, service: str):
+        logger = get_agent_logger(service)
+        while True:
+            await asyncio.sleep(PROFILE_CHECK_INTERVAL)
+            if self.should_capture():
+                logger.warning(f"요청 p99가 {self.threshold}초를 넘어 프로파일을 자동 수집합니다.")
+                await self.profiler.run(PROFILE_AUTO_SECONDS, "sample", reason="auto")
+
+    def start(self, service: str):
+        """
+        p99 감시 작업을 시작합니다 (이벤트 루프 안에서 호출).
+
+        Args:
+            service (str): 경고 로그를 남길 에이전트 이름
+        """
+        if self.threshold > 0 and self._task is None:
+            self._task = asyncio.create_task(self._watch(service))
+
+    def stop(self):
+        """
+        p99 감시 작업을 멈춥니다.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+# 프로세스 전역 프로파일러
+profiler = Profiler()
+
+router = APIRouter(prefix="/admin/profile", dependencies=[Depends(require_admin)])
+
+
+@router.post("", response_class=PlainTextResponse)
+async def run_profile(
+    seconds: float = Query(5.0, gt=0, le=120, description="프로파일링 시간 (초)"),
+    mode: str = Query("sample", pattern="^(cprofile|sample)$", description="cprofile 또는 sample"),
+) -> PlainTextResponse:
+    """
+    이벤트 루프를 N초 동안 프로파일링하고 결과 텍스트를 반환합니다.
+
+    Args:
+        seconds: 프로파일링 시간 (초)
+        mode: 'cprofile'이면 pstats 텍스트, 'sample'이면 collapsed-stack 텍스트
+
+    Returns:
+        PlainTextResponse: 프로파일 결과
+
+    Raises:
+        HTTPException: 다른 프로파일링이 진행 중인 경우
+    """
+    if profiler.busy:
+        raise HTTPException(status_code=409, detail="다른 프로파일링이 진행 중입니다.")
+    result = await profiler.run(seconds, mode)
+    return PlainTextResponse(result["text"])
+
+
+@router.get("/results")
+async def list_profiles() -> Dict[str, Any]:
+    """
+    최근 프로파일 결과(자동 수집 포함)를 최신순으로 조회합니다.
+
+    Returns:
+        Dict[str, Any]: 프로파일 결과 목록
+    """
+    return {"busy": profiler.busy, "results": list(reversed(profiler.results))}
+
+
+def instrument_profiling(app: FastAPI, service: str):
+    """
+    앱에 프로파일링 관리자 엔드포인트와 p99 자동 수집을 추가합니다.
+
+    Args:
+        app (FastAPI): 대상 FastAPI 앱
+        service (str): 에이전트 이름 (로그에 사용)
+    """
+    app.include_router(router)
+    auto = AutoProfiler(profiler)
+    app.add_event_handler("startup", lambda: auto.start(service))
+    app.add_event_handler("shutdown", auto.stop)
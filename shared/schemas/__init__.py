@@ -2,6 +2,9 @@
 구구단 프로젝트 스키마 정의 패키지
 """
 from shared.schemas.messages import (
+    PacingPolicy,
+    RunOptions,
+    JobSpec,
     SupervisorRequest,
     SupervisorResponse,
     ProblemRequest,
@@ -13,6 +16,9 @@ from shared.schemas.messages import (
 )
 
 __all__ = [
+    "PacingPolicy",
+    "RunOptions",
+    "JobSpec",
     "SupervisorRequest",
     "SupervisorResponse",
     "ProblemRequest",
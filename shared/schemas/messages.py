@@ -3,18 +3,81 @@
 
 에이전트 간 통신에 사용되는 메시지 형식을 정의합니다.
 """
-from typing import Optional, Literal
-from pydantic import BaseModel, Field
+from typing import List, Optional, Literal
+from pydantic import BaseModel, Field, model_validator
+
+from shared.gugudan import format_problem, parse_problem
+
+
+class PacingPolicy(BaseModel):
+    """구구단 단계 사이의 진행 속도 정책"""
+    mode: Literal["none", "fixed", "token_bucket", "ack"] = Field(
+        "fixed", description="페이싱 방식 (none: 대기 없음, fixed: 고정 간격, token_bucket: 토큰 버킷, ack: 클라이언트 확인)"
+    )
+    interval: float = Field(1.0, description="fixed 모드의 단계 간격 (초)", ge=0)
+    rate: float = Field(1.0, description="token_bucket 모드의 초당 단계 수", gt=0)
+    burst: int = Field(1, description="token_bucket 모드의 최대 연속 단계 수", ge=1)
+    ack_timeout: Optional[float] = Field(
+        30.0, description="ack 모드에서 클라이언트 확인을 기다리는 최대 시간 (초, None이면 무제한)", gt=0
+    )
+
+
+class RunOptions(BaseModel):
+    """구구단 실행 옵션"""
+    pacing: PacingPolicy = Field(default_factory=PacingPolicy, description="단계 진행 속도 정책")
+    execution: Literal["sequential", "planned"] = Field(
+        "sequential", description="실행 방식 (sequential: 단계별 순차 실행, planned: 계획 후 다음 K단계 동시 요청)"
+    )
+    lookahead: int = Field(3, description="planned 모드에서 동시에 요청할 최대 단계 수 (K)", ge=1, le=32)
+    topology: Optional[Literal["relay", "direct"]] = Field(
+        None,
+        description="답변 요청 경로 (relay: 문제 생성기를 거쳐 답변기, direct: 답변기 직접 호출, None이면 서버 기본값)",
+    )
+
+
+class JobSpec(BaseModel):
+    """
+    슈퍼바이저 일괄 작업(job) 명세
+
+    pairs 작업은 각 단수의 곱하는 수 범위 전체를, stop_sweep 작업은 각 단수와 종료 조건 값 조합의
+    실행 단계를 답변기에 요청하고 결과를 파일에 기록합니다.
+    """
+    kind: Literal["pairs", "stop_sweep"] = Field(
+        "pairs", description="작업 종류 (pairs: 단수 × 곱하는 수 전체, stop_sweep: 종료 조건 값별 실행)"
+    )
+    tables: List[int] = Field(..., description="구구단 단수 목록 (1~100)", min_length=1)
+    multiplicand_start: int = Field(1, description="시작 곱하는 수", ge=0)
+    multiplicand_end: int = Field(9, description="마지막 곱하는 수", ge=0, le=10_000)
+    stop_values: List[int] = Field(default_factory=list, description="stop_sweep 작업의 종료 조건 값 목록")
+    format: Literal["jsonl", "csv"] = Field("jsonl", description="결과 파일 형식")
+    concurrency: int = Field(4, description="동시에 답변을 요청하는 작업자 수", ge=1, le=32)
+    rate: Optional[float] = Field(None, description="초당 최대 답변 요청 수 (None이면 제한 없음)", gt=0)
+    topology: Optional[Literal["relay", "direct"]] = Field(
+        None, description="답변 요청 경로 (None이면 서버 기본값)"
+    )
+
+    @model_validator(mode="after")
+    def check_ranges(self) -> "JobSpec":
+        """단수, 곱하는 수 범위, stop_sweep의 종료 조건 값을 확인합니다."""
+        if any(table < 1 or table > 100 for table in self.tables):
+            raise ValueError("단수는 1~100 사이여야 합니다.")
+        if self.multiplicand_start > self.multiplicand_end:
+            raise ValueError("multiplicand_start는 multiplicand_end보다 클 수 없습니다.")
+        if self.kind == "stop_sweep" and not self.stop_values:
+            raise ValueError("stop_sweep 작업에는 stop_values가 필요합니다.")
+        return self
 
 
 class SupervisorRequest(BaseModel):
     """사용자로부터 슈퍼바이저로의 요청 메시지"""
     message: str = Field(..., description="사용자 요청 메시지")
+    options: RunOptions = Field(default_factory=RunOptions, description="구구단 실행 옵션")
 
 
 class SupervisorResponse(BaseModel):
     """슈퍼바이저로부터 사용자로의 응답 메시지"""
     message: str = Field(..., description="슈퍼바이저 응답 메시지")
+    run_id: Optional[str] = Field(None, description="시작된 구구단 실행 ID")
 
 
 class ProblemRequest(BaseModel):
@@ -34,8 +97,41 @@ class ProblemGenerated(BaseModel):
 
 
 class AnswerRequest(BaseModel):
-    """문제 생성기로부터 답변기로의 문제 전송 메시지"""
-    problem: str = Field(..., description="구구단 문제 (예: '3×4=')")
+    """
+    문제 생성기(또는 슈퍼바이저)로부터 답변기로의 문제 전송 메시지
+
+    multiplier와 multiplicand가 있으면 답변기는 문제 문자열을 파싱하지 않습니다.
+    호환성을 위해 문제 문자열만 보내는 요청도 받으며, 숫자만 보내면 문제 문자열을 채웁니다.
+    """
+    problem: Optional[str] = Field(None, description="구구단 문제 (예: '3×4=')")
+    multiplier: Optional[int] = Field(None, description="첫 번째 숫자 (N, 0~100)", ge=0, le=100)
+    multiplicand: Optional[int] = Field(None, description="두 번째 숫자 (X, 0~10000)", ge=0, le=10_000)
+    id: Optional[str] = Field(None, description="문제 ID (응답에 그대로 포함)")
+
+    @model_validator(mode="after")
+    def fill_problem(self) -> "AnswerRequest":
+        """
+        문제 문자열이나 두 숫자 중 하나는 있어야 하며, 숫자만 있으면 문제 문자열을 채웁니다.
+
+        문제 문자열과 숫자가 함께 오면 문자열의 숫자가 같아야 합니다.
+        """
+        if self.problem is None:
+            if not self.structured:
+                raise ValueError("problem 또는 multiplier와 multiplicand가 필요합니다.")
+            self.problem = format_problem(self.multiplier, self.multiplicand)
+        elif self.structured:
+            numbers = parse_problem(self.problem)
+            if numbers is not None and numbers != (self.multiplier, self.multiplicand):
+                raise ValueError(
+                    f"problem({self.problem})과 multiplier({self.multiplier}), "
+                    f"multiplicand({self.multiplicand})가 일치하지 않습니다."
+                )
+        return self
+
+    @property
+    def structured(self) -> bool:
+        """multiplier와 multiplicand가 모두 있는지 여부"""
+        return self.multiplier is not None and self.multiplicand is not None
 
 
 class AnswerResponse(BaseModel):
@@ -44,6 +140,8 @@ class AnswerResponse(BaseModel):
     calculation: str = Field(..., description="전체 계산식 (예: '3×4=12')")
     explanation: Optional[str] = Field(None, description="계산 결과에 대한 교육적 설명")
     visual_representation: Optional[str] = Field(None, description="구구단 계산의 시각적 표현")
+    id: Optional[str] = Field(None, description="요청의 문제 ID")
+    explanation_error: bool = Field(False, description="설명 생성에 실패해 explanation에 오류 안내 문구가 담겼는지 여부")
 
 
 class StatusUpdate(BaseModel):
@@ -59,11 +157,12 @@ class StatusUpdate(BaseModel):
 
 class WebSocketMessage(BaseModel):
     """웹소켓을 통한 메시지"""
-    type: Literal["user_message", "system_message", "problem", "answer", "status_update", "explanation"] = Field(
+    type: Literal["user_message", "system_message", "problem", "answer", "status_update", "explanation", "ack", "session", "agent_status"] = Field(
         ..., description="메시지 유형"
     )
     content: str = Field(..., description="메시지 내용")
     sender: Literal["user", "system", "agent1", "agent2", "supervisor"] = Field(
         ..., description="메시지 발신자"
     )
-    timestamp: Optional[str] = Field(None, description="메시지 타임스탬프") 
\ No newline at end of file
+    timestamp: Optional[str] = Field(None, description="메시지 타임스탬프")
+    seq: Optional[int] = Field(None, description="세션 내 이벤트 시퀀스 번호 (서버가 전송 시 부여)") 
\ No newline at end of file
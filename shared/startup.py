@@ -0,0 +1,127 @@
+"""
+시작 시간 보고 모듈
+
+에이전트 앱 모듈을 `python -X importtime`으로 새 프로세스에서 가져와 모듈별 가져오기 시간과
+앱 모듈 자체의 초기화 시간을 정리하고, 그 프로세스가 사용하는 설정 값을 함께 보여줍니다.
+각 에이전트의 `main.py --startup-report`에서 사용합니다.
+"""
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+from shared.config import ROOT_DIR, format_settings, get_settings
+
+# 보고서에 표시할 최대 항목 수
+REPORT_TOP = 15
+
+# 자식 프로세스에서 앱 모듈을 가져오며 전체 시간을 출력하는 코드
+_IMPORT_SCRIPT = (
+    "import sys, time\n"
+    "started = time.perf_counter()\n"
+    # importlib.import_module은 -X importtime 측정 대상이 아니므로 __import__ 사용
+    "__import__(sys.argv[1])\n"
+    "print(time.perf_counter() - started)\n"
+)
+
+
+class ImportTiming(NamedTuple):
+    """
+    `-X importtime` 한 줄의 측정값
+
+    Attributes:
+        module (str): 모듈 이름
+        self_us (int): 모듈 자체 실행 시간 (마이크로초)
+        cumulative_us (int): 하위 모듈 가져오기를 포함한 시간 (마이크로초)
+    """
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    `-X importtime` 출력을 파싱합니다.
+
+    Args:
+        output (str): 표준 에러로 출력된 importtime 텍스트
+
+    Returns:
+        List[ImportTiming]: 모듈별 측정값 (출력 순서)
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            # 머리글 줄 건너뜀
+            continue
+        timings.append(ImportTiming(parts[2].strip(), int(parts[0]), int(parts[1])))
+    return timings
+
+
+def format_report(module: str, total_seconds: float, timings: List[ImportTiming], top: int = REPORT_TOP) -> str:
+    """
+    시작 시간 보고서를 만듭니다.
+
+    Args:
+        module (str): 측정한 앱 모듈 이름
+        total_seconds (float): 앱 모듈 가져오기 전체 시간 (초)
+        timings (List[ImportTiming]): 모듈별 측정값
+        top (int): 항목별 최대 표시 수
+
+    Returns:
+        str: 보고서 텍스트
+    """
+    by_package: Dict[str, int] = defaultdict(int)
+    for timing in timings:
+        by_package[timing.module.split(".")[0]] += timing.self_us
+    app_self = sum(timing.self_us for timing in timings if timing.module == module)
+
+    lines = [
+        f"[시작 시간 보고] {module}",
+        f"전체 가져오기+초기화: {total_seconds * 1000:.1f}ms",
+        f"{module} 초기화(모듈 본문 실행): {app_self / 1000:.1f}ms",
+        "",
+        "패키지별 가져오기 시간:",
+    ]
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append(f"  {package:<30} {self_us / 1000:8.1f}ms")
+    lines += ["", "가장 느린 모듈 (자체 시간):"]
+    for timing in sorted(timings, key=lambda timing: timing.self_us, reverse=True)[:top]:
+        lines.append(f"  {timing.module:<40} {timing.self_us / 1000:8.1f}ms")
+    return "\n".join(lines)
+
+
+def startup_report(module: str, app_dir: str) -> str:
+    """
+    앱 모듈을 새 프로세스에서 가져와 시작 시간 보고서를 만듭니다.
+
+    Args:
+        module (str): 앱 모듈 이름 (예: 'app.api')
+        app_dir (str): 앱 모듈이 있는 에이전트 디렉토리
+
+    Returns:
+        str: 보고서 텍스트 (끝에 현재 설정 값 포함)
+
+    Raises:
+        RuntimeError: 앱 모듈을 가져오지 못한 경우
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [app_dir, str(ROOT_DIR), env.get("PYTHONPATH")]))
+    # Reason: 이미 가져온 모듈이 없는 새 프로세스에서 측정해야 실제 시작 비용이 드러납니다.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_SCRIPT, module],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=str(ROOT_DIR),
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} 가져오기 실패:\n{result.stderr[-2000:]}")
+    total_seconds = float(result.stdout.strip().splitlines()[-1])
+    report = format_report(module, total_seconds, parse_importtime(result.stderr))
+    # Reason: 자식 프로세스는 같은 환경 변수와 .env로 설정을 읽으므로 현재 프로세스의 설정이 곧 앱의 설정입니다.
+    return "\n".join([report, "", "설정 (환경 변수/.env 적용 결과):", *format_settings(get_settings())])
@@ -0,0 +1,373 @@
+"""
+공통 분산 추적 모듈
+
+구구단 실행과 단계마다 추적 컨텍스트를 만들고, W3C `traceparent` 헤더로
+슈퍼바이저 → 에이전트1 → 에이전트2 → LLM 호출까지 전달합니다.
+구간(span) 시간은 프로세스 메모리의 링 버퍼(`/traces`)와 선택적으로 JSONL 파일에 기록됩니다.
+샘플링되지 않은 추적은 컨텍스트만 전달하고 시간을 기록하지 않으므로 항상 켜 두어도 부담이 적습니다.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from fastapi import FastAPI, Query
+
+from shared.config import get_settings
+from shared.logger import LOG_DIR, BatchingQueueListener, BufferedRotatingFileHandler
+
+# 새 추적을 샘플링할 확률 (0~1, 상위 컨텍스트가 있으면 그 결정을 따름)
+TRACE_SAMPLE_RATE = get_settings().trace_sample_rate
+# 메모리에 보관하는 최근 구간 수
+TRACE_BUFFER_SIZE = get_settings().trace_buffer_size
+# 구간 내보내기 방식 ('memory' 또는 'jsonl')
+TRACE_EXPORT = get_settings().trace_export
+# JSONL 내보내기 파일 경로
+TRACE_FILE = os.path.join(LOG_DIR, "traces.jsonl")
+# 추적 컨텍스트 헤더
+TRACEPARENT_HEADER = "traceparent"
+
+
+class Span:
+    """
+    추적 구간
+
+    샘플링되지 않은 구간은 추적 ID와 샘플링 여부만 전달하고 기록되지 않습니다.
+    """
+
+    __slots__ = (
+        "trace_id", "span_id", "parent_id", "sampled", "name",
+        "service", "attributes", "status", "started", "start_time",
+    )
+
+    def __init__(
+        self,
+        trace_id: str,
+        span_id: str,
+        parent_id: Optional[str],
+        sampled: bool,
+        name: str = "",
+        service: str = "unknown",
+    ):
+        """
+        Span 초기화
+
+        Args:
+            trace_id (str): 추적 ID (16진수 32자)
+            span_id (str): 구간 ID (16진수 16자)
+            parent_id (Optional[str]): 상위 구간 ID
+            sampled (bool): 샘플링 여부
+            name (str): 구간 이름
+            service (str): 구간을 기록한 서비스 이름
+        """
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.name = name
+        self.service = service
+        self.attributes: Dict[str, Any] = {}
+        self.status = "ok"
+        self.started = time.perf_counter()
+        self.start_time = time.time()
+
+    def set_attribute(self, key: str, value: Any):
+        """
+        구간 속성을 설정합니다 (샘플링된 구간에만 기록).
+
+        Args:
+            key (str): 속성 이름
+            value (Any): 속성 값
+        """
+        if self.sampled:
+            self.attributes[key] = value
+
+    def traceparent(self) -> str:
+        """
+        이 구간을 상위로 하는 `traceparent` 헤더 값을 반환합니다.
+
+        Returns:
+            str: `00-{trace_id}-{span_id}-{flags}` 형식 문자열
+        """
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def to_dict(self, duration_ms: float) -> Dict[str, Any]:
+        """
+        내보내기용 딕셔너리로 변환합니다.
+
+        Args:
+            duration_ms (float): 구간 시간 (밀리초)
+
+        Returns:
+            Dict[str, Any]: 구간 정보
+        """
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "service": self.service,
+            "start": self.start_time,
+            "duration_ms": round(duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+# 현재 실행 흐름의 구간
+current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def new_id(bits: int) -> str:
+    """
+    임의의 16진수 ID를 생성합니다.
+
+    Args:
+        bits (int): ID 비트 수
+
+    Returns:
+        str: 16진수 문자열
+    """
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Span]:
+    """
+    `traceparent` 헤더를 원격 상위 구간으로 변환합니다.
+
+    Args:
+        value (Optional[str]): 헤더 값
+
+    Returns:
+        Optional[Span]: 원격 상위 구간 (형식이 잘못되었으면 None)
+    """
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        flags = int(parts[3], 16)
+        int(parts[1], 16)
+        int(parts[2], 16)
+    except ValueError:
+        return None
+    return Span(parts[1], parts[2], None, bool(flags & 1))
+
+
+class SpanExporter:
+    """
+    완료된 구간을 메모리 링 버퍼와 선택적으로 JSONL 파일에 기록하는 내보내기
+    """
+
+    def __init__(self, capacity: int = TRACE_BUFFER_SIZE, jsonl_path: Optional[str] = None):
+        """
+        SpanExporter 초기화
+
+        Args:
+            capacity (int): 메모리에 보관할 최근 구간 수
+            jsonl_path (Optional[str]): JSONL 파일 경로 (None이면 파일에 기록하지 않음)
+        """
+        self.spans: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self.jsonl_path = jsonl_path
+        self._queue_handler: Optional[QueueHandler] = None
+        self._listener: Optional[BatchingQueueListener] = None
+
+    def export(self, span: Dict[str, Any]):
+        """
+        완료된 구간을 기록합니다.
+
+        Args:
+            span (Dict[str, Any]): 구간 정보
+        """
+        self.spans.append(span)
+        if self.jsonl_path:
+            if self._queue_handler is None:
+                self._start_file_writer()
+            # Reason: 파일 기록은 로깅 모듈의 백그라운드 리스너가 배치로 처리하므로 이벤트 루프를 막지 않습니다.
+            self._queue_handler.handle(
+                logging.makeLogRecord({"msg": json.dumps(span, ensure_ascii=False)})
+            )
+
+    def _start_file_writer(self):
+        directory = os.path.dirname(self.jsonl_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file_handler = BufferedRotatingFileHandler(
+            self.jsonl_path, maxBytes=10 * 1024 * 1024, backupCount=3, encoding="utf-8"
+        )
+        file_handler.setFormatter(logging.Formatter("%(message)s"))
+        span_queue = queue.Queue(-1)
+        self._queue_handler = QueueHandler(span_queue)
+        self._listener = BatchingQueueListener(span_queue, file_handler)
+        self._listener.start()
+        atexit.register(self.close)
+
+    def recent(self, trace_id: Optional[str] = None, limit: int = 200) -> List[Dict[str, Any]]:
+        """
+        최근 구간을 최신순으로 조회합니다.
+
+        Args:
+            trace_id (Optional[str]): 추적 ID (None이면 전체)
+            limit (int): 최대 구간 수
+
+        Returns:
+            List[Dict[str, Any]]: 구간 정보 목록
+        """
+        result = []
+        for span in reversed(self.spans):
+            if trace_id is None or span["trace_id"] == trace_id:
+                result.append(span)
+                if len(result) >= limit:
+                    break
+        return result
+
+    def close(self):
+        """
+        JSONL 파일 기록을 멈추고 남은 구간을 모두 기록합니다.
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+            self._queue_handler = None
+
+
+# 프로세스 전역 내보내기
+exporter = SpanExporter(jsonl_path=TRACE_FILE if TRACE_EXPORT == "jsonl" else None)
+
+
+@contextmanager
+def start_span(
+    name: str,
+    service: Optional[str] = None,
+    parent: Optional[Span] = None,
+    **attributes: Any,
+) -> Iterator[Span]:
+    """
+    현재 구간의 하위 구간을 시작합니다.
+
+    상위 구간이 없으면 새 추적을 만들고 TRACE_SAMPLE_RATE에 따라 샘플링 여부를 정합니다.
+    샘플링되지 않은 추적은 ID만 전달하고 시간은 기록하지 않습니다.
+
+    Args:
+        name (str): 구간 이름
+        service (Optional[str]): 서비스 이름 (None이면 상위 구간의 서비스)
+        parent (Optional[Span]): 상위 구간 (None이면 현재 구간)
+        **attributes: 구간 속성
+
+    Yields:
+        Span: 시작된 구간
+    """
+    parent = parent or current_span.get()
+    if parent is None:
+        span = Span(new_id(128), new_id(64), None, random.random() < TRACE_SAMPLE_RATE, name, service or "unknown")
+    else:
+        span = Span(parent.trace_id, new_id(64), parent.span_id, parent.sampled, name, service or parent.service)
+    if span.sampled:
+        span.attributes.update(attributes)
+
+    token = current_span.set(span)
+    try:
+        yield span
+    except BaseException:
+        span.status = "error"
+        raise
+    finally:
+        current_span.reset(token)
+        if span.sampled:
+            exporter.export(span.to_dict((time.perf_counter() - span.started) * 1000))
+
+
+def inject(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    현재 구간의 추적 컨텍스트를 요청 헤더에 추가합니다.
+
+    Args:
+        headers (Optional[Dict[str, str]]): 기존 헤더
+
+    Returns:
+        Dict[str, str]: `traceparent`가 추가된 헤더 (현재 구간이 없으면 그대로)
+    """
+    headers = dict(headers or {})
+    span = current_span.get()
+    if span is not None:
+        headers[TRACEPARENT_HEADER] = span.traceparent()
+    return headers
+
+
+class TracingMiddleware:
+    """
+    들어오는 HTTP 요청마다 서버 구간을 만드는 ASGI 미들웨어
+
+    요청의 `traceparent` 헤더가 있으면 그 추적을 이어받습니다.
+    """
+
+    def __init__(self, app, service: str):
+        """
+        TracingMiddleware 초기화
+
+        Args:
+            app: 감쌀 ASGI 애플리케이션
+            service (str): 서비스 이름
+        """
+        self.app = app
+        self.service = service
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header = None
+        for key, value in scope.get("headers", ()):
+            if key == b"traceparent":
+                header = value.decode("latin-1")
+                break
+        remote = parse_traceparent(header)
+
+        with start_span(f"{scope['method']} {scope['path']}", self.service, parent=remote) as span:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start" and span.sampled:
+                    status = message["status"]
+                    span.set_attribute("http.status_code", status)
+                    if status >= 500:
+                        span.status = "error"
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+            route = scope.get("route")
+            if route is not None:
+                # 경로 파라미터 대신 라우트 템플릿으로 이름을 정함
+                span.name = f"{scope['method']} {route.path}"
+
+
+def instrument_tracing(app: FastAPI, service: str):
+    """
+    앱에 추적 미들웨어와 최근 구간 조회 엔드포인트(`/traces`)를 추가합니다.
+
+    Args:
+        app (FastAPI): 대상 FastAPI 앱
+        service (str): 서비스 이름
+    """
+    app.add_middleware(TracingMiddleware, service=service)
+
+    @app.get("/traces", include_in_schema=False)
+    async def get_traces(
+        trace_id: Optional[str] = Query(None, description="추적 ID"),
+        limit: int = Query(200, ge=1, le=5000, description="조회할 최대 구간 수"),
+    ) -> Dict[str, Any]:
+        """
+        이 프로세스에 기록된 최근 구간을 최신순으로 조회합니다.
+        """
+        spans = exporter.recent(trace_id, limit)
+        return {"service": service, "sample_rate": TRACE_SAMPLE_RATE, "spans": spans}
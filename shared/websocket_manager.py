@@ -2,75 +2,357 @@
 웹소켓 연결 관리 모듈
 
 클라이언트의 웹소켓 연결을 관리하는 기능을 제공합니다.
+클라이언트마다 세션을 두고, 전송하는 모든 이벤트에 단조 증가하는 시퀀스 번호를 붙여
+세션별 링 버퍼에 보관하므로 재연결한 클라이언트는 놓친 이벤트만 다시 받을 수 있습니다.
 """
 from fastapi import WebSocket
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Awaitable, Optional, Deque
+from collections import deque
+import asyncio
 import json
+import time
+import uuid
+
+from shared.config import get_settings
+from shared.metrics import REGISTRY
+
+# 세션별로 보관하는 최근 이벤트 개수
+SESSION_BUFFER_SIZE = get_settings().session_buffer_size
+# 연결이 끊긴 세션을 재연결 대기 상태로 유지하는 시간 (초)
+SESSION_TTL = get_settings().session_ttl
+# 만료된 세션을 정리하는 주기 (초)
+SESSION_PRUNE_INTERVAL = 60.0
+
+# 이벤트 한 번의 팬아웃 시간 (source: 'broadcast'는 모든 세션으로의 직렬화 + 전송, 'run'은 실행 구독자 전달)
+broadcast_duration = REGISTRY.histogram(
+    "websocket_broadcast_duration_seconds",
+    "웹소켓 브로드캐스트와 실행 이벤트 팬아웃 시간 (초)",
+    ("source",),
+)
+
+
+def encode_event(message: Dict[str, Any], seq: int) -> str:
+    """
+    메시지를 시퀀스 번호가 포함된 JSON 문자열로 변환합니다.
+
+    Args:
+        message (Dict[str, Any]): 전송할 메시지 데이터
+        seq (int): 시퀀스 번호
+
+    Returns:
+        str: 전송할 JSON 문자열
+    """
+    return encode_with_seq(json.dumps(message), seq)
+
+
+def encode_with_seq(payload: str, seq: int) -> str:
+    """
+    이미 직렬화된 JSON 객체 문자열 앞에 시퀀스 번호 필드를 붙입니다.
+
+    Args:
+        payload (str): 직렬화된 JSON 객체 문자열
+        seq (int): 시퀀스 번호
+
+    Returns:
+        str: 시퀀스 번호가 포함된 JSON 문자열
+    """
+    # Reason: 브로드캐스트 메시지를 세션마다 다시 직렬화하지 않도록 문자열에 필드만 붙입니다.
+    if payload == "{}":
+        return f'{{"seq": {seq}}}'
+    return f'{{"seq": {seq}, {payload[1:]}'
+
+
+class Session:
+    """
+    클라이언트 세션
+
+    연결이 끊겨도 일정 시간 유지되며, 그동안의 이벤트도 링 버퍼에 보관합니다.
+    """
+
+    def __init__(self, session_id: Optional[str] = None, buffer_size: int = SESSION_BUFFER_SIZE):
+        """
+        Session 초기화
+
+        Args:
+            session_id (Optional[str]): 세션 ID (None이면 새로 생성)
+            buffer_size (int): 보관할 최근 이벤트 개수
+        """
+        self.session_id = session_id or uuid.uuid4().hex
+        self.websocket: Optional[WebSocket] = None
+        self.last_seq = 0
+        self.buffer: Deque[tuple] = deque(maxlen=buffer_size)
+        self.disconnected_at: Optional[float] = None
+
+    def record(self, payload: str) -> str:
+        """
+        다음 시퀀스 번호를 붙여 이벤트를 링 버퍼에 보관합니다.
+
+        Args:
+            payload (str): 직렬화된 JSON 객체 문자열
+
+        Returns:
+            str: 시퀀스 번호가 포함된 전송 문자열
+        """
+        self.last_seq += 1
+        text = encode_with_seq(payload, self.last_seq)
+        self.buffer.append((self.last_seq, text))
+        return text
+
+    def missed_since(self, last_seq: int) -> List[str]:
+        """
+        지정한 시퀀스 번호 이후의 이벤트를 반환합니다.
+
+        Args:
+            last_seq (int): 클라이언트가 마지막으로 받은 시퀀스 번호
+
+        Returns:
+            List[str]: 놓친 이벤트의 전송 문자열 목록
+        """
+        return [text for seq, text in self.buffer if seq > last_seq]
+
+    async def deliver(self, text: str) -> bool:
+        """
+        연결되어 있으면 전송 문자열을 클라이언트에게 보냅니다.
+
+        Args:
+            text (str): 전송 문자열
+
+        Returns:
+            bool: 전송에 실패했으면 False
+        """
+        if self.websocket is None:
+            return True
+        try:
+            await self.websocket.send_text(text)
+            return True
+        except Exception:
+            return False
+
+    async def send(self, message: Dict[str, Any]):
+        """
+        세션에 이벤트를 기록하고 연결되어 있으면 전송합니다.
+
+        연결이 끊긴 동안의 이벤트는 버퍼에만 남고 재연결 시 전달됩니다.
+
+        Args:
+            message (Dict[str, Any]): 전송할 메시지 데이터
+        """
+        await self.deliver(self.record(json.dumps(message)))
 
 
 class ConnectionManager:
     """
     웹소켓 클라이언트 연결을 관리하는 클래스
-    
+
     클라이언트 연결 상태 관리 및 메시지 브로드캐스트 기능을 제공합니다.
     """
-    
-    def __init__(self):
+
+    def __init__(self, session_ttl: float = SESSION_TTL):
         """
         ConnectionManager 초기화
+
+        Args:
+            session_ttl (float): 연결이 끊긴 세션을 유지하는 시간 (초)
         """
         self.active_connections: List[WebSocket] = []
-    
-    async def connect(self, websocket: WebSocket):
+        self.sessions: Dict[str, Session] = {}
+        self.session_ttl = session_ttl
+        self._websocket_sessions: Dict[WebSocket, Session] = {}
+        self._prune_task: Optional[asyncio.Task] = None
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        session_id: Optional[str] = None,
+        last_seq: Optional[int] = None,
+    ) -> Session:
         """
         새로운 클라이언트 연결 수락
-        
+
+        알려진 세션 ID로 연결하면 그 세션을 이어받고 last_seq 이후의 이벤트를 다시 보냅니다.
+        재전송이 끝날 때까지 세션에 웹소켓을 연결하지 않으므로, 그동안의 새 이벤트는 버퍼에 쌓였다가
+        재전송에 이어 순서대로 전달됩니다.
+
         Args:
             websocket (WebSocket): 웹소켓 연결 객체
+            session_id (Optional[str]): 재연결할 세션 ID
+            last_seq (Optional[int]): 클라이언트가 마지막으로 받은 시퀀스 번호
+
+        Returns:
+            Session: 연결된 세션
         """
         await websocket.accept()
+        self.prune_sessions()
+
+        session = self.sessions.get(session_id) if session_id else None
+        resumed = session is not None
+        if session is None:
+            session = Session()
+            self.sessions[session.session_id] = session
+        elif session.websocket is not None:
+            # 같은 세션의 이전 연결은 더 이상 사용하지 않음
+            self.disconnect(session.websocket)
+
+        # 재전송하는 동안 만료 정리 대상이 되지 않도록 연결 중으로 표시
+        session.disconnected_at = None
+        sent_seq = (last_seq or 0) if resumed else session.last_seq
+        oldest_seq = session.buffer[0][0] if session.buffer else session.last_seq + 1
+        try:
+            await websocket.send_text(json.dumps({
+                "type": "session",
+                "session_id": session.session_id,
+                "last_seq": session.last_seq,
+                "resumed": resumed,
+                # 버퍼에서 이미 밀려난 이벤트가 있으면 클라이언트에 알림
+                "gap": resumed and sent_seq + 1 < oldest_seq,
+            }))
+            # Reason: 재전송 도중 새 이벤트가 먼저 도착하면 클라이언트가 seq 비교로 놓친 이벤트를 버리므로,
+            # 버퍼를 따라잡은 뒤에(사이에 await 없이) 웹소켓을 연결합니다.
+            while session.last_seq > sent_seq:
+                missed = session.missed_since(sent_seq)
+                sent_seq = session.last_seq
+                for text in missed:
+                    await websocket.send_text(text)
+        except Exception:
+            # 재전송 중 연결이 끊기면 세션은 재연결을 기다림 (수신 루프가 연결 종료를 처리)
+            session.disconnected_at = time.monotonic()
+            return session
+
+        session.websocket = websocket
         self.active_connections.append(websocket)
-    
+        self._websocket_sessions[websocket] = session
+        return session
+
     def disconnect(self, websocket: WebSocket):
         """
         클라이언트 연결 종료 처리
-        
+
+        세션은 재연결을 위해 일정 시간 유지됩니다.
+
         Args:
             websocket (WebSocket): 웹소켓 연결 객체
         """
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
-    
-    async def broadcast(self, message: Dict[str, Any]):
+        session = self._websocket_sessions.pop(websocket, None)
+        if session is not None and session.websocket is websocket:
+            session.websocket = None
+            session.disconnected_at = time.monotonic()
+
+    def prune_sessions(self):
+        """
+        재연결 대기 시간이 지난 세션 정리
+        """
+        now = time.monotonic()
+        expired = [
+            session_id for session_id, session in self.sessions.items()
+            if session.disconnected_at is not None
+            and now - session.disconnected_at > self.session_ttl
+        ]
+        for session_id in expired:
+            del self.sessions[session_id]
+
+    async def _prune_periodically(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            self.prune_sessions()
+
+    def start_pruning(self, interval: float = SESSION_PRUNE_INTERVAL):
+        """
+        만료된 세션을 주기적으로 정리하는 작업을 시작합니다 (이벤트 루프 안에서 호출).
+
+        새 연결이 없어도 끊긴 세션이 계속 이벤트를 쌓지 않도록 합니다.
+
+        Args:
+            interval (float): 정리 주기 (초)
+        """
+        if self._prune_task is None:
+            self._prune_task = asyncio.create_task(self._prune_periodically(interval))
+
+    def stop_pruning(self):
+        """
+        세션 정리 작업을 멈춥니다.
+        """
+        if self._prune_task is not None:
+            self._prune_task.cancel()
+            self._prune_task = None
+
+    def session_for(self, websocket: WebSocket) -> Optional[Session]:
+        """
+        웹소켓 연결의 세션 조회
+
+        Args:
+            websocket (WebSocket): 웹소켓 연결 객체
+
+        Returns:
+            Optional[Session]: 연결된 세션 (없으면 None)
+        """
+        return self._websocket_sessions.get(websocket)
+
+    async def broadcast(self, message: Dict[str, Any], record: bool = True):
         """
         모든 클라이언트에게 메시지 브로드캐스트
-        
+
+        재연결 대기 중인 세션에도 기록하여 재연결 시 전달되도록 합니다.
+        record가 False이면 시퀀스 번호 없이 연결된 클라이언트에게만 보내고 링 버퍼에 남기지 않습니다
+        (에이전트 상태처럼 최신 값만 의미 있는 알림용).
+
         Args:
             message (Dict[str, Any]): 전송할 메시지 데이터
+            record (bool): 세션 링 버퍼에 기록할지 여부
         """
+        started = time.perf_counter()
+        payload = json.dumps(message)
         disconnected_clients = []
-        
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(json.dumps(message))
-            except Exception:
+
+        for session in list(self.sessions.values()):
+            websocket = session.websocket
+            text = session.record(payload) if record else payload
+            if not await session.deliver(text):
                 # 연결 오류 발생 시 나중에 제거할 목록에 추가
-                disconnected_clients.append(connection)
-        
+                disconnected_clients.append(websocket)
+
         # 오류가 발생한 연결 제거
         for connection in disconnected_clients:
             self.disconnect(connection)
-    
+        broadcast_duration.labels("broadcast").observe(time.perf_counter() - started)
+
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket):
         """
         특정 클라이언트에게만 메시지 전송
-        
+
         Args:
             message (Dict[str, Any]): 전송할 메시지 데이터
             websocket (WebSocket): 메시지를 수신할 웹소켓 연결 객체
         """
+        session = self._websocket_sessions.get(websocket)
+        if session is not None:
+            text = session.record(json.dumps(message))
+        else:
+            text = json.dumps(message)
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(text)
         except Exception:
             # 연결 오류 발생 시 연결 제거
-            self.disconnect(websocket) 
\ No newline at end of file
+            self.disconnect(websocket)
+
+    def personal_sink(self, websocket: WebSocket) -> Callable[[Dict[str, Any]], Awaitable[None]]:
+        """
+        특정 클라이언트의 세션에 메시지를 전송하는 구독자 함수 반환
+
+        같은 세션에 대해서는 항상 같은 함수로 비교되므로 중복 구독 판별에 사용할 수 있고,
+        클라이언트가 재연결해도 같은 세션으로 계속 전달됩니다.
+
+        Args:
+            websocket (WebSocket): 메시지를 수신할 웹소켓 연결 객체
+
+        Returns:
+            Callable[[Dict[str, Any]], Awaitable[None]]: 메시지 전송 함수
+        """
+        session = self._websocket_sessions.get(websocket)
+        if session is None:
+            async def send(message: Dict[str, Any]):
+                await self.send_personal_message(message, websocket)
+
+            return send
+        return session.send
@@ -0,0 +1,143 @@
+"""
+에이전트 상태 집계 모듈
+
+슈퍼바이저가 일정 간격으로 문제 생성기와 답변기의 /health를 백그라운드에서 확인하고,
+상태·응답 시간·버전을 캐시해 두었다가 `/health/agents`로 제공합니다.
+브라우저마다 각 에이전트를 직접 확인하지 않으므로 에이전트 부하가 열린 탭 수와 무관해집니다.
+"""
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from shared.config import get_settings
+from shared.logger import get_agent_logger
+
+logger = get_agent_logger("supervisor")
+
+# 에이전트 상태 확인 간격 (초)
+AGENT_HEALTH_INTERVAL = get_settings().agent_health_interval
+# 에이전트 하나의 /health 응답 제한 시간 (초)
+AGENT_HEALTH_TIMEOUT = get_settings().agent_health_timeout
+
+# 상태가 바뀐 에이전트를 전달받는 함수 (에이전트 이름, 상태)
+StatusListener = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+def default_targets() -> Dict[str, str]:
+    """
+    확인할 에이전트와 /health URL
+
+    Returns:
+        Dict[str, str]: 에이전트 이름 -> /health URL
+    """
+    settings = get_settings()
+    return {
+        "agent1": f"{settings.agent1_url}/health",
+        "agent2": f"{settings.agent2_url}/health",
+    }
+
+
+class AgentHealthMonitor:
+    """
+    에이전트 /health를 주기적으로 확인하여 마지막 결과를 캐시합니다.
+    """
+
+    def __init__(
+        self,
+        targets: Optional[Dict[str, str]] = None,
+        interval: float = AGENT_HEALTH_INTERVAL,
+        timeout: float = AGENT_HEALTH_TIMEOUT,
+        on_change: Optional[StatusListener] = None,
+    ):
+        """
+        AgentHealthMonitor 초기화
+
+        Args:
+            targets (Optional[Dict[str, str]]): 에이전트 이름 -> /health URL (기본값: 문제 생성기, 답변기)
+            interval (float): 확인 간격 (초)
+            timeout (float): 에이전트별 응답 제한 시간 (초)
+            on_change (Optional[StatusListener]): 상태('ok'/'down')가 바뀌었을 때 호출할 함수
+        """
+        self.targets = targets or default_targets()
+        self.interval = interval
+        self.timeout = timeout
+        self.on_change = on_change
+        self.agents: Dict[str, Dict[str, Any]] = {
+            name: {"status": "unknown", "latency_ms": None, "version": None, "checked_at": None}
+            for name in self.targets
+        }
+        self._task: Optional[asyncio.Task] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        캐시된 에이전트 상태를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 에이전트별 상태, 응답 시간(ms), 버전, 확인 시각과 확인 간격
+        """
+        return {
+            "agents": {name: dict(entry) for name, entry in self.agents.items()},
+            "interval": self.interval,
+        }
+
+    async def _probe(self, client: httpx.AsyncClient, url: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        entry: Dict[str, Any] = {"status": "down", "latency_ms": None, "version": None}
+        try:
+            response = await client.get(url, timeout=self.timeout)
+            entry["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            if response.status_code == 200:
+                entry["status"] = "ok"
+                entry["version"] = response.json().get("version")
+            else:
+                entry["error"] = f"HTTP {response.status_code}"
+        except Exception as e:
+            entry["error"] = type(e).__name__
+        entry["checked_at"] = datetime.now().isoformat()
+        return entry
+
+    async def probe_once(self, client: httpx.AsyncClient):
+        """
+        모든 에이전트를 동시에 한 번 확인하고 캐시를 갱신합니다.
+
+        Args:
+            client (httpx.AsyncClient): 확인에 사용할 HTTP 클라이언트
+        """
+        names = list(self.targets)
+        results = await asyncio.gather(*(self._probe(client, self.targets[name]) for name in names))
+        for name, entry in zip(names, results):
+            previous = self.agents[name]["status"]
+            self.agents[name] = entry
+            if entry["status"] == previous:
+                continue
+            logger.info(f"에이전트 상태 변경: {name} {previous} -> {entry['status']}")
+            if self.on_change is not None:
+                try:
+                    await self.on_change(name, entry)
+                except Exception as e:
+                    logger.error(f"에이전트 상태 변경 알림 실패: {e}")
+
+    async def _run(self):
+        # Reason: 확인할 때마다 연결을 새로 맺지 않도록 클라이언트 하나를 계속 사용합니다.
+        async with httpx.AsyncClient() as client:
+            while True:
+                await self.probe_once(client)
+                await asyncio.sleep(self.interval)
+
+    def start(self):
+        """
+        백그라운드 확인 작업을 시작합니다 (이벤트 루프 안에서 호출).
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        """
+        백그라운드 확인 작업을 멈춥니다.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
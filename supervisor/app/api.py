@@ -4,11 +4,9 @@
 사용자 요청을 처리하고 다른 에이전트들의 작업을 조율하는 API를 정의합니다.
 """
 import re
-import httpx
-import asyncio
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 import json
 from datetime import datetime
 import os
@@ -17,16 +15,30 @@ import logging
 import sys
 
 from shared.schemas import (
+    RunOptions,
     SupervisorRequest,
     SupervisorResponse,
-    ProblemRequest,
-    ProblemGenerated,
-    AnswerResponse,
-    WebSocketMessage,
 )
+from shared import __version__
 from shared.logger import get_agent_logger
+from shared.http_metrics import instrument_app
+from shared.loop_monitor import instrument_loop_monitor
+from shared.memory import instrument_memory
+from shared.metrics import REGISTRY
+from shared.priority import priority_context
+from shared.profiling import instrument_profiling
+from shared.tracing import instrument_tracing
 from shared.websocket_manager import ConnectionManager
 
+
+from .agent_health import AgentHealthMonitor
+from .job_routes import router as jobs_router
+from .jobs import job_manager
+from .logs import router as logs_router
+from .pipeline import acknowledge_run, process_gugudan, replay_run
+from .result_cache import ResultCache
+from .runs import RunRegistry, Sink, run_key
+
 # 프로젝트 루트 경로 추가
 root_path = Path(__file__).parent.parent.parent
 sys.path.append(str(root_path))
@@ -58,11 +70,60 @@ app.add_middleware(
 
 # 웹소켓 연결 관리자 초기화
 manager = ConnectionManager()
+# 연결이 끊긴 채 만료된 세션을 새 연결이 없어도 주기적으로 정리
+app.add_event_handler("startup", manager.start_pruning)
+app.add_event_handler("shutdown", manager.stop_pruning)
+
+# 진행 중인 구구단 실행 목록 (동일 실행 공유)
+run_registry = RunRegistry()
+
+# 완료된 구구단 실행 결과 캐시
+result_cache = ResultCache()
+
+# 로그 조회 엔드포인트
+app.include_router(logs_router)
+# 일괄 작업 엔드포인트 (앱 종료 시 실행 중인 작업 취소)
+app.include_router(jobs_router)
+app.add_event_handler("shutdown", job_manager.shutdown)
+
 
-# 로그 디렉토리 설정
-log_dir = os.path.join(root_path, "logs")
-if not os.path.exists(log_dir):
-    os.makedirs(log_dir)
+async def broadcast_agent_status(name: str, entry: Dict[str, Any]):
+    """
+    에이전트 상태 변경을 모든 웹소켓 클라이언트에게 알립니다.
+
+    상태 알림은 재연결 시 다시 받을 필요가 없으므로 세션의 재개용 링 버퍼에 기록하지 않습니다.
+
+    Args:
+        name (str): 에이전트 이름
+        entry (Dict[str, Any]): 변경된 에이전트 상태
+    """
+    await manager.broadcast({"type": "agent_status", "agents": {name: entry}}, record=False)
+
+
+# 에이전트 상태 백그라운드 확인 (상태가 바뀌면 웹소켓으로 알림)
+agent_health = AgentHealthMonitor(on_change=broadcast_agent_status)
+app.add_event_handler("startup", agent_health.start)
+app.add_event_handler("shutdown", agent_health.stop)
+
+# 요청 지연 시간 메트릭과 /metrics 엔드포인트
+instrument_app(app)
+# 요청별 추적 구간과 /traces 엔드포인트
+instrument_tracing(app, "supervisor")
+# 관리자용 프로파일링 엔드포인트 (/admin/profile)
+instrument_profiling(app, "supervisor")
+# 이벤트 루프 지연 감시 (/admin/loop/stalls)
+instrument_loop_monitor(app, "supervisor")
+# 관리자용 메모리 스냅샷 엔드포인트 (/admin/memory)
+instrument_memory(app)
+REGISTRY.gauge(
+    "websocket_connections", "연결된 웹소켓 클라이언트 수"
+).set_function(lambda: len(manager.active_connections))
+REGISTRY.gauge(
+    "gugudan_active_runs", "진행 중인 구구단 실행 수"
+).set_function(lambda: len(run_registry))
+REGISTRY.gauge(
+    "gugudan_active_jobs", "실행 중인 일괄 작업 수"
+).set_function(lambda: job_manager.active)
 
 
 @app.get("/health")
@@ -73,7 +134,33 @@ async def health_check() -> Dict[str, str]:
     Returns:
         Dict[str, str]: 에이전트 상태 정보
     """
-    return {"status": "ok", "agent": "supervisor"}
+    return {"status": "ok", "agent": "supervisor", "version": __version__}
+
+
+@app.get("/health/agents")
+async def agents_health() -> Dict[str, Any]:
+    """
+    캐시된 에이전트 상태 조회 엔드포인트
+
+    에이전트를 직접 호출하지 않고 백그라운드 확인 결과를 반환합니다.
+
+    Returns:
+        Dict[str, Any]: 슈퍼바이저 정보와 에이전트별 상태, 응답 시간(ms), 버전, 확인 시각
+    """
+    snapshot = agent_health.snapshot()
+    snapshot["supervisor"] = {"status": "ok", "version": __version__}
+    return snapshot
+
+
+@app.get("/cache/stats")
+async def get_cache_stats() -> Dict[str, Any]:
+    """
+    실행 결과 캐시 통계 조회 엔드포인트
+
+    Returns:
+        Dict[str, Any]: 캐시 항목 수, 메모리 사용량 및 적중률
+    """
+    return result_cache.stats()
 
 
 @app.post("/request", response_model=SupervisorResponse)
@@ -82,6 +169,7 @@ async def process_request(request: SupervisorRequest) -> SupervisorResponse:
     사용자 요청 처리 엔드포인트
 
     사용자의 구구단 요청을 해석하고 에이전트들을 조율하여 문제 풀이를 진행합니다.
+    진행 과정은 모든 웹소켓 클라이언트에게 브로드캐스트됩니다.
 
     Args:
         request (SupervisorRequest): 사용자 요청 메시지
@@ -92,6 +180,28 @@ async def process_request(request: SupervisorRequest) -> SupervisorResponse:
     Raises:
         HTTPException: 요청 처리 중 오류 발생 시
     """
+    return await handle_request(request, broadcast_message, priority="api")
+
+
+async def handle_request(
+    request: SupervisorRequest,
+    sink: Sink,
+    priority: str = "api",
+    accepted: Optional[Callable[[SupervisorResponse], Awaitable[None]]] = None,
+) -> SupervisorResponse:
+    """
+    사용자 요청을 해석하고 구구단 실행을 시작하거나 진행 중인 동일 실행에 참여합니다.
+
+    Args:
+        request (SupervisorRequest): 사용자 요청 메시지
+        sink (Sink): 실행 이벤트를 전달받을 구독자 함수
+        priority (str): 새 실행의 에이전트 호출 우선순위 클래스 ('interactive' 또는 'api')
+        accepted (Optional[Callable[[SupervisorResponse], Awaitable[None]]]): 실행 이벤트를 받기 전에
+            요청 처리 결과를 먼저 알리는 함수 (웹소켓의 시작/참여/인식 실패 안내)
+
+    Returns:
+        SupervisorResponse: 요청 처리 결과
+    """
     # 요청 메시지 파싱
     message = request.message
     
@@ -99,32 +209,99 @@ async def process_request(request: SupervisorRequest) -> SupervisorResponse:
     table, stop_value = parse_request(message)
     
     if not table:
-        return SupervisorResponse(
+        response = SupervisorResponse(
             message="구구단 단수를 인식할 수 없습니다. 예: '5단 구구단 시작해줘'"
         )
+        if accepted is not None:
+            await accepted(response)
+        return response
     
-    # 비동기로 구구단 처리 시작
-    asyncio.create_task(process_gugudan(table, stop_value))
+    key = run_key(table, stop_value, request.options)
+    run = run_registry.get(key)
+    joined = run is not None
+    if not joined:
+        run = run_registry.create(key, sink)
     
     if stop_value:
         response_message = f"{table}단 구구단을 시작합니다. 정답이 {stop_value}에 도달하면 멈추겠습니다."
     else:
         response_message = f"{table}단 구구단을 시작합니다. {table}×9까지 진행하겠습니다."
+    if joined:
+        response_message += " (진행 중인 동일한 구구단에 참여합니다.)"
+    response = SupervisorResponse(message=response_message, run_id=run.run_id)
+    
+    if joined:
+        # Reason: 재전송은 오래 걸릴 수 있으므로 참여 안내(run_id 포함)를 먼저 보내야 클라이언트가 바로 ack할 수 있습니다.
+        if accepted is not None:
+            await accepted(response)
+        # 브로드캐스트로 받는 실행(HTTP로 시작)은 이미 모든 연결에 전달되므로 따로 구독하지 않음 (중복 수신 방지)
+        if not run.is_subscribed(broadcast_message):
+            # 진행 중인 동일 실행에 참여 (지금까지의 단계를 먼저 재전송)
+            await run.subscribe(sink)
+        return response
     
-    return SupervisorResponse(message=response_message)
+    try:
+        if accepted is not None:
+            await accepted(response)
+    finally:
+        # 안내 전송에 실패해도 등록한 실행은 시작해 같은 요청의 참여자가 기다리지 않도록 함
+        cached_events = result_cache.get((table, stop_value))
+        if cached_events is not None:
+            # 완료된 실행이 캐시에 있으면 에이전트 호출 없이 재생
+            pipeline = replay_run(cached_events, request.options, run.run_id, emit=run.emit)
+        else:
+            # 비동기로 구구단 처리 시작 (정상 완료 시 캐시에 저장)
+            pipeline = result_cache.record(
+                (table, stop_value),
+                process_gugudan(table, stop_value, request.options, run.run_id, emit=run.emit),
+                run,
+            )
+        # 파이프라인 태스크는 만들 때의 컨텍스트를 복사하므로 우선순위 클래스가 실행 전체에 적용됨
+        with priority_context(priority):
+            run_registry.launch(run, pipeline)
+    return response
+
+
+def handle_ack(sink: Sink, run_id: Optional[str]) -> bool:
+    """
+    클라이언트 확인(ack)을 해당 클라이언트가 구독한 실행의 페이서에만 전달합니다.
+
+    Args:
+        sink (Sink): ack를 보낸 클라이언트의 구독자 함수
+        run_id (Optional[str]): 확인 대상 실행 ID
+
+    Returns:
+        bool: ack를 전달했으면 True (run_id가 없거나 구독하지 않은 실행이면 False)
+    """
+    # Reason: run_id 없는 ack나 다른 세션의 실행에 대한 ack가 남의 ack 페이싱을 진행시키지 않도록 합니다.
+    run = run_registry.find(run_id) if run_id else None
+    if run is None:
+        return False
+    # 브로드캐스트 실행(HTTP로 시작)은 모든 연결이 받으므로 모든 세션이 구독한 것으로 봄
+    if not (run.is_subscribed(sink) or run.is_subscribed(broadcast_message)):
+        return False
+    acknowledge_run(run.run_id)
+    return True
 
 
 @app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    session_id: Optional[str] = None,
+    last_seq: Optional[int] = None,
+):
     """
     웹소켓 연결 엔드포인트
 
     클라이언트와의 실시간 양방향 통신을 위한 웹소켓 연결을 관리합니다.
+    재연결 시 `/ws?session_id=...&last_seq=...`로 접속하면 놓친 이벤트만 다시 받습니다.
 
     Args:
         websocket (WebSocket): 웹소켓 연결 객체
+        session_id (Optional[str]): 재연결할 세션 ID
+        last_seq (Optional[int]): 클라이언트가 마지막으로 받은 시퀀스 번호
     """
-    await manager.connect(websocket)
+    session = await manager.connect(websocket, session_id, last_seq)
     
     try:
         while True:
@@ -140,15 +317,30 @@ async def websocket_endpoint(websocket: WebSocket):
                     user_message = message_data.get("content", "")
                     
                     # 직접 처리 (외부 API 호출 대신)
-                    request = SupervisorRequest(message=user_message)
-                    response = await process_request(request)
-                    
-                    await manager.broadcast({
-                        "type": "system_message",
-                        "content": response.message,
-                        "sender": "supervisor",
-                        "timestamp": datetime.now().isoformat()
-                    })
+                    request = SupervisorRequest(
+                        message=user_message,
+                        options=message_data.get("options") or RunOptions(),
+                    )
+                    async def send_accepted(response: SupervisorResponse):
+                        await manager.send_personal_message({
+                            "type": "system_message",
+                            "content": response.message,
+                            "sender": "supervisor",
+                            "run_id": response.run_id,
+                            "timestamp": datetime.now().isoformat()
+                        }, websocket)
+
+                    # 시작/참여 안내는 실행 이벤트(참여 시 재전송)보다 먼저 보냄
+                    response = await handle_request(
+                        request, manager.personal_sink(websocket), priority="interactive", accepted=send_accepted
+                    )
+                    logger.info(
+                        f"웹소켓 요청 처리: {user_message}",
+                        extra={"session_id": session.session_id, "run_id": response.run_id},
+                    )
+                elif message_data.get("type") == "ack":
+                    # ack 페이싱 중인 구구단 중 이 세션이 구독한 실행만 다음 단계 진행
+                    handle_ack(manager.personal_sink(websocket), message_data.get("run_id"))
             except json.JSONDecodeError:
                 await manager.send_personal_message({
                     "type": "system_message",
@@ -201,173 +393,3 @@ def parse_request(message: str) -> tuple[Optional[int], Optional[int]]:
     stop_value = int(stop_match.group(1)) if stop_match else None
     
     return table, stop_value
-
-
-async def process_gugudan(table: int, stop_value: Optional[int] = None):
-    """
-    구구단 문제 풀이 과정 처리
-
-    에이전트1과 에이전트2를 조율하여 구구단 문제를 생성하고 풀이합니다.
-
-    Args:
-        table (int): 구구단 단수
-        stop_value (Optional[int], optional): 종료 조건 값
-    """
-    try:
-        # 에이전트1 (문제 생성기) 초기화
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "http://localhost:5000/problem/initialize",
-                json={"table": table, "stop_value": stop_value}
-            )
-            
-            if response.status_code != 200:
-                await broadcast_message({
-                    "type": "system_message",
-                    "content": "문제 생성기 초기화 실패",
-                    "sender": "supervisor",
-                    "timestamp": datetime.now().isoformat()
-                })
-                return
-            
-            problem_data = response.json()
-            problem = problem_data.get("problem", "")
-            
-            # 문제 브로드캐스트
-            await broadcast_message({
-                "type": "problem",
-                "content": problem,
-                "sender": "agent1",
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            # 지속적으로 문제 생성 및 풀이
-            while True:
-                # 답변 요청
-                answer_response = await client.post(
-                    "http://localhost:5000/problem/solve",
-                    json={"problem": problem}
-                )
-                
-                if answer_response.status_code != 200:
-                    await broadcast_message({
-                        "type": "system_message",
-                        "content": "답변 처리 실패",
-                        "sender": "supervisor",
-                        "timestamp": datetime.now().isoformat()
-                    })
-                    break
-                
-                answer_data = answer_response.json()
-                calculation = answer_data.get("calculation", "")
-                answer = answer_data.get("answer", 0)
-                explanation = answer_data.get("explanation", "")
-                
-                # 답변 브로드캐스트
-                await broadcast_message({
-                    "type": "answer",
-                    "content": calculation,
-                    "sender": "agent2",
-                    "timestamp": datetime.now().isoformat()
-                })
-                
-                # 설명이 있으면 설명 브로드캐스트
-                if explanation:
-                    await broadcast_message({
-                        "type": "explanation",
-                        "content": explanation,
-                        "sender": "agent2",
-                        "timestamp": datetime.now().isoformat()
-                    })
-                
-                # 종료 조건 확인
-                if stop_value and answer >= stop_value:
-                    await broadcast_message({
-                        "type": "system_message",
-                        "content": f"정답이 {stop_value}에 도달했습니다. 구구단이 끝났습니다.",
-                        "sender": "supervisor",
-                        "timestamp": datetime.now().isoformat()
-                    })
-                    
-                    # 에이전트1에 종료 요청
-                    await client.post("http://localhost:5000/problem/end")
-                    break
-                
-                # 다음 문제 요청
-                next_response = await client.post("http://localhost:5000/problem/next")
-                
-                if next_response.status_code != 200:
-                    await broadcast_message({
-                        "type": "system_message",
-                        "content": "다음 문제 생성 실패",
-                        "sender": "supervisor",
-                        "timestamp": datetime.now().isoformat()
-                    })
-                    break
-                
-                next_data = next_response.json()
-                
-                # 완료 확인
-                if next_data is None or next_data.get("status") == "completed":
-                    await broadcast_message({
-                        "type": "system_message",
-                        "content": f"구구단이 끝났습니다. {table}단 학습 완료!",
-                        "sender": "supervisor",
-                        "timestamp": datetime.now().isoformat()
-                    })
-                    break
-                
-                problem = next_data.get("problem", "")
-                
-                # 다음 문제 브로드캐스트
-                await broadcast_message({
-                    "type": "problem",
-                    "content": problem,
-                    "sender": "agent1",
-                    "timestamp": datetime.now().isoformat()
-                })
-                
-                # 너무 빠른 요청 방지
-                await asyncio.sleep(1)
-    
-    except Exception as e:
-        await broadcast_message({
-            "type": "system_message",
-            "content": f"구구단 처리 중 오류 발생: {str(e)}",
-            "sender": "supervisor",
-            "timestamp": datetime.now().isoformat()
-        }) 
-
-@app.get("/logs/{agent_name}")
-async def get_agent_logs(agent_name: str):
-    """
-    에이전트 로그를 조회합니다.
-    
-    Args:
-        agent_name: 에이전트 이름 (supervisor, agent1, agent2)
-        
-    Returns:
-        dict: 로그 내용을 포함하는 응답
-    """
-    # 에이전트 이름 검증
-    if agent_name not in ["supervisor", "agent1", "agent2"]:
-        raise HTTPException(status_code=400, detail="유효하지 않은 에이전트 이름입니다.")
-    
-    # 로그 파일 경로
-    log_file = os.path.join(log_dir, f"{agent_name}.log")
-    
-    # 로그 파일이 존재하는지 확인
-    if not os.path.exists(log_file):
-        return {"log_content": f"{agent_name} 로그 파일이 아직 생성되지 않았습니다."}
-    
-    try:
-        with open(log_file, "r", encoding="utf-8") as f:
-            # 마지막 100줄만 읽기
-            lines = f.readlines()
-            last_lines = lines[-100:] if len(lines) > 100 else lines
-            log_content = "".join(last_lines)
-            
-        return {"log_content": log_content}
-    except Exception as e:
-        logger.error(f"로그 파일 읽기 오류: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"로그 파일 읽기 오류: {str(e)}") 
\ No newline at end of file
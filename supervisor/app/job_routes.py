@@ -0,0 +1,173 @@
+"""
+슈퍼바이저 일괄 작업 엔드포인트 모듈
+
+작업 제출, 진행 상황 조회, 취소와 결과 파일 조회를 제공합니다.
+결과 파일은 실행 중에도 지금까지 기록된 부분을 받을 수 있고, Range 요청으로 이어 받을 수 있습니다.
+"""
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
+
+from shared.schemas import JobSpec
+
+from .jobs import job_manager
+
+router = APIRouter()
+
+# 결과 파일을 읽어 전송하는 블록 크기
+RESULT_CHUNK_SIZE = 64 * 1024
+# 형식별 결과 파일 콘텐츠 타입
+MEDIA_TYPES = {"jsonl": "application/x-ndjson", "csv": "text/csv"}
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Range 헤더(`bytes=시작-끝`, `bytes=시작-`, `bytes=-길이`)를 해석합니다.
+
+    여러 구간은 지원하지 않으며, 형식이 맞지 않으면 전체 파일을 보내도록 None을 반환합니다.
+
+    Args:
+        header (str): Range 헤더 값
+        size (int): 파일 크기
+
+    Returns:
+        Optional[Tuple[int, int]]: (시작, 끝) 바이트 위치 (끝 포함)
+
+    Raises:
+        HTTPException: 구간이 파일 범위를 벗어난 경우 (416)
+    """
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", header.strip())
+    if match is None or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        start, end = max(0, size - int(last)), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=416,
+            detail="요청한 구간이 결과 파일 범위를 벗어났습니다.",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+def iter_file(path: Path, start: int, end: int) -> Iterator[bytes]:
+    """
+    파일의 지정 구간을 블록 단위로 읽습니다.
+
+    Args:
+        path (Path): 파일 경로
+        start (int): 시작 바이트 위치
+        end (int): 끝 바이트 위치 (포함)
+
+    Yields:
+        bytes: 파일 내용 조각
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(RESULT_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+@router.post("/jobs", status_code=202)
+async def submit_job(spec: JobSpec) -> Dict[str, Any]:
+    """
+    일괄 작업 제출 엔드포인트
+
+    Args:
+        spec (JobSpec): 작업 명세
+
+    Returns:
+        Dict[str, Any]: 작업 ID와 진행 상황
+    """
+    return job_manager.submit(spec).progress()
+
+
+@router.get("/jobs")
+async def list_jobs() -> Dict[str, Any]:
+    """
+    작업 목록 조회 엔드포인트
+
+    Returns:
+        Dict[str, Any]: 작업별 진행 상황
+    """
+    return {"jobs": [job.progress() for job in job_manager.jobs.values()]}
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> Dict[str, Any]:
+    """
+    작업 진행 상황 조회 엔드포인트
+
+    Args:
+        job_id (str): 작업 ID
+
+    Returns:
+        Dict[str, Any]: 진행 상황
+    """
+    return job_manager.get(job_id).progress()
+
+
+@router.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str) -> Dict[str, Any]:
+    """
+    작업 취소 엔드포인트
+
+    Args:
+        job_id (str): 작업 ID
+
+    Returns:
+        Dict[str, Any]: 진행 상황 (실행 중이던 작업은 곧 cancelled로 바뀜)
+    """
+    return job_manager.cancel(job_id).progress()
+
+
+@router.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str, range_header: Optional[str] = Header(None, alias="Range")) -> StreamingResponse:
+    """
+    작업 결과 파일 조회 엔드포인트
+
+    실행 중에도 지금까지 기록된 부분을 받을 수 있으며, `Range: bytes=시작-`로 이어 받을 수 있습니다.
+    X-Job-Status 헤더로 결과가 더 늘어날 수 있는지(running) 알 수 있습니다.
+
+    Args:
+        job_id (str): 작업 ID
+        range_header (Optional[str]): Range 헤더
+
+    Returns:
+        StreamingResponse: 결과 파일 전체(200) 또는 요청한 구간(206)
+
+    Raises:
+        HTTPException: 작업이나 결과 파일이 없거나(404) 구간이 범위를 벗어난 경우(416)
+    """
+    job = job_manager.get(job_id)
+    if not job.path.exists():
+        raise HTTPException(status_code=404, detail="결과 파일이 아직 없습니다.")
+    size = job.path.stat().st_size
+    byte_range = parse_range(range_header, size) if range_header else None
+    start, end = byte_range or (0, size - 1)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(end - start + 1),
+        "Content-Disposition": f'attachment; filename="{job.path.name}"',
+        "X-Job-Status": job.status,
+    }
+    if byte_range is not None:
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return StreamingResponse(
+        iter_file(job.path, start, end),
+        status_code=206 if byte_range is not None else 200,
+        media_type=MEDIA_TYPES[job.spec.format],
+        headers=headers,
+    )
@@ -0,0 +1,436 @@
+"""
+슈퍼바이저 일괄 작업(job) 모듈
+
+모든 (단수, 곱하는 수) 조합의 설명이나 종료 조건 값 스윕처럼 웹소켓 대화 흐름으로 처리하기 어려운
+오프라인 실행을 작업으로 받아 처리합니다. 작업은 제한된 수만 동시에 실행되며, 각 작업은 작업자 풀로
+답변기에 요청을 보내고(선택적으로 초당 요청 수 제한) 결과를 한 줄씩 JSONL 또는 CSV 파일에 기록합니다.
+HTTP 엔드포인트는 job_routes 모듈에 있습니다.
+"""
+import asyncio
+import csv
+import io
+import json
+import time
+import uuid
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+from shared.config import get_settings
+from shared.gugudan import PlannedStep, iter_steps
+from shared.logger import get_agent_logger
+from shared.priority import priority_context
+from shared.schemas import JobSpec, RunOptions
+
+from .pacing import Pacer, TokenBucketPacer, timer_wheel
+from .pipeline import answer_payload, post_hop, solve_route
+
+logger = get_agent_logger("supervisor")
+
+# 결과 파일을 저장하는 디렉토리
+JOB_DIR = get_settings().job_dir
+# 동시에 실행하는 최대 작업 수 (나머지는 대기열에서 기다림)
+JOB_MAX_ACTIVE = get_settings().job_max_active
+# 작업 하나에서 허용하는 최대 답변 요청 수
+MAX_JOB_ITEMS = get_settings().job_max_items
+# 메모리에 보관하는 끝난 작업 수 (결과 파일은 지우지 않음)
+JOB_HISTORY = 100
+# 답변 요청 제한 시간 (초, 설명 생성 포함)
+JOB_REQUEST_TIMEOUT = 60.0
+# 결과 파일에 한 번에 기록하는 최대 행 수
+JOB_FLUSH_ROWS = get_settings().job_flush_rows
+# 행이 모자라도 결과 파일에 기록하는 간격 (초)
+JOB_FLUSH_INTERVAL = get_settings().job_flush_interval
+
+# 결과 파일 열 순서
+RESULT_FIELDS = ("table", "multiplicand", "stop_value", "problem", "answer", "calculation", "explanation", "error")
+
+# (단수, 종료 조건 값, 단계) 작업 항목
+JobItem = Tuple[int, Optional[int], PlannedStep]
+
+
+def iter_items(spec: JobSpec) -> Iterator[JobItem]:
+    """
+    작업 명세에서 답변을 요청할 항목을 생성합니다.
+
+    Args:
+        spec (JobSpec): 작업 명세
+
+    Yields:
+        JobItem: (단수, 종료 조건 값, 단계)
+    """
+    stop_values = spec.stop_values if spec.kind == "stop_sweep" else [None]
+    for table in spec.tables:
+        for stop_value in stop_values:
+            for step in iter_steps(table, stop_value, spec.multiplicand_start, spec.multiplicand_end):
+                yield table, stop_value, step
+
+
+def count_items(spec: JobSpec, limit: int = MAX_JOB_ITEMS) -> int:
+    """
+    작업 항목 수를 셉니다 (limit을 넘으면 limit + 1에서 멈춤).
+
+    Args:
+        spec (JobSpec): 작업 명세
+        limit (int): 셀 최대 항목 수
+
+    Returns:
+        int: 항목 수
+    """
+    return sum(1 for _ in islice(iter_items(spec), limit + 1))
+
+
+class ResultWriter:
+    """
+    작업 결과를 JSONL 또는 CSV 파일에 기록하는 객체
+
+    행은 메모리에 모았다가 flush_rows개가 차거나 flush_interval초가 지나면 스레드 풀에서 한 번에 기록하므로,
+    이벤트 루프가 파일 쓰기를 기다리지 않으면서 Range 요청으로 진행 중인 결과도 읽을 수 있습니다.
+    """
+
+    def __init__(self, path: Path, fmt: str, flush_rows: int = JOB_FLUSH_ROWS, flush_interval: float = JOB_FLUSH_INTERVAL):
+        """
+        ResultWriter 초기화
+
+        Args:
+            path (Path): 결과 파일 경로
+            fmt (str): 결과 형식 ('jsonl' 또는 'csv')
+            flush_rows (int): 한 번에 기록하는 최대 행 수
+            flush_interval (float): 행이 모자라도 기록하는 간격 (초)
+        """
+        self.fmt = fmt
+        self.flush_rows = max(1, flush_rows)
+        self.flush_interval = flush_interval
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._buffer = io.StringIO()
+        self._rows = 0
+        self._flushed_at = time.monotonic()
+        # Reason: 여러 작업자가 동시에 기록해도 묶음이 파일에 섞이지 않도록 기록을 직렬화합니다.
+        self._lock = asyncio.Lock()
+        self._csv = csv.DictWriter(self._buffer, fieldnames=RESULT_FIELDS) if fmt == "csv" else None
+        if self._csv is not None:
+            self._csv.writeheader()
+
+    async def write(self, row: Dict[str, Any]) -> None:
+        """
+        결과 행을 버퍼에 추가하고 기준을 넘으면 파일에 기록합니다.
+
+        Args:
+            row (Dict[str, Any]): 결과 행
+        """
+        if self._csv is not None:
+            self._csv.writerow(row)
+        else:
+            self._buffer.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._rows += 1
+        if self._rows >= self.flush_rows or time.monotonic() - self._flushed_at >= self.flush_interval:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """
+        버퍼에 모인 행을 스레드 풀에서 파일에 기록합니다.
+        """
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._rows = 0
+        self._flushed_at = time.monotonic()
+        if text:
+            async with self._lock:
+                await run_in_threadpool(self._write_text, text)
+
+    def _write_text(self, text: str) -> None:
+        self._file.write(text)
+        self._file.flush()
+
+    async def close(self) -> None:
+        """
+        남은 행을 기록하고 파일을 닫습니다.
+        """
+        await self.flush()
+        async with self._lock:
+            await run_in_threadpool(self._file.close)
+
+
+class Job:
+    """
+    일괄 작업 하나의 상태
+    """
+
+    def __init__(self, spec: JobSpec, path: Path, total: int, job_id: Optional[str] = None):
+        """
+        Job 초기화
+
+        Args:
+            spec (JobSpec): 작업 명세
+            path (Path): 결과 파일 경로
+            total (int): 전체 항목 수
+            job_id (Optional[str]): 작업 ID (None이면 새로 생성)
+        """
+        self.job_id = job_id or uuid.uuid4().hex[:12]
+        self.spec = spec
+        self.path = path
+        self.total = total
+        self.status = "queued"
+        self.completed = 0
+        self.failed = 0
+        self.error: Optional[str] = None
+        self.created_at = datetime.now().isoformat()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        """작업이 끝났는지(완료, 실패, 취소) 여부"""
+        return self.status in ("completed", "failed", "cancelled")
+
+    def progress(self) -> Dict[str, Any]:
+        """
+        작업 진행 상황을 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 상태, 처리한 항목 수, 결과 파일 크기 등
+        """
+        return {
+            "job_id": self.job_id,
+            "kind": self.spec.kind,
+            "format": self.spec.format,
+            "status": self.status,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "result_bytes": self.path.stat().st_size if self.path.exists() else 0,
+            "result_url": f"/jobs/{self.job_id}/result",
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+async def solve_item(client: httpx.AsyncClient, job: Job, solve_hop: str, solve_url: str, item: JobItem) -> Dict[str, Any]:
+    """
+    작업 항목 하나의 답변을 요청하고 결과 행을 만듭니다.
+
+    Args:
+        client (httpx.AsyncClient): 에이전트 호출에 사용할 HTTP 클라이언트
+        job (Job): 작업
+        solve_hop (str): 호출 구간 이름
+        solve_url (str): 답변 요청 URL
+        item (JobItem): 작업 항목
+
+    Returns:
+        Dict[str, Any]: 결과 행 (실패하면 error에 사유)
+    """
+    table, stop_value, step = item
+    row = dict.fromkeys(RESULT_FIELDS)
+    row.update(table=table, multiplicand=step.multiplicand, stop_value=stop_value, problem=step.problem)
+    # Reason: 한 작업 안에서 같은 곱하는 수가 단수와 종료 조건 값마다 반복되므로 문제 ID에 둘 다 넣습니다.
+    stop_part = "" if stop_value is None else stop_value
+    problem_id = f"{job.job_id}:{table}:{stop_part}:{step.multiplicand}"
+    try:
+        response = await post_hop(
+            client, job.job_id, solve_hop, solve_url,
+            json=answer_payload(step.problem, step.multiplier, step.multiplicand, job.job_id, problem_id),
+        )
+    except httpx.HTTPError as e:
+        row["error"] = f"답변기 연결 실패: {e}"
+        return row
+    if response.status_code != 200:
+        row["error"] = f"답변 처리 실패 ({response.status_code})"
+        return row
+    try:
+        data = response.json()
+    except ValueError:
+        row["error"] = "답변 응답 형식 오류"
+        return row
+    row.update(answer=data.get("answer"), calculation=data.get("calculation"), explanation=data.get("explanation"))
+    if data.get("explanation_error"):
+        # 설명 대신 오류 안내 문구가 온 항목은 실패로 셈
+        row["error"] = "설명 생성 실패"
+    return row
+
+
+async def run_job(job: Job, client: httpx.AsyncClient) -> None:
+    """
+    작업자 풀로 작업의 모든 항목을 처리하고 결과를 파일에 기록합니다.
+
+    Args:
+        job (Job): 실행할 작업
+        client (httpx.AsyncClient): 에이전트 호출에 사용할 HTTP 클라이언트
+    """
+    spec = job.spec
+    solve_hop, solve_url = solve_route(RunOptions(topology=spec.topology))
+    workers = spec.concurrency
+    pacer = TokenBucketPacer(spec.rate, workers, timer_wheel) if spec.rate else Pacer()
+    # Reason: 토큰 버킷은 동시에 기다리는 작업자를 구분하지 않으므로 대기를 직렬화해 제한 속도를 지킵니다.
+    pacing_lock = asyncio.Lock()
+    # 작업자들이 함께 꺼내 쓰는 항목 생성기 (필요한 만큼만 만듦)
+    items = iter_items(spec)
+    writer = ResultWriter(job.path, spec.format)
+
+    async def worker() -> None:
+        for item in items:
+            async with pacing_lock:
+                await pacer.wait()
+            row = await solve_item(client, job, solve_hop, solve_url, item)
+            await writer.write(row)
+            if row["error"]:
+                job.failed += 1
+            else:
+                job.completed += 1
+
+    tasks = [asyncio.ensure_future(worker()) for _ in range(workers)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # Reason: 한 작업자가 실패해도 나머지가 닫힌 파일에 쓰지 않도록 모두 멈춘 뒤 파일을 닫습니다.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await writer.close()
+
+
+class JobManager:
+    """
+    일괄 작업 목록과 대기열 관리자
+
+    동시에 최대 max_active개의 작업만 실행하고 나머지는 제출 순서대로 기다립니다.
+    """
+
+    def __init__(self, job_dir: Path = JOB_DIR, max_active: int = JOB_MAX_ACTIVE):
+        """
+        JobManager 초기화
+
+        Args:
+            job_dir (Path): 결과 파일 디렉토리
+            max_active (int): 동시에 실행하는 최대 작업 수
+        """
+        self.job_dir = job_dir
+        self.max_active = max_active
+        self.jobs: Dict[str, Job] = {}
+        self.pending: List[Job] = []
+        self.active = 0
+        self.client_factory: Callable[[], httpx.AsyncClient] = lambda: httpx.AsyncClient(timeout=JOB_REQUEST_TIMEOUT)
+
+    def get(self, job_id: str) -> Job:
+        """
+        작업을 찾습니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            Job: 작업
+
+        Raises:
+            HTTPException: 작업이 없는 경우
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+        return job
+
+    def submit(self, spec: JobSpec) -> Job:
+        """
+        작업을 등록하고 실행 슬롯이 있으면 바로 시작합니다.
+
+        Args:
+            spec (JobSpec): 작업 명세
+
+        Returns:
+            Job: 등록된 작업
+
+        Raises:
+            HTTPException: 항목 수가 최대값을 넘는 경우
+        """
+        total = count_items(spec)
+        if total > MAX_JOB_ITEMS:
+            raise HTTPException(status_code=413, detail=f"작업 항목 수가 최대 {MAX_JOB_ITEMS}개를 넘습니다.")
+        job_id = uuid.uuid4().hex[:12]
+        job = Job(spec, self.job_dir / f"{job_id}.{spec.format}", total, job_id)
+        self.jobs[job_id] = job
+        self._prune()
+        self.pending.append(job)
+        self._start_pending()
+        return job
+
+    def cancel(self, job_id: str) -> Job:
+        """
+        대기 중이거나 실행 중인 작업을 취소합니다 (이미 기록된 결과는 남김).
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            Job: 취소한 작업
+        """
+        job = self.get(job_id)
+        if job in self.pending:
+            self.pending.remove(job)
+            self._finish(job, "cancelled")
+        elif job.task is not None and not job.task.done():
+            job.task.cancel()
+        return job
+
+    async def shutdown(self):
+        """
+        실행 중인 작업을 모두 취소합니다 (앱 종료 시 호출).
+        """
+        for job in list(self.pending):
+            self.cancel(job.job_id)
+        tasks = [job.task for job in self.jobs.values() if job.task is not None and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start_pending(self) -> None:
+        while self.pending and self.active < self.max_active:
+            job = self.pending.pop(0)
+            self.active += 1
+            job.status = "running"
+            job.started_at = datetime.now().isoformat()
+            job.task = asyncio.get_running_loop().create_task(self._execute(job))
+
+    async def _execute(self, job: Job) -> None:
+        logger.info(f"작업 시작: {job.spec.kind} ({job.total}개 항목)", extra={"run_id": job.job_id})
+        try:
+            self.job_dir.mkdir(parents=True, exist_ok=True)
+            # 일괄 작업의 에이전트 호출은 실시간 실행보다 뒤에 배정
+            with priority_context("batch"):
+                async with self.client_factory() as client:
+                    await run_job(job, client)
+            self._finish(job, "completed")
+        except asyncio.CancelledError:
+            self._finish(job, "cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"작업 처리 중 오류 발생: {str(e)}", extra={"run_id": job.job_id})
+            job.error = str(e)
+            self._finish(job, "failed")
+        finally:
+            self.active -= 1
+            self._start_pending()
+
+    def _finish(self, job: Job, status: str) -> None:
+        job.status = status
+        job.finished_at = datetime.now().isoformat()
+        logger.info(
+            f"작업 {status}: 성공 {job.completed}개, 실패 {job.failed}개",
+            extra={"run_id": job.job_id},
+        )
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - JOB_HISTORY)]:
+            del self.jobs[job_id]
+
+
+# 프로세스 전체에서 공유하는 작업 관리자
+job_manager = JobManager()
@@ -0,0 +1,310 @@
+"""
+슈퍼바이저 로그 조회 엔드포인트 모듈
+
+로그 파일 끝에서부터 필요한 만큼만 거꾸로 읽어 최근 로그를 반환하고,
+새로 추가되는 줄만 SSE(Server-Sent Events)로 전달하는 follow 모드를 제공합니다.
+"""
+import asyncio
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from shared.log_index import query_logs
+from shared.logger import LOG_DIR, LOG_INDEX_ENABLED, LOG_INDEX_FILE, get_agent_logger
+
+logger = get_agent_logger("supervisor")
+
+router = APIRouter()
+
+# 로그 디렉토리 설정
+root_path = Path(__file__).parent.parent.parent
+# Reason: 디렉토리는 로거가 처음 설정될 때 만들므로 여기서 가져올 때 만들지 않습니다.
+log_dir = os.path.join(root_path, LOG_DIR)
+# 구조화 로그 인덱스 파일
+log_index_path = os.path.join(log_dir, LOG_INDEX_FILE)
+
+# 로그를 조회할 수 있는 에이전트
+LOG_AGENTS = ("supervisor", "agent1", "agent2")
+# 파일 끝에서 거꾸로 읽을 때의 블록 크기
+TAIL_BLOCK_SIZE = 8192
+# follow 모드에서 파일 변경을 확인하는 간격 (초)
+FOLLOW_POLL_INTERVAL = 0.5
+# follow 모드에서 연결 유지용 주석을 보내는 간격 (초)
+FOLLOW_KEEPALIVE_INTERVAL = 15.0
+
+
+def tail_lines(
+    log_file: str,
+    lines: int = 100,
+    max_bytes: int = 1024 * 1024,
+    offset: Optional[int] = None,
+) -> Tuple[str, int, int]:
+    """
+    로그 파일의 지정 위치 이전 마지막 N줄을 읽습니다.
+
+    파일 전체를 읽지 않고 끝에서부터 블록 단위로 거꾸로 읽으며,
+    읽는 양은 max_bytes를 넘지 않습니다.
+
+    Args:
+        log_file (str): 로그 파일 경로
+        lines (int): 읽을 최대 줄 수
+        max_bytes (int): 읽을 최대 바이트 수
+        offset (Optional[int]): 이 바이트 위치 이전까지 읽음 (None이면 파일 끝)
+
+    Returns:
+        Tuple[str, int, int]: (로그 내용, 첫 줄의 바이트 위치, 마지막 줄 끝의 바이트 위치)
+    """
+    with open(log_file, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        file_size = f.tell()
+        end = file_size if offset is None else max(0, min(offset, file_size))
+
+        position = end
+        # Reason: 블록을 앞에 이어 붙이고 전체 줄바꿈을 다시 세면 읽은 양의 제곱에 비례하므로,
+        #         블록은 목록에 모으고 줄바꿈 수는 블록마다 더한 뒤 마지막에 한 번만 합칩니다.
+        blocks = []
+        newlines = 0
+        # Reason: 마지막 줄 앞의 줄바꿈까지 찾아야 lines개의 완전한 줄을 얻을 수 있습니다.
+        while position > 0 and newlines <= lines and end - position < max_bytes:
+            read_size = min(TAIL_BLOCK_SIZE, position, max_bytes - (end - position))
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+        data = b"".join(reversed(blocks))
+
+    start = position
+    if position > 0:
+        # 잘려서 시작하는 첫 줄은 버림
+        newline = data.find(b"\n")
+        if newline == -1:
+            # 한 줄이 max_bytes보다 길면 내용 없이 위치만 앞으로 이동
+            return "", position, end
+        data = data[newline + 1:]
+        start += newline + 1
+
+    # 끝의 줄바꿈을 제외하고 나눈 뒤 마지막 lines줄만 남김
+    body = data[:-1] if data.endswith(b"\n") else data
+    parts = body.split(b"\n") if body else []
+    if len(parts) > lines:
+        dropped = parts[:-lines]
+        start += sum(len(part) + 1 for part in dropped)
+        parts = parts[-lines:]
+
+    content = b"\n".join(parts) + (b"\n" if parts and data.endswith(b"\n") else b"")
+    return content.decode("utf-8", errors="replace"), start, end
+
+
+def read_appended(log_file: str, position: int, inode: Optional[int], max_bytes: int) -> Tuple[bytes, int, Optional[int]]:
+    """
+    지정 위치 이후에 추가된 내용을 읽습니다.
+
+    로그 파일이 교체(로테이션)되었거나 잘렸으면 처음부터 읽습니다.
+
+    Args:
+        log_file (str): 로그 파일 경로
+        position (int): 마지막으로 읽은 바이트 위치
+        inode (Optional[int]): 마지막으로 읽은 파일의 inode
+        max_bytes (int): 한 번에 읽을 최대 바이트 수
+
+    Returns:
+        Tuple[bytes, int, Optional[int]]: (새 내용, 새 바이트 위치, 파일 inode)
+    """
+    try:
+        stat = os.stat(log_file)
+    except FileNotFoundError:
+        return b"", 0, None
+
+    if (inode is not None and stat.st_ino != inode) or stat.st_size < position:
+        position = 0
+    if stat.st_size == position:
+        return b"", position, stat.st_ino
+
+    with open(log_file, "rb") as f:
+        f.seek(position)
+        data = f.read(max_bytes)
+    return data, position + len(data), stat.st_ino
+
+
+def validate_agent(agent_name: str) -> str:
+    """
+    에이전트 이름을 검증하고 로그 파일 경로를 반환합니다.
+
+    Args:
+        agent_name (str): 에이전트 이름
+
+    Returns:
+        str: 로그 파일 경로
+
+    Raises:
+        HTTPException: 유효하지 않은 에이전트 이름인 경우
+    """
+    if agent_name not in LOG_AGENTS:
+        raise HTTPException(status_code=400, detail="유효하지 않은 에이전트 이름입니다.")
+    return os.path.join(log_dir, f"{agent_name}.log")
+
+
+# Reason: '/logs/{agent_name}'보다 먼저 등록해야 'query'가 에이전트 이름으로 해석되지 않습니다.
+@router.get("/logs/query")
+async def query_agent_logs(
+    agent: Optional[str] = Query(None, description="에이전트 이름"),
+    session_id: Optional[str] = Query(None, description="세션 ID"),
+    run_id: Optional[str] = Query(None, description="실행 ID"),
+    level: Optional[str] = Query(None, description="최소 로그 레벨 (예: WARNING)"),
+    since: Optional[datetime] = Query(None, description="시작 시각 (ISO 8601)"),
+    until: Optional[datetime] = Query(None, description="종료 시각 (ISO 8601)"),
+    limit: int = Query(200, ge=1, le=5000, description="조회할 최대 레코드 수"),
+) -> Dict:
+    """
+    구조화 로그 인덱스에서 조건에 맞는 레코드를 최신순으로 조회합니다.
+
+    Args:
+        agent: 에이전트 이름 (supervisor, agent1, agent2)
+        session_id: 세션 ID
+        run_id: 실행 ID
+        level: 최소 로그 레벨
+        since: 시작 시각
+        until: 종료 시각
+        limit: 조회할 최대 레코드 수
+
+    Returns:
+        dict: 조회된 로그 레코드 목록
+
+    Raises:
+        HTTPException: 로그 인덱스가 꺼져 있거나(409) 인덱스 파일이 없는 경우(404)
+    """
+    if agent is not None:
+        validate_agent(agent)
+    # Reason: 인덱스가 없을 때 빈 목록을 돌려주면 "조건에 맞는 로그 없음"과 구분되지 않으므로 오류로 알립니다.
+    if not LOG_INDEX_ENABLED:
+        raise HTTPException(status_code=409, detail="로그 인덱스가 꺼져 있습니다. LOG_INDEX=1로 설정한 뒤 다시 시작하세요.")
+    if not os.path.exists(log_index_path):
+        raise HTTPException(status_code=404, detail="로그 인덱스 파일이 아직 없습니다. 인덱스에 기록된 로그가 없습니다.")
+
+    try:
+        records = await run_in_threadpool(
+            query_logs,
+            log_index_path,
+            agent=agent,
+            session_id=session_id,
+            run_id=run_id,
+            level=level,
+            since=since.timestamp() if since else None,
+            until=until.timestamp() if until else None,
+            limit=limit,
+        )
+    except Exception as e:
+        logger.error(f"로그 인덱스 조회 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"로그 인덱스 조회 오류: {str(e)}")
+    return {"records": records, "count": len(records)}
+
+
+@router.get("/logs/{agent_name}")
+async def get_agent_logs(
+    agent_name: str,
+    lines: int = Query(100, ge=1, le=5000, description="조회할 최대 줄 수"),
+    max_bytes: int = Query(1024 * 1024, ge=1024, le=10 * 1024 * 1024, description="읽을 최대 바이트 수"),
+    offset: Optional[int] = Query(None, ge=0, description="이 바이트 위치 이전의 로그를 조회 (이전 페이지)"),
+) -> Dict:
+    """
+    에이전트 로그를 조회합니다.
+
+    이전 페이지는 응답의 start_offset을 offset으로 다시 요청하여 조회합니다.
+
+    Args:
+        agent_name: 에이전트 이름 (supervisor, agent1, agent2)
+        lines: 조회할 최대 줄 수
+        max_bytes: 읽을 최대 바이트 수
+        offset: 이 바이트 위치 이전의 로그를 조회
+
+    Returns:
+        dict: 로그 내용과 페이지 위치 정보를 포함하는 응답
+    """
+    log_file = validate_agent(agent_name)
+
+    # 로그 파일이 존재하는지 확인
+    if not os.path.exists(log_file):
+        return {"log_content": f"{agent_name} 로그 파일이 아직 생성되지 않았습니다."}
+
+    try:
+        log_content, start, end = await run_in_threadpool(
+            tail_lines, log_file, lines, max_bytes, offset
+        )
+        return {
+            "log_content": log_content,
+            "start_offset": start,
+            "end_offset": end,
+            "has_more": start > 0,
+        }
+    except Exception as e:
+        logger.error(f"로그 파일 읽기 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"로그 파일 읽기 오류: {str(e)}")
+
+
+async def follow_log(log_file: str, offset: Optional[int], max_bytes: int = 64 * 1024) -> AsyncIterator[str]:
+    """
+    로그 파일에 새로 추가되는 줄을 SSE 이벤트로 생성합니다.
+
+    Args:
+        log_file (str): 로그 파일 경로
+        offset (Optional[int]): 읽기 시작할 바이트 위치 (None이면 현재 파일 끝)
+        max_bytes (int): 한 번에 읽을 최대 바이트 수
+
+    Yields:
+        str: SSE 이벤트 문자열 (한 이벤트에 여러 줄 포함 가능)
+    """
+    if offset is None:
+        offset = os.path.getsize(log_file) if os.path.exists(log_file) else 0
+    position, inode, pending = offset, None, b""
+    idle = 0.0
+
+    while True:
+        data, position, inode = await run_in_threadpool(
+            read_appended, log_file, position, inode, max_bytes
+        )
+        if data:
+            idle = 0.0
+            pending += data
+            complete, _, pending = pending.rpartition(b"\n")
+            if complete:
+                text = complete.decode("utf-8", errors="replace")
+                payload = "\n".join(f"data: {line}" for line in text.split("\n"))
+                yield f"id: {position - len(pending)}\n{payload}\n\n"
+            continue
+
+        await asyncio.sleep(FOLLOW_POLL_INTERVAL)
+        idle += FOLLOW_POLL_INTERVAL
+        if idle >= FOLLOW_KEEPALIVE_INTERVAL:
+            idle = 0.0
+            yield ": keepalive\n\n"
+
+
+@router.get("/logs/{agent_name}/follow")
+async def follow_agent_logs(
+    agent_name: str,
+    offset: Optional[int] = Query(None, ge=0, description="읽기 시작할 바이트 위치 (기본값: 현재 파일 끝)"),
+) -> StreamingResponse:
+    """
+    에이전트 로그에 새로 추가되는 줄을 SSE로 전달합니다.
+
+    각 이벤트의 id는 다음에 읽을 바이트 위치이므로 재연결 시 offset으로 사용할 수 있습니다.
+
+    Args:
+        agent_name: 에이전트 이름 (supervisor, agent1, agent2)
+        offset: 읽기 시작할 바이트 위치
+
+    Returns:
+        StreamingResponse: text/event-stream 응답
+    """
+    log_file = validate_agent(agent_name)
+    return StreamingResponse(
+        follow_log(log_file, offset),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
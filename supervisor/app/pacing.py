@@ -0,0 +1,273 @@
+"""
+구구단 단계 페이싱 모듈
+
+세션별 페이싱 정책(없음, 고정 간격, 토큰 버킷, 클라이언트 확인)에 따라
+구구단 단계 사이의 대기를 제어합니다. 모든 대기는 하나의 타이머 휠이 관리합니다.
+"""
+import asyncio
+import math
+import time
+from typing import List, Optional, Tuple
+
+from shared.schemas import PacingPolicy
+
+
+class TimerWheel:
+    """
+    해시드 타이머 휠
+
+    세션마다 asyncio.sleep 타이머를 만드는 대신, 하나의 백그라운드 태스크가
+    일정한 틱 간격으로 슬롯을 돌며 만료된 대기를 한꺼번에 깨웁니다.
+    """
+
+    def __init__(self, tick: float = 0.01, slots: int = 512):
+        """
+        TimerWheel 초기화
+
+        Args:
+            tick (float): 틱 간격 (초)
+            slots (int): 슬롯 개수
+        """
+        self.tick = tick
+        self.slots: List[List[Tuple[int, asyncio.Future]]] = [[] for _ in range(slots)]
+        self._origin = time.monotonic()
+        self._processed_tick = 0
+        self._pending = 0
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def pending(self) -> int:
+        """
+        휠에 등록된 대기 개수
+
+        Returns:
+            int: 아직 만료되지 않은 대기 개수
+        """
+        return self._pending
+
+    def _now_tick(self) -> int:
+        return int((time.monotonic() - self._origin) / self.tick)
+
+    def _ensure_driver(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Reason: 이전 이벤트 루프(예: 테스트마다 새로 만들어지는 루프)의 대기는 더 이상 깨울 수 없으므로 버립니다.
+            self.slots = [[] for _ in range(len(self.slots))]
+            self._pending = 0
+            self._processed_tick = self._now_tick()
+            self._loop = loop
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    def schedule(self, delay: float) -> asyncio.Future:
+        """
+        지정한 시간 후에 완료되는 퓨처를 등록합니다.
+
+        Args:
+            delay (float): 대기 시간 (초)
+
+        Returns:
+            asyncio.Future: 만료 시 None으로 완료되는 퓨처
+        """
+        self._ensure_driver()
+        future = self._loop.create_future()
+        target = max(
+            self._processed_tick + 1,
+            math.ceil((time.monotonic() + delay - self._origin) / self.tick),
+        )
+        self.slots[target % len(self.slots)].append((target, future))
+        self._pending += 1
+        return future
+
+    async def sleep(self, delay: float) -> None:
+        """
+        타이머 휠을 이용해 지정한 시간만큼 대기합니다.
+
+        Args:
+            delay (float): 대기 시간 (초)
+        """
+        if delay <= 0:
+            return
+        await self.schedule(delay)
+
+    async def _run(self) -> None:
+        while self._pending > 0:
+            await asyncio.sleep(self.tick)
+            now_tick = self._now_tick()
+            # Reason: 루프가 지연되어 여러 틱을 건너뛰었더라도 한 바퀴 이상은 볼 필요가 없습니다.
+            start = max(self._processed_tick + 1, now_tick - len(self.slots) + 1)
+            for current in range(start, now_tick + 1):
+                slot = self.slots[current % len(self.slots)]
+                if not slot:
+                    continue
+                remaining = []
+                for target, future in slot:
+                    if target <= now_tick:
+                        self._pending -= 1
+                        if not future.done():
+                            future.set_result(None)
+                    else:
+                        remaining.append((target, future))
+                self.slots[current % len(self.slots)] = remaining
+            self._processed_tick = now_tick
+
+
+# 프로세스 전체에서 공유하는 타이머 휠
+timer_wheel = TimerWheel()
+
+
+class Pacer:
+    """
+    대기 없이 바로 다음 단계로 진행하는 기본 페이서 (none 모드)
+    """
+
+    async def wait(self) -> None:
+        """
+        다음 단계로 진행해도 될 때까지 대기합니다.
+        """
+        return None
+
+    def ack(self) -> None:
+        """
+        클라이언트 확인 수신 처리 (ack 모드 외에는 무시)
+        """
+        return None
+
+
+class FixedIntervalPacer(Pacer):
+    """
+    고정 간격으로 단계를 진행하는 페이서 (fixed 모드)
+    """
+
+    def __init__(self, interval: float, wheel: TimerWheel):
+        """
+        FixedIntervalPacer 초기화
+
+        Args:
+            interval (float): 단계 사이 간격 (초)
+            wheel (TimerWheel): 대기에 사용할 타이머 휠
+        """
+        self.interval = interval
+        self.wheel = wheel
+
+    async def wait(self) -> None:
+        """
+        고정 간격만큼 타이머 휠에서 대기합니다.
+        """
+        await self.wheel.sleep(self.interval)
+
+
+class TokenBucketPacer(Pacer):
+    """
+    토큰 버킷 방식으로 평균 속도와 순간 최대 단계 수를 제한하는 페이서 (token_bucket 모드)
+    """
+
+    def __init__(self, rate: float, burst: int, wheel: TimerWheel):
+        """
+        TokenBucketPacer 초기화 (버킷은 가득 찬 상태로 시작)
+
+        Args:
+            rate (float): 초당 채워지는 토큰 수 (평균 단계 속도)
+            burst (int): 버킷 크기 (대기 없이 연속 진행할 수 있는 최대 단계 수)
+            wheel (TimerWheel): 대기에 사용할 타이머 휠
+        """
+        self.rate = rate
+        self.burst = burst
+        self.wheel = wheel
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """
+        마지막 갱신 이후 흐른 시간만큼 토큰을 채웁니다 (버킷 크기까지).
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def wait(self) -> None:
+        """
+        토큰 하나를 쓰고 진행합니다. 토큰이 부족하면 한 개가 찰 때까지 타이머 휠에서 대기합니다.
+        """
+        self._refill()
+        if self.tokens < 1:
+            await self.wheel.sleep((1 - self.tokens) / self.rate)
+            self._refill()
+        self.tokens = max(0.0, self.tokens - 1)
+
+
+class AckPacer(Pacer):
+    """
+    클라이언트가 웹소켓으로 확인(ack)을 보낼 때까지 대기하는 페이서 (ack 모드)
+    """
+
+    def __init__(self, timeout: Optional[float], wheel: TimerWheel):
+        """
+        AckPacer 초기화
+
+        Args:
+            timeout (Optional[float]): 확인이 없을 때 자동으로 진행하기까지의 시간 (초, None이면 무한 대기)
+            wheel (TimerWheel): 제한 시간 타이머에 사용할 타이머 휠
+        """
+        self.timeout = timeout
+        self.wheel = wheel
+        self._credits = 0
+        self._waiter: Optional[asyncio.Future] = None
+
+    def ack(self) -> None:
+        """
+        클라이언트 확인을 받아 대기 중인 단계를 진행시킵니다 (대기 중이 아니면 다음 대기에 쓰도록 적립).
+        """
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(True)
+        else:
+            # Reason: 대기를 시작하기 전에 도착한 확인도 잃어버리지 않도록 적립합니다.
+            self._credits += 1
+
+    async def wait(self) -> None:
+        """
+        클라이언트 확인이나 제한 시간 경과 중 먼저 오는 것을 기다립니다 (적립된 확인이 있으면 바로 진행).
+        """
+        if self._credits > 0:
+            self._credits -= 1
+            return
+        loop = asyncio.get_running_loop()
+        self._waiter = loop.create_future()
+        timer = None
+        if self.timeout is not None:
+            timer = self.wheel.schedule(self.timeout)
+            waiter = self._waiter
+            timer.add_done_callback(
+                lambda _: waiter.done() or waiter.set_result(False)
+            )
+        try:
+            await self._waiter
+        finally:
+            self._waiter = None
+            if timer is not None and not timer.done():
+                timer.cancel()
+
+
+def create_pacer(policy: Optional[PacingPolicy], wheel: Optional[TimerWheel] = None) -> Pacer:
+    """
+    페이싱 정책에 맞는 페이서를 생성합니다.
+
+    Args:
+        policy (Optional[PacingPolicy]): 페이싱 정책 (None이면 기본 정책)
+        wheel (Optional[TimerWheel]): 사용할 타이머 휠 (None이면 공유 휠)
+
+    Returns:
+        Pacer: 생성된 페이서
+    """
+    policy = policy or PacingPolicy()
+    wheel = wheel or timer_wheel
+
+    if policy.mode == "fixed":
+        return FixedIntervalPacer(policy.interval, wheel)
+    if policy.mode == "token_bucket":
+        return TokenBucketPacer(policy.rate, policy.burst, wheel)
+    if policy.mode == "ack":
+        return AckPacer(policy.ack_timeout, wheel)
+    return Pacer()
@@ -0,0 +1,450 @@
+"""
+슈퍼바이저 구구단 파이프라인 모듈
+
+에이전트1(문제 생성기)과 에이전트2(답변기)를 조율하여 구구단 한 번의 실행을
+처리하고, 진행 과정을 이벤트로 전달합니다.
+"""
+import time
+import uuid
+import httpx
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+from shared.config import agent_request_timeout, get_settings
+from shared.schemas import RunOptions
+from shared.gugudan import iter_steps, reaches_stop_value
+from shared.logger import get_agent_logger
+from shared.metrics import REGISTRY
+from shared.priority import PriorityScheduler, inject_priority
+from shared.tracing import inject, start_span
+
+from .pacing import Pacer, create_pacer
+from .planner import execute_plan
+from .result_cache import CompactEvent
+from .runs import Sink
+
+logger = get_agent_logger("supervisor")
+
+# 문제 생성기, 답변기 기본 URL (환경 변수 AGENT1_URL/AGENT2_URL 또는 포트)
+AGENT1_URL = get_settings().agent1_url
+AGENT2_URL = get_settings().agent2_url
+
+# 에이전트 호출 제한 시간 (초, 답변기의 설명 묶음 대기와 LLM 호출 시간을 포함)
+AGENT_REQUEST_TIMEOUT = agent_request_timeout()
+
+# 에이전트 호출 구간(hop)별 지연 시간
+hop_duration = REGISTRY.histogram(
+    "gugudan_hop_duration_seconds",
+    "구구단 파이프라인의 에이전트 호출 시간 (초)",
+    ("hop", "status"),
+)
+
+# 에이전트 호출 스케줄러 (웹소켓 실행 > API 실행 > 일괄 작업 순으로 슬롯 배정)
+outbound_scheduler = PriorityScheduler("supervisor", get_settings().supervisor_outbound_concurrency)
+
+# 실행 중인 구구단의 페이서 (실행 ID -> 페이서), ack 메시지 전달에 사용
+active_pacers: Dict[str, Pacer] = {}
+
+
+def solve_route(options: RunOptions) -> Tuple[str, str]:
+    """
+    실행 옵션의 경로(topology)에 따라 답변을 요청할 구간 이름과 URL을 정합니다.
+
+    Args:
+        options (RunOptions): 실행 옵션 (topology가 없으면 GUGUDAN_TOPOLOGY 설정을 따름)
+
+    Returns:
+        Tuple[str, str]: (hop 이름, 요청 URL)
+    """
+    topology = options.topology or get_settings().topology
+    if topology == "direct":
+        # Reason: 문제 생성기는 요청을 그대로 중계만 하므로 답변기를 직접 호출해 한 구간을 줄입니다.
+        return "answer", f"{AGENT2_URL}/answer"
+    return "solve", f"{AGENT1_URL}/problem/solve"
+
+
+def answer_payload(
+    problem: str,
+    multiplier: Optional[int],
+    multiplicand: Optional[int],
+    run_id: str,
+    problem_id: Optional[str] = None,
+) -> Dict:
+    """
+    답변 요청 본문을 만듭니다.
+
+    숫자를 함께 보내 답변기가 문제 문자열을 파싱하지 않도록 합니다.
+
+    Args:
+        problem (str): 구구단 문제 (예: '3×4=')
+        multiplier (Optional[int]): 첫 번째 숫자 (N)
+        multiplicand (Optional[int]): 두 번째 숫자 (X)
+        run_id (str): 실행 ID (문제 ID 생성에 사용)
+        problem_id (Optional[str]): 문제 ID (None이면 '실행 ID:곱하는 수')
+
+    Returns:
+        Dict: AnswerRequest 형식의 요청 본문
+    """
+    payload: Dict = {"problem": problem}
+    if multiplier is not None and multiplicand is not None:
+        payload.update(
+            multiplier=multiplier,
+            multiplicand=multiplicand,
+            id=problem_id or f"{run_id}:{multiplicand}",
+        )
+    return payload
+
+
+def acknowledge_run(run_id: Optional[str]):
+    """
+    클라이언트 확인(ack)을 실행 중인 구구단의 페이서에 전달
+
+    Args:
+        run_id (Optional[str]): 확인 대상 실행 ID (없으면 무시)
+    """
+    if run_id in active_pacers:
+        active_pacers[run_id].ack()
+
+
+async def post_hop(client: httpx.AsyncClient, run_id: str, hop: str, url: str, **kwargs) -> httpx.Response:
+    """
+    에이전트 호출 한 번(hop)을 수행하고 지연 시간을 구조화 로그, 메트릭, 추적 구간으로 남깁니다.
+
+    호출은 현재 우선순위 클래스로 outbound_scheduler의 슬롯을 얻은 뒤 보냅니다.
+
+    Args:
+        client (httpx.AsyncClient): 에이전트 호출에 사용할 HTTP 클라이언트
+        run_id (str): 실행 ID
+        hop (str): 호출 구간 이름 (예: 'initialize', 'solve')
+        url (str): 요청 URL
+        **kwargs: httpx 요청 인자
+
+    Returns:
+        httpx.Response: 에이전트 응답
+    """
+    payload = kwargs.get("json") or {}
+    with start_span(f"hop.{hop}", run_id=run_id, step=payload.get("problem")) as span:
+        # 현재 우선순위 클래스로 호출 슬롯을 얻은 뒤 호출 (대기 시간은 호출 시간에서 제외)
+        async with outbound_scheduler.slot():
+            started = time.perf_counter()
+            try:
+                # 추적 컨텍스트와 우선순위 클래스를 헤더로 전달하여 에이전트1, 에이전트2로 이어감
+                response = await client.post(url, headers=inject_priority(inject()), **kwargs)
+            except Exception:
+                hop_duration.labels(hop, "error").observe(time.perf_counter() - started)
+                raise
+            elapsed = time.perf_counter() - started
+        span.set_attribute("http.status_code", response.status_code)
+    hop_duration.labels(hop, response.status_code).observe(elapsed)
+    latency_ms = round(elapsed * 1000, 2)
+    logger.info(
+        f"{hop} 응답 {response.status_code} ({latency_ms}ms)",
+        extra={"run_id": run_id, "hop": hop, "latency_ms": latency_ms},
+    )
+    return response
+
+
+async def process_gugudan(
+    table: int,
+    stop_value: Optional[int] = None,
+    options: Optional[RunOptions] = None,
+    run_id: Optional[str] = None,
+    *,
+    emit: Sink,
+) -> bool:
+    """
+    구구단 문제 풀이 과정 처리
+
+    에이전트1과 에이전트2를 조율하여 구구단 문제를 생성하고 풀이합니다.
+
+    Args:
+        table (int): 구구단 단수
+        stop_value (Optional[int], optional): 종료 조건 값
+        options (Optional[RunOptions], optional): 실행 옵션 (페이싱 정책 등)
+        run_id (Optional[str], optional): 실행 ID (ack 메시지 전달에 사용)
+        emit (Sink): 이벤트 전송 함수
+
+    Returns:
+        bool: 종료 조건 또는 마지막 단계까지 정상적으로 완료했고 설명 생성에 실패한 단계가 없으면 True
+    """
+    options = options or RunOptions()
+    run_id = run_id or uuid.uuid4().hex[:12]
+    pacer = create_pacer(options.pacing)
+    active_pacers[run_id] = pacer
+    completed = False
+    # Reason: 답변기는 설명 생성 실패도 200으로 응답하므로, 오류 안내 문구가 담긴 실행을 결과 캐시에 남기지 않도록 따로 표시합니다.
+    explanation_failed = False
+
+    # 실행 단위 추적 구간 (각 에이전트 호출은 하위 구간으로 기록)
+    with start_span("gugudan.run", "supervisor", run_id=run_id, table=table) as run_span:
+        try:
+            # 에이전트1 (문제 생성기) 초기화
+            # Reason: httpx 기본 제한 시간(5초)은 묶음 대기와 LLM 호출(최대 30초)보다 짧아 정상 응답도 끊기므로 명시합니다.
+            async with httpx.AsyncClient(timeout=AGENT_REQUEST_TIMEOUT) as client:
+                response = await post_hop(
+                    client, run_id, "initialize",
+                    f"{AGENT1_URL}/problem/initialize",
+                    json={"table": table, "stop_value": stop_value}
+                )
+            
+                if response.status_code != 200:
+                    await emit({
+                        "type": "system_message",
+                        "content": "문제 생성기 초기화 실패",
+                        "sender": "supervisor",
+                        "timestamp": datetime.now().isoformat()
+                    })
+                    return False
+            
+                problem_data = response.json()
+                problem = problem_data.get("problem", "")
+            
+                # 문제 브로드캐스트
+                await emit({
+                    "type": "problem",
+                    "content": problem,
+                    "sender": "agent1",
+                    "timestamp": datetime.now().isoformat()
+                })
+            
+                if options.execution == "planned":
+                    # 계획 실행 모드: 다음 K단계를 미리 요청
+                    completed = await process_planned(client, table, stop_value, options, pacer, emit, run_id)
+                    return completed
+            
+                # 지속적으로 문제 생성 및 풀이
+                solve_hop, solve_url = solve_route(options)
+                while True:
+                    # 단계(답변 → 종료 또는 다음 문제) 추적 구간, 에이전트 호출 구간은 그 하위 구간으로 기록
+                    with start_span("gugudan.step", run_id=run_id, step=problem):
+                        # 답변 요청
+                        answer_response = await post_hop(
+                            client, run_id, solve_hop, solve_url,
+                            json=answer_payload(
+                                problem, problem_data.get("multiplier"), problem_data.get("multiplicand"), run_id
+                            )
+                        )
+                
+                        if answer_response.status_code != 200:
+                            await emit({
+                                "type": "system_message",
+                                "content": "답변 처리 실패",
+                                "sender": "supervisor",
+                                "timestamp": datetime.now().isoformat()
+                            })
+                            break
+                
+                        answer_data = answer_response.json()
+                        calculation = answer_data.get("calculation", "")
+                        answer = answer_data.get("answer", 0)
+                        explanation = answer_data.get("explanation", "")
+                        explanation_failed = explanation_failed or bool(answer_data.get("explanation_error"))
+                
+                        # 답변 브로드캐스트
+                        await emit({
+                            "type": "answer",
+                            "content": calculation,
+                            "sender": "agent2",
+                            "timestamp": datetime.now().isoformat()
+                        })
+                
+                        # 설명이 있으면 설명 브로드캐스트
+                        if explanation:
+                            await emit({
+                                "type": "explanation",
+                                "content": explanation,
+                                "sender": "agent2",
+                                "timestamp": datetime.now().isoformat()
+                            })
+                
+                        # 종료 조건 확인
+                        if stop_value and answer >= stop_value:
+                            await emit({
+                                "type": "system_message",
+                                "content": f"정답이 {stop_value}에 도달했습니다. 구구단이 끝났습니다.",
+                                "sender": "supervisor",
+                                "timestamp": datetime.now().isoformat()
+                            })
+                    
+                            # 에이전트1에 종료 요청
+                            await post_hop(client, run_id, "end", f"{AGENT1_URL}/problem/end")
+                            completed = True
+                            break
+                
+                        # 다음 문제 요청
+                        next_response = await post_hop(client, run_id, "next", f"{AGENT1_URL}/problem/next")
+                
+                        if next_response.status_code != 200:
+                            await emit({
+                                "type": "system_message",
+                                "content": "다음 문제 생성 실패",
+                                "sender": "supervisor",
+                                "timestamp": datetime.now().isoformat()
+                            })
+                            break
+                
+                        next_data = next_response.json()
+                
+                        # 완료 확인
+                        if next_data is None or next_data.get("status") == "completed":
+                            await emit({
+                                "type": "system_message",
+                                "content": f"구구단이 끝났습니다. {table}단 학습 완료!",
+                                "sender": "supervisor",
+                                "timestamp": datetime.now().isoformat()
+                            })
+                            completed = True
+                            break
+                
+                        problem_data = next_data
+                        problem = next_data.get("problem", "")
+                
+                        # 다음 문제 브로드캐스트
+                        await emit({
+                            "type": "problem",
+                            "content": problem,
+                            "sender": "agent1",
+                            "timestamp": datetime.now().isoformat()
+                        })
+                
+                    # 페이싱 정책에 따라 다음 단계까지 대기
+                    await pacer.wait()
+    
+        except Exception as e:
+            logger.error(f"구구단 처리 중 오류 발생: {str(e)}", extra={"run_id": run_id})
+            await emit({
+                "type": "system_message",
+                "content": f"구구단 처리 중 오류 발생: {str(e)}",
+                "sender": "supervisor",
+                "timestamp": datetime.now().isoformat()
+            })
+        finally:
+            active_pacers.pop(run_id, None)
+            run_span.set_attribute("completed", completed)
+
+    return completed and not explanation_failed
+
+
+async def replay_run(
+    events: Sequence[CompactEvent],
+    options: Optional[RunOptions] = None,
+    run_id: Optional[str] = None,
+    *,
+    emit: Sink,
+) -> bool:
+    """
+    캐시된 구구단 실행을 에이전트 호출 없이 재생합니다.
+
+    실제 실행과 같은 위치(두 번째 문제부터 문제 전송 직후)에서 페이싱 정책에 따라 대기합니다.
+
+    Args:
+        events (Sequence[CompactEvent]): 캐시된 이벤트 목록
+        options (Optional[RunOptions], optional): 실행 옵션 (페이싱 정책 등)
+        run_id (Optional[str], optional): 실행 ID (ack 메시지 전달에 사용)
+        emit (Sink): 이벤트 전송 함수
+
+    Returns:
+        bool: 재생을 끝까지 완료했으면 True
+    """
+    options = options or RunOptions()
+    run_id = run_id or uuid.uuid4().hex[:12]
+    pacer = create_pacer(options.pacing)
+    active_pacers[run_id] = pacer
+
+    try:
+        problems_sent = 0
+        for event_type, content, sender in events:
+            await emit({
+                "type": event_type,
+                "content": content,
+                "sender": sender,
+                "timestamp": datetime.now().isoformat()
+            })
+            if event_type == "problem":
+                problems_sent += 1
+                if problems_sent > 1:
+                    await pacer.wait()
+        return True
+    finally:
+        active_pacers.pop(run_id, None)
+
+
+async def process_planned(
+    client: httpx.AsyncClient,
+    table: int,
+    stop_value: Optional[int],
+    options: RunOptions,
+    pacer: Pacer,
+    emit: Sink,
+    run_id: Optional[str] = None,
+) -> bool:
+    """
+    계획 실행 모드의 구구단 풀이 처리
+
+    문제 순서는 단수, 종료 조건, ×9 제한으로 결정되므로 계획을 미리 계산하고
+    다음 K단계의 답변을 동시에 요청합니다. 종료 조건을 계획에 반영하므로
+    종료 이후의 단계는 요청하지 않습니다.
+
+    Args:
+        client (httpx.AsyncClient): 에이전트 호출에 사용할 HTTP 클라이언트
+        table (int): 구구단 단수
+        stop_value (Optional[int]): 종료 조건 값
+        options (RunOptions): 실행 옵션
+        pacer (Pacer): 단계 사이의 대기를 담당하는 페이서
+        emit (Sink): 이벤트 전송 함수
+        run_id (Optional[str]): 실행 ID (구조화 로그에 사용)
+
+    Returns:
+        bool: 종료 조건 또는 마지막 단계까지 정상적으로 완료했고 설명 생성에 실패한 단계가 없으면 True
+    """
+    solve_hop, solve_url = solve_route(options)
+    explanation_failures = []
+
+    async def solve(step) -> Optional[Dict]:
+        # 미리 요청하는 단계마다 추적 구간을 두고 답변 호출 구간을 그 하위 구간으로 기록
+        with start_span("gugudan.step", run_id=run_id, step=step.problem):
+            answer_response = await post_hop(
+                client, run_id, solve_hop, solve_url,
+                json=answer_payload(step.problem, step.multiplier, step.multiplicand, run_id)
+            )
+        if answer_response.status_code != 200:
+            return None
+        answer_data = answer_response.json()
+        if answer_data.get("explanation_error"):
+            explanation_failures.append(step.problem)
+        return answer_data
+
+    last_step = await execute_plan(
+        iter_steps(table, stop_value),
+        solve,
+        emit,
+        pacer,
+        lookahead=options.lookahead,
+    )
+
+    if last_step is None:
+        await emit({
+            "type": "system_message",
+            "content": "답변 처리 실패",
+            "sender": "supervisor",
+            "timestamp": datetime.now().isoformat()
+        })
+        return False
+
+    if reaches_stop_value(last_step.answer, stop_value):
+        await emit({
+            "type": "system_message",
+            "content": f"정답이 {stop_value}에 도달했습니다. 구구단이 끝났습니다.",
+            "sender": "supervisor",
+            "timestamp": datetime.now().isoformat()
+        })
+        # 에이전트1에 종료 요청
+        await post_hop(client, run_id, "end", f"{AGENT1_URL}/problem/end")
+    else:
+        await emit({
+            "type": "system_message",
+            "content": f"구구단이 끝났습니다. {table}단 학습 완료!",
+            "sender": "supervisor",
+            "timestamp": datetime.now().isoformat()
+        })
+    return not explanation_failures
@@ -0,0 +1,92 @@
+"""
+구구단 계획 실행 모듈
+
+실행 계획을 미리 계산한 뒤 다음 K단계의 답변 요청을 동시에 보내고,
+결과는 항상 계획 순서대로 브로드캐스트합니다.
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from shared.gugudan import PlannedStep
+
+from .pacing import Pacer
+
+# 단계 답변 요청 함수 (실패 시 None 반환)
+SolveFunc = Callable[[PlannedStep], Awaitable[Optional[Dict[str, Any]]]]
+# 이벤트 전송 함수
+EmitFunc = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+async def execute_plan(
+    steps: Iterable[PlannedStep],
+    solve: SolveFunc,
+    emit: EmitFunc,
+    pacer: Pacer,
+    lookahead: int = 3,
+) -> Optional[PlannedStep]:
+    """
+    실행 계획을 파이프라인 방식으로 실행합니다.
+
+    첫 번째 문제는 초기화 단계에서 이미 브로드캐스트되었다고 가정하고,
+    이후 문제/답변/설명 이벤트를 순차 실행과 같은 순서로 전송합니다.
+
+    Args:
+        steps (Iterable[PlannedStep]): 실행할 단계 목록
+        solve (SolveFunc): 단계의 답변을 요청하는 함수
+        emit (EmitFunc): 이벤트 전송 함수
+        pacer (Pacer): 단계 사이의 대기를 담당하는 페이서
+        lookahead (int): 동시에 답변을 요청할 최대 단계 수
+
+    Returns:
+        Optional[PlannedStep]: 마지막으로 완료한 단계 (답변 실패 시 None)
+    """
+    plan = list(steps)
+    in_flight: Dict[int, asyncio.Task] = {}
+
+    def dispatch(start: int) -> None:
+        for index in range(start, min(start + lookahead, len(plan))):
+            if index not in in_flight:
+                in_flight[index] = asyncio.ensure_future(solve(plan[index]))
+
+    try:
+        for index, step in enumerate(plan):
+            dispatch(index)
+
+            if index > 0:
+                await emit({
+                    "type": "problem",
+                    "content": step.problem,
+                    "sender": "agent1",
+                    "timestamp": datetime.now().isoformat()
+                })
+                # 대기하는 동안에도 앞선 단계들의 답변 요청은 계속 진행됩니다.
+                await pacer.wait()
+
+            answer_data = await in_flight.pop(index)
+            if answer_data is None:
+                return None
+
+            await emit({
+                "type": "answer",
+                "content": answer_data.get("calculation", ""),
+                "sender": "agent2",
+                "timestamp": datetime.now().isoformat()
+            })
+
+            explanation = answer_data.get("explanation", "")
+            if explanation:
+                await emit({
+                    "type": "explanation",
+                    "content": explanation,
+                    "sender": "agent2",
+                    "timestamp": datetime.now().isoformat()
+                })
+
+            if step.final:
+                return step
+        return None
+    finally:
+        # 실패나 취소로 중단된 경우 남은 요청 정리
+        for task in in_flight.values():
+            task.cancel()
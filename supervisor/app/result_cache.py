@@ -0,0 +1,152 @@
+"""
+완료된 구구단 실행 결과 캐시 모듈
+
+설명까지 모두 생성된 구구단 실행을 간결한 이벤트 목록으로 저장하고,
+같은 (단수, 종료 조건) 요청은 에이전트 호출 없이 캐시에서 재생합니다.
+메모리 사용량 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다(LRU).
+"""
+import sys
+from collections import OrderedDict
+from typing import Any, Awaitable, Dict, Iterable, Optional, Tuple
+
+from shared.config import get_settings
+
+# 간결한 이벤트 형식: (type, content, sender), 타임스탬프는 재생 시 새로 생성
+CompactEvent = Tuple[str, str, str]
+# 캐시 키: (단수, 종료 조건)
+CacheKey = Tuple[int, Optional[int]]
+
+# 기본 메모리 한도 (16MB)
+DEFAULT_MAX_BYTES = get_settings().result_cache_max_bytes
+
+
+def compact_events(events: Iterable[Dict[str, Any]]) -> Tuple[CompactEvent, ...]:
+    """
+    브로드캐스트 이벤트를 캐시 저장용 간결한 형식으로 변환합니다.
+
+    Args:
+        events (Iterable[Dict[str, Any]]): 실행 중 전송된 이벤트 목록
+
+    Returns:
+        Tuple[CompactEvent, ...]: (type, content, sender) 튜플 목록
+    """
+    return tuple(
+        (event["type"], event.get("content", ""), event.get("sender", "supervisor"))
+        for event in events
+    )
+
+
+def estimate_size(events: Tuple[CompactEvent, ...]) -> int:
+    """
+    간결한 이벤트 목록의 대략적인 메모리 사용량을 계산합니다.
+
+    Args:
+        events (Tuple[CompactEvent, ...]): 이벤트 목록
+
+    Returns:
+        int: 추정 메모리 사용량 (바이트)
+    """
+    size = sys.getsizeof(events)
+    for event in events:
+        size += sys.getsizeof(event) + sum(sys.getsizeof(field) for field in event)
+    return size
+
+
+class ResultCache:
+    """
+    메모리 한도가 있는 LRU 실행 결과 캐시
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        ResultCache 초기화
+
+        Args:
+            max_bytes (int): 캐시 전체의 최대 메모리 사용량 (바이트)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, Tuple[Tuple[CompactEvent, ...], int]]" = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> Optional[Tuple[CompactEvent, ...]]:
+        """
+        캐시된 실행을 조회하고 적중률 통계를 갱신합니다.
+
+        Args:
+            key (CacheKey): (단수, 종료 조건)
+
+        Returns:
+            Optional[Tuple[CompactEvent, ...]]: 캐시된 이벤트 목록 (없으면 None)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: CacheKey, events: Iterable[Dict[str, Any]]) -> bool:
+        """
+        완료된 실행을 저장하고 한도를 넘으면 오래된 항목을 제거합니다.
+
+        Args:
+            key (CacheKey): (단수, 종료 조건)
+            events (Iterable[Dict[str, Any]]): 실행 중 전송된 이벤트 목록
+
+        Returns:
+            bool: 저장했으면 True (한 항목이 한도보다 크면 False)
+        """
+        compact = compact_events(events)
+        size = estimate_size(compact)
+        if size > self.max_bytes:
+            return False
+
+        if key in self._entries:
+            self.size -= self._entries.pop(key)[1]
+        self._entries[key] = (compact, size)
+        self.size += size
+
+        while self.size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+        return True
+
+    async def record(self, key: CacheKey, pipeline: Awaitable[bool], run: Any) -> bool:
+        """
+        파이프라인을 실행하고 정상적으로 완료되면 실행 이벤트를 저장합니다.
+
+        Args:
+            key (CacheKey): (단수, 종료 조건)
+            pipeline (Awaitable[bool]): 완료 여부를 반환하는 구구단 파이프라인
+            run (Any): 이벤트를 기록하는 실행 객체 (events 속성 사용)
+
+        Returns:
+            bool: 파이프라인 완료 여부
+        """
+        completed = await pipeline
+        if completed is True:
+            self.put(key, run.events)
+        return completed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 항목 수, 메모리 사용량, 적중/실패 횟수 및 적중률
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,200 @@
+"""
+구구단 실행 관리 모듈
+
+동일한 구구단 실행(단수, 종료 조건, 페이싱 정책)이 동시에 요청되면
+하나의 파이프라인을 공유하고, 그 이벤트를 모든 구독자에게 전달합니다.
+"""
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Tuple
+
+from shared.schemas import RunOptions
+from shared.websocket_manager import broadcast_duration
+
+# 이벤트를 전달받는 구독자 함수
+Sink = Callable[[Dict[str, Any]], Awaitable[None]]
+# 실행 식별 키 (단수, 종료 조건, 페이싱 정책)
+RunKey = Tuple[int, Optional[int], str]
+
+
+def run_key(table: int, stop_value: Optional[int], options: RunOptions) -> RunKey:
+    """
+    구구단 실행의 중복 판별 키를 생성합니다.
+
+    Args:
+        table (int): 구구단 단수
+        stop_value (Optional[int]): 종료 조건 값
+        options (RunOptions): 실행 옵션
+
+    Returns:
+        RunKey: 실행 식별 키
+    """
+    return (table, stop_value, options.pacing.model_dump_json())
+
+
+class Run:
+    """
+    진행 중인 구구단 실행
+
+    지금까지 생성된 이벤트를 보관하여 늦게 참여한 구독자에게 먼저 재전송합니다.
+    """
+
+    def __init__(self, key: RunKey, run_id: Optional[str] = None):
+        """
+        Run 초기화
+
+        Args:
+            key (RunKey): 실행 식별 키
+            run_id (Optional[str]): 실행 ID (None이면 새로 생성)
+        """
+        self.key = key
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.events: List[Dict[str, Any]] = []
+        self.sinks: List[Sink] = []
+        self.task: Optional[asyncio.Task] = None
+        # 지난 이벤트를 재전송받는 중인 구독자
+        self._joining: List[Sink] = []
+        # Reason: 이벤트 기록 순서와 구독자 목록 변경이 섞이지 않도록 직렬화합니다.
+        self._lock = asyncio.Lock()
+
+    async def _deliver(self, sink: Sink, event: Dict[str, Any]) -> None:
+        try:
+            await sink(event)
+        except Exception:
+            # 전송에 실패한 구독자는 더 이상 이벤트를 받지 않음
+            if sink in self.sinks:
+                self.sinks.remove(sink)
+
+    async def emit(self, event: Dict[str, Any]) -> None:
+        """
+        이벤트를 기록하고 모든 구독자에게 전달합니다.
+
+        Args:
+            event (Dict[str, Any]): 전달할 이벤트
+        """
+        async with self._lock:
+            self.events.append(event)
+            # 잠금 대기를 빼고 구독자 전달(팬아웃)에 걸린 시간만 기록
+            started = time.perf_counter()
+            await asyncio.gather(*(self._deliver(sink, event) for sink in list(self.sinks)))
+            broadcast_duration.labels("run").observe(time.perf_counter() - started)
+
+    def is_subscribed(self, sink: Sink) -> bool:
+        """
+        구독자가 이 실행의 이벤트를 받고 있는지 확인합니다.
+
+        Args:
+            sink (Sink): 구독자 함수
+
+        Returns:
+            bool: 구독 중이면 True
+        """
+        return sink in self.sinks
+
+    async def subscribe(self, sink: Sink) -> None:
+        """
+        구독자를 추가하고 지금까지의 이벤트를 먼저 재전송합니다.
+
+        재전송은 잠금 밖에서 하므로 느린 구독자가 다른 구독자로의 이벤트 전달을 막지 않습니다.
+        재전송하는 동안 기록된 이벤트도 순서대로 이어서 보낸 뒤 구독자 목록에 추가하며,
+        재전송에 실패한 구독자는 추가하지 않습니다.
+
+        Args:
+            sink (Sink): 이벤트를 전달받을 구독자 함수
+        """
+        if sink in self.sinks or sink in self._joining:
+            return
+        self._joining.append(sink)
+        sent = 0
+        try:
+            while True:
+                async with self._lock:
+                    # 이벤트 목록은 뒤에 추가만 되므로 보낸 개수로 중복 없이 이어서 보냄
+                    pending = self.events[sent:]
+                    if not pending:
+                        self.sinks.append(sink)
+                        return
+                for event in pending:
+                    await sink(event)
+                sent += len(pending)
+        except Exception:
+            # 재전송에 실패한 구독자는 이벤트를 받지 않음
+            return
+        finally:
+            self._joining.remove(sink)
+
+
+class RunRegistry:
+    """
+    진행 중인 구구단 실행 목록을 관리하는 클래스
+    """
+
+    def __init__(self):
+        """
+        RunRegistry 초기화
+        """
+        self._runs: Dict[RunKey, Run] = {}
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def get(self, key: RunKey) -> Optional[Run]:
+        """
+        진행 중인 실행을 조회합니다.
+
+        Args:
+            key (RunKey): 실행 식별 키
+
+        Returns:
+            Optional[Run]: 진행 중인 실행 (없으면 None)
+        """
+        return self._runs.get(key)
+
+    def find(self, run_id: Optional[str]) -> Optional[Run]:
+        """
+        실행 ID로 진행 중인 실행을 조회합니다.
+
+        Args:
+            run_id (Optional[str]): 실행 ID
+
+        Returns:
+            Optional[Run]: 진행 중인 실행 (없으면 None)
+        """
+        return next((run for run in self._runs.values() if run.run_id == run_id), None)
+
+    def create(self, key: RunKey, sink: Sink, run_id: Optional[str] = None) -> Run:
+        """
+        새 실행을 등록하고 첫 번째 구독자를 추가합니다.
+
+        Args:
+            key (RunKey): 실행 식별 키
+            sink (Sink): 첫 번째 구독자 함수
+            run_id (Optional[str]): 실행 ID
+
+        Returns:
+            Run: 등록된 실행
+        """
+        run = Run(key, run_id)
+        run.sinks.append(sink)
+        self._runs[key] = run
+        return run
+
+    def launch(self, run: Run, pipeline: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """
+        실행의 파이프라인을 시작하고 완료되면 목록에서 제거합니다.
+
+        Args:
+            run (Run): 파이프라인을 실행할 구구단 실행
+            pipeline (Coroutine): 이벤트를 run.emit으로 전달하는 파이프라인 코루틴
+
+        Returns:
+            asyncio.Task: 파이프라인 태스크
+        """
+        run.task = asyncio.create_task(pipeline)
+        run.task.add_done_callback(lambda _: self._remove(run))
+        return run.task
+
+    def _remove(self, run: Run) -> None:
+        if self._runs.get(run.key) is run:
+            del self._runs[run.key]
@@ -3,28 +3,25 @@
 
 사용자 요청을 처리하고 에이전트들의 작업을 조율하는 슈퍼바이저 서버를 실행합니다.
 """
+import argparse
 import uvicorn
-import os
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
 # 현재 파일 위치를 기준으로 프로젝트 루트 경로를 추가
 sys.path.append(str(Path(__file__).parent.parent))
 
-# 공통 로깅 모듈 임포트
+# 공통 설정/로깅 모듈 임포트 (shared를 가져올 때 .env가 한 번 적용됨)
+from shared.config import get_settings
 from shared.logger import get_agent_logger
 
 # 로깅 설정
 logger = get_agent_logger("supervisor")
 
-# .env 파일 로드 (있는 경우)
-load_dotenv()
-
-# 기본 포트 설정
-DEFAULT_PORT = 8000
-PORT = int(os.getenv("SUPERVISOR_PORT", DEFAULT_PORT))
-HOST = os.getenv("SUPERVISOR_HOST", "0.0.0.0")
+# 포트 설정 (환경 변수 SUPERVISOR_HOST, SUPERVISOR_PORT)
+settings = get_settings()
+PORT = settings.supervisor_port
+HOST = settings.supervisor_host
 
 
 def main():
@@ -43,4 +40,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="슈퍼바이저 에이전트 서버 실행")
+    parser.add_argument("--startup-report", action="store_true", help="모듈별 가져오기/초기화 시간을 출력하고 종료")
+    args = parser.parse_args()
+
+    if args.startup_report:
+        from shared.startup import startup_report
+        print(startup_report("app.api", str(Path(__file__).parent)))
+    else:
+        main()
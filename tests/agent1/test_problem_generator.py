@@ -11,6 +11,7 @@ from pathlib import Path
 # 상위 디렉터리 경로를 모듈 검색 경로에 추가
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+from shared import __version__
 from agent1.app.api import app
 
 
@@ -34,7 +35,7 @@ def test_health_check(client):
     """
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "ok", "agent": "problem_generator"}
+    assert response.json() == {"status": "ok", "agent": "problem_generator", "version": __version__}
 
 
 def test_initialize_problem(client):
@@ -0,0 +1,110 @@
+"""
+에이전트1(문제 생성기) 답변기 중계 단위 테스트 모듈
+
+passthrough 모드가 답변기 응답을 그대로 전달하고, validate 모드가 응답을 검증하는지 확인합니다.
+"""
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from agent1.app import relay
+from agent1.app.api import app
+
+ANSWER_BODY = json.dumps(
+    {"answer": 12, "calculation": "3×4=12", "explanation": "# 설명\n" * 100, "visual_representation": None},
+    ensure_ascii=False,
+).encode("utf-8")
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    """
+    네트워크 응답처럼 본문을 여러 조각으로 나누어 전달하는 스트림
+    """
+
+    def __init__(self, body, chunk_size=256):
+        self.body = body
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self):
+        for start in range(0, len(self.body), self.chunk_size):
+            yield self.body[start:start + self.chunk_size]
+
+
+@pytest.fixture
+def agent2(monkeypatch):
+    """
+    답변기 에이전트를 흉내 내는 HTTP 클라이언트로 교체하는 픽스처
+
+    Returns:
+        dict: 답변기가 응답할 상태 코드와 본문, 받은 요청 목록
+    """
+    behaviour = {"status": 200, "body": ANSWER_BODY, "requests": []}
+
+    def handler(request):
+        behaviour["requests"].append(request)
+        if behaviour["status"] is None:
+            raise httpx.ConnectError("연결 거부", request=request)
+        return httpx.Response(
+            behaviour["status"],
+            stream=ChunkedStream(behaviour["body"]),
+            headers={"content-type": "application/json"},
+        )
+
+    monkeypatch.setattr(relay, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return behaviour
+
+
+def test_passthrough_forwards_body_unchanged(agent2):
+    """
+    답변기 응답 본문이 바이트 단위로 그대로 전달되는지 테스트
+    """
+    response = TestClient(app).post("/problem/solve", json={"problem": "3×4="})
+
+    assert response.status_code == 200
+    assert response.content == ANSWER_BODY
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(agent2["requests"][0].content) == {"problem": "3×4="}
+    assert "traceparent" in agent2["requests"][0].headers
+
+
+def test_passthrough_forwards_error_status(agent2):
+    """
+    답변기의 오류 상태 코드와 본문이 그대로 전달되는지 테스트
+    """
+    agent2["status"] = 400
+    agent2["body"] = b'{"detail": "bad"}'
+
+    response = TestClient(app).post("/problem/solve", json={"problem": "3×4="})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "bad"}
+
+
+def test_validate_mode_checks_response(agent2, monkeypatch):
+    """
+    validate 모드에서 답변기 응답이 AnswerResponse로 검증되는지 테스트
+    """
+    monkeypatch.setattr(relay, "RELAY_MODE", "validate")
+
+    response = TestClient(app).post("/problem/solve", json={"problem": "3×4="})
+
+    assert response.status_code == 200
+    assert response.json()["calculation"] == "3×4=12"
+
+
+def test_connection_failure_returns_503(agent2):
+    """
+    답변기에 연결할 수 없으면 503을 반환하는지 테스트
+    """
+    agent2["status"] = None
+
+    response = TestClient(app).post("/problem/solve", json={"problem": "3×4="})
+
+    assert response.status_code == 503
@@ -0,0 +1,79 @@
+"""
+에이전트1(문제 생성기) 문제 스트리밍 단위 테스트 모듈
+
+NDJSON/SSE/compact 형식, 종료 조건, ×9를 넘는 범위를 검증합니다.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from agent1.app.api import app, state
+from shared.schemas import ProblemGenerated
+
+
+@pytest.fixture
+def client():
+    """
+    FastAPI 테스트 클라이언트 픽스처
+
+    Returns:
+        TestClient: FastAPI 테스트 클라이언트
+    """
+    return TestClient(app)
+
+
+def test_ndjson_stream_matches_problem_schema(client):
+    """
+    NDJSON 항목이 ProblemGenerated 형식이고 마지막 항목만 completed인지 테스트
+    """
+    response = client.get("/problem/stream", params={"table": 3})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    items = [ProblemGenerated.model_validate_json(line) for line in response.text.splitlines()]
+    assert [item.problem for item in items] == [f"3×{x}=" for x in range(1, 10)]
+    assert [item.status for item in items].count("completed") == 1
+    assert items[-1].status == "completed"
+
+
+def test_stream_honours_stop_value_and_large_range(client):
+    """
+    ×9를 넘는 범위를 스트리밍하고 종료 조건에서 멈추는지 테스트
+    """
+    response = client.get("/problem/stream", params={"table": 7, "last": 5000, "stop_value": 21000})
+
+    lines = response.text.splitlines()
+    assert len(lines) == 3000
+    assert json.loads(lines[-1])["problem"] == "7×3000="
+
+
+def test_sse_and_compact_formats(client):
+    """
+    SSE 형식과 [N, X] 배열 형식을 테스트
+    """
+    sse = client.get("/problem/stream", params={"table": 2, "last": 2, "format": "sse"})
+    compact = client.get("/problem/stream", params={"table": 2, "first": 10, "last": 12, "format": "compact"})
+
+    assert sse.headers["content-type"].startswith("text/event-stream")
+    events = [json.loads(block[len("data: "):]) for block in sse.text.strip().split("\n\n")]
+    assert [event["multiplicand"] for event in events] == [1, 2]
+    assert [json.loads(line) for line in compact.text.splitlines()] == [[2, 10], [2, 11], [2, 12]]
+
+
+def test_stream_does_not_touch_polling_state(client):
+    """
+    스트리밍이 /problem/next의 전역 상태를 바꾸지 않는지 테스트
+    """
+    client.post("/problem/initialize", json={"table": 4})
+    before = dict(state)
+
+    client.get("/problem/stream", params={"table": 9})
+
+    assert state == before
+    assert client.get("/problem/stream", params={"table": 2, "first": 5, "last": 3}).status_code == 400
@@ -14,7 +14,9 @@ import unittest.mock as mock
 # 상위 디렉터리 경로를 모듈 검색 경로에 추가
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+from shared import __version__
 from agent2.app.api import app, get_explanation
+from agent2.app.batching import ExplanationError
 
 
 @pytest.fixture
@@ -37,7 +39,7 @@ def test_health_check(client):
     """
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "ok", "agent": "answer_provider"}
+    assert response.json() == {"status": "ok", "agent": "answer_provider", "version": __version__}
 
 
 def test_calculate_answer_success(client):
@@ -108,6 +110,75 @@ def test_calculate_answer_invalid_format(client):
         assert response.status_code == 400  # Bad Request 응답 코드 확인
 
 
+def test_calculate_answer_structured_skips_parsing(client):
+    """
+    숫자가 함께 오면 문제 문자열 대신 숫자로 계산하고 문제 ID를 돌려주는지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+    """
+    with mock.patch("agent2.app.api.get_explanation", mock.AsyncMock(return_value="설명")):
+        response = client.post("/answer", json={"multiplier": 6, "multiplicand": 7, "id": "run:7"})
+        # 숫자가 있으면 형식이 맞지 않는 문제 문자열도 파싱하지 않음
+        legacy = client.post("/answer", json={"problem": "hello", "multiplier": 2, "multiplicand": 3})
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["answer"] == 42
+    assert result["calculation"] == "6×7=42"
+    assert result["id"] == "run:7"
+    assert legacy.json()["answer"] == 6
+
+
+def test_calculate_answer_flags_explanation_error(client):
+    """
+    설명 생성에 실패하면 오류 안내 문구와 함께 explanation_error를 표시하는지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+    """
+    with mock.patch("agent2.app.api.get_explanation", mock.AsyncMock(return_value="설명")):
+        assert client.post("/answer", json={"problem": "3×4="}).json()["explanation_error"] is False
+
+    failure = ExplanationError("설명 생성 중 오류 발생: 500")
+    with mock.patch("agent2.app.api.get_explanation", mock.AsyncMock(side_effect=failure)):
+        response = client.post("/answer", json={"problem": "3×4="})
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["answer"] == 12
+    assert result["explanation_error"] is True
+    assert result["explanation"].startswith("설명 생성 중 오류 발생: 500")
+
+
+def test_calculate_answer_requires_problem_or_numbers(client):
+    """
+    문제 문자열도 숫자도 없으면 검증 오류(422)를 반환하는지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+    """
+    assert client.post("/answer", json={"multiplier": 3}).status_code == 422
+
+
+def test_calculate_answer_rejects_inconsistent_or_out_of_range_numbers(client):
+    """
+    문제 문자열과 숫자가 다르거나 숫자가 허용 범위를 벗어나면 검증 오류(422)를 반환하는지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+    """
+    mismatch = {"problem": "3×4=", "multiplier": 3, "multiplicand": 5}
+    assert client.post("/answer", json=mismatch).status_code == 422
+    assert client.post("/answer", json={"multiplier": -1, "multiplicand": 2}).status_code == 422
+    assert client.post("/answer", json={"multiplier": 101, "multiplicand": 2}).status_code == 422
+    assert client.post("/answer", json={"multiplier": 2, "multiplicand": 10_001}).status_code == 422
+
+    with mock.patch("agent2.app.api.get_explanation", mock.AsyncMock(return_value="설명")):
+        matching = client.post("/answer", json={"problem": "3×4=", "multiplier": 3, "multiplicand": 4})
+    assert matching.json()["answer"] == 12
+
+
 @pytest.mark.asyncio
 async def test_get_explanation():
     """
@@ -124,8 +195,11 @@ async def test_get_explanation():
     calculation = "5×6=30"
     answer = 30
     
-    # API 호출
-    explanation = await get_explanation(calculation, answer)
+    # API 호출 (네트워크 등으로 API를 호출할 수 없으면 스킵)
+    try:
+        explanation = await get_explanation(calculation, answer)
+    except ExplanationError as e:
+        pytest.skip(f"Claude API를 호출할 수 없습니다: {e}")
     
     # 응답 검증
     assert explanation is not None
@@ -159,4 +233,21 @@ async def test_get_explanation_with_mock():
         # 응답 검증
         assert explanation == mock_explanation
         # post 메서드가 호출되었는지 확인
-        mock_post.assert_called_once() 
\ No newline at end of file
+        mock_post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_explanation_raises_on_api_error():
+    """
+    API 키가 없거나 Claude API가 오류를 응답하면 ExplanationError를 발생시키는지 테스트
+    """
+    no_key = mock.MagicMock(anthropic_api_key="")
+    with mock.patch("agent2.app.api.get_settings", return_value=no_key):
+        with pytest.raises(ExplanationError, match="API 키"):
+            await get_explanation("2×3=6", 6)
+
+    with_key = mock.MagicMock(anthropic_api_key="test-key")
+    with mock.patch("agent2.app.api.get_settings", return_value=with_key), \
+            mock.patch("httpx.AsyncClient.post", return_value=mock.MagicMock(status_code=529)):
+        with pytest.raises(ExplanationError, match="529"):
+            await get_explanation("2×3=6", 6)
@@ -0,0 +1,194 @@
+"""
+에이전트2(답변기) 설명 묶음 생성 테스트 모듈
+
+묶음 프롬프트 해석, 요청 모으기, 해석 실패 시 한 건씩 다시 요청하는 동작과 호출 실패 처리를 검증합니다.
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from agent2.app import api
+from agent2.app.batching import MAX_BATCH_TOKENS, ExplanationBatcher, ExplanationError, build_batch_prompt, parse_batch_response
+from shared.priority import priority_context
+
+
+class FakeLLM:
+    """
+    묶음 요청과 한 건 요청을 기록하는 가짜 LLM
+
+    묶음 요청에는 프롬프트에 있는 계산식 중 skip에 없는 것의 설명을 JSON으로 응답합니다.
+    """
+
+    def __init__(self, skip=(), text=None, error=None, single_errors=()):
+        self.skip = set(skip)
+        self.text = text
+        self.error = error
+        self.single_errors = set(single_errors)
+        self.batches = []
+        self.max_tokens = []
+        self.singles = []
+
+    async def request(self, prompt: str, max_tokens: int) -> str:
+        calculations = [line.split("계산: ")[1].split(" ")[0] for line in prompt.splitlines() if "계산: " in line]
+        self.batches.append(calculations)
+        self.max_tokens.append(max_tokens)
+        if self.error is not None:
+            raise ExplanationError(self.error)
+        if self.text is not None:
+            return self.text
+        entries = [{"calculation": c, "explanation": f"{c} 설명"} for c in calculations if c not in self.skip]
+        return "```json\n" + json.dumps({"explanations": entries}, ensure_ascii=False) + "\n```"
+
+    async def single(self, calculation: str, answer: int) -> str:
+        self.singles.append(calculation)
+        if calculation in self.single_errors:
+            raise ExplanationError(f"{calculation} 설명 생성 중 오류 발생: 500")
+        return f"{calculation} 한 건 설명"
+
+
+def test_build_and_parse_batch_prompt():
+    """
+    묶음 프롬프트에 모든 계산이 들어가고, 응답의 JSON에서 요청한 계산의 설명만 꺼내는지 테스트
+    """
+    prompt = build_batch_prompt([("3×1=3", 3), ("3×2=6", 6)])
+    assert "1. 계산: 3×1=3" in prompt and "2. 계산: 3×2=6" in prompt
+
+    text = '설명입니다.\n{"explanations": [{"calculation": "3×1=3", "explanation": "세 개"}, ' \
+           '{"calculation": "9×9=81", "explanation": "요청 안 함"}, {"calculation": "3×2=6", "explanation": ""}]}'
+    assert parse_batch_response(text, ["3×1=3", "3×2=6"]) == {"3×1=3": "세 개"}
+    assert parse_batch_response("설명 생성 중 오류 발생: 529", ["3×1=3"]) == {}
+    assert parse_batch_response('{"explanations": "없음"}', ["3×1=3"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_batcher_combines_requests_within_window():
+    """
+    짧은 시간 안에 들어온 요청을 한 번의 LLM 호출로 처리하는지 테스트
+    """
+    llm = FakeLLM()
+    batcher = ExplanationBatcher(llm.request, llm.single, window=0.01)
+
+    results = await asyncio.gather(*(batcher.explain(f"7×{x}={7 * x}", 7 * x) for x in range(1, 10)))
+
+    assert llm.batches == [[f"7×{x}={7 * x}" for x in range(1, 10)]]
+    assert llm.singles == []
+    assert results[3] == "7×4=28 설명"
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_when_full():
+    """
+    최대 묶음 크기에 도달하면 대기 시간을 기다리지 않고 바로 요청하는지 테스트
+    """
+    llm = FakeLLM()
+    batcher = ExplanationBatcher(llm.request, llm.single, window=10.0, max_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.explain("2×1=2", 2), batcher.explain("2×2=4", 4)), timeout=1
+    )
+
+    assert results == ["2×1=2 설명", "2×2=4 설명"]
+
+
+@pytest.mark.asyncio
+async def test_batcher_caps_max_tokens():
+    """
+    묶음 요청의 max_tokens가 계산 수에 비례하되 모델의 최대 출력 토큰 수를 넘지 않는지 테스트
+    """
+    llm = FakeLLM()
+    batcher = ExplanationBatcher(llm.request, llm.single, window=0.01, max_size=20)
+
+    await asyncio.gather(*(batcher.explain(f"{x}×1={x}", x) for x in range(1, 21)))
+    await asyncio.gather(batcher.explain("2×1=2", 2), batcher.explain("2×2=4", 4))
+
+    assert llm.max_tokens == [MAX_BATCH_TOKENS, 600]
+
+
+@pytest.mark.asyncio
+async def test_batcher_falls_back_to_single_calls():
+    """
+    응답에서 빠진 계산만, 또는 해석할 수 없는 응답이면 모든 계산을 한 건씩 다시 요청하는지 테스트
+    """
+    llm = FakeLLM(skip={"4×2=8"})
+    batcher = ExplanationBatcher(llm.request, llm.single, window=0.01)
+    results = await asyncio.gather(batcher.explain("4×1=4", 4), batcher.explain("4×2=8", 8))
+    assert results == ["4×1=4 설명", "4×2=8 한 건 설명"]
+    assert llm.singles == ["4×2=8"]
+
+    broken = FakeLLM(text="JSON이 아닌 응답")
+    batcher = ExplanationBatcher(broken.request, broken.single, window=0.01)
+    results = await asyncio.gather(batcher.explain("5×1=5", 5), batcher.explain("5×2=10", 10))
+    assert results == ["5×1=5 한 건 설명", "5×2=10 한 건 설명"]
+
+
+@pytest.mark.asyncio
+async def test_batcher_call_failure_reaches_every_waiter():
+    """
+    묶음 호출이 실패하면 한 건씩 다시 요청하지 않고 모든 요청에 같은 오류를 돌려주는지 테스트
+    """
+    llm = FakeLLM(error="설명 생성 중 오류 발생: 529")
+    batcher = ExplanationBatcher(llm.request, llm.single, window=0.01)
+
+    results = await asyncio.gather(
+        batcher.explain("3×1=3", 3), batcher.explain("3×2=6", 6), return_exceptions=True
+    )
+
+    assert llm.singles == []
+    assert all(isinstance(result, ExplanationError) and "529" in str(result) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_batcher_fallback_failure_only_affects_its_item():
+    """
+    빠진 계산을 한 건씩 다시 요청하다 실패하면 그 계산의 요청만 오류를 받는지 테스트
+    """
+    llm = FakeLLM(skip={"9×2=18"}, single_errors={"9×2=18"})
+    batcher = ExplanationBatcher(llm.request, llm.single, window=0.01)
+
+    results = await asyncio.gather(
+        batcher.explain("9×1=9", 9), batcher.explain("9×2=18", 18), return_exceptions=True
+    )
+
+    assert results[0] == "9×1=9 설명"
+    assert isinstance(results[1], ExplanationError)
+
+
+@pytest.mark.asyncio
+async def test_batcher_single_item_and_priority_classes():
+    """
+    한 건만 모이면 한 건 요청을 쓰고, 우선순위 클래스가 다른 요청은 섞지 않는지 테스트
+    """
+    llm = FakeLLM()
+    batcher = ExplanationBatcher(llm.request, llm.single, window=0.01)
+
+    async def explain(cls, calculation):
+        with priority_context(cls):
+            return await batcher.explain(calculation, 0)
+
+    await asyncio.gather(explain("interactive", "6×1=6"), explain("batch", "6×2=12"), explain("batch", "6×3=18"))
+
+    assert llm.singles == ["6×1=6"]
+    assert llm.batches == [["6×2=12", "6×3=18"]]
+
+
+@pytest.mark.asyncio
+async def test_get_explanation_uses_batcher_in_batch_mode(monkeypatch):
+    """
+    EXPLANATION_MODE가 batch이면 get_explanation이 묶음 요청기를 거치는지 테스트
+    """
+    llm = FakeLLM()
+    monkeypatch.setattr(api, "EXPLANATION_MODE", "batch")
+    monkeypatch.setattr(api, "get_settings", lambda: SimpleNamespace(anthropic_api_key="test-key"))
+    monkeypatch.setattr(api, "explanation_batcher", ExplanationBatcher(llm.request, llm.single, window=0.01))
+
+    results = await asyncio.gather(api.get_explanation("8×1=8", 8), api.get_explanation("8×2=16", 16))
+
+    assert results == ["8×1=8 설명", "8×2=16 설명"]
+    assert len(llm.batches) == 1
@@ -0,0 +1,168 @@
+"""
+에이전트2(답변기) 구구단 행렬 테스트 모듈
+
+/matrix 엔드포인트의 형식별 출력과 범위 검증을 확인합니다.
+"""
+import json
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from agent2.app import matrix
+from agent2.app.api import app
+
+
+@pytest.fixture
+def client():
+    """
+    FastAPI 테스트 클라이언트 픽스처
+
+    Returns:
+        TestClient: FastAPI 테스트 클라이언트
+    """
+    return TestClient(app)
+
+
+def test_matrix_ndjson(client):
+    """
+    기본 NDJSON 형식이 단수마다 곱 목록 한 줄을 돌려주는지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+    """
+    response = client.get("/matrix", params={"table_start": 2, "table_end": 3, "backend": "python"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["x-matrix-shape"] == "2,9"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [
+        {"table": 2, "products": [2 * x for x in range(1, 10)]},
+        {"table": 3, "products": [3 * x for x in range(1, 10)]},
+    ]
+
+
+def test_matrix_csv_includes_zero_table(client):
+    """
+    CSV 형식이 머리글과 0단(모두 0)을 올바르게 출력하는지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+    """
+    params = {
+        "table_start": 0, "table_end": 1,
+        "multiplicand_start": 5, "multiplicand_end": 7,
+        "format": "csv", "backend": "python",
+    }
+    response = client.get("/matrix", params=params)
+
+    assert response.status_code == 200
+    assert response.text == "table,5,6,7\n0,0,0,0\n1,5,6,7\n"
+
+
+def test_matrix_binary_is_row_major_int64(client, monkeypatch):
+    """
+    binary 형식이 여러 묶음에 걸쳐서도 행 우선 little-endian int64로 이어지는지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+        monkeypatch: pytest monkeypatch 픽스처
+    """
+    # 묶음 하나에 2행만 들어가도록 줄여 여러 묶음을 만듦
+    monkeypatch.setattr(matrix, "MATRIX_CHUNK_CELLS", 8)
+    params = {"table_start": 1, "table_end": 5, "multiplicand_end": 4, "format": "binary", "backend": "python"}
+    response = client.get("/matrix", params=params)
+
+    assert response.status_code == 200
+    assert response.headers["x-matrix-shape"] == "5,4"
+    values = struct.unpack("<20q", response.content)
+    assert list(values) == [t * x for t in range(1, 6) for x in range(1, 5)]
+
+
+@pytest.mark.skipif(matrix.np is None, reason="NumPy가 설치되어 있지 않습니다.")
+def test_matrix_numpy_matches_python(client):
+    """
+    NumPy 계산 결과가 array 기반 계산과 같은지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+    """
+    for fmt in ("ndjson", "csv", "binary"):
+        params = {"table_start": 3, "table_end": 40, "multiplicand_end": 30, "format": fmt}
+        with_numpy = client.get("/matrix", params={**params, "backend": "numpy"})
+        with_python = client.get("/matrix", params={**params, "backend": "python"})
+        assert with_numpy.content == with_python.content
+
+
+@pytest.mark.skipif(matrix.np is not None, reason="NumPy가 설치되어 있습니다.")
+def test_matrix_numpy_backend_unavailable(client):
+    """
+    NumPy가 없을 때 numpy 계산을 요청하면 400, 기본값은 python 계산인지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+    """
+    assert client.get("/matrix", params={"backend": "numpy"}).status_code == 400
+    assert client.get("/matrix").headers["x-matrix-backend"] == "python"
+
+
+def test_matrix_rejects_invalid_ranges(client, monkeypatch):
+    """
+    뒤집힌 범위는 400, 최대 셀 수를 넘는 범위는 413을 반환하는지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+        monkeypatch: pytest monkeypatch 픽스처
+    """
+    assert client.get("/matrix", params={"table_start": 5, "table_end": 2}).status_code == 400
+
+    monkeypatch.setattr(matrix, "MAX_MATRIX_CELLS", 100)
+    assert client.get("/matrix", params={"table_end": 20, "multiplicand_end": 20}).status_code == 413
+
+
+def test_matrix_python_text_formats_have_lower_cap(client, monkeypatch):
+    """
+    python 계산의 텍스트 형식은 더 작은 셀 수 제한을 받고 binary 형식은 받지 않는지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+        monkeypatch: pytest monkeypatch 픽스처
+    """
+    monkeypatch.setattr(matrix, "MAX_PYTHON_TEXT_CELLS", 100)
+    params = {"table_end": 20, "multiplicand_end": 20, "backend": "python"}
+
+    assert client.get("/matrix", params={**params, "format": "csv"}).status_code == 413
+    assert client.get("/matrix", params={**params, "format": "ndjson"}).status_code == 413
+    assert client.get("/matrix", params={**params, "format": "binary"}).status_code == 200
+
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_matrix_wide_rows_are_split_into_column_chunks(client, monkeypatch, backend):
+    """
+    한 행의 열 수가 묶음 크기를 넘으면 열 단위로 나눠도 출력이 같고 조각마다 셀 수가 제한되는지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+        monkeypatch: pytest monkeypatch 픽스처
+        backend (str): 계산 방식
+    """
+    if backend == "numpy" and matrix.np is None:
+        pytest.skip("NumPy가 설치되어 있지 않습니다.")
+    params = {"table_start": 0, "table_end": 2, "multiplicand_start": 3, "multiplicand_end": 12, "backend": backend}
+    expected = {fmt: client.get("/matrix", params={**params, "format": fmt}).content for fmt in ("ndjson", "csv", "binary")}
+
+    # 한 행(10열)이 묶음 하나(4셀)보다 넓도록 줄임
+    monkeypatch.setattr(matrix, "MATRIX_CHUNK_CELLS", 4)
+    for fmt, body in expected.items():
+        assert client.get("/matrix", params={**params, "format": fmt}).content == body
+
+    chunks = list(matrix.iter_matrix(range(1, 3), range(1, 11), "binary", backend))
+    assert all(len(chunk) <= 4 * 8 for chunk in chunks)
+    assert b"".join(chunks) == struct.pack("<20q", *[t * x for t in range(1, 3) for x in range(1, 11)])
@@ -5,8 +5,12 @@
 """
 import sys
 import os
+import shutil
+import tempfile
 import pytest
+from contextlib import ExitStack
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # 프로젝트 루트 디렉터리 경로를 모듈 검색 경로에 추가
 root_dir = Path(__file__).parent.parent
@@ -15,6 +19,11 @@ sys.path.append(str(root_dir))
 
 # 환경 변수 설정
 os.environ["TESTING"] = "1"
+# Reason: 모듈을 가져올 때 만들어지는 에이전트 로거가 저장소의 logs/에 쓰지 않도록 임시 디렉토리를 씁니다.
+test_log_dir = tempfile.mkdtemp(prefix="gugudan-test-logs-")
+os.environ["LOG_DIR"] = test_log_dir
+# 로그 인덱스가 필요한 테스트는 setup_logger(index=True)로 직접 켭니다.
+os.environ["LOG_INDEX"] = "0"
 
 
 # asyncio 마커 등록
@@ -30,4 +39,102 @@ def pytest_configure(config):
     )
 
     # pytest 설정 작업 수행
-    pass 
\ No newline at end of file
+    pass
+
+
+def pytest_unconfigure(config):
+    """
+    테스트가 끝나면 로거를 멈추고 임시 로그 디렉토리를 지웁니다.
+
+    Args:
+        config: pytest 구성 객체
+    """
+    from shared.logger import shutdown_logging
+
+    shutdown_logging()
+    shutil.rmtree(test_log_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def agent_log_dir(tmp_path, monkeypatch):
+    """
+    테스트 안에서 새로 만드는 에이전트 로거를 tmp_path에 기록하도록 하는 픽스처
+
+    Args:
+        tmp_path (Path): 테스트별 임시 디렉토리
+        monkeypatch: pytest monkeypatch 픽스처
+
+    Returns:
+        Path: 로그 디렉토리
+    """
+    import shared.logger
+
+    monkeypatch.setattr(shared.logger, "LOG_DIR", str(tmp_path))
+    return tmp_path
+
+
+def fake_agent_post(table, explanation=None, explanation_errors=()):
+    """
+    슈퍼바이저가 보내는 에이전트 호출을 URL 경로별로 흉내 내는 가짜 post 함수를 만듭니다.
+
+    초기화는 `table×1=`, 다음 문제는 곱하는 수를 하나씩 늘린 문제(×9 다음은 completed)를 돌려주고,
+    답변 요청(`/problem/solve`, `/answer`)에는 요청한 곱하는 수로 계산한 답을 돌려줍니다.
+
+    Args:
+        table (int): 구구단 단수
+        explanation (Optional[str]): 답변에 넣을 설명 (None이면 설명 없음)
+        explanation_errors (Iterable[str]): 설명 생성 실패로 표시할 문제 목록
+
+    Returns:
+        Callable: httpx.AsyncClient.post 대신 쓸 코루틴 함수
+    """
+    failing = set(explanation_errors)
+    state = {"multiplicand": 1}
+
+    async def post(url, json=None, headers=None):
+        response = MagicMock()
+        response.status_code = 200
+        if url.endswith("/problem/initialize"):
+            state["multiplicand"] = 1
+            response.json.return_value = {
+                "problem": f"{table}×1=", "multiplier": table, "multiplicand": 1, "status": "continue"
+            }
+        elif url.endswith("/problem/next"):
+            state["multiplicand"] += 1
+            x = state["multiplicand"]
+            response.json.return_value = {"status": "completed"} if x > 9 else {
+                "problem": f"{table}×{x}=", "multiplier": table, "multiplicand": x, "status": "continue"
+            }
+        elif url.endswith("/problem/solve") or url.endswith("/answer"):
+            answer = table * int(json["problem"].rstrip("=").split("×")[1])
+            data = {"answer": answer, "calculation": f"{json['problem']}{answer}"}
+            if explanation is not None:
+                data["explanation"] = explanation
+            data["explanation_error"] = json["problem"] in failing
+            response.json.return_value = data
+        else:
+            response.json.return_value = {"status": "ok"}
+        return response
+
+    return post
+
+
+@pytest.fixture
+def fake_agents():
+    """
+    슈퍼바이저 파이프라인의 httpx.AsyncClient를 fake_agent_post 응답으로 바꾸는 픽스처
+
+    여러 번 설치할 수 있으며 나중에 설치한 응답이 이후 실행에 쓰입니다.
+
+    Yields:
+        Callable[..., AsyncMock]: fake_agent_post와 같은 인자로 응답을 설치하고 post 모의 객체를 반환하는 함수
+    """
+    with ExitStack() as stack:
+        def install(table, explanation=None, explanation_errors=()):
+            post = AsyncMock(side_effect=fake_agent_post(table, explanation, explanation_errors))
+            client = AsyncMock()
+            client.__aenter__.return_value.post = post
+            stack.enter_context(patch("supervisor.app.pipeline.httpx.AsyncClient", return_value=client))
+            return post
+
+        yield install
@@ -7,12 +7,15 @@ import pytest
 import asyncio
 import sys
 from pathlib import Path
-from unittest.mock import patch, AsyncMock
+from unittest.mock import AsyncMock, ANY
 
 # 상위 디렉터리 경로를 모듈 검색 경로에 추가
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from supervisor.app.api import process_gugudan, parse_request
+from supervisor.app.api import parse_request
+from supervisor.app.pipeline import process_gugudan
+from shared import tracing
+from shared.schemas import RunOptions
 from fastapi.testclient import TestClient
 from agent1.app.api import app as agent1_app
 from agent2.app.api import app as agent2_app
@@ -104,62 +107,26 @@ def test_agent1_to_agent2_communication(agent1_client, agent2_client):
 
 
 @pytest.mark.asyncio
-@patch("supervisor.app.api.broadcast_message", new_callable=AsyncMock)
-@patch("supervisor.app.api.httpx.AsyncClient")
-async def test_process_gugudan_flow(mock_async_client, mock_broadcast, agent1_client, agent2_client):
+async def test_process_gugudan_flow(fake_agents):
     """
     구구단 처리 흐름 통합 테스트
 
-    모의 객체를 사용하여 에이전트 간 통신 및 메시지 브로드캐스트를 검증합니다.
+    가짜 에이전트 응답으로 에이전트 간 통신 및 메시지 브로드캐스트를 검증합니다.
 
     Args:
-        mock_async_client (Mock): httpx.AsyncClient 모의 객체
-        mock_broadcast (AsyncMock): broadcast_message 함수 모의 객체
-        agent1_client (TestClient): 에이전트1 테스트 클라이언트
-        agent2_client (TestClient): 에이전트2 테스트 클라이언트
+        fake_agents (Callable): 가짜 에이전트 응답 설치 함수
     """
-    # 모의 응답 데이터 설정
-    initialize_response_mock = AsyncMock()
-    initialize_response_mock.status_code = 200
-    initialize_response_mock.json.return_value = {
-        "problem": "2×1=",
-        "multiplier": 2,
-        "multiplicand": 1,
-        "status": "continue"
-    }
+    mock_broadcast = AsyncMock()
+    post = fake_agents(2)
     
-    solve_response_mock = AsyncMock()
-    solve_response_mock.status_code = 200
-    solve_response_mock.json.return_value = {
-        "answer": 2,
-        "calculation": "2×1=2"
-    }
-    
-    next_response_mock = AsyncMock()
-    next_response_mock.status_code = 200
-    next_response_mock.json.return_value = {
-        "problem": "2×2=",
-        "multiplier": 2,
-        "multiplicand": 2,
-        "status": "continue"
-    }
-    
-    # AsyncClient의 post 메서드 모의 구현
-    mock_client_instance = AsyncMock()
-    mock_client_instance.__aenter__.return_value.post.side_effect = [
-        initialize_response_mock,  # 초기화 응답
-        solve_response_mock,       # 답변 응답
-        next_response_mock,        # 다음 문제 응답
-    ]
-    mock_async_client.return_value = mock_client_instance
-    
-    # process_gugudan 함수 호출
-    await process_gugudan(2, 10)
+    # process_gugudan 함수 호출 (단계 사이 대기 없이)
+    await process_gugudan(2, 10, RunOptions(pacing={"mode": "none"}), emit=mock_broadcast)
     
     # 에이전트1 초기화 호출 검증
-    mock_client_instance.__aenter__.return_value.post.assert_any_call(
+    post.assert_any_call(
         "http://localhost:5000/problem/initialize",
-        json={"table": 2, "stop_value": 10}
+        json={"table": 2, "stop_value": 10},
+        headers=ANY,
     )
     
     # 브로드캐스트 메시지 검증
@@ -179,4 +146,126 @@ async def test_process_gugudan_flow(mock_async_client, mock_broadcast, agent1_cl
         "content": "2×1=2",
         "sender": "agent2",
         "timestamp": mock_broadcast.call_args_list[1][0][0]["timestamp"]
-    }) 
\ No newline at end of file
+    }) 
+
+@pytest.mark.asyncio
+async def test_process_gugudan_planned_flow(fake_agents):
+    """
+    계획 실행 모드의 구구단 처리 흐름 통합 테스트
+
+    Args:
+        fake_agents (Callable): 가짜 에이전트 응답 설치 함수
+    """
+    mock_broadcast = AsyncMock()
+    post = fake_agents(3)
+
+    options = RunOptions(execution="planned", pacing={"mode": "none"})
+    await process_gugudan(3, 12, options, emit=mock_broadcast)
+
+    solved = [call.kwargs["json"]["problem"] for call in post.call_args_list
+              if call.args[0].endswith("/problem/solve")]
+    assert solved == ["3×1=", "3×2=", "3×3=", "3×4="]
+    # 답변기가 문자열을 파싱하지 않도록 숫자와 문제 ID를 함께 전달
+    first = next(call.kwargs["json"] for call in post.call_args_list if call.args[0].endswith("/problem/solve"))
+    assert first["multiplier"] == 3 and first["multiplicand"] == 1 and first["id"]
+    post.assert_any_call("http://localhost:5000/problem/end", headers=ANY)
+    # 모든 에이전트 호출에 같은 추적 ID의 traceparent 헤더 전달
+    trace_ids = {call.kwargs["headers"]["traceparent"].split("-")[1] for call in post.call_args_list}
+    assert len(trace_ids) == 1
+
+    contents = [call.args[0]["content"] for call in mock_broadcast.call_args_list]
+    assert contents == [
+        "3×1=", "3×1=3", "3×2=", "3×2=6", "3×3=", "3×3=9", "3×4=", "3×4=12",
+        "정답이 12에 도달했습니다. 구구단이 끝났습니다.",
+    ]
+
+
+async def run_with_topology(fake_agents, topology):
+    """
+    주어진 답변 요청 경로로 구구단을 실행하고 이벤트와 호출 URL을 반환합니다.
+
+    Args:
+        fake_agents (Callable): 가짜 에이전트 응답 설치 함수
+        topology (str): 'relay' 또는 'direct'
+
+    Returns:
+        tuple: (브로드캐스트 내용 목록, 호출한 URL 목록)
+    """
+    mock_broadcast = AsyncMock()
+    post = fake_agents(2)
+
+    options = RunOptions(pacing={"mode": "none"}, topology=topology)
+    await process_gugudan(2, 6, options, emit=mock_broadcast)
+
+    contents = [call.args[0]["content"] for call in mock_broadcast.call_args_list]
+    return contents, [call.args[0] for call in post.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_direct_topology_skips_agent1_relay(fake_agents):
+    """
+    direct 경로가 답변기를 직접 호출하면서 relay 경로와 같은 이벤트를 같은 순서로 보내는지 테스트
+
+    Args:
+        fake_agents (Callable): 가짜 에이전트 응답 설치 함수
+    """
+    relay_contents, relay_urls = await run_with_topology(fake_agents, "relay")
+    direct_contents, direct_urls = await run_with_topology(fake_agents, "direct")
+
+    assert direct_contents == relay_contents
+    assert "http://localhost:6001/answer" in direct_urls
+    assert not any(url.endswith("/problem/solve") for url in direct_urls)
+    assert any(url.endswith("/problem/solve") for url in relay_urls)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("execution", ["sequential", "planned"])
+async def test_explanation_failure_marks_run_incomplete(execution, fake_agents):
+    """
+    답변기가 설명 생성 실패를 표시하면 실행을 완료로 보고하지 않는지 테스트 (결과 캐시에 남지 않음)
+
+    Args:
+        execution (str): 실행 방식
+        fake_agents (Callable): 가짜 에이전트 응답 설치 함수
+    """
+    async def run(failing_problems):
+        fake_agents(4, explanation="설명 생성 중 오류 발생: 500", explanation_errors=failing_problems)
+        options = RunOptions(execution=execution, pacing={"mode": "none"})
+        return await process_gugudan(4, 8, options, emit=AsyncMock())
+
+    assert await run(failing_problems=()) is True
+    assert await run(failing_problems=("4×1=",)) is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("execution", ["sequential", "planned"])
+async def test_step_spans_group_hop_spans(execution, fake_agents, monkeypatch):
+    """
+    단계마다 gugudan.step 구간이 실행 구간 아래에 생기고 답변/다음 문제 호출 구간이 그 아래에 기록되는지 테스트
+
+    Args:
+        execution (str): 실행 방식
+        fake_agents (Callable): 가짜 에이전트 응답 설치 함수
+        monkeypatch: pytest monkeypatch 픽스처
+    """
+    exporter = tracing.SpanExporter(capacity=100)
+    monkeypatch.setattr(tracing, "exporter", exporter)
+    monkeypatch.setattr(tracing, "TRACE_SAMPLE_RATE", 1.0)
+    fake_agents(5)
+
+    options = RunOptions(execution=execution, pacing={"mode": "none"})
+    await process_gugudan(5, 10, options, emit=AsyncMock())
+
+    spans = exporter.recent()
+    by_id = {span["span_id"]: span for span in spans}
+    run_span = next(span for span in spans if span["name"] == "gugudan.run")
+    steps = [span for span in spans if span["name"] == "gugudan.step"]
+    assert sorted(span["attributes"]["step"] for span in steps) == ["5×1=", "5×2="]
+    assert all(span["parent_id"] == run_span["span_id"] for span in steps)
+
+    solve_hops = [span for span in spans if span["name"] == "hop.solve"]
+    assert len(solve_hops) == 2
+    assert all(by_id[span["parent_id"]]["name"] == "gugudan.step" for span in solve_hops)
+    if execution == "sequential":
+        next_hop = next(span for span in spans if span["name"] == "hop.next")
+        assert by_id[next_hop["parent_id"]]["attributes"]["step"] == "5×1="
@@ -0,0 +1,64 @@
+"""
+공통 설정 모듈 단위 테스트 모듈
+
+환경 변수에서 설정 객체를 만들고 .env를 한 번만 읽는지 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import shared.config as config
+from shared.config import Settings, format_settings, get_settings
+
+
+def test_settings_read_ports_and_derive_urls(monkeypatch):
+    """
+    포트 환경 변수로 에이전트 URL이 정해지고, URL 환경 변수가 있으면 그 값을 쓰는지 테스트
+    """
+    monkeypatch.setenv("AGENT1_PORT", "5100")
+    monkeypatch.setenv("AGENT2_PORT", "6100")
+    monkeypatch.setenv("AGENT2_URL", "http://answerer:9000")
+    get_settings.cache_clear()
+    try:
+        settings = get_settings()
+
+        assert settings.agent1_port == 5100
+        assert settings.agent1_url == "http://localhost:5100"
+        assert settings.agent2_url == "http://answerer:9000"
+        # 같은 프로세스에서는 같은 객체를 재사용
+        assert get_settings() is settings
+    finally:
+        get_settings.cache_clear()
+
+
+def test_load_env_reads_dotenv_once(monkeypatch, tmp_path):
+    """
+    .env 파일의 값이 적용되고, 두 번째 호출에서는 파일을 다시 읽지 않는지 테스트
+    """
+    (tmp_path / ".env").write_text("CONFIG_TEST_VALUE=from-dotenv\n", encoding="utf-8")
+    monkeypatch.setattr(config, "ROOT_DIR", tmp_path)
+    monkeypatch.setattr(config, "_env_loaded", False)
+    monkeypatch.delenv("CONFIG_TEST_VALUE", raising=False)
+
+    config.load_env()
+    assert config.os.environ["CONFIG_TEST_VALUE"] == "from-dotenv"
+
+    (tmp_path / ".env").write_text("CONFIG_TEST_VALUE=changed\n", encoding="utf-8")
+    monkeypatch.delenv("CONFIG_TEST_VALUE")
+    config.load_env()
+    assert "CONFIG_TEST_VALUE" not in config.os.environ
+
+
+def test_format_settings_lists_every_field_and_hides_secrets():
+    """
+    설정 보고서가 모든 설정 항목을 보여주되 API 키 값은 가리는지 테스트
+    """
+    lines = format_settings(Settings(anthropic_api_key="sk-secret", job_max_active=3))
+    text = "\n".join(lines)
+
+    assert len(lines) == len(config.fields(Settings))
+    assert "sk-secret" not in text
+    assert any(line.split()[0] == "anthropic_api_key" and line.endswith("***") for line in lines)
+    assert any(line.split()[0] == "job_max_active" and line.endswith("= 3") for line in lines)
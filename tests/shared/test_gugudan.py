@@ -0,0 +1,60 @@
+"""
+구구단 진행 규칙 단위 테스트 모듈
+
+실행 계획 생성 규칙(종료 조건, ×9 제한)을 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.gugudan import iter_steps, format_problem, parse_problem, reaches_stop_value
+
+
+def test_iter_steps_full_table():
+    """
+    종료 조건이 없으면 ×9까지 계획하는지 테스트
+    """
+    steps = list(iter_steps(3))
+
+    assert [step.multiplicand for step in steps] == list(range(1, 10))
+    assert steps[-1].final is True
+    assert not any(step.final for step in steps[:-1])
+    assert steps[3].problem == "3×4="
+
+
+def test_iter_steps_stops_at_stop_value():
+    """
+    정답이 종료 조건에 도달하는 단계에서 계획이 끝나는지 테스트
+    """
+    steps = list(iter_steps(5, 30))
+
+    assert [step.answer for step in steps] == [5, 10, 15, 20, 25, 30]
+    assert steps[-1].final is True
+
+
+def test_iter_steps_unreachable_stop_value():
+    """
+    도달할 수 없는 종료 조건은 ×9 제한으로 끝나는지 테스트
+    """
+    steps = list(iter_steps(2, 1000))
+
+    assert len(steps) == 9
+    assert not reaches_stop_value(steps[-1].answer, 1000)
+
+
+def test_format_problem():
+    """
+    문제 문자열 형식 테스트
+    """
+    assert format_problem(12, 5) == "12×5="
+
+
+def test_parse_problem():
+    """
+    문제 문자열에서 두 숫자를 꺼내고, 형식이 맞지 않으면 None을 반환하는지 테스트
+    """
+    assert parse_problem("12×5=") == (12, 5)
+    assert parse_problem(format_problem(3, 40)) == (3, 40)
+    assert parse_problem("hello") is None
@@ -0,0 +1,88 @@
+"""
+로그 인덱스 모듈 단위 테스트 모듈
+
+JSON 포매터, SQLite 인덱스 핸들러 및 조건별 조회를 검증합니다.
+"""
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.log_index import JsonFormatter, LogIndexHandler, query_logs
+from shared.logger import setup_logger, shutdown_logger
+
+
+def make_record(name="supervisor", level=logging.INFO, message="메시지", **extra):
+    """
+    테스트용 로그 레코드 생성
+
+    Args:
+        name (str): 로거 이름
+        level (int): 로그 레벨
+        message (str): 로그 메시지
+        **extra: 구조화 필드
+
+    Returns:
+        logging.LogRecord: 로그 레코드
+    """
+    record = logging.LogRecord(name, level, __file__, 1, message, None, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_json_formatter_includes_structured_fields():
+    """
+    JSON 포매터가 구조화 필드를 포함한 한 줄 JSON을 만드는지 테스트
+    """
+    line = JsonFormatter().format(make_record(run_id="abc", hop="solve", latency_ms=12.5))
+    entry = json.loads(line)
+
+    assert "\n" not in line
+    assert entry["agent"] == "supervisor"
+    assert entry["level"] == "INFO"
+    assert entry["run_id"] == "abc"
+    assert entry["latency_ms"] == 12.5
+    assert "session_id" not in entry
+
+
+def test_index_handler_writes_on_flush_and_filters(tmp_path):
+    """
+    flush 시 한 번에 저장되고 조건별로 조회되는지 테스트
+    """
+    db_path = str(tmp_path / "index.sqlite3")
+    handler = LogIndexHandler(db_path)
+    handler.emit(make_record(message="첫 요청", session_id="s1", run_id="r1", hop="solve"))
+    handler.emit(make_record(name="agent2", level=logging.WARNING, message="느린 응답", run_id="r1"))
+    handler.emit(make_record(message="다른 실행", run_id="r2"))
+
+    assert query_logs(db_path) == []
+    handler.flush()
+    try:
+        assert len(query_logs(db_path)) == 3
+        assert [r["message"] for r in query_logs(db_path, session_id="s1")] == ["첫 요청"]
+        assert {r["message"] for r in query_logs(db_path, run_id="r1")} == {"첫 요청", "느린 응답"}
+        assert [r["agent"] for r in query_logs(db_path, level="warning")] == ["agent2"]
+        assert query_logs(db_path, since=time.time() + 60) == []
+        assert len(query_logs(db_path, limit=1)) == 1
+    finally:
+        handler.close()
+
+
+def test_setup_logger_indexes_records(tmp_path):
+    """
+    setup_logger로 만든 로거의 레코드가 인덱스에 저장되는지 테스트
+    """
+    logger = setup_logger("test_indexed", str(tmp_path / "indexed.log"), index=True)
+    try:
+        logger.info("인덱스 기록", extra={"run_id": "run-1", "hop": "next", "latency_ms": 3.0})
+    finally:
+        shutdown_logger("test_indexed")
+
+    records = query_logs(str(tmp_path / "index.sqlite3"), agent="test_indexed")
+    assert len(records) == 1
+    assert records[0]["hop"] == "next"
@@ -0,0 +1,89 @@
+"""
+공통 로깅 모듈 단위 테스트 모듈
+
+큐 기반 비동기 기록, 중복 핸들러 방지 및 배치 flush를 검증합니다.
+"""
+import logging
+import sys
+import time
+from pathlib import Path
+from logging.handlers import QueueHandler
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.logger import BufferedRotatingFileHandler, setup_logger, shutdown_logger
+
+
+def test_setup_logger_is_idempotent(tmp_path):
+    """
+    같은 이름으로 여러 번 설정해도 핸들러가 한 번만 추가되는지 테스트
+    """
+    log_file = tmp_path / "idempotent.log"
+    first = setup_logger("test_idempotent", str(log_file))
+    second = setup_logger("test_idempotent", str(log_file))
+    try:
+        first.info("한 번만 기록")
+
+        assert first is second
+        assert sum(isinstance(h, QueueHandler) for h in first.handlers) == 1
+    finally:
+        shutdown_logger("test_idempotent")
+
+    assert log_file.read_text(encoding="utf-8").count("한 번만 기록") == 1
+
+
+def test_logging_does_not_block_on_file_io(tmp_path, monkeypatch):
+    """
+    로그 호출이 파일 기록을 기다리지 않고 백그라운드에서 모두 기록되는지 테스트
+    """
+    original_emit = BufferedRotatingFileHandler.emit
+
+    def slow_emit(self, record):
+        # 느린 디스크를 흉내 내어 레코드마다 2ms씩 지연
+        time.sleep(0.002)
+        original_emit(self, record)
+
+    monkeypatch.setattr(BufferedRotatingFileHandler, "emit", slow_emit)
+    log_file = tmp_path / "fast.log"
+    logger = setup_logger("test_fast", str(log_file), index=False)
+    try:
+        started = time.perf_counter()
+        for i in range(500):
+            logger.info("레코드 %d", i)
+        elapsed = time.perf_counter() - started
+    finally:
+        shutdown_logger("test_fast")
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 500
+    assert lines[-1].endswith("test_fast: 레코드 499")
+    # 동기로 기록했다면 최소 1초가 걸림
+    assert elapsed < 0.25
+
+
+def test_exception_is_recorded(tmp_path):
+    """
+    예외 정보가 백그라운드 기록에도 포함되는지 테스트
+    """
+    log_file = tmp_path / "error.log"
+    logger = setup_logger("test_error", str(log_file))
+    try:
+        try:
+            raise ValueError("잘못된 값")
+        except ValueError:
+            logger.exception("처리 실패")
+    finally:
+        shutdown_logger("test_error")
+
+    content = log_file.read_text(encoding="utf-8")
+    assert "[ERROR] test_error: 처리 실패" in content
+    assert "ValueError: 잘못된 값" in content
+
+
+def test_shutdown_unknown_logger_is_noop():
+    """
+    설정되지 않은 로거 종료 호출이 오류 없이 무시되는지 테스트
+    """
+    shutdown_logger("never_configured")
+    assert logging.getLogger("never_configured").handlers == []
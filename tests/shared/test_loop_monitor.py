@@ -0,0 +1,96 @@
+"""
+이벤트 루프 지연 감시 모듈 단위 테스트 모듈
+
+지연 히스토그램 기록과 루프 정지 시 스택 수집을 검증합니다.
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.logger import shutdown_logger
+from shared.loop_monitor import LoopMonitor, instrument_loop_monitor, loop_lag, slow_callbacks
+
+
+@pytest.fixture(autouse=True)
+def monitor_log_dir(agent_log_dir):
+    """
+    정지 기록 로그를 테스트별 임시 디렉토리에 남기고 테스트가 끝나면 로거를 닫는 픽스처
+    """
+    yield agent_log_dir
+    shutdown_logger("test_loop_monitor")
+
+
+def block_event_loop(seconds):
+    """
+    이벤트 루프를 막는 동기 작업
+
+    Args:
+        seconds (float): 막는 시간 (초)
+    """
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_stall_is_recorded_with_stack(monitor_log_dir):
+    """
+    루프를 막은 콜백의 스택이 기록되고 지연이 히스토그램에 남는지 테스트
+    """
+    monitor = LoopMonitor("test_loop_monitor", interval=0.02, slow_threshold=0.05)
+    observed = loop_lag.labels().count
+    stalls = slow_callbacks.labels().value
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        block_event_loop(0.3)
+        await asyncio.sleep(0.05)
+    finally:
+        monitor.stop()
+
+    assert len(monitor.stalls) == 1
+    assert "block_event_loop" in monitor.stalls[0]["stack"]
+    assert monitor.stalls[0]["blocked_seconds"] >= 0.05
+    assert slow_callbacks.labels().value == stalls + 1
+    assert loop_lag.labels().count > observed
+    shutdown_logger("test_loop_monitor")
+    assert "block_event_loop" in (monitor_log_dir / "test_loop_monitor.log").read_text(encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_idle_loop_records_no_stall():
+    """
+    루프가 막히지 않으면 정지 기록이 없고, 멈추면 감시 스레드가 종료되는지 테스트
+    """
+    monitor = LoopMonitor("test_loop_monitor", interval=0.01, slow_threshold=0.1)
+    monitor.start()
+    watchdog = monitor._watchdog
+    try:
+        await asyncio.sleep(0.15)
+    finally:
+        monitor.stop()
+
+    assert list(monitor.stalls) == []
+    # 멈춘 뒤에는 감시 스레드도 종료됨
+    assert not watchdog.is_alive()
+
+
+def test_stalls_endpoint_requires_admin(monkeypatch):
+    """
+    정지 기록 조회 엔드포인트가 관리자 토큰으로 보호되는지 테스트
+    """
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    app = FastAPI()
+    instrument_loop_monitor(app, "test_loop_monitor")
+    client = TestClient(app)
+
+    assert client.get("/admin/loop/stalls").status_code == 401
+    response = client.get("/admin/loop/stalls", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert response.json()["stalls"] == []
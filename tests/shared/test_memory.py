@@ -0,0 +1,79 @@
+"""
+메모리 스냅샷 모듈 단위 테스트 모듈
+
+tracemalloc 시작, 스냅샷 상위 할당 위치 및 스냅샷 차이 엔드포인트를 검증합니다.
+"""
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared import memory
+from shared.memory import MemoryTracker, instrument_memory
+
+HEADERS = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """
+    메모리 스냅샷 엔드포인트가 추가된 테스트 앱 클라이언트 픽스처
+
+    Yields:
+        TestClient: FastAPI 테스트 클라이언트
+    """
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    monkeypatch.setattr(memory, "tracker", MemoryTracker(max_snapshots=2))
+    app = FastAPI()
+    instrument_memory(app)
+    yield TestClient(app)
+    tracemalloc.stop()
+
+
+def test_snapshot_requires_tracing(client):
+    """
+    추적을 시작하지 않으면 스냅샷을 찍을 수 없는지 테스트
+    """
+    tracemalloc.stop()
+
+    assert client.post("/admin/memory/snapshots", headers=HEADERS).status_code == 409
+    assert client.post("/admin/memory/snapshots").status_code == 401
+
+
+def test_diff_shows_growth_site(client):
+    """
+    두 스냅샷 사이에 늘어난 할당 위치가 차이에 나타나는지 테스트
+    """
+    assert client.post("/admin/memory/start", params={"frames": 5}, headers=HEADERS).json()["tracing"] is True
+    base = client.post("/admin/memory/snapshots", headers=HEADERS).json()["id"]
+
+    leaked = [bytearray(1024) for _ in range(2000)]
+    target = client.post("/admin/memory/snapshots", headers=HEADERS).json()["id"]
+
+    response = client.get("/admin/memory/diff", params={"base": base, "target": target}, headers=HEADERS)
+
+    assert response.status_code == 200
+    top = response.json()["diff"][0]
+    assert "test_memory.py" in top["location"]
+    assert top["size_diff_kb"] >= 2000
+    assert len(leaked) == 2000
+
+
+def test_old_snapshots_are_evicted(client):
+    """
+    최대 개수를 넘으면 오래된 스냅샷부터 삭제되는지 테스트
+    """
+    client.post("/admin/memory/start", headers=HEADERS)
+    ids = [client.post("/admin/memory/snapshots", headers=HEADERS).json()["id"] for _ in range(3)]
+
+    status = client.get("/admin/memory", headers=HEADERS).json()
+
+    assert [snapshot["id"] for snapshot in status["snapshots"]] == ids[1:]
+    assert client.get(f"/admin/memory/snapshots/{ids[0]}", headers=HEADERS).status_code == 404
+    assert client.get(f"/admin/memory/snapshots/{ids[2]}", params={"group_by": "filename"}, headers=HEADERS).status_code == 200
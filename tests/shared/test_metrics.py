@@ -0,0 +1,111 @@
+"""
+공통 메트릭 모듈 단위 테스트 모듈
+
+카운터, 게이지, 히스토그램의 Prometheus 텍스트 출력과 요청 지연 시간 미들웨어를 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.http_metrics import instrument_app
+from shared.metrics import Metric, MetricsRegistry
+
+
+def test_counter_and_gauge_render():
+    """
+    카운터와 게이지가 레이블별로 출력되는지 테스트
+    """
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "처리한 작업 수", ("kind",))
+    counter.labels("a").inc()
+    counter.labels("a").inc(2)
+    counter.labels('b"').inc()
+    registry.gauge("queue_depth", "대기 중인 작업 수").set_function(lambda: 7)
+
+    text = registry.render()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{kind="a"} 3' in text
+    assert 'jobs_total{kind="b\\""} 1' in text
+    assert "queue_depth 7" in text
+    assert registry.counter("jobs_total", "처리한 작업 수", ("kind",)) is counter
+
+
+def test_histogram_buckets_are_cumulative():
+    """
+    히스토그램 버킷이 누적 값과 합계, 개수를 출력하는지 테스트
+    """
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "지연 시간", ("hop",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 2.0):
+        histogram.labels("solve").observe(value)
+
+    text = registry.render()
+
+    assert 'latency_seconds_bucket{hop="solve",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{hop="solve",le="1"} 2' in text
+    assert 'latency_seconds_bucket{hop="solve",le="+Inf"} 3' in text
+    assert 'latency_seconds_sum{hop="solve"} 2.55' in text
+    assert 'latency_seconds_count{hop="solve"} 3' in text
+
+
+def test_labels_require_all_values():
+    """
+    레이블 값 개수가 맞지 않으면 오류가 발생하는지 테스트
+    """
+    registry = MetricsRegistry()
+    histogram = registry.histogram("needs_labels", "레이블 필요", ("hop",))
+
+    with pytest.raises(ValueError):
+        histogram.observe(1.0)
+
+
+def test_metric_base_requires_new_child():
+    """
+    _new_child를 구현하지 않은 메트릭 클래스는 만들 수 없는지 테스트
+    """
+    class Incomplete(Metric):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete", "구현 없음")
+
+
+def test_gauge_inc_dec():
+    """
+    레이블이 없는 게이지가 늘고 줄어드는지 테스트
+    """
+    gauge = MetricsRegistry().gauge("in_flight", "진행 중인 요청 수")
+    gauge.inc(3)
+    gauge.dec()
+
+    assert gauge.labels().value == 2
+
+
+def test_instrumented_app_records_route_template():
+    """
+    요청 지연 시간이 실제 경로가 아닌 라우트 템플릿으로 기록되는지 테스트
+    """
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"item_id": item_id}
+
+    instrument_app(app)
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"} 2' in response.text
+    assert "/items/1" not in response.text
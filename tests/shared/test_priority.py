@@ -0,0 +1,153 @@
+"""
+우선순위 스케줄링 모듈 단위 테스트 모듈
+
+interactive 우선 배정, WFQ 가중치, 예약 슬롯, 취소 처리와 우선순위 헤더 전달을 검증합니다.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.priority import (
+    PriorityScheduler,
+    current_priority,
+    inject_priority,
+    instrument_priority,
+    priority_context,
+)
+
+
+async def queue_waiters(scheduler: PriorityScheduler, classes, order):
+    """
+    클래스 목록 순서대로 슬롯을 기다리는 태스크를 만들고 대기열에 들어갈 때까지 기다립니다.
+
+    Args:
+        scheduler (PriorityScheduler): 대상 스케줄러
+        classes: 우선순위 클래스 목록
+        order (list): 슬롯을 얻은 순서대로 (클래스, 번호)를 기록할 목록
+
+    Returns:
+        list: 생성한 태스크 목록
+    """
+    async def waiter(index, cls):
+        await scheduler.acquire(cls)
+        order.append((cls, index))
+
+    tasks = []
+    for index, cls in enumerate(classes):
+        tasks.append(asyncio.create_task(waiter(index, cls)))
+        await asyncio.sleep(0)
+    return tasks
+
+
+async def drain(scheduler: PriorityScheduler, tasks):
+    """
+    슬롯을 하나씩 반환하며 기다리는 태스크를 모두 깨웁니다.
+    """
+    for _ in tasks:
+        scheduler.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_interactive_preempts_queued_batch_work():
+    """
+    먼저 기다리던 일괄 작업보다 나중에 온 interactive 호출이 먼저 슬롯을 얻는지 테스트
+    """
+    scheduler = PriorityScheduler("test", capacity=1, reserved=0)
+    await scheduler.acquire("batch")
+    order = []
+
+    tasks = await queue_waiters(scheduler, ["batch", "batch", "api", "interactive"], order)
+    await drain(scheduler, tasks)
+
+    assert order[0] == ("interactive", 3)
+    assert order[1] == ("api", 2)
+
+
+@pytest.mark.asyncio
+async def test_weighted_fair_queuing_between_api_and_batch():
+    """
+    api와 batch가 함께 기다리면 가중치(4:1) 비율로 슬롯을 나누는지 테스트
+    """
+    scheduler = PriorityScheduler("test", capacity=1, reserved=0, weights={"api": 4, "batch": 1})
+    await scheduler.acquire("api")
+    order = []
+
+    tasks = await queue_waiters(scheduler, ["batch"] * 10 + ["api"] * 10, order)
+    await drain(scheduler, tasks)
+
+    first_ten = [cls for cls, _ in order[:10]]
+    assert first_ten.count("api") == 8
+    assert first_ten.count("batch") == 2
+    # 같은 클래스 안에서는 도착 순서를 지킴
+    assert [index for cls, index in order if cls == "batch"] == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_reserved_slot_only_for_interactive():
+    """
+    예약 슬롯은 일괄 작업이 쓰지 못하고 interactive 호출이 바로 쓸 수 있는지 테스트
+    """
+    scheduler = PriorityScheduler("test", capacity=2, reserved=1)
+    await scheduler.acquire("batch")
+    order = []
+
+    tasks = await queue_waiters(scheduler, ["batch"], order)
+    assert order == [] and scheduler.waiting == 1
+
+    await asyncio.wait_for(scheduler.acquire("interactive"), timeout=1)
+    assert scheduler.in_use == 2
+
+    scheduler.release()
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    assert order == [("batch", 0)]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    """
+    기다리다 취소된 호출이 슬롯을 차지하지 않는지 테스트
+    """
+    scheduler = PriorityScheduler("test", capacity=1, reserved=0)
+    async with scheduler.slot("api"):
+        waiting = asyncio.create_task(scheduler.acquire("api"))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+
+    assert scheduler.in_use == 0
+    async with scheduler.slot("batch"):
+        assert scheduler.in_use == 1
+
+
+def test_priority_context_and_header():
+    """
+    우선순위 컨텍스트가 헤더로 전달되고, 미들웨어가 헤더를 현재 클래스로 적용하는지 테스트
+    """
+    assert current_priority() == "api"
+    with priority_context("interactive"):
+        headers = inject_priority({"content-type": "application/json"})
+    assert headers["x-priority-class"] == "interactive"
+    assert current_priority() == "api"
+
+    app = FastAPI()
+    instrument_priority(app)
+
+    @app.get("/priority")
+    async def read_priority():
+        return {"class": current_priority()}
+
+    client = TestClient(app)
+    assert client.get("/priority", headers={"x-priority-class": "batch"}).json() == {"class": "batch"}
+    assert client.get("/priority").json() == {"class": "api"}
+    # 알 수 없는 클래스는 기본 클래스로 처리
+    assert client.get("/priority", headers={"x-priority-class": "vip"}).json() == {"class": "api"}
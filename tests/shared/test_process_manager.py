@@ -0,0 +1,139 @@
+"""
+자식 프로세스 관리 모듈 단위 테스트 모듈
+
+출력 파이프를 계속 비우는지, 출력 줄 수 제한과 비정상 종료 시 재시작(정상 종료는 정책에 따름)이 동작하는지 검증합니다.
+"""
+import sys
+import time
+from pathlib import Path
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import shared.process_manager as process_manager
+from shared.process_manager import LineRateLimiter, ManagedProcess, ProcessSupervisor
+
+
+def python_command(code):
+    """
+    파이썬 코드를 실행하는 명령어
+
+    Args:
+        code (str): 실행할 코드
+
+    Returns:
+        list: 명령어와 인자
+    """
+    return [sys.executable, "-c", code]
+
+
+def wait_for(condition, timeout=5.0):
+    """
+    조건이 참이 될 때까지 기다립니다.
+
+    Args:
+        condition (Callable[[], bool]): 확인할 조건
+        timeout (float): 제한 시간 (초)
+
+    Returns:
+        bool: 제한 시간 안에 참이 되었으면 True
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_output_is_drained_so_child_does_not_block():
+    """
+    파이프 버퍼보다 많이 출력하는 자식 프로세스가 멈추지 않고 종료되는지 테스트
+    """
+    # 약 1MB 출력 (기본 파이프 버퍼 64KB보다 훨씬 큼)
+    process = ManagedProcess("대량 출력", python_command("for _ in range(10000): print('y' * 100)"), restart=False)
+    process.start()
+
+    assert wait_for(lambda: process.poll() is not None)
+    assert process.returncode == 0
+
+
+def test_rate_limiter_drops_and_counts_excess_lines():
+    """
+    순간 허용량을 넘은 줄은 버리고 그 수를 알려 주는지 테스트
+    """
+    limiter = LineRateLimiter(rate=0.001, burst=3)
+
+    allowed = [limiter.allow() for _ in range(5)]
+
+    assert allowed == [True, True, True, False, False]
+    assert limiter.take_dropped() == 2
+    assert limiter.take_dropped() == 0
+
+
+def test_crashed_process_is_restarted_with_backoff(monkeypatch):
+    """
+    비정상 종료한 프로세스가 백오프 후 다시 실행되고 재시작 횟수가 늘어나는지 테스트
+    """
+    monkeypatch.setattr(process_manager, "RESTART_BACKOFF_BASE", 0.05)
+    supervisor = ProcessSupervisor()
+    process = ManagedProcess("충돌", python_command("import sys; sys.exit(3)"))
+    supervisor.add(process)
+    process.start()
+
+    try:
+        def restarted_twice():
+            supervisor.check()
+            return process.restarts >= 2
+
+        assert wait_for(restarted_twice)
+        # 연속 실패마다 백오프가 두 배로 늘어남
+        assert process.failures >= 2
+    finally:
+        supervisor.stop_all()
+
+    assert supervisor.processes[0].status()["restarts"] >= 2
+
+
+def test_clean_exit_is_restarted_only_when_policy_allows(monkeypatch):
+    """
+    종료 코드 0으로 끝난 프로세스는 기본적으로 다시 실행하지 않고, restart_on_success일 때만 다시 실행하는지 테스트
+    """
+    monkeypatch.setattr(process_manager, "RESTART_BACKOFF_BASE", 0.05)
+    supervisor = ProcessSupervisor()
+    finished = ManagedProcess("정상 종료", python_command("pass"))
+    always = ManagedProcess("항상 재시작", python_command("pass"), restart_on_success=True)
+    for process in (finished, always):
+        supervisor.add(process)
+        process.start()
+
+    try:
+        def always_restarted():
+            supervisor.check()
+            return always.restarts >= 1
+
+        assert wait_for(always_restarted)
+        assert finished.poll() == 0
+        assert finished.restarts == 0
+        assert finished.next_restart_at is None
+        assert finished.restart is False
+    finally:
+        supervisor.stop_all()
+
+
+def test_stop_all_terminates_and_disables_restart():
+    """
+    stop_all이 실행 중인 프로세스를 종료하고 다시 실행하지 않는지 테스트
+    """
+    supervisor = ProcessSupervisor()
+    process = ManagedProcess("대기", python_command("import time; time.sleep(30)"))
+    supervisor.add(process)
+    process.start()
+    assert process.status()["running"] is True
+
+    supervisor.stop_all()
+    supervisor.check()
+
+    assert process.poll() is not None
+    assert process.restarts == 0
+    assert process.status()["uptime"] == 0.0
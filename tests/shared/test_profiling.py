@@ -0,0 +1,124 @@
+"""
+온디맨드 프로파일링 모듈 단위 테스트 모듈
+
+관리자 토큰 검증, cProfile/샘플링 결과 형식 및 p99 자동 수집 판단을 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.metrics import MetricsRegistry, bucket_quantile
+from shared.profiling import AutoProfiler, Profiler, instrument_profiling
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """
+    프로파일링 엔드포인트가 추가된 테스트 앱 클라이언트 픽스처
+
+    Returns:
+        TestClient: FastAPI 테스트 클라이언트
+    """
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    app = FastAPI()
+    instrument_profiling(app, "test_profiling")
+    return TestClient(app)
+
+
+def test_admin_token_is_required(client, monkeypatch):
+    """
+    토큰이 없거나 틀리면 거부하고, ADMIN_TOKEN이 없으면 비활성화되는지 테스트
+    """
+    assert client.post("/admin/profile", params={"seconds": 0.1}).status_code == 401
+    assert client.post(
+        "/admin/profile", params={"seconds": 0.1}, headers={"X-Admin-Token": "wrong"}
+    ).status_code == 401
+
+    monkeypatch.delenv("ADMIN_TOKEN")
+    assert client.get("/admin/profile/results", headers={"X-Admin-Token": "secret"}).status_code == 403
+
+
+def test_sample_profile_returns_collapsed_stacks(client):
+    """
+    샘플링 프로파일이 collapsed-stack 형식으로 반환되는지 테스트
+    """
+    response = client.post(
+        "/admin/profile", params={"seconds": 0.1, "mode": "sample"}, headers={"X-Admin-Token": "secret"}
+    )
+
+    assert response.status_code == 200
+    lines = response.text.strip().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) >= 1
+    assert ":" in stack.split(";")[0]
+
+
+def test_cprofile_returns_pstats_text(client):
+    """
+    cProfile 프로파일이 pstats 텍스트로 반환되고 결과 목록에 남는지 테스트
+    """
+    headers = {"X-Admin-Token": "secret"}
+    response = client.post("/admin/profile", params={"seconds": 0.1, "mode": "cprofile"}, headers=headers)
+
+    assert response.status_code == 200
+    assert "cumulative" in response.text
+    results = client.get("/admin/profile/results", headers=headers).json()["results"]
+    assert results[0]["mode"] == "cprofile"
+    assert results[0]["reason"] == "manual"
+
+
+def test_bucket_quantile():
+    """
+    버킷 관측 수로 분위수 상한을 추정하는 테스트
+    """
+    assert bucket_quantile((0.1, 1.0), [98, 1, 1], 0.99) == 1.0
+    assert bucket_quantile((0.1, 1.0), [0, 0, 5], 0.5) == float("inf")
+    assert bucket_quantile((0.1, 1.0), [0, 0, 0], 0.99) is None
+
+
+def test_auto_profiler_triggers_on_slow_window():
+    """
+    직전 구간의 p99가 임계값을 넘을 때만 자동 수집하고 대기 시간을 지키는지 테스트
+    """
+    histogram = MetricsRegistry().histogram("latency", "지연 시간", buckets=(0.1, 1.0))
+    auto = AutoProfiler(Profiler(), threshold=0.5, histogram=histogram, cooldown=60)
+
+    for _ in range(50):
+        histogram.observe(0.01)
+    assert auto.should_capture() is False
+
+    for _ in range(50):
+        histogram.observe(0.8)
+    assert auto.should_capture() is True
+
+    for _ in range(50):
+        histogram.observe(0.8)
+    assert auto.should_capture() is False
+
+
+def test_auto_profiler_ignores_admin_and_streaming_routes():
+    """
+    관리자 엔드포인트와 스트리밍 경로의 긴 요청은 자동 수집의 p99 계산에서 빠지는지 테스트
+    """
+    histogram = MetricsRegistry().histogram(
+        "latency", "지연 시간", ("method", "route", "status"), buckets=(0.1, 1.0)
+    )
+    auto = AutoProfiler(Profiler(), threshold=0.5, histogram=histogram, cooldown=0)
+
+    for _ in range(50):
+        histogram.labels("GET", "/answer", "200").observe(0.01)
+    for route in ("/admin/profile", "/problem/stream", "/logs/{agent_name}/follow"):
+        for _ in range(20):
+            histogram.labels("GET", route, "200").observe(5.0)
+    assert auto.should_capture() is False
+
+    for _ in range(50):
+        histogram.labels("GET", "/answer", "200").observe(0.8)
+    assert auto.should_capture() is True
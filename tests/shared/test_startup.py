@@ -0,0 +1,51 @@
+"""
+시작 시간 보고 모듈 단위 테스트 모듈
+
+`-X importtime` 출력 파싱과 보고서 생성을 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.startup import ImportTiming, format_report, parse_importtime, startup_report
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     pydantic.types
+import time:      3000 |       3120 |   pydantic
+import time:       500 |        500 |   fastapi.routing
+import time:      2000 |       5620 | app.api
+"""
+
+
+def test_parse_importtime_skips_header():
+    """
+    머리글을 건너뛰고 모듈별 자체/누적 시간을 읽는지 테스트
+    """
+    timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert timings[0] == ImportTiming("pydantic.types", 120, 120)
+    assert timings[-1] == ImportTiming("app.api", 2000, 5620)
+    assert len(timings) == 4
+
+
+def test_format_report_groups_by_package():
+    """
+    앱 모듈 초기화 시간과 패키지별 합계가 보고서에 표시되는지 테스트
+    """
+    report = format_report("app.api", 0.0056, parse_importtime(IMPORTTIME_OUTPUT))
+
+    assert "app.api 초기화(모듈 본문 실행): 2.0ms" in report
+    # pydantic 패키지는 두 모듈의 자체 시간 합계
+    assert "pydantic" in report and "3.1ms" in report
+
+
+def test_startup_report_measures_fresh_process():
+    """
+    새 프로세스에서 실제 모듈을 가져와 보고서를 만드는지 테스트
+    """
+    report = startup_report("shared.gugudan", str(Path(__file__).parent.parent.parent))
+
+    assert report.startswith("[시작 시간 보고] shared.gugudan")
+    assert "shared" in report
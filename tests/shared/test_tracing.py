@@ -0,0 +1,107 @@
+"""
+공통 분산 추적 모듈 단위 테스트 모듈
+
+traceparent 전달, 하위 구간 연결, 샘플링 및 추적 미들웨어를 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared import tracing
+from shared.tracing import SpanExporter, inject, instrument_tracing, parse_traceparent, start_span
+
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+def use_exporter(monkeypatch, sample_rate):
+    """
+    테스트 전용 내보내기와 샘플링 확률을 설정합니다.
+
+    Args:
+        monkeypatch: pytest monkeypatch 픽스처
+        sample_rate (float): 샘플링 확률
+
+    Returns:
+        SpanExporter: 테스트 전용 내보내기
+    """
+    exporter = SpanExporter(capacity=100)
+    monkeypatch.setattr(tracing, "exporter", exporter)
+    monkeypatch.setattr(tracing, "TRACE_SAMPLE_RATE", sample_rate)
+    return exporter
+
+
+def test_parse_traceparent():
+    """
+    traceparent 헤더 파싱과 잘못된 형식 처리 테스트
+    """
+    span = parse_traceparent(TRACEPARENT)
+
+    assert span.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert span.span_id == "b7ad6b7169203331"
+    assert span.sampled is True
+    assert parse_traceparent("00-zz-b7ad6b7169203331-01") is None
+    assert parse_traceparent(None) is None
+
+
+def test_child_spans_share_trace_and_link_parent(monkeypatch):
+    """
+    하위 구간이 같은 추적 ID와 상위 구간 ID로 기록되는지 테스트
+    """
+    exporter = use_exporter(monkeypatch, 1.0)
+
+    with start_span("gugudan.run", "supervisor", run_id="r1") as root:
+        with start_span("hop.solve") as child:
+            headers = inject({"accept": "application/json"})
+
+    spans = {span["name"]: span for span in exporter.recent()}
+    assert headers["traceparent"] == f"00-{root.trace_id}-{child.span_id}-01"
+    assert spans["hop.solve"]["parent_id"] == root.span_id
+    assert spans["hop.solve"]["service"] == "supervisor"
+    assert spans["gugudan.run"]["attributes"] == {"run_id": "r1"}
+    assert spans["gugudan.run"]["duration_ms"] >= spans["hop.solve"]["duration_ms"]
+
+
+def test_unsampled_trace_propagates_without_recording(monkeypatch):
+    """
+    샘플링되지 않은 추적은 기록 없이 컨텍스트만 전달하는지 테스트
+    """
+    exporter = use_exporter(monkeypatch, 0.0)
+
+    with start_span("gugudan.run", "supervisor"):
+        with start_span("hop.solve"):
+            header = inject()["traceparent"]
+
+    assert header.endswith("-00")
+    assert exporter.recent() == []
+    assert inject() == {}
+
+
+def test_middleware_continues_incoming_trace(monkeypatch):
+    """
+    추적 미들웨어가 요청의 traceparent를 이어받고 /traces로 조회되는지 테스트
+    """
+    exporter = use_exporter(monkeypatch, 0.0)
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        with start_span("work"):
+            return {"item_id": item_id}
+
+    instrument_tracing(app, "agent1")
+    client = TestClient(app)
+    client.get("/items/7", headers={"traceparent": TRACEPARENT})
+
+    response = client.get("/traces", params={"trace_id": "0af7651916cd43dd8448eb211c80319c"})
+
+    spans = response.json()["spans"]
+    assert [span["name"] for span in spans] == ["GET /items/{item_id}", "work"]
+    assert spans[0]["parent_id"] == "b7ad6b7169203331"
+    assert spans[0]["service"] == "agent1"
+    assert spans[0]["attributes"]["http.status_code"] == 200
+    assert len(exporter.recent()) == 2
@@ -0,0 +1,224 @@
+"""
+웹소켓 연결 관리 모듈 단위 테스트 모듈
+
+이벤트 시퀀스 번호, 세션 링 버퍼 및 재연결 재개를 검증합니다.
+"""
+import asyncio
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.websocket_manager import ConnectionManager, Session, encode_event
+
+
+class FakeWebSocket:
+    """
+    전송된 메시지를 기록하는 테스트용 웹소켓
+    """
+
+    def __init__(self, fail: bool = False):
+        self.sent = []
+        self.fail = fail
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("연결 끊김")
+        self.sent.append(json.loads(text))
+
+
+def test_encode_event_adds_seq():
+    """
+    직렬화된 메시지에 시퀀스 번호가 추가되는지 테스트
+    """
+    assert json.loads(encode_event({"type": "problem", "content": "2×1="}, 7)) == {
+        "seq": 7, "type": "problem", "content": "2×1="
+    }
+    assert json.loads(encode_event({}, 1)) == {"seq": 1}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_assigns_increasing_seq():
+    """
+    브로드캐스트 이벤트에 세션별로 단조 증가하는 시퀀스 번호가 붙는지 테스트
+    """
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    await manager.connect(websocket)
+
+    await manager.broadcast({"type": "problem", "content": "2×1="})
+    await manager.broadcast({"type": "answer", "content": "2×1=2"})
+
+    hello, first, second = websocket.sent
+    assert hello["type"] == "session"
+    assert hello["resumed"] is False
+    assert (first["seq"], second["seq"]) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_broadcast_skips_seq_and_buffer():
+    """
+    기록하지 않는 브로드캐스트는 시퀀스 번호와 링 버퍼를 사용하지 않는지 테스트
+    """
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    session = await manager.connect(websocket)
+
+    await manager.broadcast({"type": "agent_status", "agents": {}}, record=False)
+    await manager.broadcast({"type": "problem", "content": "2×1="})
+
+    _, status, problem = websocket.sent
+    assert "seq" not in status
+    assert problem["seq"] == 1
+    assert [json.loads(text)["type"] for text in session.missed_since(0)] == ["problem"]
+
+
+@pytest.mark.asyncio
+async def test_resume_receives_only_missed_events():
+    """
+    재연결한 클라이언트가 놓친 이벤트만 받는지 테스트
+    """
+    manager = ConnectionManager()
+    first_socket = FakeWebSocket()
+    session = await manager.connect(first_socket)
+    await manager.broadcast({"type": "problem", "content": "3×1="})
+
+    manager.disconnect(first_socket)
+    await manager.broadcast({"type": "answer", "content": "3×1=3"})
+    await manager.broadcast({"type": "problem", "content": "3×2="})
+
+    second_socket = FakeWebSocket()
+    resumed = await manager.connect(second_socket, session.session_id, last_seq=1)
+
+    assert resumed is session
+    hello, *missed = second_socket.sent
+    assert hello["resumed"] is True
+    assert hello["gap"] is False
+    assert [event["seq"] for event in missed] == [2, 3]
+    assert [event["content"] for event in missed] == ["3×1=3", "3×2="]
+
+
+class SlowWebSocket(FakeWebSocket):
+    """
+    전송할 때마다 이벤트 루프에 양보하고, 첫 재전송 이벤트를 보낼 때 콜백을 실행하는 테스트용 웹소켓
+    """
+
+    def __init__(self, on_replay):
+        super().__init__()
+        self.on_replay = on_replay
+
+    async def send_text(self, text):
+        await super().send_text(text)
+        if len(self.sent) == 2 and self.on_replay is not None:
+            self.on_replay()
+            self.on_replay = None
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_events_emitted_during_replay_arrive_in_order():
+    """
+    재전송 도중 기록된 새 이벤트가 놓친 이벤트보다 먼저 전달되지 않고 순서대로 이어지는지 테스트
+    """
+    manager = ConnectionManager()
+    first_socket = FakeWebSocket()
+    session = await manager.connect(first_socket)
+    manager.disconnect(first_socket)
+    for multiplicand in range(1, 4):
+        await manager.broadcast({"type": "problem", "content": f"6×{multiplicand}="})
+
+    tasks = []
+
+    def emit_during_replay():
+        tasks.append(asyncio.ensure_future(manager.broadcast({"type": "answer", "content": "6×3=18"})))
+        tasks.append(asyncio.ensure_future(session.send({"type": "system_message", "content": "개인"})))
+
+    second_socket = SlowWebSocket(emit_during_replay)
+    await manager.connect(second_socket, session.session_id, last_seq=0)
+    await asyncio.gather(*tasks)
+    await manager.broadcast({"type": "problem", "content": "6×4="})
+
+    _, *events = second_socket.sent
+    assert [event["seq"] for event in events] == [1, 2, 3, 4, 5, 6]
+
+
+@pytest.mark.asyncio
+async def test_pruning_task_removes_expired_sessions():
+    """
+    새 연결이 없어도 주기적인 정리 작업이 만료된 세션을 지우는지 테스트
+    """
+    manager = ConnectionManager(session_ttl=0)
+    websocket = FakeWebSocket()
+    session = await manager.connect(websocket)
+    manager.disconnect(websocket)
+
+    manager.start_pruning(interval=0.01)
+    try:
+        await asyncio.sleep(0.05)
+    finally:
+        manager.stop_pruning()
+
+    assert session.session_id not in manager.sessions
+
+
+@pytest.mark.asyncio
+async def test_resume_reports_gap_when_buffer_overflowed():
+    """
+    링 버퍼에서 밀려난 이벤트가 있으면 gap을 알리는지 테스트
+    """
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    session = await manager.connect(websocket)
+    session.buffer = type(session.buffer)(maxlen=2)
+    manager.disconnect(websocket)
+
+    for multiplicand in range(1, 5):
+        await manager.broadcast({"type": "problem", "content": f"4×{multiplicand}="})
+
+    new_socket = FakeWebSocket()
+    await manager.connect(new_socket, session.session_id, last_seq=0)
+
+    hello, *missed = new_socket.sent
+    assert hello["gap"] is True
+    assert [event["seq"] for event in missed] == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_unknown_session_starts_new_session():
+    """
+    알 수 없거나 만료된 세션 ID로 연결하면 새 세션이 시작되는지 테스트
+    """
+    manager = ConnectionManager(session_ttl=0)
+    websocket = FakeWebSocket()
+    session = await manager.connect(websocket)
+    manager.disconnect(websocket)
+
+    new_socket = FakeWebSocket()
+    new_session = await manager.connect(new_socket, session.session_id, last_seq=5)
+
+    assert new_session.session_id != session.session_id
+    assert new_socket.sent[0]["resumed"] is False
+
+
+@pytest.mark.asyncio
+async def test_failed_send_disconnects_client():
+    """
+    전송 실패한 연결은 제거되지만 세션은 재연결을 위해 유지되는지 테스트
+    """
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    session = await manager.connect(websocket)
+    websocket.fail = True
+
+    await manager.broadcast({"type": "problem", "content": "5×1="})
+
+    assert websocket not in manager.active_connections
+    assert session.websocket is None
+    assert session.session_id in manager.sessions
+    assert isinstance(manager.sessions[session.session_id], Session)
@@ -0,0 +1,89 @@
+"""
+에이전트 상태 집계 모듈 단위 테스트 모듈
+
+백그라운드 확인 결과 캐시와 상태 변경 알림, `/health/agents` 응답을 검증합니다.
+"""
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared import __version__
+from supervisor.app.agent_health import AgentHealthMonitor
+from supervisor.app.api import app
+
+TARGETS = {"agent1": "http://agent1/health", "agent2": "http://agent2/health"}
+
+
+def mock_client(up):
+    """
+    에이전트 /health 응답을 흉내 내는 HTTP 클라이언트
+
+    Args:
+        up (set): 200으로 응답할 호스트 이름
+
+    Returns:
+        httpx.AsyncClient: 모의 전송 계층을 사용하는 클라이언트
+    """
+    def handler(request):
+        if request.url.host in up:
+            return httpx.Response(200, json={"status": "ok", "version": "9.9.9"})
+        raise httpx.ConnectError("연결 거부", request=request)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_probe_caches_status_latency_and_version():
+    """
+    확인 결과의 상태, 응답 시간, 버전이 캐시되는지 테스트
+    """
+    monitor = AgentHealthMonitor(targets=TARGETS)
+
+    async with mock_client({"agent1"}) as client:
+        await monitor.probe_once(client)
+
+    agents = monitor.snapshot()["agents"]
+    assert agents["agent1"]["status"] == "ok"
+    assert agents["agent1"]["version"] == "9.9.9"
+    assert agents["agent1"]["latency_ms"] is not None
+    assert agents["agent2"]["status"] == "down"
+    assert agents["agent2"]["error"] == "ConnectError"
+
+
+@pytest.mark.asyncio
+async def test_listener_called_only_on_status_change():
+    """
+    상태가 바뀐 에이전트만 알림을 받는지 테스트
+    """
+    changes = []
+
+    async def on_change(name, entry):
+        changes.append((name, entry["status"]))
+
+    monitor = AgentHealthMonitor(targets=TARGETS, on_change=on_change)
+
+    async with mock_client({"agent1", "agent2"}) as client:
+        await monitor.probe_once(client)
+        await monitor.probe_once(client)
+    async with mock_client({"agent1"}) as client:
+        await monitor.probe_once(client)
+
+    assert changes == [("agent1", "ok"), ("agent2", "ok"), ("agent2", "down")]
+
+
+def test_health_agents_serves_cached_snapshot():
+    """
+    /health/agents가 에이전트를 호출하지 않고 캐시된 상태를 반환하는지 테스트
+    """
+    response = TestClient(app).get("/health/agents")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["supervisor"] == {"status": "ok", "version": __version__}
+    assert set(body["agents"]) == {"agent1", "agent2"}
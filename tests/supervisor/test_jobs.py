@@ -0,0 +1,265 @@
+"""
+슈퍼바이저 일괄 작업 모듈 단위 테스트 모듈
+
+작업 항목 생성, 작업자 풀 실행과 결과 파일 기록, 동시 실행 제한, Range 결과 조회를 검증합니다.
+"""
+import asyncio
+import csv
+import io
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.schemas import JobSpec
+from supervisor.app.api import app
+from supervisor.app.job_routes import parse_range
+from supervisor.app.jobs import Job, JobManager, ResultWriter, count_items, iter_items, job_manager, run_job
+
+
+def answer_client(fail_multiplicand=None, priorities=None, explanation_error_multiplicand=None, ids=None) -> httpx.AsyncClient:
+    """
+    답변기 응답을 흉내 내는 HTTP 클라이언트를 만듭니다.
+
+    Args:
+        fail_multiplicand (Optional[int]): 500 오류를 응답할 곱하는 수
+        priorities (Optional[list]): 요청의 우선순위 클래스 헤더를 기록할 목록
+        explanation_error_multiplicand (Optional[int]): 설명 생성 실패를 표시할 곱하는 수
+        ids (Optional[list]): 요청의 문제 ID를 기록할 목록
+
+    Returns:
+        httpx.AsyncClient: 모의 전송 계층을 사용하는 클라이언트
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        if priorities is not None:
+            priorities.append(request.headers.get("x-priority-class"))
+        body = json.loads(request.content)
+        if ids is not None:
+            ids.append(body["id"])
+        if body["multiplicand"] == fail_multiplicand:
+            return httpx.Response(500)
+        answer = body["multiplier"] * body["multiplicand"]
+        return httpx.Response(200, json={
+            "answer": answer,
+            "calculation": f"{body['problem']}{answer}",
+            "explanation": "설명",
+            "id": body["id"],
+            "explanation_error": body["multiplicand"] == explanation_error_multiplicand,
+        })
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_iter_items_pairs_and_stop_sweep():
+    """
+    pairs 작업은 곱하는 수 범위 전체를, stop_sweep 작업은 종료 조건 값까지의 단계를 만드는지 테스트
+    """
+    pairs = JobSpec(tables=[2, 3], multiplicand_end=4)
+    assert [(table, step.multiplicand) for table, _, step in iter_items(pairs)] == [
+        (2, 1), (2, 2), (2, 3), (2, 4), (3, 1), (3, 2), (3, 3), (3, 4),
+    ]
+
+    sweep = JobSpec(kind="stop_sweep", tables=[5], stop_values=[10, 20])
+    assert [(stop, step.answer) for _, stop, step in iter_items(sweep)] == [
+        (10, 5), (10, 10), (20, 5), (20, 10), (20, 15), (20, 20),
+    ]
+    assert count_items(sweep) == 6
+    assert count_items(pairs, limit=3) == 4
+
+
+def test_job_spec_validation():
+    """
+    잘못된 단수, 뒤집힌 범위, 종료 조건 값 없는 stop_sweep을 거부하는지 테스트
+    """
+    for invalid in (
+        {"tables": [0]},
+        {"tables": [3], "multiplicand_start": 5, "multiplicand_end": 2},
+        {"kind": "stop_sweep", "tables": [3]},
+    ):
+        with pytest.raises(ValueError):
+            JobSpec(**invalid)
+
+
+@pytest.mark.asyncio
+async def test_run_job_writes_jsonl_rows(tmp_path):
+    """
+    작업자 풀이 모든 항목을 처리하고 실패한 항목은 error와 함께 기록하는지 테스트
+    """
+    job = Job(JobSpec(tables=[3, 4], concurrency=3, topology="direct"), tmp_path / "job.jsonl", 18)
+
+    async with answer_client(fail_multiplicand=7) as client:
+        await run_job(job, client)
+
+    rows = [json.loads(line) for line in (tmp_path / "job.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert len(rows) == 18
+    assert job.completed == 16 and job.failed == 2
+    by_problem = {row["problem"]: row for row in rows}
+    assert by_problem["4×9="]["answer"] == 36
+    assert by_problem["3×7="]["error"] and by_problem["3×7="]["answer"] is None
+
+
+@pytest.mark.asyncio
+async def test_run_job_counts_explanation_errors_as_failed(tmp_path):
+    """
+    답변기가 설명 생성 실패를 표시한 항목은 error와 함께 실패로 세고, 문제 ID가 작업 안에서 겹치지 않는지 테스트
+    """
+    spec = JobSpec(kind="stop_sweep", tables=[2, 3], stop_values=[6, 9], concurrency=2, topology="direct")
+    job = Job(spec, tmp_path / "job.jsonl", count_items(spec))
+    ids = []
+
+    async with answer_client(explanation_error_multiplicand=2, ids=ids) as client:
+        await run_job(job, client)
+
+    rows = [json.loads(line) for line in (tmp_path / "job.jsonl").read_text(encoding="utf-8").splitlines()]
+    failed = [row for row in rows if row["error"]]
+    assert {row["multiplicand"] for row in failed} == {2}
+    assert job.failed == len(failed) and job.completed == len(rows) - len(failed)
+    assert len(ids) == len(set(ids)) == job.total
+
+
+@pytest.mark.asyncio
+async def test_run_job_writes_csv_with_header(tmp_path):
+    """
+    CSV 형식이 머리글과 항목별 행을 기록하는지 테스트
+    """
+    spec = JobSpec(kind="stop_sweep", tables=[6], stop_values=[12], format="csv", concurrency=1)
+    job = Job(spec, tmp_path / "job.csv", 2)
+
+    async with answer_client() as client:
+        await run_job(job, client)
+
+    rows = list(csv.DictReader(io.StringIO((tmp_path / "job.csv").read_text(encoding="utf-8"))))
+    assert [(row["calculation"], row["stop_value"]) for row in rows] == [("6×1=6", "12"), ("6×2=12", "12")]
+
+
+@pytest.mark.asyncio
+async def test_result_writer_flushes_in_batches(tmp_path):
+    """
+    결과 행을 모았다가 행 수 기준에 도달하거나 닫을 때 파일에 기록하는지 테스트
+    """
+    path = tmp_path / "rows.jsonl"
+    writer = ResultWriter(path, "jsonl", flush_rows=2, flush_interval=60)
+
+    await writer.write({"problem": "2×1="})
+    assert path.read_text(encoding="utf-8") == ""
+    await writer.write({"problem": "2×2="})
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+    await writer.write({"problem": "2×3="})
+    await writer.close()
+    assert [json.loads(line)["problem"] for line in path.read_text(encoding="utf-8").splitlines()] == [
+        "2×1=", "2×2=", "2×3=",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_job_manager_limits_active_jobs(tmp_path):
+    """
+    동시 실행 수를 넘는 작업은 대기했다가 앞의 작업이 끝나면 실행되는지 테스트
+    """
+    manager = JobManager(job_dir=tmp_path, max_active=1)
+    manager.client_factory = answer_client
+
+    first = manager.submit(JobSpec(tables=[2]))
+    second = manager.submit(JobSpec(tables=[3]))
+    assert first.status == "running" and second.status == "queued"
+
+    await first.task
+    assert first.status == "completed"
+    await second.task
+    assert second.status == "completed"
+    assert second.progress()["completed"] == 9
+    assert manager.active == 0
+
+
+@pytest.mark.asyncio
+async def test_job_requests_use_batch_priority(tmp_path):
+    """
+    일괄 작업의 답변 요청이 batch 우선순위 클래스로 전달되는지 테스트
+    """
+    priorities = []
+    manager = JobManager(job_dir=tmp_path)
+    manager.client_factory = lambda: answer_client(priorities=priorities)
+
+    job = manager.submit(JobSpec(tables=[4], multiplicand_end=3))
+    await job.task
+
+    assert priorities == ["batch"] * 3
+
+
+@pytest.mark.asyncio
+async def test_job_manager_cancel(tmp_path):
+    """
+    대기 중인 작업과 실행 중인 작업을 취소할 수 있는지 테스트
+    """
+    manager = JobManager(job_dir=tmp_path, max_active=1)
+    manager.client_factory = answer_client
+
+    running = manager.submit(JobSpec(tables=[2], rate=1))
+    queued = manager.submit(JobSpec(tables=[3]))
+    manager.cancel(queued.job_id)
+    assert queued.status == "cancelled"
+
+    await asyncio.sleep(0.05)
+    manager.cancel(running.job_id)
+    await asyncio.gather(running.task, return_exceptions=True)
+    assert running.status == "cancelled"
+    # 취소는 작업 태스크까지 전달됨
+    assert running.task.cancelled()
+    assert running.completed < running.total
+
+
+def test_parse_range():
+    """
+    Range 헤더 형식별 해석과 범위를 벗어난 요청의 416 오류 테스트
+    """
+    assert parse_range("bytes=0-9", 100) == (0, 9)
+    assert parse_range("bytes=90-", 100) == (90, 99)
+    assert parse_range("bytes=-10", 100) == (90, 99)
+    assert parse_range("bytes=50-500", 100) == (50, 99)
+    assert parse_range("items=0-1", 100) is None
+    with pytest.raises(HTTPException) as exc:
+        parse_range("bytes=100-", 100)
+    assert exc.value.status_code == 416
+
+
+def test_job_endpoints_serve_result_ranges(tmp_path, monkeypatch):
+    """
+    작업 제출과 진행 상황 조회, 결과 파일의 전체/구간 조회 테스트
+    """
+    monkeypatch.setattr(job_manager, "job_dir", tmp_path)
+    monkeypatch.setattr(job_manager, "client_factory", answer_client)
+
+    with TestClient(app) as client:
+        response = client.post("/jobs", json={"tables": [7], "topology": "direct"})
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        job = job_manager.get(job_id)
+        # 작업은 앱의 이벤트 루프에서 실행되므로 끝날 때까지 진행 상황을 조회
+        for _ in range(100):
+            if job.finished:
+                break
+            client.get(f"/jobs/{job_id}")
+        progress = client.get(f"/jobs/{job_id}").json()
+        assert progress["status"] == "completed"
+        assert progress["completed"] == progress["total"] == 9
+
+        full = client.get(f"/jobs/{job_id}/result")
+        assert full.status_code == 200
+        assert full.headers["accept-ranges"] == "bytes"
+        assert len(full.text.splitlines()) == 9
+
+        part = client.get(f"/jobs/{job_id}/result", headers={"Range": "bytes=10-"})
+        assert part.status_code == 206
+        assert part.content == full.content[10:]
+        assert part.headers["content-range"] == f"bytes 10-{len(full.content) - 1}/{len(full.content)}"
+
+        assert client.get("/jobs/missing").status_code == 404
+        assert client.post("/jobs", json={"tables": [0]}).status_code == 422
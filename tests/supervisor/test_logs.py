@@ -0,0 +1,174 @@
+"""
+슈퍼바이저 로그 조회 모듈 단위 테스트 모듈
+
+파일 끝 역방향 읽기, 오프셋 페이지 조회 및 follow 모드를 검증합니다.
+"""
+import asyncio
+import logging
+import pytest
+import sys
+from pathlib import Path
+from fastapi.testclient import TestClient
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.log_index import LogIndexHandler
+from supervisor.app import logs
+from supervisor.app.api import app
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """
+    1000줄짜리 테스트 로그 파일 픽스처
+
+    Args:
+        tmp_path (Path): pytest 임시 디렉터리
+
+    Returns:
+        Path: 로그 파일 경로
+    """
+    path = tmp_path / "agent1.log"
+    path.write_text("".join(f"줄 {i}\n" for i in range(1000)), encoding="utf-8")
+    return path
+
+
+def test_tail_lines_returns_last_lines(log_file):
+    """
+    마지막 N줄만 반환하는지 테스트
+    """
+    content, start, end = logs.tail_lines(str(log_file), lines=3)
+
+    assert content == "줄 997\n줄 998\n줄 999\n"
+    assert end == log_file.stat().st_size
+    assert log_file.read_bytes()[start:end].decode("utf-8") == content
+
+
+def test_tail_lines_pages_backwards(log_file):
+    """
+    start_offset을 offset으로 사용해 이전 페이지를 조회하는 테스트
+    """
+    _, start, _ = logs.tail_lines(str(log_file), lines=10)
+    previous, previous_start, previous_end = logs.tail_lines(str(log_file), lines=2, offset=start)
+
+    assert previous == "줄 988\n줄 989\n"
+    assert previous_end == start
+    assert previous_start < start
+
+
+def test_tail_lines_respects_max_bytes(log_file):
+    """
+    max_bytes 한도 안에서 완전한 줄만 반환하는지 테스트
+    """
+    content, start, end = logs.tail_lines(str(log_file), lines=500, max_bytes=64)
+
+    assert end - start <= 64
+    assert content.endswith("줄 999\n")
+    assert all(line.startswith("줄 ") for line in content.splitlines())
+
+
+def test_tail_lines_joins_many_blocks_in_order(log_file, monkeypatch):
+    """
+    작은 블록 여러 개로 거꾸로 읽어도 줄 순서와 위치가 한 번에 읽은 결과와 같은지 테스트
+    """
+    expected = logs.tail_lines(str(log_file), lines=300)
+    # 블록 하나에 한두 줄만 들어가도록 줄임
+    monkeypatch.setattr(logs, "TAIL_BLOCK_SIZE", 7)
+
+    assert logs.tail_lines(str(log_file), lines=300) == expected
+    assert expected[0].splitlines()[0] == "줄 700"
+
+
+def test_tail_lines_whole_small_file(tmp_path):
+    """
+    요청한 줄 수보다 짧은 파일은 전체를 반환하는지 테스트
+    """
+    path = tmp_path / "small.log"
+    path.write_text("첫 줄\n둘째 줄", encoding="utf-8")
+
+    assert logs.tail_lines(str(path), lines=100) == ("첫 줄\n둘째 줄", 0, path.stat().st_size)
+
+
+def test_get_agent_logs_endpoint(log_file, monkeypatch):
+    """
+    로그 조회 엔드포인트의 페이지 정보 응답 테스트
+    """
+    monkeypatch.setattr(logs, "log_dir", str(log_file.parent))
+    client = TestClient(app)
+
+    response = client.get("/logs/agent1", params={"lines": 2})
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["log_content"] == "줄 998\n줄 999\n"
+    assert result["has_more"] is True
+
+
+def test_get_agent_logs_invalid_agent():
+    """
+    유효하지 않은 에이전트 이름 요청 테스트
+    """
+    client = TestClient(app)
+
+    assert client.get("/logs/unknown").status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_follow_log_streams_only_appended_lines(log_file, monkeypatch):
+    """
+    follow 모드가 새로 추가된 줄만 전달하는지 테스트
+    """
+    monkeypatch.setattr(logs, "FOLLOW_POLL_INTERVAL", 0.01)
+    stream = logs.follow_log(str(log_file), None)
+    next_event = asyncio.ensure_future(stream.__anext__())
+
+    await asyncio.sleep(0.05)
+    with open(log_file, "a", encoding="utf-8") as f:
+        f.write("새 줄 1\n새 줄 2\n부분")
+
+    event = await asyncio.wait_for(next_event, 2)
+    await stream.aclose()
+
+    assert "data: 새 줄 1\ndata: 새 줄 2\n\n" in event
+    assert "부분" not in event
+
+
+def test_query_logs_endpoint(tmp_path, monkeypatch):
+    """
+    구조화 로그 조회 엔드포인트가 실행 ID로 필터링하는지 테스트
+    """
+    db_path = tmp_path / "index.sqlite3"
+    handler = LogIndexHandler(str(db_path))
+    for run_id in ("r1", "r2"):
+        record = logging.LogRecord("supervisor", logging.INFO, __file__, 1, f"{run_id} 기록", None, None)
+        record.run_id = run_id
+        handler.emit(record)
+    handler.close()
+    monkeypatch.setattr(logs, "log_index_path", str(db_path))
+    monkeypatch.setattr(logs, "LOG_INDEX_ENABLED", True)
+    client = TestClient(app)
+
+    response = client.get("/logs/query", params={"run_id": "r2", "agent": "supervisor"})
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["count"] == 1
+    assert result["records"][0]["message"] == "r2 기록"
+    assert client.get("/logs/query", params={"agent": "unknown"}).status_code == 400
+
+
+def test_query_logs_reports_missing_index(tmp_path, monkeypatch):
+    """
+    로그 인덱스가 꺼져 있으면 409, 켜져 있지만 인덱스 파일이 없으면 404를 반환하는지 테스트
+    """
+    monkeypatch.setattr(logs, "log_index_path", str(tmp_path / "index.sqlite3"))
+    client = TestClient(app)
+
+    monkeypatch.setattr(logs, "LOG_INDEX_ENABLED", False)
+    disabled = client.get("/logs/query")
+    assert disabled.status_code == 409
+    assert "LOG_INDEX=1" in disabled.json()["detail"]
+
+    monkeypatch.setattr(logs, "LOG_INDEX_ENABLED", True)
+    assert client.get("/logs/query").status_code == 404
@@ -0,0 +1,97 @@
+"""
+슈퍼바이저 페이싱 모듈 단위 테스트 모듈
+
+타이머 휠과 페이싱 정책별 페이서의 동작을 검증합니다.
+"""
+import asyncio
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.schemas import PacingPolicy
+from supervisor.app.pacing import (
+    TimerWheel,
+    Pacer,
+    FixedIntervalPacer,
+    TokenBucketPacer,
+    AckPacer,
+    create_pacer,
+)
+
+
+def test_create_pacer_modes():
+    """
+    페이싱 정책별 페이서 생성 테스트
+    """
+    assert isinstance(create_pacer(None), FixedIntervalPacer)
+    assert type(create_pacer(PacingPolicy(mode="none"))) is Pacer
+    assert isinstance(create_pacer(PacingPolicy(mode="token_bucket")), TokenBucketPacer)
+    assert isinstance(create_pacer(PacingPolicy(mode="ack")), AckPacer)
+
+
+def test_pacing_policy_rejects_negative_interval():
+    """
+    음수 간격 정책 거부 테스트
+    """
+    with pytest.raises(ValueError):
+        PacingPolicy(mode="fixed", interval=-1)
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_wakes_many_sleepers():
+    """
+    하나의 타이머 휠로 여러 대기를 처리하는 테스트
+    """
+    wheel = TimerWheel(tick=0.005)
+    started = time.monotonic()
+
+    await asyncio.gather(*(wheel.sleep(0.02) for _ in range(200)))
+
+    assert time.monotonic() - started >= 0.02
+    assert wheel.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_throttles():
+    """
+    토큰 버킷 페이서의 버스트 허용 및 속도 제한 테스트
+    """
+    pacer = TokenBucketPacer(rate=50, burst=3, wheel=TimerWheel(tick=0.005))
+    started = time.monotonic()
+
+    for _ in range(3):
+        await pacer.wait()
+    burst_elapsed = time.monotonic() - started
+    await pacer.wait()
+
+    assert burst_elapsed < 0.015
+    assert time.monotonic() - started >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_ack_pacer_waits_for_ack():
+    """
+    ack 페이서가 클라이언트 확인을 받을 때까지 대기하는 테스트
+    """
+    pacer = AckPacer(timeout=None, wheel=TimerWheel(tick=0.005))
+    waiting = asyncio.ensure_future(pacer.wait())
+
+    await asyncio.sleep(0.02)
+    assert not waiting.done()
+
+    pacer.ack()
+    await asyncio.wait_for(waiting, 1)
+
+
+@pytest.mark.asyncio
+async def test_ack_pacer_times_out():
+    """
+    ack 페이서의 확인 대기 시간 초과 테스트
+    """
+    pacer = AckPacer(timeout=0.02, wheel=TimerWheel(tick=0.005))
+
+    await asyncio.wait_for(pacer.wait(), 1)
@@ -0,0 +1,90 @@
+"""
+슈퍼바이저 계획 실행 모듈 단위 테스트 모듈
+
+다음 K단계 동시 요청과 순서 보장 브로드캐스트를 검증합니다.
+"""
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.gugudan import iter_steps
+from supervisor.app.pacing import Pacer
+from supervisor.app.planner import execute_plan
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_broadcasts_in_order_with_lookahead():
+    """
+    답변이 역순으로 완료되어도 계획 순서대로 브로드캐스트하는지 테스트
+    """
+    events = []
+    concurrent = 0
+    max_concurrent = 0
+
+    async def solve(step):
+        nonlocal concurrent, max_concurrent
+        concurrent += 1
+        max_concurrent = max(max_concurrent, concurrent)
+        # 뒤 단계일수록 빨리 끝나도록 지연
+        await asyncio.sleep(0.01 * (10 - step.multiplicand))
+        concurrent -= 1
+        return {"calculation": f"{step.problem}{step.answer}", "answer": step.answer}
+
+    async def emit(event):
+        events.append(event)
+
+    last = await execute_plan(iter_steps(4), solve, emit, Pacer(), lookahead=3)
+
+    answers = [event["content"] for event in events if event["type"] == "answer"]
+    problems = [event["content"] for event in events if event["type"] == "problem"]
+    assert answers == [f"4×{m}={4 * m}" for m in range(1, 10)]
+    # 첫 번째 문제는 초기화 단계에서 전송됨
+    assert problems == [f"4×{m}=" for m in range(2, 10)]
+    assert last.multiplicand == 9
+    assert max_concurrent == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_does_not_dispatch_past_stop_value():
+    """
+    종료 조건 이후의 단계는 요청하지 않는지 테스트
+    """
+    solved = []
+
+    async def solve(step):
+        solved.append(step.multiplicand)
+        return {"calculation": "", "answer": step.answer}
+
+    async def emit(event):
+        pass
+
+    last = await execute_plan(iter_steps(5, 15), solve, emit, Pacer(), lookahead=8)
+
+    assert sorted(solved) == [1, 2, 3]
+    assert last.answer == 15
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_stops_on_failed_answer():
+    """
+    답변 요청 실패 시 중단하고 남은 요청을 취소하는지 테스트
+    """
+    events = []
+
+    async def solve(step):
+        if step.multiplicand == 2:
+            return None
+        await asyncio.sleep(0.01)
+        return {"calculation": step.problem, "answer": step.answer}
+
+    async def emit(event):
+        events.append(event)
+
+    last = await execute_plan(iter_steps(3), solve, emit, Pacer(), lookahead=4)
+
+    assert last is None
+    assert [event["type"] for event in events] == ["answer", "problem"]
@@ -0,0 +1,121 @@
+"""
+슈퍼바이저 실행 결과 캐시 단위 테스트 모듈
+
+LRU 제거, 적중률 통계 및 캐시 재생을 검증합니다.
+"""
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.schemas import RunOptions, SupervisorRequest
+from supervisor.app import api
+from supervisor.app.pipeline import replay_run
+from supervisor.app.result_cache import ResultCache, compact_events
+
+
+def make_events(table, explanation="설명"):
+    """
+    테스트용 실행 이벤트 목록 생성
+
+    Args:
+        table (int): 구구단 단수
+        explanation (str): 설명 내용
+
+    Returns:
+        list: 이벤트 목록
+    """
+    events = []
+    for multiplicand in (1, 2):
+        events.append({"type": "problem", "content": f"{table}×{multiplicand}=", "sender": "agent1", "timestamp": "t"})
+        events.append({"type": "answer", "content": f"{table}×{multiplicand}={table * multiplicand}", "sender": "agent2", "timestamp": "t"})
+        events.append({"type": "explanation", "content": explanation, "sender": "agent2", "timestamp": "t"})
+    return events
+
+
+def test_cache_hit_ratio():
+    """
+    캐시 적중/실패 통계 테스트
+    """
+    cache = ResultCache()
+    assert cache.get((3, None)) is None
+
+    cache.put((3, None), make_events(3))
+    cached = cache.get((3, None))
+
+    assert cached == compact_events(make_events(3))
+    assert cached[0] == ("problem", "3×1=", "agent1")
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_cache_evicts_least_recently_used():
+    """
+    메모리 한도를 넘으면 가장 오래 사용하지 않은 항목을 제거하는지 테스트
+    """
+    probe = ResultCache()
+    probe.put((1, None), make_events(1))
+    cache = ResultCache(max_bytes=probe.size * 2 + probe.size // 2)
+
+    cache.put((1, None), make_events(1))
+    cache.put((2, None), make_events(2))
+    cache.get((1, None))
+    cache.put((3, None), make_events(3))
+
+    assert cache.get((2, None)) is None
+    assert cache.get((1, None)) is not None
+    assert cache.get((3, None)) is not None
+    assert cache.size <= cache.max_bytes
+
+
+def test_cache_rejects_oversized_entry():
+    """
+    한도보다 큰 실행은 저장하지 않는지 테스트
+    """
+    cache = ResultCache(max_bytes=100)
+
+    assert cache.put((4, None), make_events(4, "긴 설명" * 1000)) is False
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_run_emits_cached_events():
+    """
+    캐시된 이벤트를 새 타임스탬프와 함께 순서대로 재생하는지 테스트
+    """
+    emit = AsyncMock()
+    events = compact_events(make_events(5))
+
+    completed = await replay_run(events, RunOptions(pacing={"mode": "none"}), emit=emit)
+
+    sent = [call.args[0] for call in emit.call_args_list]
+    assert completed is True
+    assert [(e["type"], e["content"], e["sender"]) for e in sent] == list(events)
+    assert all(e["timestamp"] != "t" for e in sent)
+
+
+@pytest.mark.asyncio
+async def test_handle_request_serves_cache_without_agent_calls():
+    """
+    완료된 실행이 캐시에 있으면 에이전트를 호출하지 않고 재생하는지 테스트
+    """
+    received = []
+
+    async def sink(event):
+        received.append(event)
+
+    api.result_cache.put((7, None), make_events(7))
+    request = SupervisorRequest(message="7단 구구단 시작해줘", options={"pacing": {"mode": "none"}})
+
+    with patch("supervisor.app.api.process_gugudan") as mock_process:
+        await api.handle_request(request, sink)
+        await asyncio.sleep(0.01)
+
+    mock_process.assert_not_called()
+    assert [e["content"] for e in received][:2] == ["7×1=", "7×1=7"]
@@ -0,0 +1,301 @@
+"""
+슈퍼바이저 실행 관리 모듈 단위 테스트 모듈
+
+동일 실행 공유, 이벤트 팬아웃 및 늦은 참여자 재전송을 검증합니다.
+"""
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from shared.schemas import RunOptions, SupervisorRequest
+from shared.websocket_manager import broadcast_duration
+from supervisor.app.result_cache import ResultCache
+from supervisor.app.runs import Run, RunRegistry, run_key
+from supervisor.app import api
+
+
+def test_run_key_depends_on_pacing():
+    """
+    페이싱 정책이 다르면 다른 실행으로 판별하는지 테스트
+    """
+    fixed = RunOptions()
+    none = RunOptions(pacing={"mode": "none"})
+
+    assert run_key(5, 30, fixed) == run_key(5, 30, RunOptions())
+    assert run_key(5, 30, fixed) != run_key(5, 30, none)
+    assert run_key(5, 30, fixed) != run_key(5, None, fixed)
+
+
+@pytest.mark.asyncio
+async def test_late_subscriber_receives_replay_then_live_events():
+    """
+    늦게 참여한 구독자가 지난 이벤트를 먼저 받은 뒤 새 이벤트를 받는지 테스트
+    """
+    first, second = [], []
+
+    async def first_sink(event):
+        first.append(event)
+
+    async def second_sink(event):
+        second.append(event)
+
+    run = Run(run_key(3, None, RunOptions()))
+    run.sinks.append(first_sink)
+    await run.emit({"content": "3×1="})
+    await run.emit({"content": "3×1=3"})
+    await run.subscribe(second_sink)
+    await run.emit({"content": "3×2="})
+
+    assert [e["content"] for e in first] == ["3×1=", "3×1=3", "3×2="]
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_emit_records_fanout_duration():
+    """
+    실행 이벤트 전달 시간이 source="run" 팬아웃 시간으로 기록되는지 테스트
+    """
+    def run_fanouts():
+        return sum(broadcast_duration.totals(where=lambda labels: labels["source"] == "run"))
+
+    async def sink(event):
+        pass
+
+    before = run_fanouts()
+    run = Run(run_key(4, None, RunOptions()))
+    run.sinks.append(sink)
+    await run.emit({"content": "4×1="})
+    await run.emit({"content": "4×1=4"})
+
+    assert run_fanouts() == before + 2
+
+
+@pytest.mark.asyncio
+async def test_failing_subscriber_is_dropped():
+    """
+    전송에 실패한 구독자가 제거되고 다른 구독자는 계속 받는지 테스트
+    """
+    received = []
+
+    async def broken_sink(event):
+        raise RuntimeError("연결 끊김")
+
+    async def sink(event):
+        received.append(event)
+
+    run = Run(run_key(2, None, RunOptions()))
+    run.sinks.extend([broken_sink, sink])
+    await run.emit({"content": "2×1="})
+    await run.emit({"content": "2×1=2"})
+
+    assert run.sinks == [sink]
+    assert len(received) == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_replay_does_not_block_emit():
+    """
+    재전송이 느린 구독자가 새 이벤트 전달을 막지 않고, 재전송 중 기록된 이벤트도 순서대로 중복 없이 받는지 테스트
+    """
+    gate = asyncio.Event()
+    live, late = [], []
+
+    async def live_sink(event):
+        live.append(event["content"])
+
+    async def slow_sink(event):
+        await gate.wait()
+        late.append(event["content"])
+
+    run = Run(run_key(4, None, RunOptions()))
+    run.sinks.append(live_sink)
+    await run.emit({"content": "4×1="})
+    joining = asyncio.create_task(run.subscribe(slow_sink))
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(run.emit({"content": "4×1=4"}), timeout=1)
+    assert live == ["4×1=", "4×1=4"]
+
+    gate.set()
+    await joining
+    await run.emit({"content": "4×2="})
+    assert late == live == ["4×1=", "4×1=4", "4×2="]
+
+
+@pytest.mark.asyncio
+async def test_failing_replay_subscriber_is_not_added():
+    """
+    재전송 중 전송에 실패한 구독자는 오류 없이 구독자 목록에 추가되지 않는지 테스트
+    """
+    async def broken_sink(event):
+        raise RuntimeError("연결 끊김")
+
+    run = Run(run_key(2, None, RunOptions()))
+    await run.emit({"content": "2×1="})
+    await run.subscribe(broken_sink)
+
+    assert run.sinks == []
+    await run.emit({"content": "2×1=2"})
+
+
+@pytest.mark.asyncio
+async def test_registry_removes_finished_run():
+    """
+    파이프라인이 끝나면 실행 목록에서 제거되는지 테스트
+    """
+    registry = RunRegistry()
+    key = run_key(4, None, RunOptions())
+
+    async def sink(event):
+        pass
+
+    run = registry.create(key, sink)
+    task = registry.launch(run, asyncio.sleep(0))
+    assert registry.get(key) is run
+
+    await task
+    await asyncio.sleep(0)
+    assert registry.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_handle_request_shares_identical_runs():
+    """
+    동일한 요청이 동시에 들어오면 하나의 파이프라인을 공유하는지 테스트
+    """
+    release = asyncio.Event()
+    calls = []
+
+    async def fake_process(table, stop_value, options, run_id, *, emit):
+        calls.append(run_id)
+        await emit({"type": "problem", "content": f"{table}×1="})
+        await release.wait()
+
+    first, second = [], []
+
+    async def first_sink(event):
+        first.append(event)
+
+    async def second_sink(event):
+        second.append(event)
+
+    request = SupervisorRequest(message="5단 구구단 시작해줘. 정답이 30에 도달하면 멈춰줘")
+    with patch("supervisor.app.api.process_gugudan", fake_process):
+        response1 = await api.handle_request(request, first_sink)
+        await asyncio.sleep(0.01)
+        response2 = await api.handle_request(request, second_sink)
+        release.set()
+        await asyncio.sleep(0.01)
+
+    assert len(calls) == 1
+    assert response1.run_id == response2.run_id
+    assert "참여합니다" in response2.message
+    assert second == first == [{"type": "problem", "content": "5×1="}]
+
+
+@pytest.mark.asyncio
+async def test_ack_only_reaches_subscribed_run(monkeypatch):
+    """
+    ack는 run_id가 있고 보낸 클라이언트가 구독한 실행의 페이서에만 전달되는지 테스트
+    """
+    registry = RunRegistry()
+    monkeypatch.setattr(api, "run_registry", registry)
+    acked = []
+    monkeypatch.setattr(api, "acknowledge_run", acked.append)
+
+    async def owner(event):
+        pass
+
+    async def stranger(event):
+        pass
+
+    run = registry.create(("key",), owner)
+
+    assert api.handle_ack(owner, None) is False
+    assert api.handle_ack(stranger, run.run_id) is False
+    assert api.handle_ack(owner, "unknown") is False
+    assert acked == []
+
+    assert api.handle_ack(owner, run.run_id) is True
+    assert acked == [run.run_id]
+
+
+@pytest.mark.asyncio
+async def test_join_sends_accepted_notice_before_replay(monkeypatch):
+    """
+    진행 중인 실행에 참여하면 재전송 이벤트보다 참여 안내(run_id 포함)를 먼저 받는지 테스트
+    """
+    monkeypatch.setattr(api, "run_registry", RunRegistry())
+    monkeypatch.setattr(api, "result_cache", ResultCache())
+    release = asyncio.Event()
+
+    async def fake_process(table, stop_value, options, run_id, *, emit):
+        await emit({"type": "problem", "content": f"{table}×1="})
+        await release.wait()
+
+    async def owner(event):
+        pass
+
+    received = []
+
+    async def joiner(event):
+        received.append(("event", event["content"]))
+
+    async def accepted(response):
+        received.append(("accepted", response.run_id))
+
+    request = SupervisorRequest(message="7단 구구단 시작해줘")
+    with patch("supervisor.app.api.process_gugudan", fake_process):
+        first = await api.handle_request(request, owner)
+        await asyncio.sleep(0.01)
+        await api.handle_request(request, joiner, accepted=accepted)
+        release.set()
+        await asyncio.sleep(0.01)
+
+    assert received == [("accepted", first.run_id), ("event", "7×1=")]
+
+
+@pytest.mark.asyncio
+async def test_join_of_broadcast_run_does_not_duplicate_events(monkeypatch):
+    """
+    HTTP로 시작해 브로드캐스트하는 실행에 웹소켓 클라이언트가 참여하면 개인 구독을 추가하지 않고,
+    그 클라이언트의 ack는 전달되는지 테스트
+    """
+    monkeypatch.setattr(api, "run_registry", RunRegistry())
+    monkeypatch.setattr(api, "result_cache", ResultCache())
+    acked = []
+    monkeypatch.setattr(api, "acknowledge_run", acked.append)
+    broadcasts, personal = [], []
+    release = asyncio.Event()
+
+    async def fake_process(table, stop_value, options, run_id, *, emit):
+        await emit({"type": "problem", "content": f"{table}×1="})
+        await release.wait()
+
+    async def fake_broadcast(event):
+        broadcasts.append(event)
+
+    async def personal_sink(event):
+        personal.append(event)
+
+    monkeypatch.setattr(api, "broadcast_message", fake_broadcast)
+    request = SupervisorRequest(message="8단 구구단 시작해줘")
+    with patch("supervisor.app.api.process_gugudan", fake_process):
+        started = await api.handle_request(request, fake_broadcast)
+        await asyncio.sleep(0.01)
+        joined = await api.handle_request(request, personal_sink)
+        run = api.run_registry.find(started.run_id)
+        assert not run.is_subscribed(personal_sink)
+        assert api.handle_ack(personal_sink, started.run_id) is True
+        release.set()
+        await asyncio.sleep(0.01)
+
+    assert joined.run_id == started.run_id
+    assert personal == []
+    assert broadcasts == [{"type": "problem", "content": "8×1="}]
+    assert acked == [started.run_id]
@@ -12,6 +12,7 @@ from unittest.mock import patch, AsyncMock
 # 상위 디렉터리 경로를 모듈 검색 경로에 추가
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+from shared import __version__
 from supervisor.app.api import app, parse_request
 
 
@@ -35,7 +36,23 @@ def test_health_check(client):
     """
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "ok", "agent": "supervisor"}
+    assert response.json() == {"status": "ok", "agent": "supervisor", "version": __version__}
+
+
+def test_metrics_endpoint(client):
+    """
+    메트릭 엔드포인트가 웹소켓 연결 수와 진행 중인 실행 수를 출력하는지 테스트
+
+    Args:
+        client (TestClient): FastAPI 테스트 클라이언트
+    """
+    client.get("/health")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert "websocket_connections 0" in response.text
+    assert "gugudan_active_runs " in response.text
+    assert 'route="/health",status="200"' in response.text
 
 
 def test_parse_request_with_stop_value():
@@ -92,7 +109,9 @@ def test_process_request_with_stop_value(mock_process_gugudan, client):
     assert "30에 도달하면 멈추겠습니다" in response.json()["message"]
     
     # process_gugudan 함수 호출 검증
-    mock_process_gugudan.assert_called_once_with(6, 30)
+    mock_process_gugudan.assert_called_once()
+    assert mock_process_gugudan.call_args.args[:2] == (6, 30)
+    assert response.json()["run_id"] == mock_process_gugudan.call_args.args[3]
 
 
 @patch("supervisor.app.api.process_gugudan", new_callable=AsyncMock)
@@ -116,7 +135,8 @@ def test_process_request_without_stop_value(mock_process_gugudan, client):
     assert "8×9까지 진행하겠습니다" in response.json()["message"]
     
     # process_gugudan 함수 호출 검증
-    mock_process_gugudan.assert_called_once_with(8, None)
+    mock_process_gugudan.assert_called_once()
+    assert mock_process_gugudan.call_args.args[:2] == (8, None)
 
 
 def test_process_request_invalid_format(client):
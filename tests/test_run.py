@@ -0,0 +1,92 @@
+"""
+전체 시스템 실행 스크립트 단위 테스트 모듈
+
+고정 대기 대신 /health 응답으로 준비 완료를 판단하는 기능을 검증합니다.
+"""
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# 상위 디렉터리 경로를 모듈 검색 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+import run
+
+
+def running_process():
+    """
+    실행 중인 프로세스 모의 객체
+
+    Returns:
+        MagicMock: poll()이 None을 반환하는 프로세스
+    """
+    process = MagicMock()
+    process.poll.return_value = None
+    return process
+
+
+def test_wait_until_ready_returns_boot_time(monkeypatch):
+    """
+    /health가 응답하는 즉시 시작부터 걸린 시간을 반환하는지 테스트
+    """
+    monkeypatch.setattr(run, "HEALTH_POLL_INTERVAL", 0.01)
+    answers = iter([False, False, True])
+    started = time.monotonic()
+
+    elapsed = run.wait_until_ready(
+        "테스트", "http://test/health", running_process(), started, started + 5,
+        probe=lambda url: next(answers),
+    )
+
+    assert elapsed is not None
+    assert elapsed < 1
+
+
+def test_wait_until_ready_stops_when_process_exits(monkeypatch):
+    """
+    준비 전에 프로세스가 종료되면 제한 시간을 기다리지 않고 실패하는지 테스트
+    """
+    monkeypatch.setattr(run, "HEALTH_POLL_INTERVAL", 0.01)
+    process = MagicMock()
+    process.poll.return_value = 1
+    started = time.monotonic()
+
+    assert run.wait_until_ready("테스트", "http://test/health", process, started, started + 5,
+                                probe=lambda url: False) is None
+    assert time.monotonic() - started < 1
+
+
+def test_wait_until_ready_times_out(monkeypatch):
+    """
+    전체 제한 시간이 지나면 실패하는지 테스트
+    """
+    monkeypatch.setattr(run, "HEALTH_POLL_INTERVAL", 0.01)
+    started = time.monotonic()
+
+    assert run.wait_until_ready("테스트", "http://test/health", running_process(), started, started + 0.05,
+                                probe=lambda url: False) is None
+
+
+def test_start_backends_waits_in_parallel(monkeypatch):
+    """
+    모든 백엔드를 동시에 기다려 가장 느린 컴포넌트만큼만 걸리는지 테스트
+    """
+    launched = []
+
+    def fake_run_command(command, name):
+        launched.append(name)
+        return running_process()
+
+    monkeypatch.setattr(run, "run_command", fake_run_command)
+
+    def slow_ready(name, url, process, started, deadline):
+        time.sleep(0.2)
+        return 0.2
+
+    monkeypatch.setattr(run, "wait_until_ready", slow_ready)
+    started = time.monotonic()
+
+    assert run.start_backends(timeout=5) is True
+    assert time.monotonic() - started < 0.5
+    assert len(launched) == len(run.BACKEND_COMPONENTS)